@@ -0,0 +1,115 @@
+"""Token usage rollup
+
+Revision ID: 0b3e9c7a5d28
+Revises: f4b8d2a61c95
+Create Date: 2026-10-18 18:04:26.517930
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b3e9c7a5d28"
+down_revision: Union[str, None] = "f4b8d2a61c95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Token consumption summed per user, project, model, task, type and day
+ROLLUP = """
+    INSERT INTO token_usage_daily (
+        id, day, user_id, vlab_id, project_id, model, task, type, count
+    )
+    SELECT
+        gen_random_uuid(),
+        (messages.creation_date AT TIME ZONE 'UTC')::date,
+        threads.user_id,
+        threads.vlab_id,
+        threads.project_id,
+        {table}.model,
+        {table}.task,
+        {table}.type,
+        sum({table}.count)
+    FROM {table}
+    JOIN messages ON messages.message_id = {table}.message_id
+    JOIN threads ON threads.thread_id = messages.thread_id
+    GROUP BY 2, 3, 4, 5, 6, 7, 8
+    -- Rows locked in the order of the conflict key, so that concurrent
+    -- rollups of the same users do not deadlock
+    ORDER BY 3, 2, 4, 5, 6, 7, 8
+    ON CONFLICT (user_id, day, vlab_id, project_id, model, task, type)
+    DO UPDATE SET count = token_usage_daily.count + EXCLUDED.count
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_usage_daily",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("vlab_id", sa.UUID(), nullable=True),
+        sa.Column("project_id", sa.UUID(), nullable=True),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column(
+            "task", postgresql.ENUM(name="task", create_type=False), nullable=False
+        ),
+        sa.Column(
+            "type",
+            postgresql.ENUM(name="tokentype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id",
+            "day",
+            "vlab_id",
+            "project_id",
+            "model",
+            "task",
+            "type",
+            name="uq_token_usage_daily_user_day",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        "ix_token_usage_daily_project_day",
+        "token_usage_daily",
+        ["vlab_id", "project_id", "day"],
+        unique=False,
+    )
+
+    # Statement level, so that the rows inserted together are summed once
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION rollup_token_consumption()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            {ROLLUP.format(table="new_rows")};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER token_consumption_rollup_trigger
+        AFTER INSERT ON token_consumption
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION rollup_token_consumption();
+    """)
+
+    # Existing consumption
+    op.execute(ROLLUP.format(table="token_consumption"))
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS token_consumption_rollup_trigger ON token_consumption"
+    )
+    op.execute("DROP FUNCTION IF EXISTS rollup_token_consumption()")
+    op.drop_index("ix_token_usage_daily_project_day", table_name="token_usage_daily")
+    op.drop_table("token_usage_daily")
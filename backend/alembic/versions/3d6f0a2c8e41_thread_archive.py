@@ -0,0 +1,85 @@
+"""Thread archive
+
+Revision ID: 3d6f0a2c8e41
+Revises: 0b3e9c7a5d28
+Create Date: 2026-10-18 23:12:40.381527
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d6f0a2c8e41"
+down_revision: Union[str, None] = "0b3e9c7a5d28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("threads", sa.Column("archive_key", sa.String(), nullable=True))
+    op.add_column(
+        "threads",
+        sa.Column("archive_date", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_threads_update_date_not_archived",
+        "threads",
+        ["update_date"],
+        unique=False,
+        postgresql_where=sa.text("archive_key IS NULL"),
+    )
+
+    # The consumption of the rehydrated messages is already in the rollup
+    op.execute(
+        "DROP TRIGGER IF EXISTS token_consumption_rollup_trigger ON token_consumption"
+    )
+    op.execute("""
+        CREATE TRIGGER token_consumption_rollup_trigger
+        AFTER INSERT ON token_consumption
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        WHEN (current_setting('neuroagent.rehydrating', true) IS DISTINCT FROM 'on')
+        EXECUTE FUNCTION rollup_token_consumption();
+    """)
+    # The rehydrated messages are already in the search document of the thread
+    op.execute("DROP TRIGGER IF EXISTS threads_search_vector_trigger ON messages")
+    op.execute("""
+        CREATE TRIGGER threads_search_vector_trigger
+        AFTER INSERT ON messages
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        WHEN (current_setting('neuroagent.rehydrating', true) IS DISTINCT FROM 'on')
+        EXECUTE FUNCTION update_threads_search_vector();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS threads_search_vector_trigger ON messages")
+    op.execute("""
+        CREATE TRIGGER threads_search_vector_trigger
+        AFTER INSERT ON messages
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION update_threads_search_vector();
+    """)
+    op.execute(
+        "DROP TRIGGER IF EXISTS token_consumption_rollup_trigger ON token_consumption"
+    )
+    op.execute("""
+        CREATE TRIGGER token_consumption_rollup_trigger
+        AFTER INSERT ON token_consumption
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION rollup_token_consumption();
+    """)
+    op.drop_index(
+        "ix_threads_update_date_not_archived",
+        table_name="threads",
+        postgresql_where=sa.text("archive_key IS NULL"),
+    )
+    op.drop_column("threads", "archive_date")
+    op.drop_column("threads", "archive_key")
@@ -0,0 +1,27 @@
+"""history summary task
+
+Revision ID: 5e9a1c7d3f60
+Revises: 3d6f0a2c8e41
+Create Date: 2026-10-18 23:41:12.508311
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e9a1c7d3f60"
+down_revision: Union[str, None] = "3d6f0a2c8e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.execute("ALTER TYPE task ADD VALUE IF NOT EXISTS 'HISTORY_SUMMARY'")
+
+
+def downgrade():
+    # PostgreSQL doesn't support removing enum values directly
+    # Noop shouldn't break anything
+    pass
@@ -0,0 +1,100 @@
+"""JSONB message content
+
+Revision ID: e2a7c4b9d613
+Revises: c5f1a8d3e207
+Create Date: 2026-10-18 16:02:37.418205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c4b9d613"
+down_revision: Union[str, None] = "c5f1a8d3e207"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROJECTED_COLUMNS = {
+    "role": "content ->> 'role'",
+    # Tool results are not duplicated
+    "text_content": (
+        "CASE WHEN entity IN ('USER', 'AI_MESSAGE') THEN content ->> 'content' END"
+    ),
+    "reasoning": "content ->> 'reasoning'",
+    "tool_call_id": "content ->> 'tool_call_id'",
+}
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "messages",
+        "content",
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="content::jsonb",
+    )
+    for column, expression in PROJECTED_COLUMNS.items():
+        op.add_column(
+            "messages",
+            sa.Column(
+                column,
+                sa.String(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+
+    # The content does not need to be parsed anymore
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_messages_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := CASE
+                WHEN NEW.entity IN ('USER', 'AI_MESSAGE') THEN
+                    to_tsvector('english', COALESCE(NEW.content ->> 'content', ''))
+                ELSE to_tsvector('english', '')
+            END;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_messages_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := CASE
+                WHEN NEW.entity IN ('USER', 'AI_MESSAGE') THEN
+                    to_tsvector('english',
+                        COALESCE(
+                            CASE
+                                WHEN NEW.content::jsonb ? 'content' THEN
+                                    NEW.content::jsonb->>'content'
+                                ELSE ''
+                            END,
+                            ''
+                        )
+                    )
+                ELSE to_tsvector('english', '')
+            END;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for column in reversed(PROJECTED_COLUMNS):
+        op.drop_column("messages", column)
+    op.alter_column(
+        "messages",
+        "content",
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="content::text",
+    )
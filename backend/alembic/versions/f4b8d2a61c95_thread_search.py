@@ -0,0 +1,135 @@
+"""Thread search
+
+Revision ID: f4b8d2a61c95
+Revises: e2a7c4b9d613
+Create Date: 2026-10-18 17:11:52.903461
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b8d2a61c95"
+down_revision: Union[str, None] = "e2a7c4b9d613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Search document of the threads
+    op.add_column(
+        "threads", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+    )
+    # A tsvector is limited to 1MB and keeps at most 256 positions per lexeme.
+    # Large documents drop their positions, which their text form bounds.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION append_search_vector(
+            document tsvector, addition tsvector
+        )
+        RETURNS tsvector AS $$
+            SELECT CASE
+                WHEN octet_length(COALESCE(document, ''::tsvector)::text)
+                    + octet_length(COALESCE(addition, ''::tsvector)::text) < 524288
+                THEN COALESCE(document, ''::tsvector)
+                    || COALESCE(addition, ''::tsvector)
+                ELSE strip(COALESCE(document, ''::tsvector))
+                    || strip(COALESCE(addition, ''::tsvector))
+            END
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+    op.execute("""
+        CREATE AGGREGATE search_vector_agg (tsvector) (
+            SFUNC = append_search_vector,
+            STYPE = tsvector
+        )
+    """)
+    # Once per statement, each thread document is rewritten once with all its
+    # inserted messages
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_threads_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE threads
+            SET search_vector = append_search_vector(
+                threads.search_vector, additions.search_vector
+            )
+            FROM (
+                SELECT
+                    thread_id,
+                    search_vector_agg(
+                        search_vector ORDER BY creation_date, message_id
+                    ) AS search_vector
+                FROM new_rows
+                WHERE entity IN ('USER', 'AI_MESSAGE')
+                GROUP BY thread_id
+            ) AS additions
+            WHERE threads.thread_id = additions.thread_id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER threads_search_vector_trigger
+        AFTER INSERT ON messages
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION update_threads_search_vector();
+    """)
+
+    # Update existing threads
+    op.execute("""
+        UPDATE threads
+        SET search_vector = documents.search_vector
+        FROM (
+            SELECT
+                thread_id,
+                search_vector_agg(
+                    search_vector ORDER BY creation_date, message_id
+                ) AS search_vector
+            FROM messages
+            WHERE entity IN ('USER', 'AI_MESSAGE')
+            GROUP BY thread_id
+        ) AS documents
+        WHERE threads.thread_id = documents.thread_id
+    """)
+
+    op.create_index(
+        "ix_threads_search_vector",
+        "threads",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_messages_text_content_trgm",
+        "messages",
+        ["text_content"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"text_content": "gin_trgm_ops"},
+        postgresql_where=sa.text("entity IN ('USER', 'AI_MESSAGE')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_messages_text_content_trgm",
+        table_name="messages",
+        postgresql_using="gin",
+        postgresql_where=sa.text("entity IN ('USER', 'AI_MESSAGE')"),
+    )
+    op.drop_index(
+        "ix_threads_search_vector", table_name="threads", postgresql_using="gin"
+    )
+    op.execute("DROP TRIGGER IF EXISTS threads_search_vector_trigger ON messages")
+    op.execute("DROP FUNCTION IF EXISTS update_threads_search_vector()")
+    op.execute("DROP AGGREGATE IF EXISTS search_vector_agg (tsvector)")
+    op.execute("DROP FUNCTION IF EXISTS append_search_vector(tsvector, tsvector)")
+    op.drop_column("threads", "search_vector")
@@ -6,7 +6,8 @@ import json
 import logging
 import uuid
 from collections import defaultdict
-from typing import Any, AsyncIterator
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
 from openai import AsyncOpenAI, AsyncStream
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
@@ -15,17 +16,20 @@ from pydantic import BaseModel, ValidationError
 from neuroagent.app.database.sql_schemas import (
     Entity,
     Messages,
+    StorageArtifacts,
     Task,
     TokenConsumption,
     TokenType,
     ToolCalls,
 )
+from neuroagent.app.database.writer import MessageWriter
 from neuroagent.new_types import (
     Agent,
     Response,
     Result,
 )
 from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import ToolEntry, get_tool_manifest, load_tool
 from neuroagent.utils import (
     complete_partial_json,
     get_entity,
@@ -34,6 +38,9 @@ from neuroagent.utils import (
     messages_to_openai_content,
 )
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 logger = logging.getLogger(__name__)
 
 
@@ -198,6 +205,12 @@ class AgentsRoutine:
                 context_variables["usage_dict"][tool_call.tool_call_id] = (
                     tool_instance.metadata.token_consumption
                 )
+            # Storage keys are specific to the call, they should not leak to the next ones
+            storage_keys = context_variables.pop("storage_keys", None)
+            if storage_keys:
+                context_variables.setdefault("storage_dict", {})[
+                    tool_call.tool_call_id
+                ] = storage_keys
         except Exception as err:
             response = {
                 "role": "tool",
@@ -220,6 +233,43 @@ class AgentsRoutine:
             agent = None
         return response, agent
 
+    @staticmethod
+    def dataset_sources(
+        messages: list[Messages], tools: list[type[BaseTool]]
+    ) -> list[tuple[str, Callable[[], "DataFrame | list[dict[str, Any]] | None"]]]:
+        """Get the tabular outputs of the tool calls of the thread, extracted lazily.
+
+        The datasets are named after the tool call IDs, which lets the LLM read them
+        from the python sandbox at `/datasets/<tool_call_id>.parquet`. They are only
+        extracted from the messages when the sandbox is used.
+        """
+        tool_map: dict[str, ToolEntry] = {
+            tool.name: tool for tool in get_tool_manifest().values()
+        }
+        tool_map.update({tool.name: tool for tool in tools})
+
+        def extract(
+            tool: ToolEntry, output: str
+        ) -> "DataFrame | list[dict[str, Any]] | None":
+            return load_tool(tool).to_dataset(output)
+
+        sources: list[
+            tuple[str, Callable[[], "DataFrame | list[dict[str, Any]] | None"]]
+        ] = []
+        for message in messages:
+            if message.entity != Entity.TOOL:
+                continue
+            tool = tool_map.get(message.content.get("tool_name", ""))
+            if tool is None:
+                continue
+            sources.append(
+                (
+                    message.content["tool_call_id"],
+                    partial(extract, tool, message.content["content"]),
+                )
+            )
+        return sources
+
     async def astream(
         self,
         agent: Agent,
@@ -228,12 +278,21 @@ class AgentsRoutine:
         model_override: str | None = None,
         max_turns: int = 10,
         max_parallel_tool_calls: int = 5,
+        max_tool_content_length: int | None = None,
+        message_writer: MessageWriter | None = None,
     ) -> AsyncIterator[str]:
-        """Stream the agent response."""
+        """Stream the agent response.
+
+        If a `message_writer` is given, the new messages are written to the
+        database as soon as they are final.
+        """
         try:
             active_agent = agent
-            content = await messages_to_openai_content(messages)
-            history = copy.deepcopy(content)
+            history = await messages_to_openai_content(
+                messages, max_tool_content_length=max_tool_content_length
+            )
+            if message_writer is not None:
+                message_writer.submit(messages)
             tool_map = {tool.name: tool for tool in agent.tools}
             turns = 0
 
@@ -426,12 +485,14 @@ class AgentsRoutine:
                     Messages(
                         thread_id=messages[-1].thread_id,
                         entity=get_entity(message),
-                        content=json.dumps(message),
+                        content=copy.deepcopy(message),
                         tool_calls=tool_calls,
                         is_complete=True,
                         token_consumption=token_consumption,
                     )
                 )
+                if message_writer is not None:
+                    message_writer.submit(messages)
 
                 if not messages[-1].tool_calls:
                     yield f"e:{json.dumps(finish_data)}\n"
@@ -452,6 +513,9 @@ class AgentsRoutine:
 
                 # handle function calls, updating context_variables, and switching agents
                 if tool_calls_to_execute:
+                    context_variables["dataset_sources"] = self.dataset_sources(
+                        messages, active_agent.tools
+                    )
                     tool_calls_executed = await self.execute_tool_calls(
                         tool_calls_to_execute[:max_parallel_tool_calls],
                         active_agent.tools,
@@ -520,15 +584,26 @@ class AgentsRoutine:
                     else:
                         token_consumption = []
 
+                    # Index the storage objects created by the tool
+                    storage_artifacts = [
+                        StorageArtifacts(thread_id=messages[-1].thread_id, key=key)
+                        for key in context_variables.get("storage_dict", {}).get(
+                            tool_response["tool_call_id"], []
+                        )
+                    ]
+
                     messages.append(
                         Messages(
                             thread_id=messages[-1].thread_id,
                             entity=Entity.TOOL,
-                            content=json.dumps(tool_response),
+                            content=tool_response,
                             is_complete=True,
                             token_consumption=token_consumption,
+                            storage_artifacts=storage_artifacts,
                         )
                     )
+                if message_writer is not None:
+                    message_writer.submit(messages)
 
                 # If the tool call response contains HIL validation, do not update anything and return
                 if tool_calls_with_hil:
@@ -580,14 +655,14 @@ class AgentsRoutine:
 
             # If the partial message hasn't been appended and the last message is not an AI_TOOL, append partial message
             if (
-                json.dumps(message) != messages[-1].content
+                message != messages[-1].content
                 and messages[-1].entity != Entity.AI_TOOL
             ):
                 messages.append(
                     Messages(
                         thread_id=messages[-1].thread_id,
                         entity=get_entity(message),
-                        content=json.dumps(message),
+                        content=message,
                         tool_calls=tool_calls,
                         is_complete=False,
                     )
@@ -600,14 +675,12 @@ class AgentsRoutine:
                         Messages(
                             thread_id=messages[-1].thread_id,
                             entity=Entity.TOOL,
-                            content=json.dumps(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": call.tool_call_id,
-                                    "tool_name": call.name,
-                                    "content": "Tool execution aborted by the user.",
-                                }
-                            ),
+                            content={
+                                "role": "tool",
+                                "tool_call_id": call.tool_call_id,
+                                "tool_name": call.name,
+                                "content": "Tool execution aborted by the user.",
+                            },
                             is_complete=False,
                         )
                         for call in tool_calls
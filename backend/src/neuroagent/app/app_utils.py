@@ -1,21 +1,25 @@
 """App utilities functions."""
 
 import asyncio
+import datetime
 import json
 import logging
+import re
 import time
 import uuid
+from dataclasses import dataclass
 from typing import Any, Literal, Sequence
 
 from fastapi import HTTPException
 from openai import AsyncOpenAI
 from pydantic import BaseModel, ConfigDict, Field, create_model
 from redis import asyncio as aioredis
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import desc, literal, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from starlette.status import HTTP_401_UNAUTHORIZED
 
 from neuroagent.app.config import Settings
+from neuroagent.app.database.pool import MeteredPool
 from neuroagent.app.database.sql_schemas import (
     ComplexityEstimation,
     Entity,
@@ -41,11 +45,19 @@ from neuroagent.app.schemas import (
     ToolCallPartVercel,
     ToolCallVercel,
 )
-from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import ToolEntry
 from neuroagent.utils import get_token_count, messages_to_openai_content
 
 logger = logging.getLogger(__name__)
 
+# Rate limited routes, by field of `RateLimitOutput`. A user has one key per
+# route, so that their rate limits are read without scanning the keys.
+RATE_LIMITED_ROUTES = {
+    "chat_streamed": "/qa/chat_streamed/{thread_id}",
+    "question_suggestions": "/qa/question_suggestions",
+    "generate_title": "/threads/{thread_id}/generate_title",
+}
+
 
 class RateLimitHeaders(BaseModel):
     """Headers for the rate limits."""
@@ -57,29 +69,120 @@ class RateLimitHeaders(BaseModel):
     model_config = ConfigDict(validate_by_name=True, validate_by_alias=True)
 
 
+@dataclass
+class RateLimitLease:
+    """Requests of a rate limit window leased from redis."""
+
+    limit: int
+    # Requests of the window, counted in redis, up to the last one made locally
+    count: int
+    # and up to the end of the lease
+    end: int
+    # `time.monotonic()` at the end of the window
+    deadline: float
+
+
+class RateLimitLeases:
+    """Local tier of the rate limiter, leasing the requests from redis.
+
+    Instead of counting every request in redis, the worker reserves
+    `lease_size` requests of the quota of a user at once and counts them
+    locally, so that only one request out of `lease_size` makes a round-trip
+    to redis. Once the quota is used, the requests are rejected without
+    round-trip until the end of the window.
+
+    The leased requests are counted in redis, so the limit is never exceeded.
+    However, the requests leased by a worker are not available to the others:
+    with `n` workers, a user can be rate limited up to
+    `(n - 1) * (lease_size - 1)` requests before the limit, and the remaining
+    requests of the headers and of `GET /rate_limit` are underestimated by up
+    to `n * (lease_size - 1)`.
+    """
+
+    def __init__(self, lease_size: int) -> None:
+        self.lease_size = lease_size
+        self.leases: dict[str, RateLimitLease] = {}
+        self.locks: dict[str, asyncio.Lock] = {}
+
+    def lock(self, key: str) -> asyncio.Lock:
+        """Get the lock preventing concurrent leases of a key."""
+        return self.locks.setdefault(key, asyncio.Lock())
+
+    def get(self, key: str, limit: int) -> RateLimitLease | None:
+        """Get the lease of a key in the current window, with requests left."""
+        lease = self.leases.get(key)
+        if (
+            lease is None
+            or lease.limit != limit
+            or lease.deadline <= time.monotonic()
+            # No request left, but the quota is not used
+            or lease.count == lease.end < limit
+        ):
+            return None
+        return lease
+
+    async def lease(
+        self, redis_client: aioredis.Redis, key: str, limit: int, expiry: int
+    ) -> RateLimitLease:
+        """Lease requests of a key from redis."""
+        total, ttl = await count_requests(redis_client, key, self.lease_size, expiry)
+        start = total - self.lease_size
+        lease = RateLimitLease(
+            limit=limit,
+            count=start,
+            end=max(start, min(total, limit)),
+            deadline=time.monotonic() + (ttl / 1000 if ttl > 0 else expiry),
+        )
+
+        # Forget the leases of the past windows
+        now = time.monotonic()
+        for other in [k for k, v in self.leases.items() if v.deadline <= now]:
+            del self.leases[other]
+            if not self.locks[other].locked():
+                del self.locks[other]
+        self.leases[key] = lease
+        return lease
+
+
 def setup_engine(
     settings: Settings, connection_string: str | None = None
 ) -> AsyncEngine | None:
-    """Get the SQL engine."""
-    if connection_string:
-        engine_kwargs: dict[str, Any] = {"url": connection_string}
-        engine = create_async_engine(**engine_kwargs)
-    else:
+    """Get the SQL engine.
+
+    The connection is only made when needed, see `check_db_connection`.
+    """
+    if not connection_string:
         logger.warning("The SQL db_prefix needs to be set to use the SQL DB.")
         return None
+
+    engine_kwargs: dict[str, Any] = {
+        "url": connection_string,
+        "poolclass": MeteredPool,
+        "pool_size": settings.db.pool_size,
+        "max_overflow": settings.db.max_overflow,
+        "pool_timeout": settings.db.pool_timeout,
+        "pool_recycle": settings.db.pool_recycle,
+        "pool_pre_ping": settings.db.pool_pre_ping,
+    }
+    if "asyncpg" in connection_string:
+        engine_kwargs["connect_args"] = {
+            "statement_cache_size": settings.db.statement_cache_size,
+            "prepared_statement_cache_size": settings.db.prepared_statement_cache_size,
+        }
+    return create_async_engine(**engine_kwargs)
+
+
+async def check_db_connection(engine: AsyncEngine) -> bool:
+    """Check that the database can be queried."""
+    url = engine.url.render_as_string(hide_password=True)
     try:
-        engine.connect()
-        logger.info(
-            "Successfully connected to the SQL database"
-            f" {connection_string if not settings.db.password else connection_string.replace(settings.db.password.get_secret_value(), '*****')}."
-        )
-        return engine
-    except SQLAlchemyError:
-        logger.warning(
-            "Failed connection to SQL database"
-            f" {connection_string if not settings.db.password else connection_string.replace(settings.db.password.get_secret_value(), '*****')}."
-        )
-        return None
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception:
+        logger.warning(f"Failed connection to SQL database {url}.", exc_info=True)
+        return False
+    logger.info(f"Successfully connected to the SQL database {url}.")
+    return True
 
 
 def validate_project(
@@ -115,12 +218,36 @@ def validate_project(
         return
 
 
+def rate_limit_key(user_sub: uuid.UUID, route_path: str) -> str:
+    """Get the redis key counting the requests of a user to a route."""
+    return f"rate_limit:{user_sub}:{route_path}"
+
+
+async def count_requests(
+    redis_client: aioredis.Redis, key: str, amount: int, expiry: int
+) -> tuple[int, int]:
+    """Count requests in the window of a key.
+
+    Single round-trip, atomic with MULTI/EXEC: the window starts with the
+    first request and every request is counted, so that concurrent requests
+    cannot exceed the limit. Returns the count, including the new requests,
+    and the time to live of the window in milliseconds.
+    """
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.set(key, 0, ex=expiry, nx=True)
+        pipe.incrby(key, amount)
+        pipe.pttl(key)
+        _, count, ttl = await pipe.execute()
+    return count, ttl
+
+
 async def rate_limit(
     redis_client: aioredis.Redis | None,
     route_path: str,
     limit: int,
     expiry: int,
     user_sub: uuid.UUID,
+    leases: RateLimitLeases | None = None,
 ) -> tuple[RateLimitHeaders, bool]:
     """Check rate limiting for a given route and user.
 
@@ -136,6 +263,8 @@ async def rate_limit(
         Time in seconds before the rate limit resets
     user_sub : uuid.UUID
         User identifier
+    leases : RateLimitLeases | None
+        Requests leased by the worker. If None, every request is counted in redis.
 
     Returns
     -------
@@ -149,40 +278,28 @@ async def rate_limit(
             x_ratelimit_limit="-1", x_ratelimit_remaining="-1", x_ratelimit_reset="-1"
         ), False  # redis disabled
 
-    # Create key using normalized route path and user sub
-    key = f"rate_limit:{user_sub}:{route_path}"
-
-    # Get current count
-    current = await redis_client.get(key)
-    current = int(current) if current else 0
-
-    if current > 0:
-        # Get the remaining time
-        ttl = await redis_client.pttl(key)
-        if current + 1 > limit:
-            # Rate limited
-            return RateLimitHeaders(
-                x_ratelimit_limit=str(limit),
-                x_ratelimit_remaining="0",
-                x_ratelimit_reset=str(round(ttl / 1000)),
-            ), True
-
-        # Not rate limited
-        await redis_client.incr(key)
-        return RateLimitHeaders(
-            x_ratelimit_limit=str(limit),
-            x_ratelimit_remaining=str(limit - current - 1),
-            x_ratelimit_reset=str(round(ttl / 1000)),
-        ), False
+    key = rate_limit_key(user_sub, route_path)
 
-    # Key did not exist yet
+    if leases is None:
+        count, ttl = await count_requests(redis_client, key, 1, expiry)
+        rate_limited = count > limit
+        reset = round(ttl / 1000) if ttl > 0 else expiry
     else:
-        await redis_client.set(key, 1, ex=expiry)
-        return RateLimitHeaders(
-            x_ratelimit_limit=str(limit),
-            x_ratelimit_remaining=str(limit - current - 1),
-            x_ratelimit_reset=str(expiry),
-        ), False
+        async with leases.lock(key):
+            lease = leases.get(key, limit)
+            if lease is None:
+                lease = await leases.lease(redis_client, key, limit, expiry)
+            rate_limited = lease.count >= lease.end
+            if not rate_limited:
+                lease.count += 1
+            count = lease.count + rate_limited
+            reset = round(lease.deadline - time.monotonic())
+
+    return RateLimitHeaders(
+        x_ratelimit_limit=str(limit),
+        x_ratelimit_remaining=str(max(0, limit - count)),
+        x_ratelimit_reset=str(reset),
+    ), rate_limited
 
 
 async def commit_messages(
@@ -195,6 +312,218 @@ async def commit_messages(
     await session.close()
 
 
+async def load_thread_history(
+    session: AsyncSession, thread_id: uuid.UUID, max_turns: int | None = None
+) -> list[Messages]:
+    """Load the messages of the last turns of a thread.
+
+    A turn starts with a user message. Both queries go through the
+    (thread_id, creation_date) index, so the cost does not depend on the length
+    of the thread.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Database session.
+    thread_id : uuid.UUID
+        Thread to load the history of.
+    max_turns : int | None
+        Number of turns to load. None loads the whole thread.
+
+    Returns
+    -------
+    list[Messages]
+        Messages of the window, in creation order.
+    """
+    query = (
+        select(Messages)
+        .where(Messages.thread_id == thread_id)
+        .order_by(Messages.creation_date, Messages.message_id)
+    )
+    if max_turns is not None:
+        # Creation date of the oldest user message of the window
+        window_start = (
+            await session.execute(
+                select(Messages.creation_date)
+                .where(Messages.thread_id == thread_id, Messages.entity == Entity.USER)
+                .order_by(desc(Messages.creation_date))
+                .offset(max_turns - 1)
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        if window_start is not None:
+            query = query.where(Messages.creation_date >= window_start)
+
+    return list((await session.execute(query)).scalars().all())
+
+
+def close_interrupted_turn(messages: list[Messages]) -> None:
+    """Answer the tool calls left without result by an interrupted turn.
+
+    A turn whose worker died can end with tool calls without result, which the
+    LLMs reject. They get an aborted result, as when the user stops the stream.
+    """
+    if not messages or messages[-1].is_complete:
+        return
+    ai_tool_index = next(
+        (
+            i
+            for i in range(len(messages) - 1, -1, -1)
+            if messages[i].entity == Entity.AI_TOOL
+        ),
+        None,
+    )
+    if ai_tool_index is None:
+        return
+
+    ai_tool_message = messages[ai_tool_index]
+    answered = {
+        message.content.get("tool_call_id")
+        for message in messages[ai_tool_index + 1 :]
+        if message.entity == Entity.TOOL
+    }
+    for tool_call in ai_tool_message.content.get("tool_calls") or []:
+        if tool_call["id"] not in answered:
+            messages.append(
+                Messages(
+                    thread_id=ai_tool_message.thread_id,
+                    entity=Entity.TOOL,
+                    content={
+                        "role": "tool",
+                        "tool_call_id": tool_call["id"],
+                        "tool_name": tool_call["function"]["name"],
+                        "content": "Tool execution interrupted.",
+                    },
+                    is_complete=False,
+                )
+            )
+
+
+async def update_history_summary(
+    session: AsyncSession,
+    thread_id: uuid.UUID,
+    window_start: datetime.datetime,
+    openai_client: AsyncOpenAI,
+    model: str,
+) -> None:
+    """Fold the messages that left the history window into the thread's summary.
+
+    Only the user and final AI messages that are not summarized yet are sent to
+    the LLM, together with the current summary. The tokens consumed are recorded
+    on the last user message of the thread. Meant to run in a bg task.
+    """
+    try:
+        thread = await session.get(Threads, thread_id)
+        if thread is None:
+            return
+
+        query = (
+            select(Messages)
+            .where(
+                Messages.thread_id == thread_id,
+                Messages.creation_date < window_start,
+                Messages.entity.in_([Entity.USER, Entity.AI_MESSAGE]),
+            )
+            .order_by(Messages.creation_date)
+        )
+        if thread.summary_date is not None:
+            query = query.where(Messages.creation_date > thread.summary_date)
+        new_messages = (await session.execute(query)).scalars().all()
+        if not new_messages:
+            return
+
+        transcript = "\n".join(
+            f"{content['role']}: {str(content.get('content'))[:2000]}"
+            for content in await messages_to_openai_content(list(new_messages))
+        )
+        create_kwargs: dict[str, Any] = {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You maintain the summary of a conversation between a user and a neuroscience AI assistant. Update the current summary with the new messages. Keep the user's goals, the entities (names and IDs) and results discussed, the decisions taken and the open questions. Answer with the updated summary only, in less than 300 words.",
+                },
+                {
+                    "role": "user",
+                    "content": f"Current summary:\n{thread.summary or 'None'}\n\nNew messages:\n{transcript}",
+                },
+            ],
+            "model": model,
+        }
+        if "gpt-5" in model:
+            create_kwargs["reasoning_effort"] = "minimal"
+
+        response = await openai_client.chat.completions.create(**create_kwargs)
+        thread.summary = response.choices[0].message.content
+        thread.summary_date = new_messages[-1].creation_date
+
+        # Tokens are counted on the last user message, the query of this turn
+        last_user_message_id = await session.scalar(
+            select(Messages.message_id)
+            .where(Messages.thread_id == thread_id, Messages.entity == Entity.USER)
+            .order_by(Messages.creation_date.desc())
+            .limit(1)
+        )
+        token_count = get_token_count(response.usage)
+        session.add_all(
+            [
+                TokenConsumption(
+                    message_id=last_user_message_id,
+                    type=token_type,
+                    task=Task.HISTORY_SUMMARY,
+                    count=count,
+                    model=model,
+                )
+                for token_type, count in [
+                    (TokenType.INPUT_CACHED, token_count["input_cached"]),
+                    (TokenType.INPUT_NONCACHED, token_count["input_noncached"]),
+                    (TokenType.COMPLETION, token_count["completion"]),
+                ]
+                if count
+            ]
+        )
+        await session.commit()
+    except Exception:
+        logger.exception(f"Could not update the summary of thread {thread_id}.")
+    finally:
+        await session.close()
+
+
+def keyset(
+    date_column: Any,
+    id_column: Any,
+    cursor: datetime.datetime,
+    cursor_id: uuid.UUID | None,
+) -> tuple[Any, Any]:
+    """Get the sort key of the rows and its value at the cursor.
+
+    Rows are ordered by (date, id) so that the rows created at the same time are
+    not skipped or repeated across pages. Cursors without id, from older clients,
+    only compare the date.
+
+    Returns
+    -------
+    tuple[Any, Any]
+        Sort key and cursor value, to compare with `<` or `>`.
+    """
+    if cursor_id is None:
+        return date_column, cursor
+    return tuple_(date_column, id_column), tuple_(
+        literal(cursor, date_column.type), literal(cursor_id, id_column.type)
+    )
+
+
+def prefix_tsquery(query: str) -> str | None:
+    """Get a `to_tsquery` query matching all the words, the last one as a prefix.
+
+    The last word is usually still being typed when searching as you type.
+    Returns None if the query has no words.
+    """
+    words = re.findall(r"[^\W_]+", query)
+    if not words:
+        return None
+    return " & ".join([*words[:-1], f"{words[-1]}:*"])
+
+
 def format_messages_output(
     db_messages: Sequence[Messages],
     tool_hil_mapping: dict[str, bool],
@@ -205,13 +534,13 @@ def format_messages_output(
     messages = []
     for msg in db_messages:
         # Create a clean dict without SQLAlchemy attributes
-        message_data = {
+        message_data: dict[str, Any] = {
             "message_id": msg.message_id,
             "entity": msg.entity.value,  # Convert enum to string
             "thread_id": msg.thread_id,
             "is_complete": msg.is_complete,
             "creation_date": msg.creation_date.isoformat(),  # Convert datetime to string
-            "msg_content": json.loads(msg.content),
+            "msg_content": msg.content,
         }
 
         # Map validation status based on tool requirements
@@ -242,6 +571,7 @@ def format_messages_output(
 
     return PaginatedResponse(
         next_cursor=messages[-1].creation_date,
+        next_cursor_id=messages[-1].message_id,
         has_more=has_more,
         page_size=page_size,
         results=messages,
@@ -258,18 +588,19 @@ def format_messages_vercel(
     messages: list[MessagesReadVercel] = []
     parts: list[TextPartVercel | ToolCallPartVercel | ReasoningPartVercel] = []
     annotations: list[AnnotationMessageVercel | AnnotationToolCallVercel] = []
+    tool_invocations: dict[str, ToolCallVercel] = {}
+    tool_annotations: dict[str, AnnotationToolCallVercel] = {}
 
     for msg in reversed(db_messages):
         if msg.entity in [Entity.USER, Entity.AI_MESSAGE]:
-            content = json.loads(msg.content)
-            text_content = content.get("content")
-            reasoning_content = content.get("reasoning")
+            text_content = msg.text_content
+            reasoning_content = msg.reasoning
 
             # Optional reasoning
             if reasoning_content:
                 parts.append(ReasoningPartVercel(reasoning=reasoning_content))
 
-            message_data = {
+            message_data: dict[str, Any] = {
                 "id": msg.message_id,
                 "role": "user" if msg.entity == Entity.USER else "assistant",
                 "createdAt": msg.creation_date,
@@ -304,13 +635,14 @@ def format_messages_vercel(
 
             parts = []
             annotations = []
+            tool_invocations = {}
+            tool_annotations = {}
             messages.append(MessagesReadVercel(**message_data))
 
         # Buffer tool calls until the next AI_MESSAGE
         elif msg.entity == Entity.AI_TOOL:
-            content = json.loads(msg.content)
-            text_content = content.get("content")
-            reasoning_content = content.get("reasoning")
+            text_content = msg.content.get("content")
+            reasoning_content = msg.reasoning
 
             # Add optional reasoning
             if reasoning_content:
@@ -331,49 +663,31 @@ def format_messages_vercel(
                 else:
                     status = "pending"
 
-                parts.append(
-                    ToolCallPartVercel(
-                        toolInvocation=ToolCallVercel(
-                            toolCallId=tc.tool_call_id,
-                            toolName=tc.name,
-                            args=json.loads(tc.arguments),
-                            state="call",
-                        )
-                    )
+                tool_invocation = ToolCallVercel(
+                    toolCallId=tc.tool_call_id,
+                    toolName=tc.name,
+                    args=json.loads(tc.arguments),
+                    state="call",
                 )
-                annotations.append(
-                    AnnotationToolCallVercel(
-                        toolCallId=tc.tool_call_id,
-                        validated=status,  # type: ignore
-                        isComplete=msg.is_complete,
-                    )
+                tool_annotation = AnnotationToolCallVercel(
+                    toolCallId=tc.tool_call_id,
+                    validated=status,  # type: ignore
+                    isComplete=msg.is_complete,
                 )
+                parts.append(ToolCallPartVercel(toolInvocation=tool_invocation))
+                annotations.append(tool_annotation)
+                # Indexed to merge the results of the tools
+                tool_invocations[tc.tool_call_id] = tool_invocation
+                tool_annotations[tc.tool_call_id] = tool_annotation
 
         # Merge the actual tool result back into the buffered part
-        elif msg.entity == Entity.TOOL:
-            tool_call_id = json.loads(msg.content).get("tool_call_id")
-            tool_call = next(
-                (
-                    part.toolInvocation
-                    for part in parts
-                    if isinstance(part, ToolCallPartVercel)
-                    and part.toolInvocation.toolCallId == tool_call_id
-                ),
-                None,
-            )
-            annotation = next(
-                (
-                    annotation
-                    for annotation in annotations
-                    if isinstance(annotation, AnnotationToolCallVercel)
-                    and annotation.toolCallId == tool_call_id
-                ),
-                None,
-            )
+        elif msg.entity == Entity.TOOL and msg.tool_call_id is not None:
+            tool_call = tool_invocations.get(msg.tool_call_id)
             if tool_call:
-                tool_call.result = json.loads(msg.content).get("content")
+                tool_call.result = msg.content.get("content")
                 tool_call.state = "result"
 
+            annotation = tool_annotations.get(msg.tool_call_id)
             if annotation:
                 annotation.isComplete = msg.is_complete
 
@@ -393,9 +707,11 @@ def format_messages_vercel(
     # Reverse back to descending order and build next_cursor
     ordered_messages = list(reversed(messages))
     next_cursor = db_messages[-1].creation_date if has_more else None
+    next_cursor_id = db_messages[-1].message_id if has_more else None
 
     return PaginatedResponse(
         next_cursor=next_cursor,
+        next_cursor_id=next_cursor_id,
         has_more=has_more,
         page_size=page_size,
         results=ordered_messages,
@@ -451,12 +767,12 @@ def complexity_to_model_and_reasoning(complexity: int) -> dict[str, str | None]:
 
 async def filter_tools_and_model_by_conversation(
     messages: list[Messages],
-    tool_list: list[type[BaseTool]],
+    tool_list: list[ToolEntry],
     openai_client: AsyncOpenAI,
     settings: Settings,
     selected_model: str | None = None,
     context: FrontendContextOutput | None = None,
-) -> tuple[list[type[BaseTool]], dict[str, str | None]]:
+) -> tuple[list[ToolEntry], dict[str, str | None]]:
     """Filter tools and select model based on conversation context and query complexity.
 
     Uses an LLM to analyze the conversation history and determine which tools are relevant
@@ -468,7 +784,7 @@ async def filter_tools_and_model_by_conversation(
     ----------
     messages : list[Messages]
         Conversation history as database message objects
-    tool_list : list[type[BaseTool]]
+    tool_list : list[ToolEntry]
         Available tools to filter from
     openai_client : AsyncOpenAI
         OpenAI client for making LLM requests
@@ -479,7 +795,7 @@ async def filter_tools_and_model_by_conversation(
 
     Returns
     -------
-    tuple[list[type[BaseTool]], dict[str, str | None]]
+    tuple[list[ToolEntry], dict[str, str | None]]
         Filtered tool list and dictionary with 'model' and 'reasoning' keys
 
     Notes
@@ -19,6 +19,12 @@ class SettingsAgent(BaseModel):
     model: Literal["simple", "multi"] = "simple"
     max_turns: int = 10
     max_parallel_tool_calls: int = 10
+    # Conversation history sent to the LLM. None loads the whole thread.
+    history_max_turns: int | None = None
+    # Summarize the turns that fall out of the history window
+    history_summary: bool = False
+    # Characters kept from the tool outputs of the previous turns
+    history_max_tool_content: int | None = None
 
     model_config = ConfigDict(frozen=True)
 
@@ -31,6 +37,13 @@ class SettingsStorage(BaseModel):
     access_key: SecretStr | None = None
     secret_key: SecretStr | None = None
     expires_in: int = 600
+    max_pool_connections: int = 20
+    upload_concurrency: int = 8
+    compress_json: bool = False
+    # Key the generated artifacts by a hash of their content to deduplicate them
+    content_addressed: bool = False
+    # Threads untouched for this number of days are archived to the storage
+    archive_after_days: int = 90
 
     model_config = ConfigDict(frozen=True)
 
@@ -44,6 +57,26 @@ class SettingsDB(BaseModel):
     host: str | None = None
     port: str | None = None
     name: str | None = None
+    # Read replica, with the same user, password and name as the primary
+    replica_host: str | None = None
+    replica_port: str | None = None
+    # Users read from the primary up to this long after their last write,
+    # recorded in the redis of the rate limiter. Without it, always the primary.
+    replica_max_staleness: float = 5  # seconds
+    # Connection pool
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30  # seconds
+    pool_recycle: int = -1  # seconds, -1 to never recycle
+    pool_pre_ping: bool = False
+    # Prepared statements cached per connection by asyncpg and SQLAlchemy.
+    # Set both to 0 behind a pgbouncer in transaction mode.
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    # Write the messages while streaming instead of at the end of the turn
+    write_behind: bool = False
+    write_behind_interval: float = 0.05  # seconds
+    write_behind_batch_size: int = 1000
 
     model_config = ConfigDict(frozen=True)
 
@@ -116,7 +149,14 @@ class SettingsTools(BaseModel):
     min_tool_selection: int = Field(default=5, ge=0)
     whitelisted_tool_regex: str | None = None
     deno_allocated_memory: int | None = 8192
+    # Datasets produced by tools and mounted in the python sandbox
+    sandbox_dataset_max_threads: int = 200
+    sandbox_dataset_max_per_thread: int = 10
+    sandbox_dataset_max_size: int = 100 * 1024 * 1024  # bytes per thread
     exa_api_key: SecretStr | None = None
+    # Online status of the tools, checked in the background once requested
+    health_check_interval: float = Field(default=60.0, gt=0)  # seconds
+    health_check_timeout: float = Field(default=5.0, gt=0)  # seconds
 
     model_config = ConfigDict(frozen=True)
 
@@ -182,6 +222,12 @@ class SettingsRateLimiter(BaseModel):
     limit_title: int = 10
     expiry_title: int = 24 * 60 * 60  # seconds
 
+    # Requests of a user reserved at once by each worker, counted locally. Saves
+    # round-trips to redis, but with n workers a user can be rate limited up to
+    # (n - 1) * (lease_size - 1) requests before the limit. 1 counts every
+    # request in redis.
+    lease_size: int = Field(default=1, ge=1)
+
     model_config = ConfigDict(frozen=True)
 
 
@@ -214,6 +260,7 @@ class MCPToolMetadata(BaseModel):
     description: str | None = None
     description_frontend: str | None = None
     utterances: list[str] | None = None
+    idempotent: bool = False  # results cached by arguments
 
     model_config = ConfigDict(frozen=True)
 
@@ -225,6 +272,12 @@ class MCPServerConfig(BaseModel):
     args: list[str] | None = None
     env: dict[str, SecretStr] | None = None
     tool_metadata: dict[str, MCPToolMetadata] | None = None
+    connect_timeout: float = 60.0  # seconds, the server is skipped after
+    pool_size: int = Field(default=1, ge=1)  # processes of the server
+    max_concurrent_calls: int = Field(default=10, ge=1)  # others wait their turn
+    call_timeout: float = 300.0  # seconds, including the wait
+    cache_size: int = 256  # results of the idempotent tools
+    cache_ttl: float = 600.0  # seconds
 
     model_config = ConfigDict(frozen=True)
 
@@ -0,0 +1,274 @@
+"""Archival of the cold threads to the object storage."""
+
+import asyncio
+import datetime
+import enum
+import gzip
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Table, delete, insert, select, text, update
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from neuroagent.app.database.sql_schemas import (
+    Base,
+    ComplexityEstimation,
+    Messages,
+    StorageArtifacts,
+    Threads,
+    TokenConsumption,
+    ToolCalls,
+    ToolSelection,
+    utc_now,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tables of the message children, in the archived records
+CHILDREN: dict[str, type[Base]] = {
+    "tool_calls": ToolCalls,
+    "tool_selection": ToolSelection,
+    "model_selection": ComplexityEstimation,
+    "token_consumption": TokenConsumption,
+}
+
+
+@dataclass
+class ArchiveStats:
+    """Size of an archived thread."""
+
+    thread_id: uuid.UUID
+    n_messages: int
+    raw_size: int
+    compressed_size: int
+
+
+def archive_key(thread: Threads) -> str:
+    """Get the storage key of the archive of a thread."""
+    return f"{thread.user_id}/archives/{thread.thread_id}.jsonl.gz"
+
+
+def to_json_row(instance: Base) -> dict[str, Any]:
+    """Get the column values of an ORM instance as JSON values.
+
+    The columns computed by the database are left out.
+    """
+    row = {}
+    for column in instance.__table__.columns:
+        if column.computed is not None or isinstance(column.type, TSVECTOR):
+            continue
+        value = getattr(instance, column.key)
+        if isinstance(value, enum.Enum):
+            value = value.name
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        row[column.key] = value
+    return row
+
+
+def from_json_row(table: Table, row: dict[str, Any]) -> dict[str, Any]:
+    """Get the column values to insert from the JSON values of `to_json_row`."""
+    values = {}
+    for key, value in row.items():
+        column_type = table.c[key].type
+        if value is not None:
+            python_type = column_type.python_type
+            if issubclass(python_type, enum.Enum):
+                value = python_type[value]
+            elif python_type is uuid.UUID:
+                value = uuid.UUID(value)
+            elif python_type is datetime.datetime:
+                value = datetime.datetime.fromisoformat(value)
+        values[key] = value
+    return values
+
+
+async def dump_thread(session: AsyncSession, thread_id: uuid.UUID) -> list[bytes]:
+    """Get the messages of a thread and their children as JSON lines."""
+    messages = (
+        (
+            await session.execute(
+                select(Messages)
+                .where(Messages.thread_id == thread_id)
+                .order_by(Messages.creation_date, Messages.message_id)
+                .options(
+                    selectinload(Messages.tool_calls),
+                    selectinload(Messages.tool_selection),
+                    selectinload(Messages.model_selection),
+                    selectinload(Messages.token_consumption),
+                    selectinload(Messages.storage_artifacts),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    lines = []
+    for message in messages:
+        record: dict[str, Any] = {"message": to_json_row(message)}
+        for name in CHILDREN:
+            children = getattr(message, name)
+            if not isinstance(children, list):
+                children = [] if children is None else [children]
+            record[name] = [to_json_row(child) for child in children]
+        # The storage artifacts stay in the database, to delete the objects
+        # with the thread
+        record["storage_artifacts"] = [
+            str(artifact.id) for artifact in message.storage_artifacts
+        ]
+        lines.append(json.dumps(record).encode())
+    return lines
+
+
+async def archive_thread(
+    session: AsyncSession,
+    s3_client: Any,
+    bucket_name: str,
+    thread_id: uuid.UUID,
+    cutoff: datetime.datetime,
+    dry_run: bool = False,
+) -> ArchiveStats | None:
+    """Move the messages of a thread untouched since `cutoff` to the storage.
+
+    The thread is left in the database, with the key of its archive and its
+    search document, so that it is still found by the search. The messages are written as gzipped JSON lines, with their tool calls, tool
+    selection, model selection and token consumption.
+
+    Returns
+    -------
+    ArchiveStats | None
+        Size of the archive, or None if the thread was updated in between.
+    """
+    thread = (
+        await session.execute(
+            select(Threads)
+            .where(
+                Threads.thread_id == thread_id,
+                Threads.update_date < cutoff,
+                Threads.archive_key.is_(None),
+            )
+            .with_for_update()
+        )
+    ).scalar_one_or_none()
+    if thread is None:
+        await session.rollback()
+        return None
+
+    lines = await dump_thread(session, thread_id)
+    raw = b"\n".join(lines)
+    body = gzip.compress(raw)
+    stats = ArchiveStats(
+        thread_id=thread_id,
+        n_messages=len(lines),
+        raw_size=len(raw),
+        compressed_size=len(body),
+    )
+    if dry_run or not lines:
+        await session.rollback()
+        return stats
+
+    key = archive_key(thread)
+    await asyncio.to_thread(
+        s3_client.put_object,
+        Bucket=bucket_name,
+        Key=key,
+        Body=body,
+        ContentType="application/x-ndjson",
+        Metadata={"category": "archive", "thread_id": str(thread_id)},
+    )
+
+    message_ids = select(Messages.message_id).where(Messages.thread_id == thread_id)
+    for child in CHILDREN.values():
+        await session.execute(
+            delete(child).where(child.message_id.in_(message_ids))  # type: ignore
+        )
+    await session.execute(
+        update(StorageArtifacts)
+        .where(StorageArtifacts.thread_id == thread_id)
+        .values(message_id=None)
+    )
+    await session.execute(delete(Messages).where(Messages.thread_id == thread_id))
+    # Deleted with the thread
+    session.add(StorageArtifacts(thread_id=thread_id, key=key))
+    thread.archive_key = key
+    thread.archive_date = utc_now()
+    await session.commit()
+    return stats
+
+
+async def rehydrate_thread(
+    session: AsyncSession, s3_client: Any, bucket_name: str, thread: Threads
+) -> None:
+    """Move the messages of an archived thread back to the database.
+
+    The thread counts as updated.
+    """
+    # Locked, so that concurrent requests rehydrate the thread once
+    thread = (
+        await session.execute(
+            select(Threads)
+            .where(Threads.thread_id == thread.thread_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+    key = thread.archive_key
+    if key is None:
+        return
+
+    response = await asyncio.to_thread(
+        s3_client.get_object, Bucket=bucket_name, Key=key
+    )
+    body = await asyncio.to_thread(response["Body"].read)
+    records = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+
+    # The consumption is already in the daily usage, and the messages in the
+    # search document of the thread
+    await session.execute(text("SET LOCAL neuroagent.rehydrating = 'on'"))
+    message_table = Messages.__table__
+    await session.execute(
+        insert(message_table),  # type: ignore
+        [from_json_row(message_table, record["message"]) for record in records],  # type: ignore
+    )
+    for name, child in CHILDREN.items():
+        rows = [
+            from_json_row(child.__table__, row)  # type: ignore
+            for record in records
+            for row in record[name]
+        ]
+        if rows:
+            await session.execute(insert(child), rows)
+    for record in records:
+        if record["storage_artifacts"]:
+            await session.execute(
+                update(StorageArtifacts)
+                .where(
+                    StorageArtifacts.id.in_(
+                        [uuid.UUID(id) for id in record["storage_artifacts"]]
+                    )
+                )
+                .values(message_id=uuid.UUID(record["message"]["message_id"]))
+            )
+
+    await session.execute(
+        delete(StorageArtifacts).where(
+            StorageArtifacts.thread_id == thread.thread_id, StorageArtifacts.key == key
+        )
+    )
+    thread.archive_key = None
+    thread.archive_date = None
+    # Written again, so that it is not archived right away and is read from the
+    # primary by its user
+    thread.update_date = utc_now()
+    await session.commit()
+    await session.refresh(thread)
+
+    await asyncio.to_thread(s3_client.delete_object, Bucket=bucket_name, Key=key)
+    logger.info(f"Rehydrated {len(records)} messages of thread {thread.thread_id}.")
@@ -0,0 +1,57 @@
+"""Connection pool of the database."""
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """Queue pool recording its usage and the time spent to check out connections.
+
+    The checkout time includes the wait for a free connection, the creation of
+    new connections and the pre-ping.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.n_checkouts = 0
+        self.n_timeouts = 0
+        self.total_checkout_time = 0.0
+        self.max_checkout_time = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection and record the time it took."""
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.n_timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.n_checkouts += 1
+            self.total_checkout_time += elapsed
+            self.max_checkout_time = max(self.max_checkout_time, elapsed)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get the usage of the pool and the checkout latency.
+
+        The utilisation is the share of the maximum number of connections
+        (pool size + max overflow) that are checked out.
+        """
+        capacity = self.size() + max(self._max_overflow, 0)
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "utilisation": self.checkedout() / capacity if capacity else 0.0,
+            "checkouts": self.n_checkouts,
+            "timeouts": self.n_timeouts,
+            "mean_checkout_ms": 1000 * self.total_checkout_time / self.n_checkouts
+            if self.n_checkouts
+            else 0.0,
+            "max_checkout_ms": 1000 * self.max_checkout_time,
+        }
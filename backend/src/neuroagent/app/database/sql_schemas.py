@@ -3,18 +3,24 @@
 import datetime
 import enum
 import uuid
+from typing import Any
 
 from sqlalchemy import (
     UUID,
+    BigInteger,
     Boolean,
+    Computed,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
     Index,
     Integer,
     String,
+    UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -39,6 +45,7 @@ class Task(enum.Enum):
     CHAT_COMPLETION = "chat-completion"
     TOOL_SELECTION = "tool-selection"
     CALL_WITHIN_TOOL = "call-within-tool"
+    HISTORY_SUMMARY = "history-summary"
 
 
 class TokenType(enum.Enum):
@@ -85,6 +92,21 @@ class Threads(Base):
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(UUID, nullable=False)
+    # Rolling summary of the messages older than the history window
+    summary: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Creation date of the last message included in the summary
+    summary_date: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Storage key of the messages of the thread, if archived
+    archive_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    archive_date: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Search document of the user and AI messages, kept up to date by a trigger
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, nullable=True, deferred=True
+    )
     messages: Mapped[list["Messages"]] = relationship(
         "Messages",
         back_populates="thread",
@@ -92,6 +114,33 @@ class Threads(Base):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Listing of the threads of a project, the thread_id breaks the ties
+        Index(
+            "ix_threads_user_project_update_date",
+            "user_id",
+            "vlab_id",
+            "project_id",
+            "update_date",
+            "thread_id",
+        ),
+        Index(
+            "ix_threads_user_project_creation_date",
+            "user_id",
+            "vlab_id",
+            "project_id",
+            "creation_date",
+            "thread_id",
+        ),
+        Index("ix_threads_search_vector", "search_vector", postgresql_using="gin"),
+        # Threads to archive
+        Index(
+            "ix_threads_update_date_not_archived",
+            "update_date",
+            postgresql_where=text("archive_key IS NULL"),
+        ),
+    )
+
 
 class Messages(Base):
     """SQL table for the messsages in the threads."""
@@ -104,8 +153,27 @@ class Messages(Base):
         DateTime(timezone=True), default=utc_now
     )
     entity: Mapped[Entity] = mapped_column(Enum(Entity), nullable=False)
-    content: Mapped[str] = mapped_column(String, nullable=False)
+    content: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
     is_complete: Mapped[bool] = mapped_column(Boolean)
+    # Fields of the content computed by the database, to list the messages
+    # without decoding their whole content
+    role: Mapped[str | None] = mapped_column(
+        String, Computed("content ->> 'role'", persisted=True)
+    )
+    # Only the text of the user and AI messages, tool results are not duplicated
+    text_content: Mapped[str | None] = mapped_column(
+        String,
+        Computed(
+            "CASE WHEN entity IN ('USER', 'AI_MESSAGE') THEN content ->> 'content' END",
+            persisted=True,
+        ),
+    )
+    reasoning: Mapped[str | None] = mapped_column(
+        String, Computed("content ->> 'reasoning'", persisted=True)
+    )
+    tool_call_id: Mapped[str | None] = mapped_column(
+        String, Computed("content ->> 'tool_call_id'", persisted=True)
+    )
 
     thread_id: Mapped[uuid.UUID] = mapped_column(
         UUID, ForeignKey("threads.thread_id"), nullable=False
@@ -123,11 +191,29 @@ class Messages(Base):
     token_consumption: Mapped[list["TokenConsumption"]] = relationship(
         "TokenConsumption", cascade="all, delete-orphan"
     )
+    storage_artifacts: Mapped[list["StorageArtifacts"]] = relationship(
+        "StorageArtifacts", cascade="all, delete-orphan"
+    )
     search_vector: Mapped[str] = mapped_column(TSVECTOR, nullable=True)
 
     __table_args__ = (
         # GIN index for full-text search performance
         Index("ix_messages_search_vector", "search_vector", postgresql_using="gin"),
+        # Search of partial words in the user and AI messages (pg_trgm)
+        Index(
+            "ix_messages_text_content_trgm",
+            "text_content",
+            postgresql_using="gin",
+            postgresql_ops={"text_content": "gin_trgm_ops"},
+            postgresql_where=text("entity IN ('USER', 'AI_MESSAGE')"),
+        ),
+        # Loading and pagination of the messages of a thread
+        Index(
+            "ix_messages_thread_id_creation_date_message_id",
+            "thread_id",
+            "creation_date",
+            "message_id",
+        ),
     )
 
 
@@ -141,7 +227,7 @@ class ToolCalls(Base):
     validated: Mapped[bool] = mapped_column(Boolean, nullable=True)
 
     message_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey("messages.message_id")
+        UUID, ForeignKey("messages.message_id"), index=True
     )
     message: Mapped[Messages] = relationship("Messages", back_populates="tool_calls")
 
@@ -155,7 +241,7 @@ class ToolSelection(Base):
     )
     tool_name: Mapped[str] = mapped_column(String, nullable=False)
     message_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey("messages.message_id")
+        UUID, ForeignKey("messages.message_id"), index=True
     )
 
 
@@ -172,7 +258,7 @@ class ComplexityEstimation(Base):
         Enum(ReasoningLevels), nullable=True
     )
     message_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey("messages.message_id")
+        UUID, ForeignKey("messages.message_id"), index=True
     )
 
 
@@ -184,9 +270,70 @@ class TokenConsumption(Base):
         UUID, primary_key=True, default=lambda: uuid.uuid4()
     )
     message_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey("messages.message_id")
+        UUID, ForeignKey("messages.message_id"), index=True
     )
     type: Mapped[TokenType] = mapped_column(Enum(TokenType), nullable=False)
     task: Mapped[Task] = mapped_column(Enum(Task), nullable=False)
     count: Mapped[int] = mapped_column(Integer, nullable=False)
     model: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class TokenUsageDaily(Base):
+    """SQL table of the token consumption summed per day.
+
+    Rows are upserted by a trigger on `token_consumption`, and kept when the
+    threads are deleted.
+    """
+
+    __tablename__ = "token_usage_daily"
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID, primary_key=True, default=lambda: uuid.uuid4()
+    )
+    day: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID, nullable=False)
+    vlab_id: Mapped[uuid.UUID | None] = mapped_column(UUID, nullable=True)
+    project_id: Mapped[uuid.UUID | None] = mapped_column(UUID, nullable=True)
+    model: Mapped[str] = mapped_column(String, nullable=False)
+    task: Mapped[Task] = mapped_column(Enum(Task), nullable=False)
+    type: Mapped[TokenType] = mapped_column(Enum(TokenType), nullable=False)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        # Target of the upserts, and usage of a user
+        UniqueConstraint(
+            "user_id",
+            "day",
+            "vlab_id",
+            "project_id",
+            "model",
+            "task",
+            "type",
+            name="uq_token_usage_daily_user_day",
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Usage of a project
+        Index("ix_token_usage_daily_project_day", "vlab_id", "project_id", "day"),
+    )
+
+
+class StorageArtifacts(Base):
+    """SQL table indexing the storage objects created in the threads."""
+
+    __tablename__ = "storage_artifacts"
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID, primary_key=True, default=lambda: uuid.uuid4()
+    )
+    key: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    creation_date: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )
+    thread_id: Mapped[uuid.UUID] = mapped_column(
+        UUID,
+        ForeignKey("threads.thread_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Null for the objects indexed by the backfill
+    message_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID, ForeignKey("messages.message_id"), nullable=True, index=True
+    )
@@ -0,0 +1,281 @@
+"""Write-behind persistence of the messages produced while streaming."""
+
+import asyncio
+import logging
+import uuid
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from sqlalchemy import Table, insert, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from neuroagent.app.database.sql_schemas import Base, Messages, Threads, utc_now
+
+logger = logging.getLogger(__name__)
+
+
+def to_row(instance: Base) -> dict[str, Any]:
+    """Get the column values of an ORM instance, filling in the python defaults.
+
+    The columns computed by the database are left out. The defaults are also set
+    on the instance, so that it holds the values written in the database.
+    """
+    row = {}
+    for column in instance.__table__.columns:
+        if column.computed is not None:
+            continue
+        value = getattr(instance, column.key)
+        if value is None and column.default is not None:
+            default = column.default
+            value = default.arg(None) if default.is_callable else default.arg
+            setattr(instance, column.key, value)
+        row[column.key] = value
+    return row
+
+
+@dataclass
+class ThreadBatch:
+    """Buffered writes of a thread, committed or rolled back together."""
+
+    # Rows to insert, per table, in insertion order
+    rows: dict[Table, list[dict[str, Any]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    # Messages of the rows, to report a failed write to their turn
+    messages: list[Messages] = field(default_factory=list)
+    # Messages of finished turns, to mark as complete
+    finished: list[Messages] = field(default_factory=list)
+
+
+class MessageWriter:
+    """Append the messages to the database as soon as they are final.
+
+    Messages submitted by the concurrent streams of the worker are buffered and
+    inserted together every `flush_interval` seconds with bulk
+    `INSERT ... RETURNING` statements, bypassing the ORM unit of work. The
+    messages are written with `is_complete=False` until their turn is finished
+    with `finish_turn`. If the worker dies in the middle of a turn, the messages
+    already written are therefore seen as interrupted by the next request.
+
+    If the batch cannot be written, for instance because a thread was deleted
+    during its stream, each thread is written again in its own transaction so
+    that only the failing threads lose their messages. The following messages
+    of a failing thread are dropped as well, so that no message is written
+    without the ones it follows, until the failure is raised by the
+    `finish_turn` of their turn.
+
+    Parameters
+    ----------
+    engine : AsyncEngine
+        Engine of the database.
+    flush_interval : float
+        Time in seconds during which the messages are gathered before a flush.
+    max_batch_size : int
+        Number of buffered messages above which the flush starts right away.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 1000,
+    ) -> None:
+        self.engine = engine
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+
+        self._batches: dict[uuid.UUID, ThreadBatch] = defaultdict(ThreadBatch)
+        self._n_messages = 0
+        # Messages written as incomplete until the end of their turn, with the
+        # error of their write if it failed. Weak, so that the messages of the
+        # turns that never finish (e.g. client disconnects) are dropped with
+        # their request.
+        self._in_flight: weakref.WeakKeyDictionary[Messages, Exception | None] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Error of the threads whose write failed, until the end of their turn
+        self._failed: dict[uuid.UUID, Exception] = {}
+        self._waiters: list[asyncio.Future[None]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the flushing loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Write the pending messages and stop the flushing loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush()
+
+    async def __aenter__(self) -> "MessageWriter":
+        """Start the flushing loop."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Write the pending messages and stop the flushing loop."""
+        await self.aclose()
+
+    def submit(self, messages: Sequence[Messages]) -> None:
+        """Queue the messages that are not in the database yet.
+
+        Messages loaded from the database already have an ID and are skipped,
+        so the whole conversation can be passed.
+        """
+        for message in messages:
+            if message.message_id is not None:
+                continue
+            error = self._failed.get(message.thread_id)
+            if error is not None:
+                self._in_flight[message] = error
+                continue
+            row = to_row(message)
+            # Complete once the turn is finished
+            row["is_complete"] = False
+            self._in_flight[message] = None
+            batch = self._batches[message.thread_id]
+            batch.rows[Messages.__table__].append(row)
+            batch.messages.append(message)
+            self._n_messages += 1
+
+            children: list[Base] = [
+                *message.tool_calls,
+                *message.tool_selection,
+                *message.token_consumption,
+                *message.storage_artifacts,
+            ]
+            if message.model_selection is not None:
+                children.append(message.model_selection)
+            for child in children:
+                child.message_id = message.message_id
+                batch.rows[child.__table__].append(to_row(child))
+
+        if self._n_messages:
+            self._wakeup.set()
+
+    async def finish_turn(self, messages: Sequence[Messages]) -> None:
+        """Write the remaining messages of a turn and mark them as complete.
+
+        Waits until the turn is in the database.
+
+        Raises
+        ------
+        RuntimeError
+            If messages of the turn could not be written.
+        """
+        self.submit(messages)
+        turn = [message for message in messages if message in self._in_flight]
+        for message in turn:
+            if message.is_complete and message.thread_id not in self._failed:
+                self._batches[message.thread_id].finished.append(message)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._wakeup.set()
+        await waiter
+
+        errors = [self._in_flight.pop(message, None) for message in turn]
+        if turn:
+            self._failed.pop(turn[0].thread_id, None)
+        for error in errors:
+            if error is not None:
+                raise RuntimeError(
+                    f"Could not write the messages of thread {turn[0].thread_id}."
+                ) from error
+
+    async def _run(self) -> None:
+        """Flush the buffered messages periodically."""
+        while True:
+            await self._wakeup.wait()
+            if self._n_messages < self.max_batch_size:
+                # Gather the messages of the other streams
+                await asyncio.sleep(self.flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Write the buffered rows of all the threads in a single transaction.
+
+        If it fails, the threads are written one transaction each.
+        """
+        self._wakeup.clear()
+        batches, self._batches = self._batches, defaultdict(ThreadBatch)
+        waiters, self._waiters = self._waiters, []
+        self._n_messages = 0
+
+        if batches:
+            try:
+                await self._write(batches)
+            except Exception:
+                logger.warning(
+                    "Could not write the messages of the batch, writing each thread separately.",
+                    exc_info=True,
+                )
+                for thread_id, batch in batches.items():
+                    try:
+                        await self._write({thread_id: batch})
+                    except Exception as error:
+                        logger.exception(
+                            f"Could not write the messages of thread {thread_id}."
+                        )
+                        self._failed[thread_id] = error
+                        # Drop the messages submitted during the write
+                        queued = self._batches.pop(thread_id, ThreadBatch())
+                        self._n_messages -= len(queued.messages)
+                        for message in [
+                            *batch.messages,
+                            *batch.finished,
+                            *queued.messages,
+                        ]:
+                            if message in self._in_flight:
+                                self._in_flight[message] = error
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _write(self, batches: dict[uuid.UUID, ThreadBatch]) -> None:
+        """Write the rows of the given threads in a transaction."""
+        rows: dict[Table, list[dict[str, Any]]] = defaultdict(list)
+        finished: list[uuid.UUID] = []
+        finished_threads: set[uuid.UUID] = set()
+        for thread_id, batch in batches.items():
+            for table, table_rows in batch.rows.items():
+                rows[table].extend(table_rows)
+            if batch.finished:
+                finished.extend(message.message_id for message in batch.finished)
+                finished_threads.add(thread_id)
+
+        async with self.engine.begin() as conn:
+            message_rows = rows.pop(Messages.__table__, [])  # type: ignore
+            if message_rows:
+                written = await conn.execute(
+                    insert(Messages.__table__).returning(  # type: ignore
+                        Messages.__table__.c.message_id
+                    ),
+                    message_rows,
+                )
+                logger.debug(f"Wrote {len(written.all())} messages.")
+            # Children, once their messages exist
+            for table, table_rows in rows.items():
+                await conn.execute(insert(table), table_rows)
+
+            if finished:
+                await conn.execute(
+                    update(Messages)
+                    .where(Messages.message_id.in_(finished))
+                    .values(is_complete=True)
+                )
+                await conn.execute(
+                    update(Threads)
+                    .where(Threads.thread_id.in_(finished_threads))
+                    .values(update_date=utc_now())
+                )
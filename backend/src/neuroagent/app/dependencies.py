@@ -1,124 +1,50 @@
 """App dependencies."""
 
-import json
 import logging
 import re
 from datetime import datetime, timezone
 from functools import cache
 from pathlib import Path
-from typing import Annotated, Any, AsyncIterator
+from typing import TYPE_CHECKING, Annotated, Any, AsyncIterator
+from uuid import UUID
 
 import boto3
 from asgi_correlation_id import correlation_id
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.security import HTTPBearer
 from httpx import AsyncClient, HTTPStatusError, get
 from obp_accounting_sdk import AsyncAccountingSessionFactory
 from openai import AsyncOpenAI
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from starlette.status import HTTP_401_UNAUTHORIZED
 
 from neuroagent.agent_routine import AgentsRoutine
 from neuroagent.app.app_utils import (
+    RateLimitLeases,
+    close_interrupted_turn,
     filter_tools_and_model_by_conversation,
+    load_thread_history,
     validate_project,
 )
 from neuroagent.app.config import Settings
+from neuroagent.app.database.archive import rehydrate_thread
 from neuroagent.app.database.sql_schemas import Entity, Messages, Threads
+from neuroagent.app.database.writer import MessageWriter
 from neuroagent.app.schemas import OpenRouterModelResponse, UserInfo
+from neuroagent.datasets import DatasetStore
 from neuroagent.executor import WasmExecutor
 from neuroagent.mcp import MCPClient, create_dynamic_tool
 from neuroagent.new_types import Agent
-from neuroagent.tools import (
-    AssetDownloadOneTool,
-    AssetGetAllTool,
-    AssetGetOneTool,
-    BrainAtlasGetAllTool,
-    BrainAtlasGetOneTool,
-    BrainRegionGetAllTool,
-    BrainRegionGetOneTool,
-    BrainRegionHierarchyGetAllTool,
-    BrainRegionHierarchyGetOneTool,
-    CellMorphologyGetAllTool,
-    CellMorphologyGetOneTool,
-    CircuitConnectivityMetricsGetOneTool,
-    CircuitGetAllTool,
-    CircuitGetOneTool,
-    CircuitMetricGetOneTool,
-    CircuitNodesetsGetOneTool,
-    CircuitPopulationAnalysisTool,
-    CircuitPopulationGetOneTool,
-    ContributionGetAllTool,
-    ContributionGetOneTool,
-    EditStateTool,
-    ElectricalCellRecordingGetAllTool,
-    ElectricalCellRecordingGetOneTool,
-    EModelGetAllTool,
-    EModelGetOneTool,
-    EphysMetricsGetOneTool,
-    EtypeGetAllTool,
-    EtypeGetOneTool,
-    ExperimentalBoutonDensityGetAllTool,
-    ExperimentalBoutonDensityGetOneTool,
-    ExperimentalNeuronDensityGetAllTool,
-    ExperimentalNeuronDensityGetOneTool,
-    ExperimentalSynapsesPerConnectionGetAllTool,
-    ExperimentalSynapsesPerConnectionGetOneTool,
-    FeedbackSubmitTool,
-    GetStateTool,
-    IonChannelGetAllTool,
-    IonChannelGetOneTool,
-    IonChannelModelGetAllTool,
-    IonChannelModelGetOneTool,
-    IonChannelRecordingGetAllTool,
-    IonChannelRecordingGetOneTool,
-    LiteratureSearchTool,
-    MeasurementAnnotationGetAllTool,
-    MeasurementAnnotationGetOneTool,
-    MEModelGetAllTool,
-    MEModelGetOneTool,
-    MorphometricsGetOneTool,
-    MtypeGetAllTool,
-    MtypeGetOneTool,
-    OBIExpertTool,
-    OrganizationGetAllTool,
-    OrganizationGetOneTool,
-    PersonGetAllTool,
-    PersonGetOneTool,
-    PlotElectricalCellRecordingGetOneTool,
-    PlotMorphologyGetOneTool,
-    ReadPaperTool,
-    RunPythonTool,
-    SimulationCampaignGetAllTool,
-    SimulationCampaignGetOneTool,
-    SimulationExecutionGetAllTool,
-    SimulationExecutionGetOneTool,
-    SimulationGenerationGetAllTool,
-    SimulationGenerationGetOneTool,
-    SimulationGetAllTool,
-    SimulationGetOneTool,
-    SimulationResultGetAllTool,
-    SimulationResultGetOneTool,
-    SingleNeuronSimulationGetAllTool,
-    SingleNeuronSimulationGetOneTool,
-    SingleNeuronSynaptomeGetAllTool,
-    SingleNeuronSynaptomeGetOneTool,
-    SingleNeuronSynaptomeSimulationGetAllTool,
-    SingleNeuronSynaptomeSimulationGetOneTool,
-    SpeciesGetAllTool,
-    SpeciesGetOneTool,
-    StrainGetAllTool,
-    StrainGetOneTool,
-    SubjectGetAllTool,
-    SubjectGetOneTool,
-    ValidateStateTool,
-    WebSearchTool,
-)
 from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import ToolEntry, get_tool_manifest, load_tool
 from neuroagent.utils import extract_frontend_context
 
+if TYPE_CHECKING:
+    from neuroagent.app.health import ToolHealthProber
+
 logger = logging.getLogger(__name__)
 
 
@@ -169,6 +95,11 @@ def get_python_sandbox(request: Request) -> WasmExecutor:
     return request.app.state.python_sandbox
 
 
+def get_dataset_store(request: Request) -> DatasetStore | None:
+    """Get the store of the datasets shared with the python sandbox."""
+    return getattr(request.app.state, "dataset_store", None)
+
+
 async def get_openai_client(
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> AsyncIterator[AsyncOpenAI | None]:
@@ -228,11 +159,52 @@ def get_connection_string(
         return None
 
 
+def get_replica_connection_string(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> str | None:
+    """Get the connection string of the read replica, if any."""
+    if not settings.db.replica_host:
+        return None
+    replica_db = settings.db.model_copy(
+        update={
+            "host": settings.db.replica_host,
+            "port": settings.db.replica_port or settings.db.port,
+        }
+    )
+    return get_connection_string(settings.model_copy(update={"db": replica_db}))
+
+
 def get_engine(request: Request) -> AsyncEngine | None:
     """Get the SQL engine."""
     return request.app.state.engine
 
 
+def get_replica_engine(request: Request) -> AsyncEngine | None:
+    """Get the SQL engine of the read replica, if any."""
+    return getattr(request.app.state, "replica_engine", None)
+
+
+def get_message_writer(request: Request) -> MessageWriter | None:
+    """Get the write-behind writer of the messages, if enabled."""
+    return getattr(request.app.state, "message_writer", None)
+
+
+def get_redis_client(request: Request) -> aioredis.Redis | None:
+    """Get the Redis client from app state.
+
+    Parameters
+    ----------
+    request : Request
+        The FastAPI request object
+
+    Returns
+    -------
+    aioredis.Redis | None
+        The Redis client instance or None if not configured
+    """
+    return request.app.state.redis_client
+
+
 async def get_session(
     engine: Annotated[AsyncEngine | None, Depends(get_engine)],
 ) -> AsyncIterator[AsyncSession]:
@@ -268,6 +240,109 @@ async def get_user_info(
         raise HTTPException(status_code=404, detail="User info url not provided.")
 
 
+def last_write_key(user_sub: UUID) -> str:
+    """Get the redis key marking the users who wrote recently."""
+    return f"last_write:{user_sub}"
+
+
+async def mark_write(
+    redis_client: aioredis.Redis | None, user_sub: UUID, settings: Settings
+) -> None:
+    """Mark the user as having written, for `replica_max_staleness` seconds."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(
+            last_write_key(user_sub),
+            1,
+            px=int(settings.db.replica_max_staleness * 1000),
+        )
+    except RedisError:
+        logger.warning("Could not record the write of the user.", exc_info=True)
+
+
+async def record_write(
+    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> AsyncIterator[None]:
+    """Mark the user as having written, for the routes that write.
+
+    The mark is set for the duration of the request and renewed once the
+    response and its background tasks are done, so that `get_read_session`
+    reads from the primary during the `replica_max_staleness` seconds after.
+    """
+    await mark_write(redis_client, user_info.sub, settings)
+    try:
+        yield
+    finally:
+        await mark_write(redis_client, user_info.sub, settings)
+
+
+async def get_read_engine(
+    engine: Annotated[AsyncEngine | None, Depends(get_engine)],
+    replica_engine: Annotated[AsyncEngine | None, Depends(get_replica_engine)],
+    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+) -> AsyncEngine:
+    """Get the engine to read from, the read replica if possible.
+
+    Users who wrote less than `replica_max_staleness` seconds ago, as recorded
+    by `record_write`, read from the primary to see their own writes. Without
+    redis to record the writes, the primary is always used.
+    """
+    if not engine:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": "Couldn't connect to the SQL DB.",
+            },
+        )
+    if replica_engine is not None and redis_client is not None:
+        try:
+            if not await redis_client.exists(last_write_key(user_info.sub)):
+                return replica_engine
+        except RedisError:
+            logger.warning("Could not check the last write of the user.", exc_info=True)
+    return engine
+
+
+async def get_read_session(
+    read_engine: Annotated[AsyncEngine, Depends(get_read_engine)],
+) -> AsyncIterator[AsyncSession]:
+    """Yield a read-only session per request, on the read replica if possible."""
+    async with AsyncSession(read_engine) as session:
+        yield session
+
+
+@cache
+def get_s3_client(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> Any:
+    """Get the S3 client, shared across requests to reuse its connection pool."""
+    if settings.storage.access_key is None:
+        access_key = None
+    else:
+        access_key = settings.storage.access_key.get_secret_value()
+
+    if settings.storage.secret_key is None:
+        secret_key = None
+    else:
+        secret_key = settings.storage.secret_key.get_secret_value()
+
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.storage.endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        aws_session_token=None,
+        config=boto3.session.Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.storage.max_pool_connections,
+        ),
+    )
+
+
 async def get_thread(
     user_info: Annotated[UserInfo, Depends(get_user_info)],
     thread_id: str,
@@ -295,6 +370,78 @@ async def get_thread(
     return thread
 
 
+async def rehydrate_archived_thread(
+    thread: Annotated[Threads, Depends(get_thread)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    s3_client: Annotated[Any, Depends(get_s3_client)],
+    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+) -> bool:
+    """Move the messages of an archived thread back to the database.
+
+    Returns whether the thread was archived. Its user then reads from the
+    primary until the replica has the messages.
+    """
+    if thread.archive_key is None:
+        return False
+    await rehydrate_thread(
+        session=session,
+        s3_client=s3_client,
+        bucket_name=settings.storage.bucket_name,
+        thread=thread,
+    )
+    await mark_write(redis_client, user_info.sub, settings)
+    return True
+
+
+async def get_rehydrated_thread(
+    thread: Annotated[Threads, Depends(get_thread)],
+    _: Annotated[bool, Depends(rehydrate_archived_thread)],
+) -> Threads:
+    """Get the thread, with the messages of an archived thread moved back to the database.
+
+    Only for the routes that read the messages of the thread.
+    """
+    return thread
+
+
+async def get_thread_read_session(
+    rehydrated: Annotated[bool, Depends(rehydrate_archived_thread)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    engine: Annotated[AsyncEngine | None, Depends(get_engine)],
+    replica_engine: Annotated[AsyncEngine | None, Depends(get_replica_engine)],
+    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+) -> AsyncIterator[AsyncSession]:
+    """Yield a read-only session for the messages of a thread, rehydrated first.
+
+    The messages of a thread rehydrated by the request are read from the
+    primary, as the replica may not have them yet.
+    """
+    if rehydrated:
+        yield session
+        return
+    read_engine = await get_read_engine(engine, replica_engine, user_info, redis_client)
+    async with AsyncSession(read_engine) as read_session:
+        yield read_session
+
+
+async def get_thread_history(
+    thread: Annotated[Threads, Depends(get_rehydrated_thread)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> list[Messages]:
+    """Load the messages of the last turns of the thread."""
+    messages = await load_thread_history(
+        session=session,
+        thread_id=thread.thread_id,
+        max_turns=settings.agent.history_max_turns,
+    )
+    close_interrupted_turn(messages)
+    return messages
+
+
 def get_mcp_client(request: Request) -> MCPClient | None:
     """Get the MCP client from the app state."""
     if request.app.state.mcp_client is None:
@@ -376,122 +523,65 @@ def get_mcp_tool_list(
                 else None,
                 utterance_list=tool_metadata.utterances if tool_metadata else None,
                 input_schema_serialized=tool.inputSchema,
-                session=mcp_client.sessions[server_name],
+                server=mcp_client.servers[server_name],
+                idempotent=tool_metadata.idempotent if tool_metadata else False,
             )
             dynamic_tools.append(dynamic_tool)
 
     return dynamic_tools
 
 
+# Internal tools of the manifest that are not offered to the agent
+EXAMPLE_TOOLS = frozenset({"WeatherTool"})
+
+
+@cache
+def get_whitelisted_tools(
+    mcp_tool_list: tuple[type[BaseTool], ...], whitelisted_tool_regex: str | None
+) -> tuple[ToolEntry, ...]:
+    """Get the internal and MCP tools matching the whitelist, filtered once."""
+    all_tools: list[ToolEntry] = [
+        tool
+        for class_name, tool in get_tool_manifest().items()
+        if class_name not in EXAMPLE_TOOLS
+    ] + list(mcp_tool_list)
+
+    return (
+        tuple(tool for tool in all_tools if re.match(whitelisted_tool_regex, tool.name))
+        if whitelisted_tool_regex
+        else ()
+    )
+
+
 def get_tool_list(
     mcp_tool_list: Annotated[list[type[BaseTool]], Depends(get_mcp_tool_list)],
     settings: Annotated[Settings, Depends(get_settings)],
-) -> list[type[BaseTool]]:
-    """Return a raw list of all of the available tools."""
-    internal_tool_list: list[type[BaseTool]] = [
-        AssetDownloadOneTool,
-        AssetGetAllTool,
-        AssetGetOneTool,
-        BrainAtlasGetAllTool,
-        BrainAtlasGetOneTool,
-        BrainRegionGetAllTool,
-        BrainRegionGetOneTool,
-        BrainRegionHierarchyGetAllTool,
-        BrainRegionHierarchyGetOneTool,
-        CellMorphologyGetAllTool,
-        CellMorphologyGetOneTool,
-        CircuitConnectivityMetricsGetOneTool,
-        CircuitGetAllTool,
-        CircuitGetOneTool,
-        CircuitMetricGetOneTool,
-        CircuitNodesetsGetOneTool,
-        CircuitPopulationAnalysisTool,
-        CircuitPopulationGetOneTool,
-        ContributionGetAllTool,
-        ContributionGetOneTool,
-        ElectricalCellRecordingGetAllTool,
-        ElectricalCellRecordingGetOneTool,
-        EModelGetAllTool,
-        EModelGetOneTool,
-        EphysMetricsGetOneTool,
-        EtypeGetAllTool,
-        EtypeGetOneTool,
-        ExperimentalBoutonDensityGetAllTool,
-        ExperimentalBoutonDensityGetOneTool,
-        FeedbackSubmitTool,
-        ExperimentalNeuronDensityGetAllTool,
-        ExperimentalNeuronDensityGetOneTool,
-        ExperimentalSynapsesPerConnectionGetAllTool,
-        ExperimentalSynapsesPerConnectionGetOneTool,
-        EditStateTool,
-        GetStateTool,
-        IonChannelGetAllTool,
-        IonChannelGetOneTool,
-        IonChannelModelGetAllTool,
-        IonChannelModelGetOneTool,
-        IonChannelRecordingGetAllTool,
-        IonChannelRecordingGetOneTool,
-        LiteratureSearchTool,
-        MeasurementAnnotationGetAllTool,
-        MeasurementAnnotationGetOneTool,
-        MEModelGetAllTool,
-        MEModelGetOneTool,
-        MorphometricsGetOneTool,
-        MtypeGetAllTool,
-        MtypeGetOneTool,
-        OBIExpertTool,
-        OrganizationGetAllTool,
-        OrganizationGetOneTool,
-        PersonGetAllTool,
-        PersonGetOneTool,
-        PlotElectricalCellRecordingGetOneTool,
-        PlotMorphologyGetOneTool,
-        SimulationCampaignGetAllTool,
-        SimulationCampaignGetOneTool,
-        SimulationExecutionGetAllTool,
-        SimulationExecutionGetOneTool,
-        SimulationGenerationGetAllTool,
-        SimulationGenerationGetOneTool,
-        SimulationGetAllTool,
-        SimulationGetOneTool,
-        SimulationResultGetAllTool,
-        SimulationResultGetOneTool,
-        SingleNeuronSimulationGetAllTool,
-        SingleNeuronSimulationGetOneTool,
-        SingleNeuronSynaptomeGetAllTool,
-        SingleNeuronSynaptomeGetOneTool,
-        SingleNeuronSynaptomeSimulationGetAllTool,
-        SingleNeuronSynaptomeSimulationGetOneTool,
-        SpeciesGetAllTool,
-        SpeciesGetOneTool,
-        StrainGetAllTool,
-        StrainGetOneTool,
-        SubjectGetAllTool,
-        SubjectGetOneTool,
-        ReadPaperTool,
-        RunPythonTool,
-        ValidateStateTool,
-        WebSearchTool,
-        # NowTool,
-        # WeatherTool,
-    ]
+) -> list[ToolEntry]:
+    """Return a raw list of all of the available tools.
+
+    The internal tools are imported once selected, see `load_tool`.
+    """
+    return list(
+        get_whitelisted_tools(
+            tuple(mcp_tool_list), settings.tools.whitelisted_tool_regex
+        )
+    )
 
-    all_tools = internal_tool_list + mcp_tool_list
 
-    return (
-        [
-            tool
-            for tool in all_tools
-            if re.match(settings.tools.whitelisted_tool_regex, tool.name)
-        ]
-        if settings.tools.whitelisted_tool_regex
-        else []
+def get_app_tool_list(fastapi_app: FastAPI) -> list[ToolEntry]:
+    """Get the tools of the app outside of a request, including the MCP tools."""
+    settings = fastapi_app.dependency_overrides.get(get_settings, get_settings)()
+    mcp_tool_list = fastapi_app.dependency_overrides.get(
+        get_mcp_tool_list, get_mcp_tool_list
+    )(getattr(fastapi_app.state, "mcp_client", None), settings)
+    return fastapi_app.dependency_overrides.get(get_tool_list, get_tool_list)(
+        mcp_tool_list=mcp_tool_list, settings=settings
     )
 
 
 async def get_selected_tools(
-    request: Request, tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)]
-) -> list[type[BaseTool]]:
+    request: Request, tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)]
+) -> list[ToolEntry]:
     """Get tools specified in the header from the frontend."""
     if request.method == "GET":
         return tool_list
@@ -510,13 +600,14 @@ async def get_selected_tools(
 async def filtered_tools(
     request: Request,
     thread: Annotated[Threads, Depends(get_thread)],
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_selected_tools)],
+    messages: Annotated[list[Messages], Depends(get_thread_history)],
+    tool_list: Annotated[list[ToolEntry], Depends(get_selected_tools)],
     openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
     settings: Annotated[Settings, Depends(get_settings)],
     filtered_models: Annotated[
         list[OpenRouterModelResponse], Depends(get_openrouter_models)
     ],
-) -> tuple[list[type[BaseTool]], dict[str, str | None]]:
+) -> tuple[list[ToolEntry], dict[str, str | None]]:
     """Based on the current conversation, select relevant tools."""
     if request.method == "GET":
         return tool_list, {
@@ -526,8 +617,6 @@ async def filtered_tools(
 
     body = await request.json()
 
-    # Awaiting here makes downstream calls already loaded so no performance issue
-    messages: list[Messages] = await thread.awaitable_attrs.messages
     if (
         not messages
         or messages[-1].entity == Entity.AI_MESSAGE
@@ -537,7 +626,7 @@ async def filtered_tools(
             Messages(
                 thread_id=thread.thread_id,
                 entity=Entity.USER,
-                content=json.dumps({"role": "user", "content": body["content"]}),
+                content={"role": "user", "content": body["content"]},
                 is_complete=True,
             )
         )
@@ -673,16 +762,25 @@ DO NOT assume relevance of these IDs unless the user specifies. For queries abou
 
 async def get_starting_agent(
     tool_list_model_reasoning: Annotated[
-        tuple[list[type[BaseTool]], dict[str, str | None]], Depends(filtered_tools)
+        tuple[list[ToolEntry], dict[str, str | None]], Depends(filtered_tools)
     ],
     system_prompt: Annotated[str, Depends(get_system_prompt)],
     settings: Annotated[Settings, Depends(get_settings)],
+    thread: Annotated[Threads, Depends(get_thread)],
 ) -> Agent:
     """Get the starting agent."""
+    if thread.summary:
+        # The messages it covers are outside of the loaded history
+        system_prompt += f"""
+
+# SUMMARY OF THE EARLIER CONVERSATION
+
+{thread.summary}"""
+
     agent = Agent(
         name="Agent",
         instructions=system_prompt,
-        tools=tool_list_model_reasoning[0],
+        tools=[load_tool(tool) for tool in tool_list_model_reasoning[0]],
         model=tool_list_model_reasoning[1]["model"],  # type: ignore
         reasoning=tool_list_model_reasoning[1].get("reasoning"),
         temperature=settings.llm.temperature,
@@ -691,30 +789,6 @@ async def get_starting_agent(
     return agent
 
 
-def get_s3_client(
-    settings: Annotated[Settings, Depends(get_settings)],
-) -> Any:
-    """Get the S3 client."""
-    if settings.storage.access_key is None:
-        access_key = None
-    else:
-        access_key = settings.storage.access_key.get_secret_value()
-
-    if settings.storage.secret_key is None:
-        secret_key = None
-    else:
-        secret_key = settings.storage.secret_key.get_secret_value()
-
-    return boto3.client(
-        "s3",
-        endpoint_url=settings.storage.endpoint_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        aws_session_token=None,
-        config=boto3.session.Config(signature_version="s3v4"),
-    )
-
-
 async def get_context_variables(
     request: Request,
     settings: Annotated[Settings, Depends(get_settings)],
@@ -724,6 +798,7 @@ async def get_context_variables(
     user_info: Annotated[UserInfo, Depends(get_user_info)],
     openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
     python_sandbox: Annotated[WasmExecutor, Depends(get_python_sandbox)],
+    dataset_store: Annotated[DatasetStore | None, Depends(get_dataset_store)],
 ) -> dict[str, Any]:
     """Get the context variables to feed the tool's metadata."""
     # Get the current frontend url
@@ -741,6 +816,7 @@ async def get_context_variables(
         "bucket_name": settings.storage.bucket_name,
         "entitycore_url": settings.tools.entitycore.url,
         "current_frontend_url": current_frontend_url,
+        "dataset_store": dataset_store,
         "entity_frontend_url": entity_frontend_url,
         "exa_api_key": settings.tools.exa_api_key.get_secret_value()
         if settings.tools.exa_api_key
@@ -754,8 +830,12 @@ async def get_context_variables(
         "request_id": request_id,
         "s3_client": s3_client,
         "sanity_url": settings.tools.sanity.url,
+        "storage_compress_json": settings.storage.compress_json,
+        "storage_content_addressed": settings.storage.content_addressed,
         "storage_frontend_url": storage_frontend_url,
+        "storage_upload_concurrency": settings.storage.upload_concurrency,
         "shared_state": shared_state,
+        "storage_dict": {},
         "thread_id": thread.thread_id,
         "thumbnail_generation_url": settings.tools.thumbnail_generation.url,
         "usage_dict": {},
@@ -795,17 +875,11 @@ def get_agents_routine(
         return AgentsRoutine(openai_client)
 
 
-def get_redis_client(request: Request) -> aioredis.Redis | None:
-    """Get the Redis client from app state.
+def get_rate_limit_leases(request: Request) -> RateLimitLeases | None:
+    """Get the requests leased by the worker from the rate limiter."""
+    return request.app.state.rate_limit_leases
 
-    Parameters
-    ----------
-    request : Request
-        The FastAPI request object
 
-    Returns
-    -------
-    aioredis.Redis | None
-        The Redis client instance or None if not configured
-    """
-    return request.app.state.redis_client
+def get_tool_health_prober(request: Request) -> "ToolHealthProber":
+    """Get the background health checks of the tools."""
+    return request.app.state.tool_health
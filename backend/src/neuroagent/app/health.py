@@ -0,0 +1,130 @@
+"""Background health checks of the tools."""
+
+import asyncio
+import inspect
+import logging
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from neuroagent.app.config import Settings
+from neuroagent.app.dependencies import get_app_tool_list, get_healthcheck_variables
+from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import load_tool
+
+logger = logging.getLogger(__name__)
+
+
+def get_healthcheck_kwargs(
+    tool_class: type[BaseTool], healthcheck_variables: dict[str, Any]
+) -> dict[str, Any]:
+    """Get the healthcheck variables required by the `is_online` of a tool."""
+    is_online_params = inspect.signature(tool_class.is_online).parameters
+    return {
+        param: healthcheck_variables[param]
+        for param in is_online_params
+        if param in healthcheck_variables
+    }
+
+
+class ToolHealthProber:
+    """Check the tools on an interval and keep their online status.
+
+    The tools calling the same upstream (e.g. the `/health` of entitycore) are
+    checked once per round: they are grouped by the urls given to their
+    `is_online`, and one tool per group is checked. The groups are checked
+    concurrently, each with a timeout, so that a slow upstream only marks its
+    own tools offline.
+
+    The checks start with the first request needing them, so that the workers
+    not serving the tool panel do not check the upstreams.
+    """
+
+    def __init__(self, fastapi_app: FastAPI, settings: Settings) -> None:
+        self.fastapi_app = fastapi_app
+        self.interval = settings.tools.health_check_interval
+        self.timeout = settings.tools.health_check_timeout
+        self.settings = settings
+        # Online status by tool name, replaced after each round
+        self.status: dict[str, bool] = {}
+        # Set once the first round is done
+        self.checked = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start checking the tools in the background, if not started."""
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def get_status(self) -> dict[str, bool]:
+        """Get the online status of the tools, waiting for the first check."""
+        self.start()
+        await self.checked.wait()
+        return self.status
+
+    async def stop(self) -> None:
+        """Stop checking the tools."""
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def run(self) -> None:
+        """Check the tools until cancelled."""
+        async with AsyncClient(
+            timeout=self.timeout,
+            verify=False,  # nosec: B501
+        ) as client:
+            healthcheck_variables = get_healthcheck_variables(self.settings, client)
+            while True:
+                try:
+                    await self.check(healthcheck_variables)
+                except Exception:
+                    logger.exception("Could not check the online status of the tools.")
+                self.checked.set()
+                await asyncio.sleep(self.interval)
+
+    async def check(self, healthcheck_variables: dict[str, Any]) -> None:
+        """Check the tools once, one per upstream."""
+        # Importing the tools is slow the first time
+        tool_classes = await asyncio.to_thread(
+            lambda: [load_tool(tool) for tool in get_app_tool_list(self.fastapi_app)]
+        )
+
+        groups: dict[tuple[Any, ...], list[type[BaseTool]]] = {}
+        for tool_class in tool_classes:
+            kwargs = get_healthcheck_kwargs(tool_class, healthcheck_variables)
+            upstream = tuple(
+                sorted(
+                    (param, value)
+                    for param, value in kwargs.items()
+                    if isinstance(value, str)
+                )
+            )
+            groups.setdefault(upstream or (tool_class.name,), []).append(tool_class)
+
+        results = await asyncio.gather(
+            *(
+                self.is_online(
+                    tool_classes[0],
+                    get_healthcheck_kwargs(tool_classes[0], healthcheck_variables),
+                )
+                for tool_classes in groups.values()
+            )
+        )
+        self.status = {
+            tool_class.name: is_online
+            for tool_classes, is_online in zip(groups.values(), results)
+            for tool_class in tool_classes
+        }
+
+    async def is_online(
+        self, tool_class: type[BaseTool], kwargs: dict[str, Any]
+    ) -> bool:
+        """Check a tool, offline if it fails or times out."""
+        try:
+            return await asyncio.wait_for(tool_class.is_online(**kwargs), self.timeout)
+        except Exception:
+            logger.warning(f"Tool {tool_class.name} is offline.", exc_info=True)
+            return False
@@ -10,7 +10,6 @@ from uuid import uuid4
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.openapi.utils import get_openapi
 from obp_accounting_sdk import AsyncAccountingSessionFactory
 from obp_accounting_sdk.errors import (
     AccountingReservationError,
@@ -21,19 +20,29 @@ from redis import asyncio as aioredis
 from starlette import status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from neuroagent import __version__
-from neuroagent.app.app_utils import setup_engine
+from neuroagent.app.app_utils import (
+    RateLimitLeases,
+    check_db_connection,
+    setup_engine,
+)
 from neuroagent.app.config import Settings
+from neuroagent.app.database.pool import MeteredPool
+from neuroagent.app.database.writer import MessageWriter
 from neuroagent.app.dependencies import (
+    get_app_tool_list,
     get_connection_string,
     get_mcp_tool_list,
+    get_replica_connection_string,
     get_settings,
-    get_tool_list,
 )
+from neuroagent.app.health import ToolHealthProber
 from neuroagent.app.middleware import strip_path_prefix
-from neuroagent.app.routers import qa, rate_limit, storage, threads, tools
+from neuroagent.app.openapi import build_openapi_document, get_openapi_document
+from neuroagent.app.routers import analytics, qa, rate_limit, storage, threads, tools
+from neuroagent.datasets import DatasetStore
 from neuroagent.executor import WasmExecutor
 from neuroagent.mcp import MCPClient
 
@@ -99,11 +108,39 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncContextManager[None]:  # type:
         fastapi_app.state.redis_client = redis_client
     else:
         fastapi_app.state.redis_client = None
+    fastapi_app.state.rate_limit_leases = (
+        RateLimitLeases(app_settings.rate_limiter.lease_size)
+        if fastapi_app.state.redis_client is not None
+        and app_settings.rate_limiter.lease_size > 1
+        else None
+    )
 
     # Get the sqlalchemy engine and store it in app state.
     engine = setup_engine(app_settings, get_connection_string(app_settings))
+    if engine:
+        await check_db_connection(engine)
     fastapi_app.state.engine = engine
 
+    # Optional read replica for the read only endpoints
+    replica_engine = None
+    replica_connection_string = get_replica_connection_string(app_settings)
+    if replica_connection_string:
+        replica_engine = setup_engine(app_settings, replica_connection_string)
+        if replica_engine:
+            await check_db_connection(replica_engine)
+    fastapi_app.state.replica_engine = replica_engine
+
+    # Write-behind persistence of the streamed messages
+    message_writer = None
+    if engine and app_settings.db.write_behind:
+        message_writer = MessageWriter(
+            engine,
+            flush_interval=app_settings.db.write_behind_interval,
+            max_batch_size=app_settings.db.write_behind_batch_size,
+        )
+        message_writer.start()
+    fastapi_app.state.message_writer = message_writer
+
     prefix = app_settings.misc.application_prefix
     fastapi_app.openapi_url = f"{prefix}/openapi.json"
     fastapi_app.servers = [{"url": prefix}]
@@ -134,6 +171,7 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncContextManager[None]:  # type:
         imports = [
             "numpy",
             "pandas",
+            "pyarrow",
             "pydantic",
             "scikit-learn",
             "scipy",
@@ -147,6 +185,13 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncContextManager[None]:  # type:
             )
             imports += [f"file:{wheel.absolute()}" for wheel in extra_wheel_list]
 
+        # Tool outputs shared with the python sandbox
+        dataset_store = DatasetStore(
+            max_threads=app_settings.tools.sandbox_dataset_max_threads,
+            max_datasets_per_thread=app_settings.tools.sandbox_dataset_max_per_thread,
+            max_bytes_per_thread=app_settings.tools.sandbox_dataset_max_size,
+        )
+
         async with MCPClient(config=app_settings.mcp) as mcp_client:
             with WasmExecutor(
                 additional_imports=imports,
@@ -154,16 +199,27 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncContextManager[None]:  # type:
                 logger=logger,
             ) as sandbox:
                 fastapi_app.state.python_sandbox = sandbox
+                fastapi_app.state.dataset_store = dataset_store
                 # trigger dynamic tool generation - only done once - it is cached
                 _ = fastapi_app.dependency_overrides.get(
                     get_mcp_tool_list, get_mcp_tool_list
                 )(mcp_client, app_settings)
                 fastapi_app.state.mcp_client = mcp_client
+                fastapi_app.state.tool_health = ToolHealthProber(
+                    fastapi_app, app_settings
+                )
                 yield
+                # The checks use the MCP servers, stop them first
+                await fastapi_app.state.tool_health.stop()
 
     # Cleanup connections
+    dataset_store.clear()
+    if message_writer is not None:
+        await message_writer.aclose()
     if engine:
         await engine.dispose()
+    if replica_engine:
+        await replica_engine.dispose()
 
     if fastapi_app.state.redis_client is not None:
         await fastapi_app.state.redis_client.aclose()
@@ -206,43 +262,47 @@ app.include_router(threads.router)
 app.include_router(tools.router)
 app.include_router(storage.router)
 app.include_router(rate_limit.router)
+app.include_router(analytics.router)
 
 
 def custom_openapi() -> dict[str, Any]:
     """Add tool outputs to the openapi."""
-    if app.openapi_schema:
-        return app.openapi_schema
-
-    openapi_schema = get_openapi(
-        title="Agents",
-        version=__version__,
-        summary="API of the agentic chatbot from the Open Brain Institute",
-        routes=app.routes,
-        servers=app.servers,
-    )
-
-    # TODO: Add the list of MCP tools as input of `get_tool_list`
-    tool_list = app.dependency_overrides.get(get_tool_list, get_tool_list)(
-        mcp_tool_list=[], settings=get_settings()
-    )
-    for tool in tool_list:
-        tool_output_type = tool.arun.__annotations__["return"]
-        tool_schema = tool_output_type.model_json_schema(
-            ref_template="#/components/schemas/{model}"
-        )
-        defs = tool_schema.pop("$defs", None)
-
-        # Find nested models and define them as their own schemas instead of having nested '$defs'
-        if defs:
-            openapi_schema["components"]["schemas"].update(defs)
-        openapi_schema["components"]["schemas"][tool_output_type.__name__] = tool_schema
-
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    document = getattr(app.state, "openapi_document", None)
+    if document is None:
+        document = build_openapi_document(app, get_app_tool_list(app))
+        app.state.openapi_document = document
+    return document.schema
 
 
 app.openapi = custom_openapi  # type: ignore
 
+# Replace the default route of the OpenAPI, which serialises it on every request
+app.router.routes = [
+    route
+    for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi(request: Request) -> Response:
+    """Serve the OpenAPI document, built once, with ETag and gzip."""
+    document = await get_openapi_document(request.app)
+    headers = {
+        "ETag": document.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if document.etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            document.gzipped,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+    return Response(document.content, media_type="application/json", headers=headers)
+
 
 @app.exception_handler(InsufficientFundsError)
 async def insufficient_funds_error_handler(
@@ -281,6 +341,21 @@ def readyz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+def metrics(request: Request) -> dict[str, Any]:
+    """Show the usage of the connection pool of the database."""
+    engine = request.app.state.engine
+    replica_engine = getattr(request.app.state, "replica_engine", None)
+    return {
+        "db_pool": engine.pool.metrics()
+        if engine is not None and isinstance(engine.pool, MeteredPool)
+        else None,
+        "db_replica_pool": replica_engine.pool.metrics()
+        if replica_engine is not None and isinstance(replica_engine.pool, MeteredPool)
+        else None,
+    }
+
+
 @app.get("/settings")
 def settings(settings: Annotated[Settings, Depends(get_settings)]) -> Any:
     """Show complete settings of the backend.
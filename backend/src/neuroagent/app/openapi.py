@@ -0,0 +1,79 @@
+"""OpenAPI document of the app, with the outputs of the tools."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+
+from neuroagent.app.dependencies import get_app_tool_list
+from neuroagent.tools.registry import ToolEntry, load_tool
+
+
+@dataclass(frozen=True)
+class OpenAPIDocument:
+    """OpenAPI document, serialised once, and the tools it documents."""
+
+    schema: dict[str, Any]
+    content: bytes
+    gzipped: bytes
+    etag: str
+    tool_names: frozenset[str]
+
+
+def build_openapi_document(
+    fastapi_app: FastAPI, tool_list: list[ToolEntry]
+) -> OpenAPIDocument:
+    """Build the OpenAPI document, with the outputs of the tools.
+
+    Slow, as the tools are imported and the schemas of their outputs built.
+    """
+    openapi_schema = get_openapi(
+        title=fastapi_app.title,
+        version=fastapi_app.version,
+        summary=fastapi_app.summary,
+        routes=fastapi_app.routes,
+        servers=fastapi_app.servers,
+    )
+
+    for tool in tool_list:
+        tool_output_type = load_tool(tool).arun.__annotations__["return"]
+        tool_schema = tool_output_type.model_json_schema(
+            ref_template="#/components/schemas/{model}"
+        )
+        defs = tool_schema.pop("$defs", None)
+
+        # Find nested models and define them as their own schemas instead of having nested '$defs'
+        if defs:
+            openapi_schema["components"]["schemas"].update(defs)
+        openapi_schema["components"]["schemas"][tool_output_type.__name__] = tool_schema
+
+    content = json.dumps(openapi_schema, separators=(",", ":")).encode()
+    return OpenAPIDocument(
+        schema=openapi_schema,
+        content=content,
+        gzipped=gzip.compress(content),
+        etag=f'"{hashlib.sha256(content).hexdigest()}"',
+        tool_names=frozenset(tool.name for tool in tool_list),
+    )
+
+
+async def get_openapi_document(fastapi_app: FastAPI) -> OpenAPIDocument:
+    """Get the OpenAPI document, built on the first request for it.
+
+    Built again only if the tools changed.
+    """
+    tool_list = get_app_tool_list(fastapi_app)
+    document: OpenAPIDocument | None = getattr(
+        fastapi_app.state, "openapi_document", None
+    )
+    if document is None or document.tool_names != {tool.name for tool in tool_list}:
+        document = await asyncio.to_thread(
+            build_openapi_document, fastapi_app, tool_list
+        )
+        fastapi_app.state.openapi_document = document
+    return document
@@ -0,0 +1,103 @@
+"""Usage analytics."""
+
+import datetime
+import logging
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from neuroagent.app.app_utils import validate_project
+from neuroagent.app.database.sql_schemas import TokenUsageDaily
+from neuroagent.app.dependencies import get_read_session, get_user_info
+from neuroagent.app.schemas import TokenUsage, TokenUsageOutput, UserInfo
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+MAX_DAYS = 366
+
+
+@router.get("/token_usage")
+async def get_token_usage(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    start_date: datetime.date | None = None,
+    end_date: datetime.date | None = None,
+    vlab_id: uuid.UUID | None = None,
+    project_id: uuid.UUID | None = None,
+) -> TokenUsageOutput:
+    """Get the tokens consumed per day, model, task and type of token.
+
+    Without project, returns the usage of the user across all projects. With a
+    project the user belongs to, returns the usage of all the users of the
+    project. The dates are inclusive, in UTC, and default to the last 30 days.
+    """
+    end_date = end_date or datetime.datetime.now(datetime.timezone.utc).date()
+    start_date = start_date or end_date - datetime.timedelta(days=29)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=422, detail="The start date must be before the end date."
+        )
+    if (end_date - start_date).days >= MAX_DAYS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"The date range cannot exceed {MAX_DAYS} days.",
+        )
+
+    if vlab_id is not None or project_id is not None:
+        validate_project(
+            groups=user_info.groups,
+            virtual_lab_id=vlab_id,
+            project_id=project_id,
+        )
+        scope = [
+            TokenUsageDaily.vlab_id == vlab_id,
+            TokenUsageDaily.project_id == project_id,
+        ]
+    else:
+        scope = [TokenUsageDaily.user_id == user_info.sub]
+
+    result = await session.execute(
+        select(
+            TokenUsageDaily.day,
+            TokenUsageDaily.model,
+            TokenUsageDaily.task,
+            TokenUsageDaily.type,
+            func.sum(TokenUsageDaily.count).label("total"),
+        )
+        .where(
+            *scope,
+            TokenUsageDaily.day >= start_date,
+            TokenUsageDaily.day <= end_date,
+        )
+        .group_by(
+            TokenUsageDaily.day,
+            TokenUsageDaily.model,
+            TokenUsageDaily.task,
+            TokenUsageDaily.type,
+        )
+        .order_by(
+            TokenUsageDaily.day,
+            TokenUsageDaily.model,
+            TokenUsageDaily.task,
+            TokenUsageDaily.type,
+        )
+    )
+    return TokenUsageOutput(
+        start_date=start_date,
+        end_date=end_date,
+        results=[
+            TokenUsage(
+                day=row.day,
+                model=row.model,
+                task=row.task.value,
+                type=row.type.value,
+                count=row.total,
+            )
+            for row in result.all()
+        ],
+    )
@@ -23,26 +23,35 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from neuroagent.agent_routine import AgentsRoutine
 from neuroagent.app.app_utils import (
+    RATE_LIMITED_ROUTES,
+    RateLimitLeases,
     commit_messages,
     rate_limit,
+    update_history_summary,
     validate_project,
 )
 from neuroagent.app.config import Settings
 from neuroagent.app.database.sql_schemas import Entity, Messages, Threads
+from neuroagent.app.database.writer import MessageWriter
 from neuroagent.app.dependencies import (
     get_accounting_session_factory,
     get_agents_routine,
     get_context_variables,
     get_httpx_client,
+    get_message_writer,
     get_openai_client,
     get_openrouter_models,
+    get_rate_limit_leases,
+    get_read_session,
     get_redis_client,
     get_session,
     get_settings,
     get_starting_agent,
     get_thread,
+    get_thread_history,
     get_tool_list,
     get_user_info,
+    record_write,
 )
 from neuroagent.app.schemas import (
     OpenRouterModelResponse,
@@ -54,7 +63,7 @@ from neuroagent.new_types import (
     Agent,
     ClientRequest,
 )
-from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import ToolEntry
 from neuroagent.utils import extract_frontend_context, messages_to_openai_content
 
 router = APIRouter(prefix="/qa", tags=["Run the agent"])
@@ -74,9 +83,12 @@ async def question_suggestions(
     settings: Annotated[Settings, Depends(get_settings)],
     user_info: Annotated[UserInfo, Depends(get_user_info)],
     redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+    rate_limit_leases: Annotated[
+        RateLimitLeases | None, Depends(get_rate_limit_leases)
+    ],
     fastapi_response: Response,
-    session: Annotated[AsyncSession, Depends(get_session)],
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
     httpx_client: Annotated[AsyncClient, Depends(get_httpx_client)],
     body: QuestionsSuggestionsRequest,
     vlab_id: UUID | None = None,
@@ -99,10 +111,11 @@ async def question_suggestions(
 
     limit_headers, rate_limited = await rate_limit(
         redis_client=redis_client,
-        route_path="/qa/question_suggestions",
+        route_path=RATE_LIMITED_ROUTES["question_suggestions"],
         limit=limit,
         expiry=settings.rate_limiter.expiry_suggestions,
         user_sub=user_info.sub,
+        leases=rate_limit_leases,
     )
     if rate_limited:
         raise HTTPException(
@@ -290,10 +303,13 @@ async def get_available_LLM_models(
     return filtererd_models
 
 
-@router.post("/chat_streamed/{thread_id}")
+@router.post("/chat_streamed/{thread_id}", dependencies=[Depends(record_write)])
 async def stream_chat_agent(
     user_request: ClientRequest,
     redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+    rate_limit_leases: Annotated[
+        RateLimitLeases | None, Depends(get_rate_limit_leases)
+    ],
     settings: Annotated[Settings, Depends(get_settings)],
     thread: Annotated[Threads, Depends(get_thread)],
     agents_routine: Annotated[AgentsRoutine, Depends(get_agents_routine)],
@@ -304,15 +320,18 @@ async def stream_chat_agent(
     ],
     openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    messages: Annotated[list[Messages], Depends(get_thread_history)],
+    message_writer: Annotated[MessageWriter | None, Depends(get_message_writer)],
     background_tasks: BackgroundTasks,
 ) -> StreamingResponse:
     """Run a single agent query in a streamed fashion."""
     limit_headers, rate_limited = await rate_limit(
         redis_client=redis_client,
-        route_path="/qa/chat_streamed/{thread_id}",
+        route_path=RATE_LIMITED_ROUTES["chat_streamed"],
         limit=settings.rate_limiter.limit_chat,
         expiry=settings.rate_limiter.expiry_chat,
         user_sub=thread.user_id,
+        leases=rate_limit_leases,
     )
     if rate_limited:
         # Outside of vlab, cannot send requests anymore
@@ -345,10 +364,29 @@ async def stream_chat_agent(
         agent.model = agent.model.removeprefix("openai/")
         agents_routine.client = openai_client
 
-    # No need to await since it has been awaited in tool filtering dependency
-    messages: list[Messages] = thread.messages
-
-    background_tasks.add_task(commit_messages, session, messages, thread)
+    if message_writer is not None:
+        # The messages are written while streaming, complete the turn
+        background_tasks.add_task(message_writer.finish_turn, messages)
+    else:
+        background_tasks.add_task(commit_messages, session, messages, thread)
+
+    # Fold the turns that left the history window into the summary
+    max_history_turns = settings.agent.history_max_turns
+    if (
+        settings.agent.history_summary
+        and openai_client is not None
+        and max_history_turns is not None
+        and sum(message.entity == Entity.USER for message in messages)
+        > max_history_turns
+    ):
+        background_tasks.add_task(
+            update_history_summary,
+            session=session,
+            thread_id=thread.thread_id,
+            window_start=messages[0].creation_date,
+            openai_client=openai_client,
+            model=settings.llm.suggestion_model,
+        )
     async with accounting_context(
         subtype=ServiceSubtype.ML_LLM,
         user_id=thread.user_id,
@@ -361,6 +399,8 @@ async def stream_chat_agent(
             context_variables=context_variables,
             max_turns=settings.agent.max_turns,
             max_parallel_tool_calls=settings.agent.max_parallel_tool_calls,
+            max_tool_content_length=settings.agent.history_max_tool_content,
+            message_writer=message_writer,
         )
     return StreamingResponse(
         stream_generator,
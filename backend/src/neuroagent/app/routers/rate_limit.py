@@ -7,7 +7,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from redis import asyncio as aioredis
 
-from neuroagent.app.app_utils import parse_redis_data, validate_project
+from neuroagent.app.app_utils import (
+    RATE_LIMITED_ROUTES,
+    parse_redis_data,
+    rate_limit_key,
+    validate_project,
+)
 from neuroagent.app.config import Settings
 from neuroagent.app.dependencies import get_redis_client, get_settings, get_user_info
 from neuroagent.app.schemas import RateLimitInfo, RateLimitOutput, UserInfo
@@ -49,22 +54,18 @@ async def get_rate_limit(
     limit_chat = settings.rate_limiter.limit_chat
     limit_title = settings.rate_limiter.limit_title
 
-    # Get the keys associated to the user in redis
-    keys = await redis_client.keys(f"*{user_sub}*")
-
-    # Prepare the usage count and the ttl
-    async with redis_client.pipeline() as pipe:
+    # The keys of the user are known, read their count and ttl in one round-trip
+    keys = [
+        rate_limit_key(user_sub, route_path)
+        for route_path in RATE_LIMITED_ROUTES.values()
+    ]
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.mget(keys)
         for key in keys:
-            pipe.get(key)
             pipe.pttl(key)
+        counts, *ttls = await pipe.execute()
 
-        # Run all tasks async
-        completed = await pipe.execute()
-
-    # Match the results back to keys
-    results = dict(
-        zip(keys, [completed[i : i + 2] for i in range(0, len(completed), 2)])
-    )
+    results = dict(zip(RATE_LIMITED_ROUTES, zip(counts, ttls)))
 
     return RateLimitOutput(
         chat_streamed=parse_redis_data(
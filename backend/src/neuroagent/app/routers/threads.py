@@ -1,35 +1,66 @@
 """Threads CRUDs."""
 
-import json
 import logging
 from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+)
 from openai import AsyncOpenAI
 from pydantic import AwareDatetime
 from redis import asyncio as aioredis
-from sqlalchemy import desc, exists, func, or_, select, true
+from sqlalchemy import (
+    desc,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager, load_only, selectinload
 
 from neuroagent.app.app_utils import (
+    RATE_LIMITED_ROUTES,
+    RateLimitLeases,
     format_messages_output,
     format_messages_vercel,
+    keyset,
+    prefix_tsquery,
     rate_limit,
     validate_project,
 )
 from neuroagent.app.config import Settings
-from neuroagent.app.database.sql_schemas import Entity, Messages, Threads, utc_now
+from neuroagent.app.database.sql_schemas import (
+    Entity,
+    Messages,
+    StorageArtifacts,
+    Threads,
+    utc_now,
+)
 from neuroagent.app.dependencies import (
+    get_dataset_store,
     get_openai_client,
+    get_rate_limit_leases,
+    get_read_session,
     get_redis_client,
     get_s3_client,
     get_session,
     get_settings,
     get_thread,
+    get_thread_read_session,
     get_tool_list,
     get_user_info,
+    record_write,
 )
 from neuroagent.app.schemas import (
     MessagesRead,
@@ -45,15 +76,16 @@ from neuroagent.app.schemas import (
     ThreadUpdate,
     UserInfo,
 )
-from neuroagent.tools.base_tool import BaseTool
-from neuroagent.utils import delete_from_storage
+from neuroagent.datasets import DatasetStore
+from neuroagent.tools.registry import ToolEntry
+from neuroagent.utils import delete_from_storage, is_content_addressed
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/threads", tags=["Threads' CRUD"])
 
 
-@router.post("")
+@router.post("", dependencies=[Depends(record_write)])
 async def create_thread(
     session: Annotated[AsyncSession, Depends(get_session)],
     user_info: Annotated[UserInfo, Depends(get_user_info)],
@@ -81,79 +113,171 @@ async def create_thread(
 
 @router.get("/search")
 async def search(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     user_info: Annotated[UserInfo, Depends(get_user_info)],
     query: str,
     virtual_lab_id: UUID | None = None,
     project_id: UUID | None = None,
     limit: int = 20,
+    cursor: float | None = None,
+    cursor_id: UUID | None = None,
 ) -> SearchMessagesList:
-    """Get threads for a user."""
+    """Search the threads of a user, the most relevant first.
+
+    Threads are matched on their search document, the last word of the query
+    being a prefix. The most relevant message of each thread is returned with
+    the matched words highlighted. If no thread matches, the messages are
+    searched for similar words instead (pg_trgm), in a single page.
+    """
     validate_project(
         virtual_lab_id=virtual_lab_id,
         project_id=project_id,
         groups=user_info.groups,
     )
+    shown_entities = [Entity.USER, Entity.AI_MESSAGE]
+    thread_conditions = [
+        Threads.user_id == user_info.sub,
+        Threads.vlab_id == virtual_lab_id,
+        Threads.project_id == project_id,
+    ]
 
-    search_query = func.plainto_tsquery("english", query)
+    tsquery = prefix_tsquery(query)
+    if tsquery is not None:
+        search_query = func.to_tsquery("english", tsquery)
+        rank = func.ts_rank(Threads.search_vector, search_query)
+        where_conditions = [
+            *thread_conditions,
+            Threads.search_vector.op("@@")(search_query),
+        ]
+        if cursor is not None and cursor_id is not None:
+            where_conditions.append(
+                tuple_(rank, Threads.thread_id)
+                < tuple_(literal(cursor), literal(cursor_id))
+            )
+        threads_page = (
+            select(Threads.thread_id, Threads.title, rank.label("rank"))
+            .where(*where_conditions)
+            .order_by(rank.desc(), Threads.thread_id.desc())
+            .limit(limit + 1)
+            .subquery()
+        )
+        # Most relevant message of each thread of the page
+        best_message = (
+            select(Messages.message_id, Messages.text_content)
+            .where(
+                Messages.thread_id == threads_page.c.thread_id,
+                Messages.entity.in_(shown_entities),
+            )
+            .order_by(
+                func.ts_rank(Messages.search_vector, search_query).desc().nulls_last(),
+                Messages.creation_date.desc(),
+            )
+            .limit(1)
+            .lateral()
+        )
+        result = await session.execute(
+            select(
+                threads_page.c.thread_id,
+                best_message.c.message_id,
+                threads_page.c.title,
+                best_message.c.text_content,
+                func.ts_headline(
+                    "english",
+                    best_message.c.text_content,
+                    search_query,
+                    "MaxFragments=2, MaxWords=20, MinWords=5",
+                ).label("headline"),
+                threads_page.c.rank,
+            )
+            # Archived threads have no messages to show
+            .outerjoin(best_message, true())
+            .order_by(threads_page.c.rank.desc(), threads_page.c.thread_id.desc())
+        )
+        results = result.all()
+        if results or cursor is not None:
+            has_more = len(results) > limit
+            results = results[:limit]
+            return SearchMessagesList(
+                result_list=[
+                    SearchMessagesResult(
+                        thread_id=row.thread_id,
+                        message_id=row.message_id,
+                        title=row.title,
+                        content=row.text_content or "",
+                        headline=row.headline,
+                    )
+                    for row in results
+                ],
+                next_cursor=results[-1].rank if has_more else None,
+                next_cursor_id=results[-1].thread_id if has_more else None,
+                has_more=has_more,
+            )
 
-    sql_query = (
+    # Fallback on the messages containing words similar to the query
+    similarity = func.word_similarity(query, Messages.text_content)
+    best_messages = (
         select(
             Messages.thread_id,
             Messages.message_id,
             Threads.title,
-            Messages.content,
+            Messages.text_content,
+            similarity.label("similarity"),
         )
-        .select_from(Messages)
         .join(Threads, Messages.thread_id == Threads.thread_id)
         .where(
-            Threads.user_id == user_info.sub,
-            Threads.vlab_id == virtual_lab_id,
-            Threads.project_id == project_id,
-            Messages.entity.in_(["USER", "AI_MESSAGE"]),
-            Messages.search_vector.op("@@")(search_query),
+            *thread_conditions,
+            # Literal predicate of the partial trigram index
+            text("messages.entity IN ('USER', 'AI_MESSAGE')"),
+            literal(query).op("<%")(Messages.text_content),
         )
         .distinct(Messages.thread_id)
-        .order_by(
-            Messages.thread_id,
-            func.ts_rank(Messages.search_vector, search_query).desc(),
-            Messages.creation_date.desc(),
+        .order_by(Messages.thread_id, similarity.desc())
+        .subquery()
+    )
+    result = await session.execute(
+        select(
+            best_messages.c.thread_id,
+            best_messages.c.message_id,
+            best_messages.c.title,
+            best_messages.c.text_content,
         )
+        .order_by(best_messages.c.similarity.desc())
         .limit(limit)
     )
-
-    result = await session.execute(sql_query)
-    results = result.fetchall()
     return SearchMessagesList(
         result_list=[
             SearchMessagesResult(
-                thread_id=result[0],
-                message_id=result[1],
-                title=result[2],
-                content=json.loads(result[3])["content"],
+                thread_id=row.thread_id,
+                message_id=row.message_id,
+                title=row.title,
+                content=row.text_content or "",
             )
-            for result in results
+            for row in result.all()
         ]
     )
 
 
-@router.patch("/{thread_id}/generate_title")
+@router.patch("/{thread_id}/generate_title", dependencies=[Depends(record_write)])
 async def generate_title(
     session: Annotated[AsyncSession, Depends(get_session)],
     openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
     settings: Annotated[Settings, Depends(get_settings)],
     thread: Annotated[Threads, Depends(get_thread)],
     redis_client: Annotated[aioredis.Redis | None, Depends(get_redis_client)],
+    rate_limit_leases: Annotated[
+        RateLimitLeases | None, Depends(get_rate_limit_leases)
+    ],
     fastapi_response: Response,
     body: ThreadGeneratBody,
 ) -> ThreadsRead:
     """Generate a short thread title based on the user's first message and update thread's title."""
     limit_headers, rate_limited = await rate_limit(
         redis_client=redis_client,
-        route_path="/threads/{thread_id}/generate_title",
+        route_path=RATE_LIMITED_ROUTES["generate_title"],
         limit=settings.rate_limiter.limit_title,
         expiry=settings.rate_limiter.expiry_title,
         user_sub=thread.user_id,
+        leases=rate_limit_leases,
     )
     if rate_limited:
         raise HTTPException(
@@ -204,7 +328,7 @@ async def generate_title(
 
 @router.get("")
 async def get_threads(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     user_info: Annotated[UserInfo, Depends(get_user_info)],
     pagination_params: PaginatedParams = Depends(),
     virtual_lab_id: UUID | None = None,
@@ -233,7 +357,13 @@ async def get_threads(
 
     # Add condition to exclude empty threads if requested
     if exclude_empty:
-        where_conditions.append(exists().where(Messages.thread_id == Threads.thread_id))
+        # The messages of archived threads are in the storage
+        where_conditions.append(
+            or_(
+                exists().where(Messages.thread_id == Threads.thread_id),
+                Threads.archive_key.is_not(None),
+            )
+        )
 
     # Add creation date filters if provided
     if creation_date_lte is not None:
@@ -242,17 +372,24 @@ async def get_threads(
         where_conditions.append(Threads.creation_date >= creation_date_gte)
 
     if pagination_params.cursor is not None:
-        comparison_op = (
-            column_attr < pagination_params.cursor
-            if sort.startswith("-")
-            else column_attr > pagination_params.cursor
+        key, cursor = keyset(
+            column_attr,
+            Threads.thread_id,
+            pagination_params.cursor,
+            pagination_params.cursor_id,
         )
-        where_conditions.append(comparison_op)
+        where_conditions.append(key < cursor if sort.startswith("-") else key > cursor)
 
     query = (
         select(Threads)
         .where(*where_conditions)
-        .order_by(desc(column_attr) if sort.startswith("-") else column_attr)
+        .order_by(
+            *(
+                (desc(column_attr), desc(Threads.thread_id))
+                if sort.startswith("-")
+                else (column_attr, Threads.thread_id)
+            )
+        )
         .limit(pagination_params.page_size + 1)
     )
 
@@ -263,13 +400,14 @@ async def get_threads(
 
     return PaginatedResponse(
         next_cursor=getattr(to_return[-1], sort_column) if to_return else None,
+        next_cursor_id=to_return[-1].thread_id if to_return else None,
         has_more=has_more,
         page_size=pagination_params.page_size,
         results=[ThreadsRead(**thread.__dict__) for thread in to_return],
     )
 
 
-@router.patch("/{thread_id}")
+@router.patch("/{thread_id}", dependencies=[Depends(record_write)])
 async def update_thread_title(
     session: Annotated[AsyncSession, Depends(get_session)],
     update_thread: ThreadUpdate,
@@ -285,25 +423,47 @@ async def update_thread_title(
     return ThreadsRead(**thread.__dict__)
 
 
-@router.delete("/{thread_id}")
+@router.delete("/{thread_id}", dependencies=[Depends(record_write)])
 async def delete_thread(
     session: Annotated[AsyncSession, Depends(get_session)],
     thread: Annotated[Threads, Depends(get_thread)],
     s3_client: Annotated[Any, Depends(get_s3_client)],
     settings: Annotated[Settings, Depends(get_settings)],
-    user_info: Annotated[UserInfo, Depends(get_user_info)],
+    dataset_store: Annotated[DatasetStore | None, Depends(get_dataset_store)],
+    background_tasks: BackgroundTasks,
 ) -> dict[str, str]:
     """Delete the specified thread and its associated S3 objects."""
-    # Delete the thread from database
+    # Get the storage objects of the thread from the index
+    keys = set(
+        (
+            await session.execute(
+                select(StorageArtifacts.key).where(
+                    StorageArtifacts.thread_id == thread.thread_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    # Delete the thread from database, its index entries are deleted in cascade
     await session.delete(thread)
     await session.commit()
 
-    # Delete associated S3 objects first
-    delete_from_storage(
+    # Content addressed objects can be reused by other threads at any time,
+    # they are deleted by `neuroagent-sweep-storage` once unreferenced instead
+    keys = {key for key in keys if not is_content_addressed(key)}
+
+    # Drop the datasets mounted in the python sandbox
+    if dataset_store is not None:
+        dataset_store.evict(thread.thread_id)
+
+    # Delete associated S3 objects after the response is sent
+    background_tasks.add_task(
+        delete_from_storage,
         s3_client=s3_client,
         bucket_name=settings.storage.bucket_name,
-        user_id=user_info.sub,
-        thread_id=thread.thread_id,
+        keys=sorted(keys),
     )
 
     # note that the above is not atomic and if only one of the two operations fails, the other will still be executed
@@ -322,10 +482,10 @@ async def get_thread_by_id(
 
 @router.get("/{thread_id}/messages")
 async def get_thread_messages(
-    session: Annotated[AsyncSession, Depends(get_session)],
-    _: Annotated[Threads, Depends(get_thread)],  # to check if thread exists
+    # Checks that the thread exists, rehydrated if it was archived
+    session: Annotated[AsyncSession, Depends(get_thread_read_session)],
     thread_id: str,
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)],
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
     pagination_params: PaginatedParams = Depends(),
     entity: list[Literal["USER", "AI_TOOL", "TOOL", "AI_MESSAGE"]] | None = Query(
         default=None
@@ -338,7 +498,9 @@ async def get_thread_messages(
     tool_hil_mapping = {tool.name: tool.hil for tool in tool_list}
 
     if vercel_format:
-        entity = ["USER", "AI_MESSAGE"]
+        return await get_vercel_messages_page(
+            session, thread_id, pagination_params, tool_hil_mapping
+        )
 
     if entity:
         entity_where = or_(*[Messages.entity == ent for ent in entity])
@@ -346,30 +508,33 @@ async def get_thread_messages(
         entity_where = true()
 
     where_conditions = [Messages.thread_id == thread_id, entity_where]
+    descending = sort.startswith("-")
+    # Messages created at the same time are ordered by id
+    order_by = (
+        (desc(Messages.creation_date), desc(Messages.message_id))
+        if descending
+        else (Messages.creation_date, Messages.message_id)
+    )
 
     if pagination_params.cursor is not None:
-        comparison_op = (
-            Messages.creation_date < pagination_params.cursor
-            if (sort.startswith("-") or vercel_format)
-            else Messages.creation_date > pagination_params.cursor
+        key, cursor = keyset(
+            Messages.creation_date,
+            Messages.message_id,
+            pagination_params.cursor,
+            pagination_params.cursor_id,
         )
-        where_conditions.append(comparison_op)
+        where_conditions.append(key < cursor if descending else key > cursor)
 
     # Only get the relevent info for output format, we will then make the full query after.
     messages_result = await session.execute(
-        select(Messages.message_id, Messages.creation_date, Messages.entity)
+        select(Messages.message_id)
         .where(*where_conditions)
-        .order_by(
-            desc(Messages.creation_date)
-            if (sort.startswith("-") or vercel_format)
-            else Messages.creation_date
-        )
+        .order_by(*order_by)
         .limit(pagination_params.page_size + 1)
     )
-    # This is a list of tuples with (message_id, creation_date, entitty)
-    db_cursor = messages_result.all()
+    message_ids = messages_result.scalars().all()
 
-    if not db_cursor:
+    if not message_ids:
         return PaginatedResponse(
             next_cursor=None,
             has_more=False,
@@ -377,55 +542,112 @@ async def get_thread_messages(
             results=[],
         )
 
-    has_more = len(db_cursor) > pagination_params.page_size
-    if not vercel_format and has_more:
-        db_cursor = db_cursor[:-1]
+    has_more = len(message_ids) > pagination_params.page_size
+    if has_more:
+        message_ids = message_ids[:-1]
+
+    # Here we simply get all messages with the ID found before.
+    # Pagination needs to happen on non-joined parent.
+    # Once we have them we can eager load the tool calls
+    complete_messages_results = await session.execute(
+        select(Messages)
+        .options(selectinload(Messages.tool_calls))
+        .where(Messages.message_id.in_(message_ids))
+        .order_by(*order_by)
+    )
+    db_messages = complete_messages_results.scalars().all()
+    return format_messages_output(
+        db_messages, tool_hil_mapping, has_more, pagination_params.page_size
+    )
 
-    if vercel_format:
-        # We set the most recent boudary to the cursor if it exists.
-        date_conditions = (
-            [(Messages.creation_date < pagination_params.cursor)]
-            if pagination_params.cursor
-            else []
-        )
 
-        # If there are more messages we set the oldest bound for the messages.
-        if has_more:
-            if db_cursor[-2][2] == Entity.USER:
-                date_conditions.append(Messages.creation_date >= db_cursor[-2][1])
-            else:
-                date_conditions.append(Messages.creation_date > db_cursor[-1][1])
-                # This is a trick to include all tool from last AI.
-
-        # Get all messages in the date frame.
-        all_msg_in_page_query = (
-            select(Messages)
-            .options(selectinload(Messages.tool_calls))
-            .where(Messages.thread_id == thread_id, *date_conditions)
-            .order_by(desc(Messages.creation_date))
+async def get_vercel_messages_page(
+    session: AsyncSession,
+    thread_id: str,
+    pagination_params: PaginatedParams,
+    tool_hil_mapping: dict[str, bool],
+) -> PaginatedResponse[MessagesReadVercel]:
+    """Get a page of messages in the vercel format with a single query.
+
+    A page holds `page_size` user and AI messages, with the tool messages of
+    their turns. The messages are ranked by the number of user and AI messages
+    at or after them, and the page is made of the ranks up to `page_size`. The
+    next user or AI message is also fetched to know if there are more messages.
+    """
+    page_size = pagination_params.page_size
+    shown_entities = [Entity.USER, Entity.AI_MESSAGE]
+
+    where_conditions = [Messages.thread_id == thread_id]
+    if pagination_params.cursor is not None:
+        key, cursor = keyset(
+            Messages.creation_date,
+            Messages.message_id,
+            pagination_params.cursor,
+            pagination_params.cursor_id,
         )
-        all_msg_in_page_result = await session.execute(all_msg_in_page_query)
-        db_messages = all_msg_in_page_result.scalars().all()
-    else:
-        # Here we simply get all messages with the ID found before.
-        # Pagination needs to happen on non-joined parent.
-        # Once we have them we can eager load the tool calls
-        complete_messages_results = await session.execute(
-            select(Messages)
-            .options(selectinload(Messages.tool_calls))
-            .where(Messages.message_id.in_([msg[0] for msg in db_cursor]))
-            .order_by(
-                desc(Messages.creation_date)
-                if sort.startswith("-")
-                else Messages.creation_date
-            )
+        where_conditions.append(key < cursor)
+
+    # The text of the user and AI messages is read from the projected columns,
+    # the content is needed for the tool calls and results
+    ranked = (
+        select(
+            Messages.message_id,
+            Messages.creation_date,
+            Messages.entity,
+            Messages.is_complete,
+            Messages.thread_id,
+            Messages.content,
+            Messages.text_content,
+            Messages.reasoning,
+            Messages.tool_call_id,
+            func.count()
+            .filter(Messages.entity.in_(shown_entities))
+            .over(order_by=[Messages.creation_date.desc(), Messages.message_id.desc()])
+            .label("rank"),
         )
-        db_messages = complete_messages_results.scalars().all()
-    if vercel_format:
-        return format_messages_vercel(
-            db_messages, tool_hil_mapping, has_more, pagination_params.page_size
+        .where(*where_conditions)
+        .subquery()
+    )
+    page = aliased(Messages, ranked)
+    result = await session.execute(
+        select(page, ranked.c.rank)
+        .outerjoin(page.tool_calls)
+        .options(
+            load_only(
+                page.message_id,
+                page.creation_date,
+                page.entity,
+                page.is_complete,
+                page.thread_id,
+                page.content,
+                page.text_content,
+                page.reasoning,
+                page.tool_call_id,
+                raiseload=True,
+            ),
+            contains_eager(page.tool_calls),
         )
-    else:
-        return format_messages_output(
-            db_messages, tool_hil_mapping, has_more, pagination_params.page_size
+        .where(
+            # Separate condition on the rank, so the window stops at the page
+            ranked.c.rank <= page_size + 1,
+            or_(ranked.c.rank <= page_size, ranked.c.entity.in_(shown_entities)),
         )
+        .order_by(desc(ranked.c.creation_date), desc(ranked.c.message_id))
+    )
+    rows = result.unique().tuples().all()
+
+    has_more = bool(rows) and rows[-1][1] > page_size
+    if has_more:
+        rows = rows[:-1]
+        # The tool messages older than a user message belong to the next page
+        oldest = next(message for message, rank in rows if rank == page_size)
+        if oldest.entity == Entity.USER:
+            rows = [
+                (message, rank)
+                for message, rank in rows
+                if rank < page_size or message is oldest
+            ]
+
+    return format_messages_vercel(
+        [message for message, _ in rows], tool_hil_mapping, has_more, page_size
+    )
@@ -1,48 +1,62 @@
 """Conversation related CRUD operations."""
 
-import inspect
-import json
+import asyncio
+import hashlib
 import logging
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import ValidationError
-from pydantic.json_schema import SkipJsonSchema
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
 
 from neuroagent.agent_routine import AgentsRoutine
-from neuroagent.app.database.sql_schemas import Entity, Messages, Threads, ToolCalls
+from neuroagent.app.database.sql_schemas import (
+    Entity,
+    Messages,
+    StorageArtifacts,
+    Threads,
+    ToolCalls,
+)
 from neuroagent.app.dependencies import (
     get_agents_routine,
     get_context_variables,
     get_healthcheck_variables,
+    get_rehydrated_thread,
     get_session,
-    get_thread,
+    get_tool_health_prober,
     get_tool_list,
     get_user_info,
+    record_write,
 )
+from neuroagent.app.health import ToolHealthProber, get_healthcheck_kwargs
 from neuroagent.app.schemas import (
     ExecuteToolCallRequest,
     ExecuteToolCallResponse,
     ToolMetadata,
     ToolMetadataDetailed,
+    ToolStatus,
     UserInfo,
 )
-from neuroagent.tools.base_tool import BaseTool
+from neuroagent.app.tool_catalogue import get_tool_catalogue
+from neuroagent.tools.registry import ToolEntry, load_tool
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tools", tags=["Tool's CRUD"])
 
 
-@router.patch("/{thread_id}/execute/{tool_call_id}")
+@router.patch(
+    "/{thread_id}/execute/{tool_call_id}", dependencies=[Depends(record_write)]
+)
 async def execute_tool_call(
     thread_id: str,
     tool_call_id: str,
     request: ExecuteToolCallRequest,
-    _: Annotated[Threads, Depends(get_thread)],  # validates thread belongs to user
+    # validates thread belongs to user
+    _: Annotated[Threads, Depends(get_rehydrated_thread)],
     session: Annotated[AsyncSession, Depends(get_session)],
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)],
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
     context_variables: Annotated[dict[str, Any], Depends(get_context_variables)],
     agents_routine: Annotated[AgentsRoutine, Depends(get_agents_routine)],
 ) -> ExecuteToolCallResponse:
@@ -80,7 +94,9 @@ async def execute_tool_call(
         try:
             message, _ = await agents_routine.handle_tool_call(
                 tool_call=tool_call,
-                tools=tool_list,
+                tools=[
+                    load_tool(tool) for tool in tool_list if tool.name == tool_call.name
+                ],
                 context_variables=context_variables,
                 raise_validation_errors=True,
             )
@@ -92,8 +108,12 @@ async def execute_tool_call(
     new_message = Messages(
         thread_id=thread_id,
         entity=Entity.TOOL,
-        content=json.dumps(message),
+        content=message,
         is_complete=True,
+        storage_artifacts=[
+            StorageArtifacts(thread_id=thread_id, key=key)
+            for key in context_variables.get("storage_dict", {}).get(tool_call_id, [])
+        ],
     )
 
     session.add(tool_call)
@@ -103,91 +123,78 @@ async def execute_tool_call(
     return ExecuteToolCallResponse(status="done", content=message["content"])
 
 
-@router.get("")
-def get_available_tools(
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)],
+def cached_response(request: Request, content: bytes, etag: str) -> Response:
+    """Respond with the content, or 304 if the client has it already.
+
+    The responses depend on the user, clients revalidate them each time.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content, media_type="application/json", headers=headers)
+
+
+@router.get("", response_model=list[ToolMetadata])
+async def get_available_tools(
+    request: Request,
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
     _: Annotated[UserInfo, Depends(get_user_info)],
-) -> list[ToolMetadata]:
+) -> Response:
     """Return the list of available tools with their basic metadata."""
+    catalogue = get_tool_catalogue(request.app, tool_list)
+    return cached_response(request, catalogue.content, catalogue.etag)
+
+
+@router.get("/status")
+async def get_tools_status(
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
+    tool_health: Annotated[ToolHealthProber, Depends(get_tool_health_prober)],
+    _: Annotated[UserInfo, Depends(get_user_info)],
+) -> list[ToolStatus]:
+    """Return the online status of the available tools, checked in the background."""
+    tool_status = await tool_health.get_status()
     return [
-        ToolMetadata(name=tool.name, name_frontend=tool.name_frontend)
+        ToolStatus(name=tool.name, is_online=tool_status.get(tool.name, False))
         for tool in tool_list
     ]
 
 
-@router.get("/{name}")
+@router.get("/{name}", response_model=ToolMetadataDetailed)
 async def get_tool_metadata(
     name: str,
-    tool_list: Annotated[list[type[BaseTool]], Depends(get_tool_list)],
+    request: Request,
+    tool_list: Annotated[list[ToolEntry], Depends(get_tool_list)],
     healthcheck_variables: Annotated[
         dict[str, Any], Depends(get_healthcheck_variables)
     ],
+    tool_health: Annotated[ToolHealthProber, Depends(get_tool_health_prober)],
     _: Annotated[UserInfo, Depends(get_user_info)],
-) -> ToolMetadataDetailed:
+) -> Response:
     """Return detailed metadata for a specific tool."""
-    tool_class = next((tool for tool in tool_list if tool.name == name), None)
-    if not tool_class:
+    catalogue = get_tool_catalogue(request.app, tool_list)
+    # The tool is imported in a thread the first time
+    tool_metadata = catalogue.details.get(name) or await asyncio.to_thread(
+        catalogue.get_details, name
+    )
+    if not tool_metadata:
         raise HTTPException(status_code=404, detail=f"Tool '{name}' not found")
 
-    # Get the parameters required by is_online
-    is_online_params = inspect.signature(tool_class.is_online).parameters
-    is_online_kwargs = {
-        param: healthcheck_variables[param]
-        for param in is_online_params
-        if param in healthcheck_variables
-    }
-
-    try:
-        is_online = await tool_class.is_online(**is_online_kwargs)
-    except Exception:
-        logger.exception(f"Error checking tool {tool_class.name} online status")
-        is_online = False
-
-    input_schema: dict[str, Any] = {"parameters": []}
-    if tool_class.json_schema is not None:
-        json_schema = tool_class.json_schema
-
-        # Extract parameters from JSON schema
-        if "properties" in json_schema:
-            for name, prop in json_schema["properties"].items():
-                parameter = {
-                    "name": name,
-                    "required": name in json_schema.get("required", []),
-                    "default": str(prop.get("default")) if "default" in prop else None,
-                    "description": prop.get("description", ""),
-                }
-                input_schema["parameters"].append(parameter)
-    else:
-        for name in tool_class.__annotations__["input_schema"].model_fields:
-            field = tool_class.__annotations__["input_schema"].model_fields[name]
-            metadata = (
-                tool_class.__annotations__["input_schema"].model_fields[name].metadata
+    # Use the status of the background checks, or check the tool if not known yet
+    tool_health.start()
+    is_online = tool_health.status.get(name)
+    if is_online is None:
+        tool_class = load_tool(next(tool for tool in tool_list if tool.name == name))
+        try:
+            is_online = await tool_class.is_online(
+                **get_healthcheck_kwargs(tool_class, healthcheck_variables)
             )
-
-            if len(metadata) == 1 and metadata[0] == SkipJsonSchema():  # type: ignore[type-arg]
-                continue
-
-            is_required = field.is_required()
-
-            parameter = {
-                "name": name,
-                "required": is_required,
-                "default": None
-                if is_required
-                else str(field.default)
-                if field.default is not None
-                else None,
-                "description": field.description,
-            }
-            input_schema["parameters"].append(parameter)
-
-    return ToolMetadataDetailed(
-        name=tool_class.name,
-        name_frontend=tool_class.name_frontend,
-        description=tool_class.description,
-        description_frontend=tool_class.description_frontend,
-        utterances=tool_class.utterances,
-        input_schema=json.dumps(input_schema),
-        hil=tool_class.hil,
-        is_online=is_online,
+        except Exception:
+            logger.exception(f"Error checking tool {tool_class.name} online status")
+            is_online = False
+
+    content = (
+        tool_metadata.model_copy(update={"is_online": is_online})
+        .model_dump_json()
+        .encode()
     )
+    return cached_response(request, content, f'"{hashlib.sha256(content).hexdigest()}"')
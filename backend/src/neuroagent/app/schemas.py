@@ -174,6 +174,13 @@ class ToolMetadataDetailed(ToolMetadata):
     is_online: bool
 
 
+class ToolStatus(BaseModel):
+    """Online status of a tool."""
+
+    name: str
+    is_online: bool
+
+
 class UserInfo(BaseModel):
     """Keycloak related info of a user."""
 
@@ -197,6 +204,8 @@ class PaginatedParams(BaseModel):
     """Input query parameters for paginated endpoints."""
 
     cursor: AwareDatetime | None = Field(default=None)
+    # Id of the last item of the previous page, breaks the ties of the cursor date
+    cursor_id: UUID | None = Field(default=None)
     page_size: int = Field(default=10, ge=1)
 
 
@@ -204,6 +213,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Base class for paginated responses."""
 
     next_cursor: AwareDatetime | None
+    next_cursor_id: UUID | None = None
     has_more: bool
     page_size: int
     results: list[T]
@@ -290,19 +300,44 @@ class RateLimitOutput(BaseModel):
     generate_title: RateLimitInfo
 
 
+class TokenUsage(BaseModel):
+    """Tokens consumed in a day, for a model, task and type of token."""
+
+    day: datetime.date
+    model: str
+    task: str
+    type: str
+    count: int
+
+
+class TokenUsageOutput(BaseModel):
+    """Output of the GET token usage endpoint."""
+
+    start_date: datetime.date
+    end_date: datetime.date
+    results: list[TokenUsage]
+
+
 class SearchMessagesResult(BaseModel):
     """Class for the one result of the message search."""
 
     thread_id: UUID
-    message_id: UUID
+    # None for the archived threads, matched on their search document only
+    message_id: UUID | None
     title: str
     content: str
+    # Fragments of the content around the matched words
+    headline: str | None = None
 
 
 class SearchMessagesList(BaseModel):
     """Class for the message search result list."""
 
     result_list: list[SearchMessagesResult]
+    # Rank and id of the last thread, to get the next results
+    next_cursor: float | None = None
+    next_cursor_id: UUID | None = None
+    has_more: bool = False
 
 
 class FrontendContextOutput(BaseModel):
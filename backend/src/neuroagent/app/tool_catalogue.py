@@ -0,0 +1,122 @@
+"""Metadata of the tools, built once for the tool routes."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI
+from pydantic.json_schema import SkipJsonSchema
+
+from neuroagent.app.schemas import ToolMetadata, ToolMetadataDetailed
+from neuroagent.tools.base_tool import BaseTool
+from neuroagent.tools.registry import ToolEntry, load_tool
+
+
+@dataclass(frozen=True)
+class ToolCatalogue:
+    """Metadata of the tools, serialised once.
+
+    The list is built from the manifest, without importing the tools. The
+    detailed metadata of a tool is built when it is first requested, see
+    `get_details`. It is offline, `is_online` is set on each request.
+    """
+
+    tools: tuple[ToolEntry, ...]
+    content: bytes
+    etag: str
+    details: dict[str, ToolMetadataDetailed] = field(default_factory=dict)
+
+    def get_details(self, name: str) -> ToolMetadataDetailed | None:
+        """Get the detailed metadata of a tool, imported the first time."""
+        if name not in self.details:
+            tool = next((tool for tool in self.tools if tool.name == name), None)
+            if tool is None:
+                return None
+            self.details[name] = build_tool_metadata(load_tool(tool))
+        return self.details[name]
+
+
+def get_input_parameters(tool_class: type[BaseTool]) -> list[dict[str, Any]]:
+    """Get the parameters of the input schema of a tool, as shown to the user."""
+    parameters = []
+    if tool_class.json_schema is not None:
+        json_schema = tool_class.json_schema
+
+        # Extract parameters from JSON schema
+        if "properties" in json_schema:
+            for name, prop in json_schema["properties"].items():
+                parameter = {
+                    "name": name,
+                    "required": name in json_schema.get("required", []),
+                    "default": str(prop.get("default")) if "default" in prop else None,
+                    "description": prop.get("description", ""),
+                }
+                parameters.append(parameter)
+    else:
+        for name in tool_class.__annotations__["input_schema"].model_fields:
+            field = tool_class.__annotations__["input_schema"].model_fields[name]
+            metadata = (
+                tool_class.__annotations__["input_schema"].model_fields[name].metadata
+            )
+
+            if len(metadata) == 1 and metadata[0] == SkipJsonSchema():  # type: ignore[type-arg]
+                continue
+
+            is_required = field.is_required()
+
+            parameter = {
+                "name": name,
+                "required": is_required,
+                "default": None
+                if is_required
+                else str(field.default)
+                if field.default is not None
+                else None,
+                "description": field.description,
+            }
+            parameters.append(parameter)
+    return parameters
+
+
+def build_tool_metadata(tool_class: type[BaseTool]) -> ToolMetadataDetailed:
+    """Build the detailed metadata of a tool, offline."""
+    return ToolMetadataDetailed(
+        name=tool_class.name,
+        name_frontend=tool_class.name_frontend,
+        description=tool_class.description,
+        description_frontend=tool_class.description_frontend,
+        utterances=tool_class.utterances,
+        input_schema=json.dumps({"parameters": get_input_parameters(tool_class)}),
+        hil=tool_class.hil,
+        is_online=False,
+    )
+
+
+def build_tool_catalogue(tool_list: list[ToolEntry]) -> ToolCatalogue:
+    """Build the list of the tools, from the manifest for the internal tools."""
+    content = json.dumps(
+        [
+            ToolMetadata(name=tool.name, name_frontend=tool.name_frontend).model_dump()
+            for tool in tool_list
+        ],
+        separators=(",", ":"),
+    ).encode()
+
+    return ToolCatalogue(
+        tools=tuple(tool_list),
+        content=content,
+        etag=f'"{hashlib.sha256(content).hexdigest()}"',
+    )
+
+
+def get_tool_catalogue(
+    fastapi_app: FastAPI, tool_list: list[ToolEntry]
+) -> ToolCatalogue:
+    """Get the metadata of the tools, built again only if the tools changed."""
+    catalogue: ToolCatalogue | None = getattr(fastapi_app.state, "tool_catalogue", None)
+    # The tool list is cached, so the same tools are the same objects
+    if catalogue is None or catalogue.tools != tuple(tool_list):
+        catalogue = build_tool_catalogue(tool_list)
+        fastapi_app.state.tool_catalogue = catalogue
+    return catalogue
@@ -0,0 +1 @@
+"""Autogenerated types trimmed to the models used by neuroagent."""
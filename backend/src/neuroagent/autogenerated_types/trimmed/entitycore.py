@@ -0,0 +1,6866 @@
+# Trimmed by `neuroagent-trim-autogenerated-types` from entitycore.py, do not edit.
+# Only the models imported by neuroagent and their dependencies are kept.
+# generated by datamodel-codegen:
+#   filename:  https://staging.cell-a.openbraininstitute.org/api/entitycore/openapi.json
+
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import (
+    UUID4,
+    AnyUrl,
+    AwareDatetime,
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+)
+
+
+class ActivityStatus(
+    RootModel[Literal['created', 'pending', 'running', 'done', 'error', 'cancelled']]
+):
+    root: Literal['created', 'pending', 'running', 'done', 'error', 'cancelled'] = (
+        Field(..., title='ActivityStatus')
+    )
+
+
+class ActivityType(
+    RootModel[
+        Literal[
+            'simulation_execution',
+            'simulation_generation',
+            'validation',
+            'calibration',
+            'analysis_notebook_execution',
+            'ion_channel_modeling_execution',
+            'ion_channel_modeling_config_generation',
+            'circuit_extraction_config_generation',
+            'circuit_extraction_execution',
+            'skeletonization_execution',
+            'skeletonization_config_generation',
+            'task_activity',
+        ]
+    ]
+):
+    root: Literal[
+        'simulation_execution',
+        'simulation_generation',
+        'validation',
+        'calibration',
+        'analysis_notebook_execution',
+        'ion_channel_modeling_execution',
+        'ion_channel_modeling_config_generation',
+        'circuit_extraction_config_generation',
+        'circuit_extraction_execution',
+        'skeletonization_execution',
+        'skeletonization_config_generation',
+        'task_activity',
+    ] = Field(..., description='Activity types.', title='ActivityType')
+
+
+class AgePeriod(RootModel[Literal['prenatal', 'postnatal', 'unknown']]):
+    root: Literal['prenatal', 'postnatal', 'unknown'] = Field(..., title='AgePeriod')
+
+
+class AgentType(RootModel[Literal['person', 'organization', 'consortium']]):
+    root: Literal['person', 'organization', 'consortium'] = Field(
+        ...,
+        description='Agent types.\n\n- person: Individual person\n- organization: Individual organization or institution\n- consortium: Group of individual persons (or organizations) formally joined together',
+        title='AgentType',
+    )
+
+
+class AnnotationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    pref_label: str = Field(..., title='Pref Label')
+    alt_label: str | None = Field(default=None, title='Alt Label')
+    definition: str = Field(..., title='Definition')
+
+
+class AssetLabel(
+    RootModel[
+        Literal[
+            'morphology',
+            'morphology_with_spines',
+            'cell_composition_summary',
+            'cell_composition_volumes',
+            'single_neuron_synaptome_config',
+            'single_neuron_synaptome_simulation_data',
+            'single_neuron_simulation_data',
+            'sonata_circuit',
+            'compressed_sonata_circuit',
+            'circuit_figures',
+            'circuit_analysis_data',
+            'circuit_connectivity_matrices',
+            'nwb',
+            'neuron_hoc',
+            'emodel_optimization_output',
+            'sonata_simulation_config',
+            'simulation_generation_config',
+            'ion_channel_modeling_generation_config',
+            'custom_node_sets',
+            'campaign_generation_config',
+            'campaign_summary',
+            'replay_spikes',
+            'voltage_report',
+            'spike_report',
+            'neuron_mechanisms',
+            'brain_atlas_annotation',
+            'brain_atlas_region_mesh',
+            'voxel_densities',
+            'validation_result_figure',
+            'validation_result_details',
+            'simulation_designer_image',
+            'circuit_visualization',
+            'node_stats',
+            'network_stats_a',
+            'network_stats_b',
+            'cell_surface_mesh',
+            'jupyter_notebook',
+            'requirements',
+            'notebook_required_files',
+            'ion_channel_model_figure',
+            'ion_channel_model_figure_summary_json',
+            'ion_channel_model_thumbnail',
+            'circuit_extraction_config',
+            'skeletonization_config',
+            'task_config',
+            'lod_mesh_block',
+            'electrode_array_weight_matrix',
+        ]
+    ]
+):
+    root: Literal[
+        'morphology',
+        'morphology_with_spines',
+        'cell_composition_summary',
+        'cell_composition_volumes',
+        'single_neuron_synaptome_config',
+        'single_neuron_synaptome_simulation_data',
+        'single_neuron_simulation_data',
+        'sonata_circuit',
+        'compressed_sonata_circuit',
+        'circuit_figures',
+        'circuit_analysis_data',
+        'circuit_connectivity_matrices',
+        'nwb',
+        'neuron_hoc',
+        'emodel_optimization_output',
+        'sonata_simulation_config',
+        'simulation_generation_config',
+        'ion_channel_modeling_generation_config',
+        'custom_node_sets',
+        'campaign_generation_config',
+        'campaign_summary',
+        'replay_spikes',
+        'voltage_report',
+        'spike_report',
+        'neuron_mechanisms',
+        'brain_atlas_annotation',
+        'brain_atlas_region_mesh',
+        'voxel_densities',
+        'validation_result_figure',
+        'validation_result_details',
+        'simulation_designer_image',
+        'circuit_visualization',
+        'node_stats',
+        'network_stats_a',
+        'network_stats_b',
+        'cell_surface_mesh',
+        'jupyter_notebook',
+        'requirements',
+        'notebook_required_files',
+        'ion_channel_model_figure',
+        'ion_channel_model_figure_summary_json',
+        'ion_channel_model_thumbnail',
+        'circuit_extraction_config',
+        'skeletonization_config',
+        'task_config',
+        'lod_mesh_block',
+        'electrode_array_weight_matrix',
+    ] = Field(..., description='See docs/asset-labels.md.', title='AssetLabel')
+
+
+class AssetStatus(RootModel[Literal['created', 'uploading', 'deleted']]):
+    root: Literal['created', 'uploading', 'deleted'] = Field(..., title='AssetStatus')
+
+
+class CellMorphologyGenerationType(
+    RootModel[
+        Literal[
+            'digital_reconstruction',
+            'modified_reconstruction',
+            'computationally_synthesized',
+            'placeholder',
+        ]
+    ]
+):
+    root: Literal[
+        'digital_reconstruction',
+        'modified_reconstruction',
+        'computationally_synthesized',
+        'placeholder',
+    ] = Field(..., title='CellMorphologyGenerationType')
+
+
+class CellMorphologyProtocolDesign(
+    RootModel[
+        Literal[
+            'electron_microscopy', 'cell_patch', 'fluorophore', 'topological_synthesis'
+        ]
+    ]
+):
+    root: Literal[
+        'electron_microscopy', 'cell_patch', 'fluorophore', 'topological_synthesis'
+    ] = Field(..., title='CellMorphologyProtocolDesign')
+
+
+class CircuitBuildCategory(
+    RootModel[Literal['computational_model', 'em_reconstruction']]
+):
+    root: Literal['computational_model', 'em_reconstruction'] = Field(
+        ...,
+        description='Information about how/from what source a circuit was built.\n\n- computational_model: Any type of data-driven or statistical model\n- em_reconstruction: Reconstruction from EM\n(More categories may be added later, if needed).',
+        title='CircuitBuildCategory',
+    )
+
+
+class CircuitScale(
+    RootModel[
+        Literal[
+            'single', 'pair', 'small', 'microcircuit', 'region', 'system', 'whole_brain'
+        ]
+    ]
+):
+    root: Literal[
+        'single', 'pair', 'small', 'microcircuit', 'region', 'system', 'whole_brain'
+    ] = Field(
+        ...,
+        description='Scale of the circuit.\n\n- single: Single neuron + extrinsic connectivity\n- pair: Two connected neurons + intrinsic connectivity + extrinsic connectivity\n- small: Small microcircuit (3-20 neurons) + intrinsic connectivity + extrinsic connectivity;\n  usually containing specific connectivity motifs\n- microcircuit: Any circuit larger than 20 neurons but not being a region, system, or\n  whole-brain circuit; may be atlas-based or not\n- region: Atlas-based continuous volume of an entire brain region or a set of continuous\n  sub-regions\n- system: Non-continuous circuit consisting of at least two microcircuits/regions that are\n  connected by inter-region connectivity\n- whole_brain: Circuit representing an entire brain.',
+        title='CircuitScale',
+    )
+
+
+class ProtocolDocument(RootModel[AnyUrl]):
+    root: AnyUrl = Field(..., title='Protocol Document')
+
+
+class ContentType(
+    RootModel[
+        Literal[
+            'application/json',
+            'application/swc',
+            'application/nrrd',
+            'application/obj',
+            'application/hoc',
+            'application/asc',
+            'application/abf',
+            'application/nwb',
+            'application/x-hdf5',
+            'text/plain',
+            'application/vnd.directory',
+            'application/mod',
+            'application/pdf',
+            'image/png',
+            'image/jpeg',
+            'model/gltf-binary',
+            'application/gzip',
+            'image/webp',
+            'application/x-ipynb+json',
+            'application/zip',
+        ]
+    ]
+):
+    root: Literal[
+        'application/json',
+        'application/swc',
+        'application/nrrd',
+        'application/obj',
+        'application/hoc',
+        'application/asc',
+        'application/abf',
+        'application/nwb',
+        'application/x-hdf5',
+        'text/plain',
+        'application/vnd.directory',
+        'application/mod',
+        'application/pdf',
+        'image/png',
+        'image/jpeg',
+        'model/gltf-binary',
+        'application/gzip',
+        'image/webp',
+        'application/x-ipynb+json',
+        'application/zip',
+    ] = Field(..., title='ContentType')
+
+
+class Magnification(RootModel[float]):
+    root: float = Field(..., ge=0.0, title='Magnification')
+
+
+class TissueShrinkage(RootModel[float]):
+    root: float = Field(..., ge=0.0, title='Tissue Shrinkage')
+
+
+class ElectricalRecordingOrigin(
+    RootModel[Literal['in_vivo', 'in_vitro', 'in_silico', 'unknown']]
+):
+    root: Literal['in_vivo', 'in_vitro', 'in_silico', 'unknown'] = Field(
+        ..., title='ElectricalRecordingOrigin'
+    )
+
+
+class ElectricalRecordingStimulusShape(
+    RootModel[
+        Literal[
+            'cheops',
+            'constant',
+            'pulse',
+            'step',
+            'ramp',
+            'noise',
+            'sinusoidal',
+            'other',
+            'two_steps',
+            'unknown',
+        ]
+    ]
+):
+    root: Literal[
+        'cheops',
+        'constant',
+        'pulse',
+        'step',
+        'ramp',
+        'noise',
+        'sinusoidal',
+        'other',
+        'two_steps',
+        'unknown',
+    ] = Field(..., title='ElectricalRecordingStimulusShape')
+
+
+class ElectricalRecordingStimulusType(
+    RootModel[
+        Literal[
+            'voltage_clamp',
+            'current_clamp',
+            'conductance_clamp',
+            'extracellular',
+            'other',
+            'unknown',
+        ]
+    ]
+):
+    root: Literal[
+        'voltage_clamp',
+        'current_clamp',
+        'conductance_clamp',
+        'extracellular',
+        'other',
+        'unknown',
+    ] = Field(..., title='ElectricalRecordingStimulusType')
+
+
+class ElectricalRecordingType(
+    RootModel[Literal['intracellular', 'extracellular', 'both', 'unknown']]
+):
+    root: Literal['intracellular', 'extracellular', 'both', 'unknown'] = Field(
+        ..., title='ElectricalRecordingType'
+    )
+
+
+class EntityRoute(
+    RootModel[
+        Literal[
+            'brain-atlas',
+            'brain-atlas-region',
+            'cell-composition',
+            'cell-morphology',
+            'cell-morphology-protocol',
+            'electrical-cell-recording',
+            'electrical-recording-stimulus',
+            'emodel',
+            'experimental-bouton-density',
+            'experimental-neuron-density',
+            'experimental-synapses-per-connection',
+            'external-url',
+            'ion-channel-model',
+            'ion-channel-modeling-campaign',
+            'ion-channel-modeling-config',
+            'ion-channel-recording',
+            'memodel',
+            'memodel-calibration-result',
+            'simulation',
+            'simulation-campaign',
+            'simulation-result',
+            'single-neuron-simulation',
+            'single-neuron-synaptome',
+            'single-neuron-synaptome-simulation',
+            'simulatable-extracellular-recording-array',
+            'subject',
+            'validation-result',
+            'circuit',
+            'circuit-extraction-campaign',
+            'circuit-extraction-config',
+            'em-dense-reconstruction-dataset',
+            'em-cell-mesh',
+            'analysis-notebook-template',
+            'analysis-notebook-environment',
+            'analysis-notebook-result',
+            'skeletonization-config',
+            'skeletonization-campaign',
+            'task-config',
+        ]
+    ]
+):
+    root: Literal[
+        'brain-atlas',
+        'brain-atlas-region',
+        'cell-composition',
+        'cell-morphology',
+        'cell-morphology-protocol',
+        'electrical-cell-recording',
+        'electrical-recording-stimulus',
+        'emodel',
+        'experimental-bouton-density',
+        'experimental-neuron-density',
+        'experimental-synapses-per-connection',
+        'external-url',
+        'ion-channel-model',
+        'ion-channel-modeling-campaign',
+        'ion-channel-modeling-config',
+        'ion-channel-recording',
+        'memodel',
+        'memodel-calibration-result',
+        'simulation',
+        'simulation-campaign',
+        'simulation-result',
+        'single-neuron-simulation',
+        'single-neuron-synaptome',
+        'single-neuron-synaptome-simulation',
+        'simulatable-extracellular-recording-array',
+        'subject',
+        'validation-result',
+        'circuit',
+        'circuit-extraction-campaign',
+        'circuit-extraction-config',
+        'em-dense-reconstruction-dataset',
+        'em-cell-mesh',
+        'analysis-notebook-template',
+        'analysis-notebook-environment',
+        'analysis-notebook-result',
+        'skeletonization-config',
+        'skeletonization-campaign',
+        'task-config',
+    ] = Field(
+        ...,
+        description='Entity routes.\n\nNote: There are fewer routes than entity types',
+        title='EntityRoute',
+    )
+
+
+class EntityType(
+    RootModel[
+        Literal[
+            'analysis_software_source_code',
+            'brain_atlas',
+            'brain_atlas_region',
+            'cell_composition',
+            'cell_morphology',
+            'cell_morphology_protocol',
+            'electrical_cell_recording',
+            'electrical_recording',
+            'electrical_recording_stimulus',
+            'emodel',
+            'experimental_bouton_density',
+            'experimental_neuron_density',
+            'experimental_synapses_per_connection',
+            'external_url',
+            'ion_channel_model',
+            'ion_channel_modeling_campaign',
+            'ion_channel_modeling_config',
+            'ion_channel_recording',
+            'memodel',
+            'memodel_calibration_result',
+            'me_type_density',
+            'simulation',
+            'simulation_campaign',
+            'simulation_result',
+            'scientific_artifact',
+            'single_neuron_simulation',
+            'single_neuron_synaptome',
+            'single_neuron_synaptome_simulation',
+            'simulatable_extracellular_recording_array',
+            'subject',
+            'validation_result',
+            'circuit',
+            'circuit_extraction_campaign',
+            'circuit_extraction_config',
+            'em_dense_reconstruction_dataset',
+            'em_cell_mesh',
+            'analysis_notebook_template',
+            'analysis_notebook_environment',
+            'analysis_notebook_result',
+            'skeletonization_config',
+            'skeletonization_campaign',
+            'task_config',
+        ]
+    ]
+):
+    root: Literal[
+        'analysis_software_source_code',
+        'brain_atlas',
+        'brain_atlas_region',
+        'cell_composition',
+        'cell_morphology',
+        'cell_morphology_protocol',
+        'electrical_cell_recording',
+        'electrical_recording',
+        'electrical_recording_stimulus',
+        'emodel',
+        'experimental_bouton_density',
+        'experimental_neuron_density',
+        'experimental_synapses_per_connection',
+        'external_url',
+        'ion_channel_model',
+        'ion_channel_modeling_campaign',
+        'ion_channel_modeling_config',
+        'ion_channel_recording',
+        'memodel',
+        'memodel_calibration_result',
+        'me_type_density',
+        'simulation',
+        'simulation_campaign',
+        'simulation_result',
+        'scientific_artifact',
+        'single_neuron_simulation',
+        'single_neuron_synaptome',
+        'single_neuron_synaptome_simulation',
+        'simulatable_extracellular_recording_array',
+        'subject',
+        'validation_result',
+        'circuit',
+        'circuit_extraction_campaign',
+        'circuit_extraction_config',
+        'em_dense_reconstruction_dataset',
+        'em_cell_mesh',
+        'analysis_notebook_template',
+        'analysis_notebook_environment',
+        'analysis_notebook_result',
+        'skeletonization_config',
+        'skeletonization_campaign',
+        'task_config',
+    ] = Field(..., description='Entity types.', title='EntityType')
+
+
+class ExecutorType(
+    RootModel[Literal['single_node_job', 'distributed_job', 'jupyter_notebook']]
+):
+    root: Literal['single_node_job', 'distributed_job', 'jupyter_notebook'] = Field(
+        ..., title='ExecutorType'
+    )
+
+
+class Facet(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID | int = Field(..., title='Id')
+    label: str = Field(..., title='Label')
+    count: int = Field(..., title='Count')
+    type: str | None = Field(..., title='Type')
+
+
+class Facets(RootModel[dict[str, list[Facet]]]):
+    root: dict[str, list[Facet]]
+
+
+class LicenseRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    label: str = Field(..., title='Label')
+
+
+class MeasurableEntity(RootModel[Literal['cell_morphology', 'em_cell_mesh']]):
+    root: Literal['cell_morphology', 'em_cell_mesh'] = Field(
+        ..., title='MeasurableEntity'
+    )
+
+
+class MeasurementStatistic(
+    RootModel[
+        Literal[
+            'mean',
+            'median',
+            'mode',
+            'variance',
+            'data_point',
+            'sample_size',
+            'standard_error',
+            'standard_deviation',
+            'raw',
+            'minimum',
+            'maximum',
+            'sum',
+        ]
+    ]
+):
+    root: Literal[
+        'mean',
+        'median',
+        'mode',
+        'variance',
+        'data_point',
+        'sample_size',
+        'standard_error',
+        'standard_deviation',
+        'raw',
+        'minimum',
+        'maximum',
+        'sum',
+    ] = Field(..., title='MeasurementStatistic')
+
+
+class MeasurementUnit(
+    RootModel[
+        Literal['dimensionless', '1/μm', '1/μm²', '1/mm³', 'μm', 'μm²', 'μm³', 'radian']
+    ]
+):
+    root: Literal[
+        'dimensionless', '1/μm', '1/μm²', '1/mm³', 'μm', 'μm²', 'μm³', 'radian'
+    ] = Field(..., title='MeasurementUnit')
+
+
+class ModifiedMorphologyMethodType(
+    RootModel[Literal['cloned', 'mix_and_match', 'mousified', 'ratified']]
+):
+    root: Literal['cloned', 'mix_and_match', 'mousified', 'ratified'] = Field(
+        ..., title='ModifiedMorphologyMethodType'
+    )
+
+
+class NestedBrainRegionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    annotation_value: int = Field(..., title='Annotation Value')
+    name: str = Field(..., title='Name')
+    acronym: str = Field(..., title='Acronym')
+    color_hex_triplet: str = Field(..., title='Color Hex Triplet')
+    parent_structure_id: UUID | None = Field(default=None, title='Parent Structure Id')
+    hierarchy_id: UUID = Field(..., title='Hierarchy Id')
+
+
+class NestedComputationallySynthesizedCellMorphologyProtocolRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    protocol_document: ProtocolDocument | None = Field(
+        default=None, title='Protocol Document'
+    )
+    protocol_design: CellMorphologyProtocolDesign
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    type: Literal['cell_morphology_protocol'] = Field(
+        default='cell_morphology_protocol', title='Type'
+    )
+    generation_type: Literal['computationally_synthesized'] = Field(
+        ..., title='Generation Type'
+    )
+    method_type: str = Field(..., title='Method Type')
+
+
+class NestedConsortiumRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    pref_label: str = Field(..., title='Pref Label')
+    alternative_name: str | None = Field(default=None, title='Alternative Name')
+    type: str = Field(..., title='Type')
+
+
+class NestedElectricalRecordingStimulusRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    dt: float | None = Field(default=None, title='Dt')
+    injection_type: ElectricalRecordingStimulusType
+    shape: ElectricalRecordingStimulusShape
+    start_time: float | None = Field(default=None, title='Start Time')
+    end_time: float | None = Field(default=None, title='End Time')
+    recording_id: UUID = Field(..., title='Recording Id')
+
+
+class NestedEntityRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    type: str = Field(..., title='Type')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(..., title='Authorized Public')
+
+
+class NestedIonChannelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    label: str = Field(..., title='Label')
+    gene: str = Field(..., title='Gene')
+    synonyms: list[str] = Field(..., title='Synonyms')
+
+
+class NestedModifiedReconstructionCellMorphologyProtocolRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    protocol_document: ProtocolDocument | None = Field(
+        default=None, title='Protocol Document'
+    )
+    protocol_design: CellMorphologyProtocolDesign
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    type: Literal['cell_morphology_protocol'] = Field(
+        default='cell_morphology_protocol', title='Type'
+    )
+    generation_type: Literal['modified_reconstruction'] = Field(
+        ..., title='Generation Type'
+    )
+    method_type: ModifiedMorphologyMethodType
+
+
+class NestedOrganizationRead(NestedConsortiumRead):
+    pass
+
+
+class NestedPersonRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    given_name: str | None = Field(default=None, title='Given Name')
+    family_name: str | None = Field(default=None, title='Family Name')
+    pref_label: str = Field(..., title='Pref Label')
+    type: str = Field(..., title='Type')
+    sub_id: UUID | None = Field(..., title='Sub Id')
+
+
+class NestedPlaceholderCellMorphologyProtocolRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    type: Literal['cell_morphology_protocol'] = Field(
+        default='cell_morphology_protocol', title='Type'
+    )
+    generation_type: Literal['placeholder'] = Field(..., title='Generation Type')
+
+
+class NestedSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    type: EntityType | None = None
+    simulation_campaign_id: UUID = Field(..., title='Simulation Campaign Id')
+    entity_id: UUID = Field(..., title='Entity Id')
+    scan_parameters: dict[str, Any] = Field(..., title='Scan Parameters')
+    number_neurons: int = Field(..., title='Number Neurons')
+
+
+class NestedSpeciesRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    name: str = Field(..., title='Name')
+    taxonomy_id: str = Field(..., title='Taxonomy Id')
+
+
+class NestedStrainRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    name: str = Field(..., title='Name')
+    taxonomy_id: str = Field(..., title='Taxonomy Id')
+    species_id: UUID = Field(..., title='Species Id')
+
+
+class Weight(RootModel[float]):
+    root: float = Field(..., description='Weight in grams', gt=0.0, title='Weight')
+
+
+class NestedSynaptome(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    seed: int = Field(..., title='Seed')
+
+
+class OrganizationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    pref_label: str = Field(..., title='Pref Label')
+    alternative_name: str | None = Field(default=None, title='Alternative Name')
+    type: str = Field(..., title='Type')
+
+
+class PaginationResponse(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(..., title='Page')
+    page_size: int = Field(..., title='Page Size')
+    total_items: int = Field(..., title='Total Items')
+
+
+class PersonRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    given_name: str | None = Field(default=None, title='Given Name')
+    family_name: str | None = Field(default=None, title='Family Name')
+    pref_label: str = Field(..., title='Pref Label')
+    type: str = Field(..., title='Type')
+    sub_id: UUID | None = Field(..., title='Sub Id')
+
+
+class PointLocationBase(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    x: float = Field(..., title='X')
+    y: float = Field(..., title='Y')
+    z: float = Field(..., title='Z')
+
+
+class RepairPipelineType(RootModel[Literal['raw', 'curated', 'unraveled', 'repaired']]):
+    root: Literal['raw', 'curated', 'unraveled', 'repaired'] = Field(
+        ..., title='RepairPipelineType'
+    )
+
+
+class RoleRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    name: str = Field(..., title='Name')
+    role_id: str = Field(..., title='Role Id')
+
+
+class Sex(RootModel[Literal['male', 'female', 'unknown']]):
+    root: Literal['male', 'female', 'unknown'] = Field(..., title='Sex')
+
+
+class SimulationExecutionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    executor: ExecutorType | None = None
+    execution_id: UUID | None = Field(default=None, title='Execution Id')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    id: UUID = Field(..., title='Id')
+    type: ActivityType | None = None
+    start_time: AwareDatetime | None = Field(default=None, title='Start Time')
+    end_time: AwareDatetime | None = Field(default=None, title='End Time')
+    status: ActivityStatus = Field(default='done', validate_default=True)
+    used: list[NestedEntityRead] = Field(..., title='Used')
+    generated: list[NestedEntityRead] = Field(..., title='Generated')
+
+
+class SimulationGenerationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    id: UUID = Field(..., title='Id')
+    type: ActivityType | None = None
+    start_time: AwareDatetime | None = Field(default=None, title='Start Time')
+    end_time: AwareDatetime | None = Field(default=None, title='End Time')
+    status: ActivityStatus = Field(default='done', validate_default=True)
+    used: list[NestedEntityRead] = Field(..., title='Used')
+    generated: list[NestedEntityRead] = Field(..., title='Generated')
+
+
+class SlicingDirectionType(
+    RootModel[Literal['coronal', 'sagittal', 'horizontal', 'custom']]
+):
+    root: Literal['coronal', 'sagittal', 'horizontal', 'custom'] = Field(
+        ..., title='SlicingDirectionType'
+    )
+
+
+class SpeciesRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    name: str = Field(..., title='Name')
+    taxonomy_id: str = Field(..., title='Taxonomy Id')
+
+
+class StainingType(
+    RootModel[
+        Literal[
+            'golgi',
+            'nissl',
+            'luxol_fast_blue',
+            'fluorescent_nissl',
+            'fluorescent_dyes',
+            'fluorescent_protein_expression',
+            'immunohistochemistry',
+            'other',
+        ]
+    ]
+):
+    root: Literal[
+        'golgi',
+        'nissl',
+        'luxol_fast_blue',
+        'fluorescent_nissl',
+        'fluorescent_dyes',
+        'fluorescent_protein_expression',
+        'immunohistochemistry',
+        'other',
+    ] = Field(..., title='StainingType')
+
+
+class StorageType(RootModel[Literal['aws_s3_internal', 'aws_s3_open']]):
+    root: Literal['aws_s3_internal', 'aws_s3_open'] = Field(
+        ..., description='Storage type.', title='StorageType'
+    )
+
+
+class StrainRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    name: str = Field(..., title='Name')
+    taxonomy_id: str = Field(..., title='Taxonomy Id')
+    species_id: UUID = Field(..., title='Species Id')
+
+
+class StructuralDomain(
+    RootModel[
+        Literal[
+            'apical_dendrite',
+            'basal_dendrite',
+            'axon',
+            'soma',
+            'neuron_morphology',
+            'not_applicable',
+        ]
+    ]
+):
+    root: Literal[
+        'apical_dendrite',
+        'basal_dendrite',
+        'axon',
+        'soma',
+        'neuron_morphology',
+        'not_applicable',
+    ] = Field(..., title='StructuralDomain')
+
+
+class SubjectRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    id: UUID = Field(..., title='Id')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    sex: Sex = Field(..., description='Sex of the subject')
+    weight: Weight | None = Field(
+        default=None, description='Weight in grams', title='Weight'
+    )
+    age_value: float | None = Field(
+        default=None, description='Age value interval.', title='Age value'
+    )
+    age_min: float | None = Field(
+        default=None, description='Minimum age range', title='Minimum age range'
+    )
+    age_max: float | None = Field(
+        default=None, description='Maximum age range', title='Maximum age range'
+    )
+    age_period: AgePeriod | None = None
+
+
+class TargetSimulator(
+    RootModel[Literal['NEURON', 'CORENEURON', 'LearningEngine', 'Brian2']]
+):
+    root: Literal['NEURON', 'CORENEURON', 'LearningEngine', 'Brian2'] = Field(
+        ...,
+        description='Target simulator values as used in libsonata.\n\nSee: https://sonata-extension.readthedocs.io/en/latest/sonata_config.html#target-simulator',
+        title='TargetSimulator',
+    )
+
+
+class UseIon(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    ion_name: str = Field(..., title='Ion Name')
+    read: list[str] = Field(default=[], title='Read')
+    write: list[str] = Field(default=[], title='Write')
+    valence: int | None = Field(default=None, title='Valence')
+    main_ion: bool | None = Field(default=None, title='Main Ion')
+
+
+class ValidationStatus(
+    RootModel[Literal['created', 'initialized', 'running', 'done', 'error']]
+):
+    root: Literal['created', 'initialized', 'running', 'done', 'error'] = Field(
+        ..., title='ValidationStatus'
+    )
+
+
+class WithinBrainRegionDirection(
+    RootModel[Literal['ascendants', 'descendants', 'ascendants_and_descendants']]
+):
+    root: Literal['ascendants', 'descendants', 'ascendants_and_descendants'] = Field(
+        ..., title='WithinBrainRegionDirection'
+    )
+
+
+class ReadManyAnalysisNotebookExecutionGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    executor: ExecutorType | None = Field(default=None, title='Executor')
+    execution_id: UUID | None = Field(default=None, title='Execution Id')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    start_time: AwareDatetime | None = Field(default=None, title='Start Time')
+    end_time: AwareDatetime | None = Field(default=None, title='End Time')
+    status: ActivityStatus | None = Field(default=None, title='Status')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    used__id: UUID | None = Field(default=None, title='Used  Id')
+    used__id__in: list[UUID] | None = Field(default=None, title='Used  Id  In')
+    used__type: EntityType | None = Field(default=None, title='Used  Type')
+    generated__id: UUID | None = Field(default=None, title='Generated  Id')
+    generated__id__in: list[UUID] | None = Field(
+        default=None, title='Generated  Id  In'
+    )
+    generated__type: EntityType | None = Field(default=None, title='Generated  Type')
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManyAnalysisNotebookResultGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManyBrainAtlasGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['name'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+
+
+class ReadManyBrainRegionGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    semantic_search: str | None = Field(default=None, title='Semantic Search')
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    acronym: str | None = Field(default=None, title='Acronym')
+    acronym__in: list[str] | None = Field(default=None, title='Acronym  In')
+    annotation_value: int | None = Field(default=None, title='Annotation Value')
+    hierarchy_id: UUID | None = Field(default=None, title='Hierarchy Id')
+    order_by: list[str] = Field(default=['name'], title='Order By')
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+
+
+class ReadManyBrainRegionHierarchyGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['name'], title='Order By')
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManyCalibrationGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    start_time: AwareDatetime | None = Field(default=None, title='Start Time')
+    end_time: AwareDatetime | None = Field(default=None, title='End Time')
+    status: ActivityStatus | None = Field(default=None, title='Status')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    used__id: UUID | None = Field(default=None, title='Used  Id')
+    used__id__in: list[UUID] | None = Field(default=None, title='Used  Id  In')
+    used__type: EntityType | None = Field(default=None, title='Used  Type')
+    generated__id: UUID | None = Field(default=None, title='Generated  Id')
+    generated__id__in: list[UUID] | None = Field(
+        default=None, title='Generated  Id  In'
+    )
+    generated__type: EntityType | None = Field(default=None, title='Generated  Type')
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManyCellMorphologyGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    has_segmented_spines: bool | None = Field(
+        default=None, title='Has Segmented Spines'
+    )
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    measurement_annotation__creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Measurement Annotation  Creation Date  Lte'
+    )
+    measurement_annotation__creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Measurement Annotation  Creation Date  Gte'
+    )
+    measurement_annotation__update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Measurement Annotation  Update Date  Lte'
+    )
+    measurement_annotation__update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Measurement Annotation  Update Date  Gte'
+    )
+    measurement_kind__pref_label: str | None = Field(
+        default=None, title='Measurement Kind  Pref Label'
+    )
+    measurement_kind__structural_domain: StructuralDomain | None = Field(
+        default=None, title='Measurement Kind  Structural Domain'
+    )
+    measurement_item__name: MeasurementStatistic | None = Field(
+        default=None, title='Measurement Item  Name'
+    )
+    measurement_item__unit: MeasurementUnit | None = Field(
+        default=None, title='Measurement Item  Unit'
+    )
+    measurement_item__value__gte: float | None = Field(
+        default=None, title='Measurement Item  Value  Gte'
+    )
+    measurement_item__value__lte: float | None = Field(
+        default=None, title='Measurement Item  Value  Lte'
+    )
+    mtype__pref_label: str | None = Field(default=None, title='Mtype  Pref Label')
+    mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Mtype  Pref Label  In'
+    )
+    mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Mtype  Pref Label  Ilike'
+    )
+    mtype__id: UUID | None = Field(default=None, title='Mtype  Id')
+    mtype__id__in: list[UUID] | None = Field(default=None, title='Mtype  Id  In')
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    cell_morphology_protocol__name: str | None = Field(
+        default=None, title='Cell Morphology Protocol  Name'
+    )
+    cell_morphology_protocol__name__in: list[str] | None = Field(
+        default=None, title='Cell Morphology Protocol  Name  In'
+    )
+    cell_morphology_protocol__name__ilike: str | None = Field(
+        default=None, title='Cell Morphology Protocol  Name  Ilike'
+    )
+    cell_morphology_protocol__id: UUID | None = Field(
+        default=None, title='Cell Morphology Protocol  Id'
+    )
+    cell_morphology_protocol__id__in: list[UUID] | None = Field(
+        default=None, title='Cell Morphology Protocol  Id  In'
+    )
+    cell_morphology_protocol__generation_type: CellMorphologyGenerationType | None = (
+        Field(default=None, title='Cell Morphology Protocol  Generation Type')
+    )
+    cell_morphology_protocol__generation_type__in: (
+        list[CellMorphologyGenerationType] | None
+    ) = Field(default=None, title='Cell Morphology Protocol  Generation Type  In')
+    cell_morphology_protocol__generation_type__not_in: (
+        list[CellMorphologyGenerationType] | None
+    ) = Field(default=None, title='Cell Morphology Protocol  Generation Type  Not In')
+    cell_morphology_protocol__protocol_design: CellMorphologyProtocolDesign | None = (
+        Field(default=None, title='Cell Morphology Protocol  Protocol Design')
+    )
+    cell_morphology_protocol__protocol_design__in: (
+        list[CellMorphologyProtocolDesign] | None
+    ) = Field(default=None, title='Cell Morphology Protocol  Protocol Design  In')
+    cell_morphology_protocol__protocol_design__not_in: (
+        list[CellMorphologyProtocolDesign] | None
+    ) = Field(default=None, title='Cell Morphology Protocol  Protocol Design  Not In')
+    cell_morphology_protocol__protocol_document: str | None = Field(
+        default=None, title='Cell Morphology Protocol  Protocol Document'
+    )
+    cell_morphology_protocol__protocol_document__in: list[str] | None = Field(
+        default=None, title='Cell Morphology Protocol  Protocol Document  In'
+    )
+    cell_morphology_protocol__protocol_document__ilike: str | None = Field(
+        default=None, title='Cell Morphology Protocol  Protocol Document  Ilike'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyCircuitGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    scale: CircuitScale | None = Field(default=None, title='Scale')
+    scale__in: list[CircuitScale] | None = Field(default=None, title='Scale  In')
+    build_category: CircuitBuildCategory | None = Field(
+        default=None, title='Build Category'
+    )
+    build_category__in: list[CircuitBuildCategory] | None = Field(
+        default=None, title='Build Category  In'
+    )
+    target_simulator: TargetSimulator | None = Field(
+        default=None, title='Target Simulator'
+    )
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    experiment_date__lte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Lte'
+    )
+    experiment_date__gte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Gte'
+    )
+    contact_email: str | None = Field(default=None, title='Contact Email')
+    published_in: str | None = Field(default=None, title='Published In')
+    published_in__ilike: str | None = Field(default=None, title='Published In  Ilike')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    atlas_id: UUID | None = Field(default=None, title='Atlas Id')
+    root_circuit_id: UUID | None = Field(default=None, title='Root Circuit Id')
+    has_morphologies: bool | None = Field(default=None, title='Has Morphologies')
+    has_point_neurons: bool | None = Field(default=None, title='Has Point Neurons')
+    has_electrical_cell_models: bool | None = Field(
+        default=None, title='Has Electrical Cell Models'
+    )
+    has_spines: bool | None = Field(default=None, title='Has Spines')
+    number_neurons__lte: int | None = Field(default=None, title='Number Neurons  Lte')
+    number_neurons__gte: int | None = Field(default=None, title='Number Neurons  Gte')
+    number_synapses__lte: int | None = Field(default=None, title='Number Synapses  Lte')
+    number_synapses__gte: int | None = Field(default=None, title='Number Synapses  Gte')
+    number_connections__lte: int | None = Field(
+        default=None, title='Number Connections  Lte'
+    )
+    number_connections__gte: int | None = Field(
+        default=None, title='Number Connections  Gte'
+    )
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyConsortiumGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    pref_label: str | None = Field(default=None, title='Pref Label')
+    pref_label__in: list[str] | None = Field(default=None, title='Pref Label  In')
+    pref_label__ilike: str | None = Field(default=None, title='Pref Label  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    type: AgentType | None = Field(default=None, title='Type')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    alternative_name: str | None = Field(default=None, title='Alternative Name')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+
+
+class ReadManyContributionGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    agent__pref_label: str | None = Field(default=None, title='Agent  Pref Label')
+    agent__pref_label__in: list[str] | None = Field(
+        default=None, title='Agent  Pref Label  In'
+    )
+    agent__pref_label__ilike: str | None = Field(
+        default=None, title='Agent  Pref Label  Ilike'
+    )
+    agent__id: UUID | None = Field(default=None, title='Agent  Id')
+    agent__id__in: list[UUID] | None = Field(default=None, title='Agent  Id  In')
+    agent__type: AgentType | None = Field(default=None, title='Agent  Type')
+    entity__id: UUID | None = Field(default=None, title='Entity  Id')
+    entity__id__in: list[UUID] | None = Field(default=None, title='Entity  Id  In')
+    entity__type: EntityType | None = Field(default=None, title='Entity  Type')
+
+
+class ReadManyElectricalCellRecordingGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    experiment_date__lte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Lte'
+    )
+    experiment_date__gte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Gte'
+    )
+    contact_email: str | None = Field(default=None, title='Contact Email')
+    published_in: str | None = Field(default=None, title='Published In')
+    published_in__ilike: str | None = Field(default=None, title='Published In  Ilike')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    recording_type: ElectricalRecordingType | None = Field(
+        default=None, title='Recording Type'
+    )
+    recording_type__in: list[ElectricalRecordingType] | None = Field(
+        default=None, title='Recording Type  In'
+    )
+    recording_origin: ElectricalRecordingOrigin | None = Field(
+        default=None, title='Recording Origin'
+    )
+    recording_origin__in: list[ElectricalRecordingOrigin] | None = Field(
+        default=None, title='Recording Origin  In'
+    )
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    etype__pref_label: str | None = Field(default=None, title='Etype  Pref Label')
+    etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Etype  Pref Label  In'
+    )
+    etype__pref_label__ilike: str | None = Field(
+        default=None, title='Etype  Pref Label  Ilike'
+    )
+    etype__id: UUID | None = Field(default=None, title='Etype  Id')
+    etype__id__in: list[UUID] | None = Field(default=None, title='Etype  Id  In')
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyEmodelGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    score__lte: float | None = Field(default=None, title='Score  Lte')
+    score__gte: float | None = Field(default=None, title='Score  Gte')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+    etype__pref_label: str | None = Field(default=None, title='Etype  Pref Label')
+    etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Etype  Pref Label  In'
+    )
+    etype__pref_label__ilike: str | None = Field(
+        default=None, title='Etype  Pref Label  Ilike'
+    )
+    etype__id: UUID | None = Field(default=None, title='Etype  Id')
+    etype__id__in: list[UUID] | None = Field(default=None, title='Etype  Id  In')
+    mtype__pref_label: str | None = Field(default=None, title='Mtype  Pref Label')
+    mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Mtype  Pref Label  In'
+    )
+    mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Mtype  Pref Label  Ilike'
+    )
+    mtype__id: UUID | None = Field(default=None, title='Mtype  Id')
+    mtype__id__in: list[UUID] | None = Field(default=None, title='Mtype  Id  In')
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    exemplar_morphology__name: str | None = Field(
+        default=None, title='Exemplar Morphology  Name'
+    )
+    exemplar_morphology__name__in: list[str] | None = Field(
+        default=None, title='Exemplar Morphology  Name  In'
+    )
+    exemplar_morphology__name__ilike: str | None = Field(
+        default=None, title='Exemplar Morphology  Name  Ilike'
+    )
+    exemplar_morphology__id: UUID | None = Field(
+        default=None, title='Exemplar Morphology  Id'
+    )
+    exemplar_morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Exemplar Morphology  Id  In'
+    )
+    exemplar_morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Exemplar Morphology  Has Segmented Spines'
+    )
+    ion_channel_model__name: str | None = Field(
+        default=None, title='Ion Channel Model  Name'
+    )
+    ion_channel_model__name__in: list[str] | None = Field(
+        default=None, title='Ion Channel Model  Name  In'
+    )
+    ion_channel_model__name__ilike: str | None = Field(
+        default=None, title='Ion Channel Model  Name  Ilike'
+    )
+    ion_channel_model__id: UUID | None = Field(
+        default=None, title='Ion Channel Model  Id'
+    )
+    ion_channel_model__id__in: list[UUID] | None = Field(
+        default=None, title='Ion Channel Model  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyEtypeGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    pref_label: str | None = Field(default=None, title='Pref Label')
+    pref_label__in: list[str] | None = Field(default=None, title='Pref Label  In')
+    pref_label__ilike: str | None = Field(default=None, title='Pref Label  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['pref_label'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: pref_label, alt_label",
+        title='Ilike Search',
+    )
+
+
+class ReadManyExperimentalBoutonDensityGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    mtype__pref_label: str | None = Field(default=None, title='Mtype  Pref Label')
+    mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Mtype  Pref Label  In'
+    )
+    mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Mtype  Pref Label  Ilike'
+    )
+    mtype__id: UUID | None = Field(default=None, title='Mtype  Id')
+    mtype__id__in: list[UUID] | None = Field(default=None, title='Mtype  Id  In')
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyExperimentalNeuronDensityGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    etype__pref_label: str | None = Field(default=None, title='Etype  Pref Label')
+    etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Etype  Pref Label  In'
+    )
+    etype__pref_label__ilike: str | None = Field(
+        default=None, title='Etype  Pref Label  Ilike'
+    )
+    etype__id: UUID | None = Field(default=None, title='Etype  Id')
+    etype__id__in: list[UUID] | None = Field(default=None, title='Etype  Id  In')
+    mtype__pref_label: str | None = Field(default=None, title='Mtype  Pref Label')
+    mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Mtype  Pref Label  In'
+    )
+    mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Mtype  Pref Label  Ilike'
+    )
+    mtype__id: UUID | None = Field(default=None, title='Mtype  Id')
+    mtype__id__in: list[UUID] | None = Field(default=None, title='Mtype  Id  In')
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyExperimentalSynapsesPerConnectionGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    pre_mtype__pref_label: str | None = Field(
+        default=None, title='Pre Mtype  Pref Label'
+    )
+    pre_mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Pre Mtype  Pref Label  In'
+    )
+    pre_mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Pre Mtype  Pref Label  Ilike'
+    )
+    pre_mtype__id: UUID | None = Field(default=None, title='Pre Mtype  Id')
+    pre_mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Pre Mtype  Id  In'
+    )
+    post_mtype__pref_label: str | None = Field(
+        default=None, title='Post Mtype  Pref Label'
+    )
+    post_mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Post Mtype  Pref Label  In'
+    )
+    post_mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Post Mtype  Pref Label  Ilike'
+    )
+    post_mtype__id: UUID | None = Field(default=None, title='Post Mtype  Id')
+    post_mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Post Mtype  Id  In'
+    )
+    pre_region__name: str | None = Field(default=None, title='Pre Region  Name')
+    pre_region__name__in: list[str] | None = Field(
+        default=None, title='Pre Region  Name  In'
+    )
+    pre_region__name__ilike: str | None = Field(
+        default=None, title='Pre Region  Name  Ilike'
+    )
+    pre_region__id: UUID | None = Field(default=None, title='Pre Region  Id')
+    pre_region__id__in: list[UUID] | None = Field(
+        default=None, title='Pre Region  Id  In'
+    )
+    pre_region__acronym: str | None = Field(default=None, title='Pre Region  Acronym')
+    pre_region__acronym__in: list[str] | None = Field(
+        default=None, title='Pre Region  Acronym  In'
+    )
+    pre_region__annotation_value: int | None = Field(
+        default=None, title='Pre Region  Annotation Value'
+    )
+    pre_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Pre Region  Hierarchy Id'
+    )
+    post_region__name: str | None = Field(default=None, title='Post Region  Name')
+    post_region__name__in: list[str] | None = Field(
+        default=None, title='Post Region  Name  In'
+    )
+    post_region__name__ilike: str | None = Field(
+        default=None, title='Post Region  Name  Ilike'
+    )
+    post_region__id: UUID | None = Field(default=None, title='Post Region  Id')
+    post_region__id__in: list[UUID] | None = Field(
+        default=None, title='Post Region  Id  In'
+    )
+    post_region__acronym: str | None = Field(default=None, title='Post Region  Acronym')
+    post_region__acronym__in: list[str] | None = Field(
+        default=None, title='Post Region  Acronym  In'
+    )
+    post_region__annotation_value: int | None = Field(
+        default=None, title='Post Region  Annotation Value'
+    )
+    post_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Post Region  Hierarchy Id'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyIonChannelGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    label: str | None = Field(default=None, title='Label')
+    gene: str | None = Field(default=None, title='Gene')
+    order_by: list[str] = Field(default=['label'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManyIonChannelModelGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    experiment_date__lte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Lte'
+    )
+    experiment_date__gte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Gte'
+    )
+    contact_email: str | None = Field(default=None, title='Contact Email')
+    published_in: str | None = Field(default=None, title='Published In')
+    published_in__ilike: str | None = Field(default=None, title='Published In  Ilike')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    nmodl_suffix: str | None = Field(default=None, title='Nmodl Suffix')
+    is_ljp_corrected: bool | None = Field(default=None, title='Is Ljp Corrected')
+    is_temperature_dependent: bool | None = Field(
+        default=None, title='Is Temperature Dependent'
+    )
+    temperature_celsius: int | None = Field(default=None, title='Temperature Celsius')
+    temperature_celsius__lte: int | None = Field(
+        default=None, title='Temperature Celsius  Lte'
+    )
+    temperature_celsius__gte: int | None = Field(
+        default=None, title='Temperature Celsius  Gte'
+    )
+    is_stochastic: bool | None = Field(default=None, title='Is Stochastic')
+    conductance_name: str | None = Field(default=None, title='Conductance Name')
+    conductance_name__isnull: bool | None = Field(
+        default=None, title='Conductance Name  Isnull'
+    )
+    max_permeability_name: str | None = Field(
+        default=None, title='Max Permeability Name'
+    )
+    max_permeability_name__isnull: bool | None = Field(
+        default=None, title='Max Permeability Name  Isnull'
+    )
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyIonChannelRecordingGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    experiment_date__lte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Lte'
+    )
+    experiment_date__gte: AwareDatetime | None = Field(
+        default=None, title='Experiment Date  Gte'
+    )
+    contact_email: str | None = Field(default=None, title='Contact Email')
+    published_in: str | None = Field(default=None, title='Published In')
+    published_in__ilike: str | None = Field(default=None, title='Published In  Ilike')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    recording_type: ElectricalRecordingType | None = Field(
+        default=None, title='Recording Type'
+    )
+    recording_type__in: list[ElectricalRecordingType] | None = Field(
+        default=None, title='Recording Type  In'
+    )
+    recording_origin: ElectricalRecordingOrigin | None = Field(
+        default=None, title='Recording Origin'
+    )
+    recording_origin__in: list[ElectricalRecordingOrigin] | None = Field(
+        default=None, title='Recording Origin  In'
+    )
+    temperature: float | None = Field(default=None, title='Temperature')
+    temperature__lte: float | None = Field(default=None, title='Temperature  Lte')
+    temperature__gte: float | None = Field(default=None, title='Temperature  Gte')
+    cell_line: str | None = Field(default=None, title='Cell Line')
+    cell_line__ilike: str | None = Field(default=None, title='Cell Line  Ilike')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    subject__name: str | None = Field(default=None, title='Subject  Name')
+    subject__name__in: list[str] | None = Field(default=None, title='Subject  Name  In')
+    subject__name__ilike: str | None = Field(default=None, title='Subject  Name  Ilike')
+    subject__id: UUID | None = Field(default=None, title='Subject  Id')
+    subject__id__in: list[UUID] | None = Field(default=None, title='Subject  Id  In')
+    subject__age_value: timedelta | None = Field(
+        default=None, title='Subject  Age Value'
+    )
+    subject__species__name: str | None = Field(
+        default=None, title='Subject  Species  Name'
+    )
+    subject__species__name__in: list[str] | None = Field(
+        default=None, title='Subject  Species  Name  In'
+    )
+    subject__species__name__ilike: str | None = Field(
+        default=None, title='Subject  Species  Name  Ilike'
+    )
+    subject__species__id: UUID | None = Field(
+        default=None, title='Subject  Species  Id'
+    )
+    subject__species__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Species  Id  In'
+    )
+    subject__strain__name: str | None = Field(
+        default=None, title='Subject  Strain  Name'
+    )
+    subject__strain__name__in: list[str] | None = Field(
+        default=None, title='Subject  Strain  Name  In'
+    )
+    subject__strain__name__ilike: str | None = Field(
+        default=None, title='Subject  Strain  Name  Ilike'
+    )
+    subject__strain__id: UUID | None = Field(default=None, title='Subject  Strain  Id')
+    subject__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Subject  Strain  Id  In'
+    )
+    ion_channel__name: str | None = Field(default=None, title='Ion Channel  Name')
+    ion_channel__name__in: list[str] | None = Field(
+        default=None, title='Ion Channel  Name  In'
+    )
+    ion_channel__name__ilike: str | None = Field(
+        default=None, title='Ion Channel  Name  Ilike'
+    )
+    ion_channel__id: UUID | None = Field(default=None, title='Ion Channel  Id')
+    ion_channel__id__in: list[UUID] | None = Field(
+        default=None, title='Ion Channel  Id  In'
+    )
+    ion_channel__label: str | None = Field(default=None, title='Ion Channel  Label')
+    ion_channel__gene: str | None = Field(default=None, title='Ion Channel  Gene')
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyMeasurementAnnotationGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    entity_id: UUID | None = Field(default=None, title='Entity Id')
+    entity_type: MeasurableEntity | None = Field(default=None, title='Entity Type')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    measurement_kind__pref_label: str | None = Field(
+        default=None, title='Measurement Kind  Pref Label'
+    )
+    measurement_kind__structural_domain: StructuralDomain | None = Field(
+        default=None, title='Measurement Kind  Structural Domain'
+    )
+    measurement_item__name: MeasurementStatistic | None = Field(
+        default=None, title='Measurement Item  Name'
+    )
+    measurement_item__unit: MeasurementUnit | None = Field(
+        default=None, title='Measurement Item  Unit'
+    )
+    measurement_item__value__gte: float | None = Field(
+        default=None, title='Measurement Item  Value  Gte'
+    )
+    measurement_item__value__lte: float | None = Field(
+        default=None, title='Measurement Item  Value  Lte'
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+
+
+class ReadManyMemodelGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    etype__pref_label: str | None = Field(default=None, title='Etype  Pref Label')
+    etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Etype  Pref Label  In'
+    )
+    etype__pref_label__ilike: str | None = Field(
+        default=None, title='Etype  Pref Label  Ilike'
+    )
+    etype__id: UUID | None = Field(default=None, title='Etype  Id')
+    etype__id__in: list[UUID] | None = Field(default=None, title='Etype  Id  In')
+    mtype__pref_label: str | None = Field(default=None, title='Mtype  Pref Label')
+    mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Mtype  Pref Label  In'
+    )
+    mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Mtype  Pref Label  Ilike'
+    )
+    mtype__id: UUID | None = Field(default=None, title='Mtype  Id')
+    mtype__id__in: list[UUID] | None = Field(default=None, title='Mtype  Id  In')
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    morphology__name: str | None = Field(default=None, title='Morphology  Name')
+    morphology__name__in: list[str] | None = Field(
+        default=None, title='Morphology  Name  In'
+    )
+    morphology__name__ilike: str | None = Field(
+        default=None, title='Morphology  Name  Ilike'
+    )
+    morphology__id: UUID | None = Field(default=None, title='Morphology  Id')
+    morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Morphology  Id  In'
+    )
+    morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Morphology  Has Segmented Spines'
+    )
+    emodel__name: str | None = Field(default=None, title='Emodel  Name')
+    emodel__name__in: list[str] | None = Field(default=None, title='Emodel  Name  In')
+    emodel__name__ilike: str | None = Field(default=None, title='Emodel  Name  Ilike')
+    emodel__id: UUID | None = Field(default=None, title='Emodel  Id')
+    emodel__id__in: list[UUID] | None = Field(default=None, title='Emodel  Id  In')
+    emodel__score__lte: float | None = Field(default=None, title='Emodel  Score  Lte')
+    emodel__score__gte: float | None = Field(default=None, title='Emodel  Score  Gte')
+    emodel__brain_region__name: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name'
+    )
+    emodel__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Name  In'
+    )
+    emodel__brain_region__name__ilike: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name  Ilike'
+    )
+    emodel__brain_region__id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Id'
+    )
+    emodel__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Brain Region  Id  In'
+    )
+    emodel__brain_region__acronym: str | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym'
+    )
+    emodel__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym  In'
+    )
+    emodel__brain_region__annotation_value: int | None = Field(
+        default=None, title='Emodel  Brain Region  Annotation Value'
+    )
+    emodel__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Hierarchy Id'
+    )
+    emodel__mtype__pref_label: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label'
+    )
+    emodel__mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  In'
+    )
+    emodel__mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  Ilike'
+    )
+    emodel__mtype__id: UUID | None = Field(default=None, title='Emodel  Mtype  Id')
+    emodel__mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Mtype  Id  In'
+    )
+    emodel__etype__pref_label: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label'
+    )
+    emodel__etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  In'
+    )
+    emodel__etype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  Ilike'
+    )
+    emodel__etype__id: UUID | None = Field(default=None, title='Emodel  Etype  Id')
+    emodel__etype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Etype  Id  In'
+    )
+    emodel__exemplar_morphology__name: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name'
+    )
+    emodel__exemplar_morphology__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  In'
+    )
+    emodel__exemplar_morphology__name__ilike: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  Ilike'
+    )
+    emodel__exemplar_morphology__id: UUID | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id'
+    )
+    emodel__exemplar_morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id  In'
+    )
+    emodel__exemplar_morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Has Segmented Spines'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManyMtypeGetParametersQuery(ReadManyEtypeGetParametersQuery):
+    pass
+
+
+class ReadManyOrganizationGetParametersQuery(ReadManyConsortiumGetParametersQuery):
+    pass
+
+
+class ReadManyPersonGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    pref_label: str | None = Field(default=None, title='Pref Label')
+    pref_label__in: list[str] | None = Field(default=None, title='Pref Label  In')
+    pref_label__ilike: str | None = Field(default=None, title='Pref Label  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    type: AgentType | None = Field(default=None, title='Type')
+    given_name: str | None = Field(default=None, title='Given Name')
+    given_name__ilike: str | None = Field(default=None, title='Given Name  Ilike')
+    family_name: str | None = Field(default=None, title='Family Name')
+    family_name__ilike: str | None = Field(default=None, title='Family Name  Ilike')
+    sub_id: UUID | None = Field(default=None, title='Sub Id')
+    sub_id__in: list[UUID] | None = Field(default=None, title='Sub Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+
+
+class ReadManySimulationGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    entity_id: UUID | None = Field(default=None, title='Entity Id')
+    entity_id__in: list[UUID] | None = Field(default=None, title='Entity Id  In')
+    simulation_campaign_id: UUID | None = Field(
+        default=None, title='Simulation Campaign Id'
+    )
+    simulation_campaign_id__in: list[UUID] | None = Field(
+        default=None, title='Simulation Campaign Id  In'
+    )
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    circuit__scale: CircuitScale | None = Field(default=None, title='Circuit  Scale')
+    circuit__scale__in: list[CircuitScale] | None = Field(
+        default=None, title='Circuit  Scale  In'
+    )
+    circuit__build_category: CircuitBuildCategory | None = Field(
+        default=None, title='Circuit  Build Category'
+    )
+    circuit__build_category__in: list[CircuitBuildCategory] | None = Field(
+        default=None, title='Circuit  Build Category  In'
+    )
+    circuit__target_simulator: TargetSimulator | None = Field(
+        default=None, title='Circuit  Target Simulator'
+    )
+    circuit__name: str | None = Field(default=None, title='Circuit  Name')
+    circuit__name__in: list[str] | None = Field(default=None, title='Circuit  Name  In')
+    circuit__name__ilike: str | None = Field(default=None, title='Circuit  Name  Ilike')
+    circuit__id: UUID | None = Field(default=None, title='Circuit  Id')
+    circuit__id__in: list[UUID] | None = Field(default=None, title='Circuit  Id  In')
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManySimulationCampaignGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    entity_id: UUID | None = Field(default=None, title='Entity Id')
+    entity_id__in: list[UUID] | None = Field(default=None, title='Entity Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    entity__id: UUID | None = Field(default=None, title='Entity  Id')
+    entity__id__in: list[UUID] | None = Field(default=None, title='Entity  Id  In')
+    entity__type: Literal['circuit', 'memodel', 'ion_channel_model'] | None = Field(
+        default=None, title='Entity  Type'
+    )
+    circuit__scale: CircuitScale | None = Field(default=None, title='Circuit  Scale')
+    circuit__scale__in: list[CircuitScale] | None = Field(
+        default=None, title='Circuit  Scale  In'
+    )
+    circuit__build_category: CircuitBuildCategory | None = Field(
+        default=None, title='Circuit  Build Category'
+    )
+    circuit__build_category__in: list[CircuitBuildCategory] | None = Field(
+        default=None, title='Circuit  Build Category  In'
+    )
+    circuit__target_simulator: TargetSimulator | None = Field(
+        default=None, title='Circuit  Target Simulator'
+    )
+    circuit__name: str | None = Field(default=None, title='Circuit  Name')
+    circuit__name__in: list[str] | None = Field(default=None, title='Circuit  Name  In')
+    circuit__name__ilike: str | None = Field(default=None, title='Circuit  Name  Ilike')
+    circuit__id: UUID | None = Field(default=None, title='Circuit  Id')
+    circuit__id__in: list[UUID] | None = Field(default=None, title='Circuit  Id  In')
+    simulation__id: UUID | None = Field(default=None, title='Simulation  Id')
+    simulation__id__in: list[UUID] | None = Field(
+        default=None, title='Simulation  Id  In'
+    )
+    simulation__name: str | None = Field(default=None, title='Simulation  Name')
+    simulation__name__in: list[str] | None = Field(
+        default=None, title='Simulation  Name  In'
+    )
+    simulation__name__ilike: str | None = Field(
+        default=None, title='Simulation  Name  Ilike'
+    )
+    simulation__entity_id: UUID | None = Field(
+        default=None, title='Simulation  Entity Id'
+    )
+    simulation__entity_id__in: list[UUID] | None = Field(
+        default=None, title='Simulation  Entity Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class ReadManySimulationExecutionGetParametersQuery(
+    ReadManyAnalysisNotebookExecutionGetParametersQuery
+):
+    pass
+
+
+class ReadManySimulationGenerationGetParametersQuery(
+    ReadManyCalibrationGetParametersQuery
+):
+    pass
+
+
+class ReadManySimulationResultGetParametersQuery(
+    ReadManyAnalysisNotebookResultGetParametersQuery
+):
+    pass
+
+
+class ReadManySingleNeuronSimulationGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    me_model__name: str | None = Field(default=None, title='Me Model  Name')
+    me_model__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Name  In'
+    )
+    me_model__name__ilike: str | None = Field(
+        default=None, title='Me Model  Name  Ilike'
+    )
+    me_model__id: UUID | None = Field(default=None, title='Me Model  Id')
+    me_model__id__in: list[UUID] | None = Field(default=None, title='Me Model  Id  In')
+    me_model__validation_status: ValidationStatus | None = Field(
+        default=None, title='Me Model  Validation Status'
+    )
+    me_model__brain_region__name: str | None = Field(
+        default=None, title='Me Model  Brain Region  Name'
+    )
+    me_model__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Brain Region  Name  In'
+    )
+    me_model__brain_region__name__ilike: str | None = Field(
+        default=None, title='Me Model  Brain Region  Name  Ilike'
+    )
+    me_model__brain_region__id: UUID | None = Field(
+        default=None, title='Me Model  Brain Region  Id'
+    )
+    me_model__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Brain Region  Id  In'
+    )
+    me_model__brain_region__acronym: str | None = Field(
+        default=None, title='Me Model  Brain Region  Acronym'
+    )
+    me_model__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Me Model  Brain Region  Acronym  In'
+    )
+    me_model__brain_region__annotation_value: int | None = Field(
+        default=None, title='Me Model  Brain Region  Annotation Value'
+    )
+    me_model__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Me Model  Brain Region  Hierarchy Id'
+    )
+    me_model__species__name: str | None = Field(
+        default=None, title='Me Model  Species  Name'
+    )
+    me_model__species__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Species  Name  In'
+    )
+    me_model__species__name__ilike: str | None = Field(
+        default=None, title='Me Model  Species  Name  Ilike'
+    )
+    me_model__species__id: UUID | None = Field(
+        default=None, title='Me Model  Species  Id'
+    )
+    me_model__species__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Species  Id  In'
+    )
+    me_model__strain__name: str | None = Field(
+        default=None, title='Me Model  Strain  Name'
+    )
+    me_model__strain__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Strain  Name  In'
+    )
+    me_model__strain__name__ilike: str | None = Field(
+        default=None, title='Me Model  Strain  Name  Ilike'
+    )
+    me_model__strain__id: UUID | None = Field(
+        default=None, title='Me Model  Strain  Id'
+    )
+    me_model__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Strain  Id  In'
+    )
+    me_model__morphology__name: str | None = Field(
+        default=None, title='Me Model  Morphology  Name'
+    )
+    me_model__morphology__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Morphology  Name  In'
+    )
+    me_model__morphology__name__ilike: str | None = Field(
+        default=None, title='Me Model  Morphology  Name  Ilike'
+    )
+    me_model__morphology__id: UUID | None = Field(
+        default=None, title='Me Model  Morphology  Id'
+    )
+    me_model__morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Morphology  Id  In'
+    )
+    me_model__morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Me Model  Morphology  Has Segmented Spines'
+    )
+    me_model__emodel__name: str | None = Field(
+        default=None, title='Me Model  Emodel  Name'
+    )
+    me_model__emodel__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Emodel  Name  In'
+    )
+    me_model__emodel__name__ilike: str | None = Field(
+        default=None, title='Me Model  Emodel  Name  Ilike'
+    )
+    me_model__emodel__id: UUID | None = Field(
+        default=None, title='Me Model  Emodel  Id'
+    )
+    me_model__emodel__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Emodel  Id  In'
+    )
+    me_model__emodel__score__lte: float | None = Field(
+        default=None, title='Me Model  Emodel  Score  Lte'
+    )
+    me_model__emodel__score__gte: float | None = Field(
+        default=None, title='Me Model  Emodel  Score  Gte'
+    )
+    emodel__brain_region__name: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name'
+    )
+    emodel__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Name  In'
+    )
+    emodel__brain_region__name__ilike: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name  Ilike'
+    )
+    emodel__brain_region__id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Id'
+    )
+    emodel__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Brain Region  Id  In'
+    )
+    emodel__brain_region__acronym: str | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym'
+    )
+    emodel__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym  In'
+    )
+    emodel__brain_region__annotation_value: int | None = Field(
+        default=None, title='Emodel  Brain Region  Annotation Value'
+    )
+    emodel__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Hierarchy Id'
+    )
+    emodel__mtype__pref_label: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label'
+    )
+    emodel__mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  In'
+    )
+    emodel__mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  Ilike'
+    )
+    emodel__mtype__id: UUID | None = Field(default=None, title='Emodel  Mtype  Id')
+    emodel__mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Mtype  Id  In'
+    )
+    emodel__etype__pref_label: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label'
+    )
+    emodel__etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  In'
+    )
+    emodel__etype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  Ilike'
+    )
+    emodel__etype__id: UUID | None = Field(default=None, title='Emodel  Etype  Id')
+    emodel__etype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Etype  Id  In'
+    )
+    emodel__exemplar_morphology__name: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name'
+    )
+    emodel__exemplar_morphology__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  In'
+    )
+    emodel__exemplar_morphology__name__ilike: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  Ilike'
+    )
+    emodel__exemplar_morphology__id: UUID | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id'
+    )
+    emodel__exemplar_morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id  In'
+    )
+    emodel__exemplar_morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Has Segmented Spines'
+    )
+    me_model__mtype__pref_label: str | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label'
+    )
+    me_model__mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label  In'
+    )
+    me_model__mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label  Ilike'
+    )
+    me_model__mtype__id: UUID | None = Field(default=None, title='Me Model  Mtype  Id')
+    me_model__mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Mtype  Id  In'
+    )
+    me_model__etype__pref_label: str | None = Field(
+        default=None, title='Me Model  Etype  Pref Label'
+    )
+    me_model__etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Me Model  Etype  Pref Label  In'
+    )
+    me_model__etype__pref_label__ilike: str | None = Field(
+        default=None, title='Me Model  Etype  Pref Label  Ilike'
+    )
+    me_model__etype__id: UUID | None = Field(default=None, title='Me Model  Etype  Id')
+    me_model__etype__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Etype  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManySingleNeuronSynaptomeGetParametersQuery(
+    ReadManySingleNeuronSimulationGetParametersQuery
+):
+    pass
+
+
+class ReadManySingleNeuronSynaptomeSimulationGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    brain_region__name: str | None = Field(default=None, title='Brain Region  Name')
+    brain_region__name__in: list[str] | None = Field(
+        default=None, title='Brain Region  Name  In'
+    )
+    brain_region__name__ilike: str | None = Field(
+        default=None, title='Brain Region  Name  Ilike'
+    )
+    brain_region__id: UUID | None = Field(default=None, title='Brain Region  Id')
+    brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Brain Region  Id  In'
+    )
+    brain_region__acronym: str | None = Field(
+        default=None, title='Brain Region  Acronym'
+    )
+    brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Brain Region  Acronym  In'
+    )
+    brain_region__annotation_value: int | None = Field(
+        default=None, title='Brain Region  Annotation Value'
+    )
+    brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Brain Region  Hierarchy Id'
+    )
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    synaptome__name: str | None = Field(default=None, title='Synaptome  Name')
+    synaptome__name__in: list[str] | None = Field(
+        default=None, title='Synaptome  Name  In'
+    )
+    synaptome__name__ilike: str | None = Field(
+        default=None, title='Synaptome  Name  Ilike'
+    )
+    synaptome__id: UUID | None = Field(default=None, title='Synaptome  Id')
+    synaptome__id__in: list[UUID] | None = Field(
+        default=None, title='Synaptome  Id  In'
+    )
+    synaptome__brain_region__name: str | None = Field(
+        default=None, title='Synaptome  Brain Region  Name'
+    )
+    synaptome__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Synaptome  Brain Region  Name  In'
+    )
+    synaptome__brain_region__name__ilike: str | None = Field(
+        default=None, title='Synaptome  Brain Region  Name  Ilike'
+    )
+    synaptome__brain_region__id: UUID | None = Field(
+        default=None, title='Synaptome  Brain Region  Id'
+    )
+    synaptome__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Synaptome  Brain Region  Id  In'
+    )
+    synaptome__brain_region__acronym: str | None = Field(
+        default=None, title='Synaptome  Brain Region  Acronym'
+    )
+    synaptome__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Synaptome  Brain Region  Acronym  In'
+    )
+    synaptome__brain_region__annotation_value: int | None = Field(
+        default=None, title='Synaptome  Brain Region  Annotation Value'
+    )
+    synaptome__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Synaptome  Brain Region  Hierarchy Id'
+    )
+    synaptome__me_model__name: str | None = Field(
+        default=None, title='Synaptome  Me Model  Name'
+    )
+    synaptome__me_model__name__in: list[str] | None = Field(
+        default=None, title='Synaptome  Me Model  Name  In'
+    )
+    synaptome__me_model__name__ilike: str | None = Field(
+        default=None, title='Synaptome  Me Model  Name  Ilike'
+    )
+    synaptome__me_model__id: UUID | None = Field(
+        default=None, title='Synaptome  Me Model  Id'
+    )
+    synaptome__me_model__id__in: list[UUID] | None = Field(
+        default=None, title='Synaptome  Me Model  Id  In'
+    )
+    synaptome__me_model__validation_status: ValidationStatus | None = Field(
+        default=None, title='Synaptome  Me Model  Validation Status'
+    )
+    me_model__brain_region__name: str | None = Field(
+        default=None, title='Me Model  Brain Region  Name'
+    )
+    me_model__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Brain Region  Name  In'
+    )
+    me_model__brain_region__name__ilike: str | None = Field(
+        default=None, title='Me Model  Brain Region  Name  Ilike'
+    )
+    me_model__brain_region__id: UUID | None = Field(
+        default=None, title='Me Model  Brain Region  Id'
+    )
+    me_model__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Brain Region  Id  In'
+    )
+    me_model__brain_region__acronym: str | None = Field(
+        default=None, title='Me Model  Brain Region  Acronym'
+    )
+    me_model__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Me Model  Brain Region  Acronym  In'
+    )
+    me_model__brain_region__annotation_value: int | None = Field(
+        default=None, title='Me Model  Brain Region  Annotation Value'
+    )
+    me_model__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Me Model  Brain Region  Hierarchy Id'
+    )
+    me_model__species__name: str | None = Field(
+        default=None, title='Me Model  Species  Name'
+    )
+    me_model__species__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Species  Name  In'
+    )
+    me_model__species__name__ilike: str | None = Field(
+        default=None, title='Me Model  Species  Name  Ilike'
+    )
+    me_model__species__id: UUID | None = Field(
+        default=None, title='Me Model  Species  Id'
+    )
+    me_model__species__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Species  Id  In'
+    )
+    me_model__strain__name: str | None = Field(
+        default=None, title='Me Model  Strain  Name'
+    )
+    me_model__strain__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Strain  Name  In'
+    )
+    me_model__strain__name__ilike: str | None = Field(
+        default=None, title='Me Model  Strain  Name  Ilike'
+    )
+    me_model__strain__id: UUID | None = Field(
+        default=None, title='Me Model  Strain  Id'
+    )
+    me_model__strain__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Strain  Id  In'
+    )
+    me_model__morphology__name: str | None = Field(
+        default=None, title='Me Model  Morphology  Name'
+    )
+    me_model__morphology__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Morphology  Name  In'
+    )
+    me_model__morphology__name__ilike: str | None = Field(
+        default=None, title='Me Model  Morphology  Name  Ilike'
+    )
+    me_model__morphology__id: UUID | None = Field(
+        default=None, title='Me Model  Morphology  Id'
+    )
+    me_model__morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Morphology  Id  In'
+    )
+    me_model__morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Me Model  Morphology  Has Segmented Spines'
+    )
+    me_model__emodel__name: str | None = Field(
+        default=None, title='Me Model  Emodel  Name'
+    )
+    me_model__emodel__name__in: list[str] | None = Field(
+        default=None, title='Me Model  Emodel  Name  In'
+    )
+    me_model__emodel__name__ilike: str | None = Field(
+        default=None, title='Me Model  Emodel  Name  Ilike'
+    )
+    me_model__emodel__id: UUID | None = Field(
+        default=None, title='Me Model  Emodel  Id'
+    )
+    me_model__emodel__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Emodel  Id  In'
+    )
+    me_model__emodel__score__lte: float | None = Field(
+        default=None, title='Me Model  Emodel  Score  Lte'
+    )
+    me_model__emodel__score__gte: float | None = Field(
+        default=None, title='Me Model  Emodel  Score  Gte'
+    )
+    emodel__brain_region__name: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name'
+    )
+    emodel__brain_region__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Name  In'
+    )
+    emodel__brain_region__name__ilike: str | None = Field(
+        default=None, title='Emodel  Brain Region  Name  Ilike'
+    )
+    emodel__brain_region__id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Id'
+    )
+    emodel__brain_region__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Brain Region  Id  In'
+    )
+    emodel__brain_region__acronym: str | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym'
+    )
+    emodel__brain_region__acronym__in: list[str] | None = Field(
+        default=None, title='Emodel  Brain Region  Acronym  In'
+    )
+    emodel__brain_region__annotation_value: int | None = Field(
+        default=None, title='Emodel  Brain Region  Annotation Value'
+    )
+    emodel__brain_region__hierarchy_id: UUID | None = Field(
+        default=None, title='Emodel  Brain Region  Hierarchy Id'
+    )
+    emodel__mtype__pref_label: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label'
+    )
+    emodel__mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  In'
+    )
+    emodel__mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Mtype  Pref Label  Ilike'
+    )
+    emodel__mtype__id: UUID | None = Field(default=None, title='Emodel  Mtype  Id')
+    emodel__mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Mtype  Id  In'
+    )
+    emodel__etype__pref_label: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label'
+    )
+    emodel__etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  In'
+    )
+    emodel__etype__pref_label__ilike: str | None = Field(
+        default=None, title='Emodel  Etype  Pref Label  Ilike'
+    )
+    emodel__etype__id: UUID | None = Field(default=None, title='Emodel  Etype  Id')
+    emodel__etype__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Etype  Id  In'
+    )
+    emodel__exemplar_morphology__name: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name'
+    )
+    emodel__exemplar_morphology__name__in: list[str] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  In'
+    )
+    emodel__exemplar_morphology__name__ilike: str | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Name  Ilike'
+    )
+    emodel__exemplar_morphology__id: UUID | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id'
+    )
+    emodel__exemplar_morphology__id__in: list[UUID] | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Id  In'
+    )
+    emodel__exemplar_morphology__has_segmented_spines: bool | None = Field(
+        default=None, title='Emodel  Exemplar Morphology  Has Segmented Spines'
+    )
+    me_model__mtype__pref_label: str | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label'
+    )
+    me_model__mtype__pref_label__in: list[str] | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label  In'
+    )
+    me_model__mtype__pref_label__ilike: str | None = Field(
+        default=None, title='Me Model  Mtype  Pref Label  Ilike'
+    )
+    me_model__mtype__id: UUID | None = Field(default=None, title='Me Model  Mtype  Id')
+    me_model__mtype__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Mtype  Id  In'
+    )
+    me_model__etype__pref_label: str | None = Field(
+        default=None, title='Me Model  Etype  Pref Label'
+    )
+    me_model__etype__pref_label__in: list[str] | None = Field(
+        default=None, title='Me Model  Etype  Pref Label  In'
+    )
+    me_model__etype__pref_label__ilike: str | None = Field(
+        default=None, title='Me Model  Etype  Pref Label  Ilike'
+    )
+    me_model__etype__id: UUID | None = Field(default=None, title='Me Model  Etype  Id')
+    me_model__etype__id__in: list[UUID] | None = Field(
+        default=None, title='Me Model  Etype  Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+    within_brain_region_brain_region_id: UUID | None = Field(
+        default=None, title='Within Brain Region Brain Region Id'
+    )
+    within_brain_region_direction: WithinBrainRegionDirection | None = Field(
+        default=None, title='Within Brain Region Direction'
+    )
+    within_brain_region_hierarchy_id: UUID | None = Field(
+        default=None, deprecated=True, title='Within Brain Region Hierarchy Id'
+    )
+
+
+class ReadManySpeciesGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    semantic_search: str | None = Field(default=None, title='Semantic Search')
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    order_by: list[str] = Field(default=['name'], title='Order By')
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+
+
+class ReadManyStrainGetParametersQuery(ReadManySpeciesGetParametersQuery):
+    pass
+
+
+class ReadManySubjectGetParametersQuery(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    page: int = Field(default=1, ge=1, title='Page')
+    page_size: int = Field(default=30, ge=1, le=1000, title='Page Size')
+    name: str | None = Field(default=None, title='Name')
+    name__in: list[str] | None = Field(default=None, title='Name  In')
+    name__ilike: str | None = Field(default=None, title='Name  Ilike')
+    creation_date__lte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Lte'
+    )
+    creation_date__gte: AwareDatetime | None = Field(
+        default=None, title='Creation Date  Gte'
+    )
+    update_date__lte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Lte'
+    )
+    update_date__gte: AwareDatetime | None = Field(
+        default=None, title='Update Date  Gte'
+    )
+    authorized_public: bool | None = Field(default=None, title='Authorized Public')
+    authorized_project_id: UUID | None = Field(
+        default=None, title='Authorized Project Id'
+    )
+    id: UUID | None = Field(default=None, title='Id')
+    id__in: list[UUID] | None = Field(default=None, title='Id  In')
+    age_value: timedelta | None = Field(default=None, title='Age Value')
+    order_by: list[str] = Field(default=['-creation_date'], title='Order By')
+    ilike_search: str | None = Field(
+        default=None,
+        description="Search text with wildcard support. Use * for zero or more characters and ? for exactly one character. All other characters are treated as literals. Examples: 'test*' matches 'testing', 'file?.txt' matches 'file1.txt'. search_model_fields: name, description",
+        title='Ilike Search',
+    )
+    species__name: str | None = Field(default=None, title='Species  Name')
+    species__name__in: list[str] | None = Field(default=None, title='Species  Name  In')
+    species__name__ilike: str | None = Field(default=None, title='Species  Name  Ilike')
+    species__id: UUID | None = Field(default=None, title='Species  Id')
+    species__id__in: list[UUID] | None = Field(default=None, title='Species  Id  In')
+    strain__name: str | None = Field(default=None, title='Strain  Name')
+    strain__name__in: list[str] | None = Field(default=None, title='Strain  Name  In')
+    strain__name__ilike: str | None = Field(default=None, title='Strain  Name  Ilike')
+    strain__id: UUID | None = Field(default=None, title='Strain  Id')
+    strain__id__in: list[UUID] | None = Field(default=None, title='Strain  Id  In')
+    contribution__pref_label: str | None = Field(
+        default=None, title='Contribution  Pref Label'
+    )
+    contribution__pref_label__in: list[str] | None = Field(
+        default=None, title='Contribution  Pref Label  In'
+    )
+    contribution__pref_label__ilike: str | None = Field(
+        default=None, title='Contribution  Pref Label  Ilike'
+    )
+    contribution__id: UUID | None = Field(default=None, title='Contribution  Id')
+    contribution__id__in: list[UUID] | None = Field(
+        default=None, title='Contribution  Id  In'
+    )
+    contribution__type: AgentType | None = Field(
+        default=None, title='Contribution  Type'
+    )
+    created_by__pref_label: str | None = Field(
+        default=None, title='Created By  Pref Label'
+    )
+    created_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Created By  Pref Label  In'
+    )
+    created_by__pref_label__ilike: str | None = Field(
+        default=None, title='Created By  Pref Label  Ilike'
+    )
+    created_by__id: UUID | None = Field(default=None, title='Created By  Id')
+    created_by__id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Id  In'
+    )
+    created_by__type: AgentType | None = Field(default=None, title='Created By  Type')
+    created_by__given_name: str | None = Field(
+        default=None, title='Created By  Given Name'
+    )
+    created_by__given_name__ilike: str | None = Field(
+        default=None, title='Created By  Given Name  Ilike'
+    )
+    created_by__family_name: str | None = Field(
+        default=None, title='Created By  Family Name'
+    )
+    created_by__family_name__ilike: str | None = Field(
+        default=None, title='Created By  Family Name  Ilike'
+    )
+    created_by__sub_id: UUID | None = Field(default=None, title='Created By  Sub Id')
+    created_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Created By  Sub Id  In'
+    )
+    updated_by__pref_label: str | None = Field(
+        default=None, title='Updated By  Pref Label'
+    )
+    updated_by__pref_label__in: list[str] | None = Field(
+        default=None, title='Updated By  Pref Label  In'
+    )
+    updated_by__pref_label__ilike: str | None = Field(
+        default=None, title='Updated By  Pref Label  Ilike'
+    )
+    updated_by__id: UUID | None = Field(default=None, title='Updated By  Id')
+    updated_by__id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Id  In'
+    )
+    updated_by__type: AgentType | None = Field(default=None, title='Updated By  Type')
+    updated_by__given_name: str | None = Field(
+        default=None, title='Updated By  Given Name'
+    )
+    updated_by__given_name__ilike: str | None = Field(
+        default=None, title='Updated By  Given Name  Ilike'
+    )
+    updated_by__family_name: str | None = Field(
+        default=None, title='Updated By  Family Name'
+    )
+    updated_by__family_name__ilike: str | None = Field(
+        default=None, title='Updated By  Family Name  Ilike'
+    )
+    updated_by__sub_id: UUID | None = Field(default=None, title='Updated By  Sub Id')
+    updated_by__sub_id__in: list[UUID] | None = Field(
+        default=None, title='Updated By  Sub Id  In'
+    )
+    search: str | None = Field(default=None, title='Search')
+    with_facets: bool = Field(default=False, title='With Facets')
+
+
+class AgentRead(
+    RootModel[NestedPersonRead | NestedOrganizationRead | NestedConsortiumRead]
+):
+    root: NestedPersonRead | NestedOrganizationRead | NestedConsortiumRead
+
+
+class AssetRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    size: int = Field(..., title='Size')
+    sha256_digest: str | None = Field(..., title='Sha256 Digest')
+    path: str = Field(..., title='Path')
+    full_path: str = Field(..., title='Full Path')
+    is_directory: bool = Field(..., title='Is Directory')
+    content_type: ContentType
+    meta: dict[str, Any] = Field(default={}, title='Meta')
+    label: AssetLabel
+    storage_type: StorageType
+    id: UUID = Field(..., title='Id')
+    status: AssetStatus
+
+
+class BrainAtlasRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    assets: list[AssetRead] = Field(..., title='Assets')
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    hierarchy_id: UUID = Field(..., title='Hierarchy Id')
+
+
+class BrainRegionHierarchyRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    name: str = Field(..., title='Name')
+
+
+class BrainRegionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    annotation_value: int = Field(..., title='Annotation Value')
+    name: str = Field(..., title='Name')
+    acronym: str = Field(..., title='Acronym')
+    color_hex_triplet: str = Field(..., title='Color Hex Triplet')
+    parent_structure_id: UUID | None = Field(default=None, title='Parent Structure Id')
+    hierarchy_id: UUID = Field(..., title='Hierarchy Id')
+
+
+class ContributionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    agent: AgentRead
+    role: RoleRead
+    entity: NestedEntityRead
+
+
+class IonChannelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    label: str = Field(..., title='Label')
+    gene: str = Field(..., title='Gene')
+    synonyms: list[str] = Field(..., title='Synonyms')
+
+
+class ListResponseAnnotationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[AnnotationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseAssetRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[AssetRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseBrainAtlasRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[BrainAtlasRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseBrainRegionHierarchyRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[BrainRegionHierarchyRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseBrainRegionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[BrainRegionRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseContributionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[ContributionRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseIonChannelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[IonChannelRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseOrganizationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[OrganizationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponsePersonRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[PersonRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSimulationExecutionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SimulationExecutionRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSimulationGenerationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SimulationGenerationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSpeciesRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SpeciesRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseStrainRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[StrainRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSubjectRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SubjectRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class MEModelCalibrationResultRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    holding_current: float = Field(..., title='Holding Current')
+    threshold_current: float = Field(..., title='Threshold Current')
+    rin: float | None = Field(default=None, title='Rin')
+    calibrated_entity_id: UUID = Field(..., title='Calibrated Entity Id')
+
+
+class MeasurementItem(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: MeasurementStatistic | None
+    unit: MeasurementUnit | None
+    value: float | None = Field(..., title='Value')
+
+
+class MeasurementKindCreate(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    structural_domain: StructuralDomain
+    measurement_items: list[MeasurementItem] = Field(..., title='Measurement Items')
+    pref_label: str = Field(..., title='Pref Label')
+
+
+class MeasurementKindRead(MeasurementKindCreate):
+    pass
+
+
+class MeasurementRecordRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: MeasurementStatistic
+    unit: MeasurementUnit
+    value: float = Field(..., title='Value')
+    id: int = Field(..., title='Id')
+
+
+class NestedContributionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    agent: AgentRead
+    role: RoleRead
+
+
+class NestedDigitalReconstructionCellMorphologyProtocolRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    protocol_document: ProtocolDocument | None = Field(
+        default=None, title='Protocol Document'
+    )
+    protocol_design: CellMorphologyProtocolDesign
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    type: Literal['cell_morphology_protocol'] = Field(
+        default='cell_morphology_protocol', title='Type'
+    )
+    generation_type: Literal['digital_reconstruction'] = Field(
+        ..., title='Generation Type'
+    )
+    staining_type: StainingType | None = None
+    slicing_thickness: float = Field(..., ge=0.0, title='Slicing Thickness')
+    slicing_direction: SlicingDirectionType | None = None
+    magnification: Magnification | None = Field(default=None, title='Magnification')
+    tissue_shrinkage: TissueShrinkage | None = Field(
+        default=None, title='Tissue Shrinkage'
+    )
+    corrected_for_shrinkage: bool | None = Field(
+        default=None, title='Corrected For Shrinkage'
+    )
+
+
+class NestedMEModel(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    validation_status: ValidationStatus = Field(
+        default='created', validate_default=True
+    )
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+
+
+class NestedSubjectRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    id: UUID = Field(..., title='Id')
+    sex: Sex = Field(..., description='Sex of the subject')
+    weight: Weight | None = Field(
+        default=None, description='Weight in grams', title='Weight'
+    )
+    age_value: float | None = Field(
+        default=None, description='Age value interval.', title='Age value'
+    )
+    age_min: float | None = Field(
+        default=None, description='Minimum age range', title='Minimum age range'
+    )
+    age_max: float | None = Field(
+        default=None, description='Maximum age range', title='Maximum age range'
+    )
+    age_period: AgePeriod | None = None
+
+
+class NeuronBlock(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    global_: list[dict[str, str | None]] = Field(
+        default=[], alias='global', title='Global'
+    )
+    range: list[dict[str, str | None]] = Field(default=[], title='Range')
+    useion: list[UseIon] = Field(default=[], title='Useion', validate_default=True)
+    nonspecific: list[dict[str, str | None]] = Field(default=[], title='Nonspecific')
+
+
+class SimulationCampaignRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    id: UUID = Field(..., title='Id')
+    type: EntityType | None = None
+    scan_parameters: dict[str, Any] = Field(..., title='Scan Parameters')
+    entity_id: UUID = Field(..., title='Entity Id')
+    simulations: list[NestedSimulationRead] = Field(..., title='Simulations')
+
+
+class SimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    id: UUID = Field(..., title='Id')
+    type: EntityType | None = None
+    simulation_campaign_id: UUID = Field(..., title='Simulation Campaign Id')
+    entity_id: UUID = Field(..., title='Entity Id')
+    scan_parameters: dict[str, Any] = Field(..., title='Scan Parameters')
+    number_neurons: int = Field(..., title='Number Neurons')
+
+
+class SimulationResultRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    id: UUID = Field(..., title='Id')
+    type: EntityType | None = None
+    simulation_id: UUID = Field(..., title='Simulation Id')
+
+
+class SingleNeuronSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    type: EntityType | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    brain_region: NestedBrainRegionRead
+    seed: int = Field(..., title='Seed')
+    injection_location: list[str] = Field(..., title='Injection Location')
+    recording_location: list[str] = Field(..., title='Recording Location')
+    me_model: NestedMEModel
+
+
+class SingleNeuronSynaptomeRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    brain_region: NestedBrainRegionRead
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    type: EntityType | None = None
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    seed: int = Field(..., title='Seed')
+    me_model: NestedMEModel
+
+
+class SingleNeuronSynaptomeSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    type: EntityType | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    id: UUID = Field(..., title='Id')
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    brain_region: NestedBrainRegionRead
+    seed: int = Field(..., title='Seed')
+    injection_location: list[str] = Field(..., title='Injection Location')
+    recording_location: list[str] = Field(..., title='Recording Location')
+    synaptome: NestedSynaptome
+
+
+class CircuitRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    has_morphologies: bool = Field(default=False, title='Has Morphologies')
+    has_point_neurons: bool = Field(default=False, title='Has Point Neurons')
+    has_electrical_cell_models: bool = Field(
+        default=False, title='Has Electrical Cell Models'
+    )
+    has_spines: bool = Field(default=False, title='Has Spines')
+    number_neurons: int = Field(..., title='Number Neurons')
+    number_synapses: int = Field(..., title='Number Synapses')
+    number_connections: int | None = Field(..., title='Number Connections')
+    scale: CircuitScale
+    build_category: CircuitBuildCategory
+    root_circuit_id: UUID | None = Field(default=None, title='Root Circuit Id')
+    atlas_id: UUID | None = Field(default=None, title='Atlas Id')
+    target_simulator: TargetSimulator = Field(default='NEURON', validate_default=True)
+
+
+class ElectricalCellRecordingRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    ljp: float = Field(
+        default=0.0,
+        description='Correction applied to the voltage trace, in mV',
+        title='Liquid Junction Potential',
+    )
+    recording_location: list[str] = Field(
+        ...,
+        description='Location on the cell where recording was performed, in hoc-compatible format.',
+        title='Recording Location',
+    )
+    recording_type: ElectricalRecordingType = Field(
+        ...,
+        description="Recording type. One of: [<ElectricalRecordingStimulusType.conductance_clamp: 'conductance_clamp'>, <ElectricalRecordingStimulusType.current_clamp: 'current_clamp'>, <ElectricalRecordingStimulusType.extracellular: 'extracellular'>, <ElectricalRecordingStimulusType.other: 'other'>, <ElectricalRecordingStimulusType.unknown: 'unknown'>, <ElectricalRecordingStimulusType.voltage_clamp: 'voltage_clamp'>]",
+        title='Recording Type',
+    )
+    recording_origin: ElectricalRecordingOrigin = Field(
+        ...,
+        description="Recording origin. One of: [<ElectricalRecordingOrigin.in_silico: 'in_silico'>, <ElectricalRecordingOrigin.in_vitro: 'in_vitro'>, <ElectricalRecordingOrigin.in_vivo: 'in_vivo'>, <ElectricalRecordingOrigin.unknown: 'unknown'>]",
+        title='Recording Origin',
+    )
+    temperature: float | None = Field(
+        default=None,
+        description='Temperature at which the recording was performed, in degrees Celsius.',
+        title='Temperature',
+    )
+    comment: str | None = Field(
+        default=None, description='Comment with further details.', title='Comment'
+    )
+    legacy_id: list[str] | None = Field(default=None, title='Legacy Id')
+    stimuli: list[NestedElectricalRecordingStimulusRead] | None = Field(
+        default=None,
+        description='List of stimuli applied to the cell with their respective time steps',
+        title='Electrical Recording Stimuli',
+    )
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+
+
+class ExperimentalBoutonDensityRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    license: LicenseRead | None
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    measurements: list[MeasurementRecordRead] = Field(..., title='Measurements')
+    assets: list[AssetRead] = Field(..., title='Assets')
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+
+
+class ExperimentalNeuronDensityRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    license: LicenseRead | None
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    measurements: list[MeasurementRecordRead] = Field(..., title='Measurements')
+    assets: list[AssetRead] = Field(..., title='Assets')
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+
+
+class ExperimentalSynapsesPerConnectionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    license: LicenseRead | None
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    measurements: list[MeasurementRecordRead] = Field(..., title='Measurements')
+    assets: list[AssetRead] = Field(..., title='Assets')
+    pre_mtype: AnnotationRead
+    post_mtype: AnnotationRead
+    pre_region: NestedBrainRegionRead
+    post_region: NestedBrainRegionRead
+
+
+class IonChannelModelExpanded(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    nmodl_suffix: str = Field(..., title='Nmodl Suffix')
+    is_ljp_corrected: bool = Field(default=False, title='Is Ljp Corrected')
+    is_temperature_dependent: bool = Field(
+        default=False, title='Is Temperature Dependent'
+    )
+    temperature_celsius: int | None = Field(..., title='Temperature Celsius')
+    is_stochastic: bool = Field(default=False, title='Is Stochastic')
+    neuron_block: NeuronBlock
+    conductance_name: str | None = Field(default=None, title='Conductance Name')
+    max_permeability_name: str | None = Field(
+        default=None, title='Max Permeability Name'
+    )
+
+
+class IonChannelModelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    nmodl_suffix: str = Field(..., title='Nmodl Suffix')
+    is_ljp_corrected: bool = Field(default=False, title='Is Ljp Corrected')
+    is_temperature_dependent: bool = Field(
+        default=False, title='Is Temperature Dependent'
+    )
+    temperature_celsius: int | None = Field(..., title='Temperature Celsius')
+    is_stochastic: bool = Field(default=False, title='Is Stochastic')
+    neuron_block: NeuronBlock
+    conductance_name: str | None = Field(default=None, title='Conductance Name')
+    max_permeability_name: str | None = Field(
+        default=None, title='Max Permeability Name'
+    )
+
+
+class IonChannelModelWAssets(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    assets: list[AssetRead] = Field(..., title='Assets')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    nmodl_suffix: str = Field(..., title='Nmodl Suffix')
+    is_ljp_corrected: bool = Field(default=False, title='Is Ljp Corrected')
+    is_temperature_dependent: bool = Field(
+        default=False, title='Is Temperature Dependent'
+    )
+    temperature_celsius: int | None = Field(..., title='Temperature Celsius')
+    is_stochastic: bool = Field(default=False, title='Is Stochastic')
+    neuron_block: NeuronBlock
+    conductance_name: str | None = Field(default=None, title='Conductance Name')
+    max_permeability_name: str | None = Field(
+        default=None, title='Max Permeability Name'
+    )
+
+
+class IonChannelRecordingRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    ljp: float = Field(
+        default=0.0,
+        description='Correction applied to the voltage trace, in mV',
+        title='Liquid Junction Potential',
+    )
+    recording_location: list[str] = Field(
+        ...,
+        description='Location on the cell where recording was performed, in hoc-compatible format.',
+        title='Recording Location',
+    )
+    recording_type: ElectricalRecordingType = Field(
+        ...,
+        description="Recording type. One of: [<ElectricalRecordingStimulusType.conductance_clamp: 'conductance_clamp'>, <ElectricalRecordingStimulusType.current_clamp: 'current_clamp'>, <ElectricalRecordingStimulusType.extracellular: 'extracellular'>, <ElectricalRecordingStimulusType.other: 'other'>, <ElectricalRecordingStimulusType.unknown: 'unknown'>, <ElectricalRecordingStimulusType.voltage_clamp: 'voltage_clamp'>]",
+        title='Recording Type',
+    )
+    recording_origin: ElectricalRecordingOrigin = Field(
+        ...,
+        description="Recording origin. One of: [<ElectricalRecordingOrigin.in_silico: 'in_silico'>, <ElectricalRecordingOrigin.in_vitro: 'in_vitro'>, <ElectricalRecordingOrigin.in_vivo: 'in_vivo'>, <ElectricalRecordingOrigin.unknown: 'unknown'>]",
+        title='Recording Origin',
+    )
+    temperature: float | None = Field(
+        default=None,
+        description='Temperature at which the recording was performed, in degrees Celsius.',
+        title='Temperature',
+    )
+    comment: str | None = Field(
+        default=None, description='Comment with further details.', title='Comment'
+    )
+    legacy_id: list[str] | None = Field(default=None, title='Legacy Id')
+    cell_line: str = Field(
+        ...,
+        description='The cell line from which the ion channel was recorded',
+        title='Cell Line',
+    )
+    ion_channel: NestedIonChannelRead = Field(
+        ..., description='The ion channel that was recorded from', title='Ion Channel'
+    )
+    stimuli: list[NestedElectricalRecordingStimulusRead] | None = Field(
+        default=None,
+        description='List of stimuli applied to the cell with their respective time steps',
+        title='Electrical Recording Stimuli',
+    )
+
+
+class ListResponseCircuitRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[CircuitRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseElectricalCellRecordingRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[ElectricalCellRecordingRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseExperimentalBoutonDensityRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[ExperimentalBoutonDensityRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseExperimentalNeuronDensityRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[ExperimentalNeuronDensityRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseExperimentalSynapsesPerConnectionRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[ExperimentalSynapsesPerConnectionRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseIonChannelModelExpanded(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[IonChannelModelExpanded] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseIonChannelRecordingRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[IonChannelRecordingRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSimulationCampaignRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SimulationCampaignRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SimulationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSimulationResultRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SimulationResultRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSingleNeuronSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SingleNeuronSimulationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSingleNeuronSynaptomeRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SingleNeuronSynaptomeRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseSingleNeuronSynaptomeSimulationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[SingleNeuronSynaptomeSimulationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class MeasurementAnnotationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    id: UUID = Field(..., title='Id')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    entity_id: UUID = Field(..., title='Entity Id')
+    entity_type: MeasurableEntity
+    measurement_kinds: list[MeasurementKindRead] = Field(..., title='Measurement Kinds')
+
+
+class NestedCellMorphologyProtocolRead(
+    RootModel[
+        NestedDigitalReconstructionCellMorphologyProtocolRead
+        | NestedModifiedReconstructionCellMorphologyProtocolRead
+        | NestedComputationallySynthesizedCellMorphologyProtocolRead
+        | NestedPlaceholderCellMorphologyProtocolRead
+    ]
+):
+    root: (
+        NestedDigitalReconstructionCellMorphologyProtocolRead
+        | NestedModifiedReconstructionCellMorphologyProtocolRead
+        | NestedComputationallySynthesizedCellMorphologyProtocolRead
+        | NestedPlaceholderCellMorphologyProtocolRead
+    ) = Field(..., discriminator='generation_type')
+
+
+class CellMorphologyAnnotationExpandedRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    location: PointLocationBase | None
+    legacy_id: list[str] | None = Field(default=None, title='Legacy Id')
+    has_segmented_spines: bool = Field(default=False, title='Has Segmented Spines')
+    repair_pipeline_state: RepairPipelineType | None = None
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    cell_morphology_protocol: NestedCellMorphologyProtocolRead
+    measurement_annotation: MeasurementAnnotationRead | None
+
+
+class CellMorphologyRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    assets: list[AssetRead] = Field(..., title='Assets')
+    license: LicenseRead | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    brain_region: NestedBrainRegionRead
+    subject: NestedSubjectRead
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    type: EntityType | None = None
+    id: UUID = Field(..., title='Id')
+    experiment_date: AwareDatetime | None = Field(
+        default=None,
+        description='Date of the experiment associated with the artifact.',
+        title='Experiment Date',
+    )
+    contact_email: str | None = Field(
+        default=None,
+        description="Optional string of a contact person's e-mail address.",
+        title='Contact Email',
+    )
+    published_in: str | None = Field(
+        default=None,
+        description='Optional string with short version of the source publication(s).',
+        title='Published In',
+    )
+    notice_text: str | None = Field(
+        default=None,
+        description='Text provided by the data creators to inform users about data caveats, limitations, or required attribution practices.',
+        title='Notice Text',
+    )
+    location: PointLocationBase | None
+    legacy_id: list[str] | None = Field(default=None, title='Legacy Id')
+    has_segmented_spines: bool = Field(default=False, title='Has Segmented Spines')
+    repair_pipeline_state: RepairPipelineType | None = None
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    cell_morphology_protocol: NestedCellMorphologyProtocolRead
+
+
+class ExemplarMorphology(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    id: UUID = Field(..., title='Id')
+    location: PointLocationBase | None
+    legacy_id: list[str] | None = Field(default=None, title='Legacy Id')
+    has_segmented_spines: bool = Field(default=False, title='Has Segmented Spines')
+    repair_pipeline_state: RepairPipelineType | None = None
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    cell_morphology_protocol: NestedCellMorphologyProtocolRead
+
+
+class ListResponseCellMorphologyRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[CellMorphologyRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ListResponseMeasurementAnnotationRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[MeasurementAnnotationRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class ReadOneCellMorphologyIdGetResponse(
+    RootModel[CellMorphologyRead | CellMorphologyAnnotationExpandedRead]
+):
+    root: CellMorphologyRead | CellMorphologyAnnotationExpandedRead = Field(
+        ..., title='Response Read One Cell Morphology  Id   Get'
+    )
+
+
+class EModelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    brain_region: NestedBrainRegionRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    iteration: str = Field(..., title='Iteration')
+    score: float = Field(..., title='Score')
+    seed: int = Field(..., title='Seed')
+    id: UUID = Field(..., title='Id')
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+    exemplar_morphology: ExemplarMorphology
+
+
+class EModelReadExpanded(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    brain_region: NestedBrainRegionRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    assets: list[AssetRead] = Field(..., title='Assets')
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    iteration: str = Field(..., title='Iteration')
+    score: float = Field(..., title='Score')
+    seed: int = Field(..., title='Seed')
+    id: UUID = Field(..., title='Id')
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+    exemplar_morphology: ExemplarMorphology
+    ion_channel_models: list[IonChannelModelWAssets] = Field(
+        ..., title='Ion Channel Models'
+    )
+
+
+class ListResponseEModelReadExpanded(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[EModelReadExpanded] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
+
+
+class MEModelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    name: str = Field(..., title='Name')
+    description: str = Field(..., title='Description')
+    species: NestedSpeciesRead
+    strain: NestedStrainRead | None = None
+    brain_region: NestedBrainRegionRead
+    contributions: list[NestedContributionRead] | None = Field(
+        ..., title='Contributions'
+    )
+    created_by: NestedPersonRead
+    updated_by: NestedPersonRead
+    type: EntityType | None = None
+    authorized_project_id: UUID4 = Field(..., title='Authorized Project Id')
+    authorized_public: bool = Field(default=False, title='Authorized Public')
+    creation_date: AwareDatetime = Field(..., title='Creation Date')
+    update_date: AwareDatetime = Field(..., title='Update Date')
+    validation_status: ValidationStatus = Field(
+        default='created', validate_default=True
+    )
+    id: UUID = Field(..., title='Id')
+    mtypes: list[AnnotationRead] | None = Field(..., title='Mtypes')
+    etypes: list[AnnotationRead] | None = Field(..., title='Etypes')
+    morphology: CellMorphologyRead
+    emodel: EModelRead
+    calibration_result: MEModelCalibrationResultRead | None
+
+
+class ListResponseMEModelRead(BaseModel):
+    model_config = ConfigDict(
+        extra='allow',
+    )
+    data: list[MEModelRead] = Field(..., title='Data')
+    pagination: PaginationResponse
+    facets: Facets | None = None
@@ -0,0 +1,2829 @@
+# Trimmed by `neuroagent-trim-autogenerated-types` from obione.py, do not edit.
+# Only the models imported by neuroagent and their dependencies are kept.
+# generated by datamodel-codegen:
+#   filename:  https://staging.cell-a.openbraininstitute.org/api/obi-one/openapi.json
+
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, RootModel
+
+
+class AllDistributionsReference(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    block_dict_name: str = Field(
+        default='',
+        description='Name of the root level dictionary which contains the block you are referencing. E.g. `neuron_sets` when referencing a block within the neuron_sets dictionary, or `timestamps` when referencing a block within the timestamps dictionary.To reference a block at the root (i.e. a block that is not contained within a dictionary), block_dict_name should be an empty string. ',
+        title='Block Dict Name',
+    )
+    block_name: str = Field(..., description='Name of the block.', title='Block Name')
+    type: Literal['AllDistributionsReference'] = Field(
+        default='AllDistributionsReference', title='Type'
+    )
+
+
+class SamplePercentage(RootModel[float]):
+    root: float = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        ge=0.0,
+        le=100.0,
+        title='Sample (Percentage)',
+    )
+
+
+class SamplePercentage1Item(RootModel[float]):
+    root: float = Field(..., ge=0.0, le=100.0)
+
+
+class SamplePercentage1(RootModel[list[SamplePercentage1Item]]):
+    root: list[SamplePercentage1Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class AllNeurons(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['AllNeurons'] = Field(default='AllNeurons', title='Type')
+    sample_percentage: SamplePercentage | SamplePercentage1 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+
+
+class Circuit(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    name: str = Field(..., title='Name')
+    path: str = Field(..., title='Path')
+    matrix_path: str | None = Field(default=None, title='Matrix Path')
+    type: Literal['Circuit'] = Field(default='Circuit', title='Type')
+
+
+class CircuitFromID(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    id_str: str = Field(
+        ..., description='ID of the entity in string format.', title='Id Str'
+    )
+    type: Literal['CircuitFromID'] = Field(default='CircuitFromID', title='Type')
+
+
+class CircuitNodesetsResponse(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    nodesets: list[str] = Field(..., title='Nodesets')
+
+
+class CircuitPopulationsResponse(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    populations: list[str] = Field(..., title='Populations')
+
+
+class CircuitStatsLevelOfDetail(RootModel[Literal[0, 1, 2, 3]]):
+    root: Literal[0, 1, 2, 3] = Field(..., title='CircuitStatsLevelOfDetail')
+
+
+class ConnectivityMetricsOutput(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    connection_probability: dict[str, Any] | None = Field(
+        default=None, title='Connection Probability'
+    )
+    mean_number_of_synapses: dict[str, Any] | None = Field(
+        default=None, title='Mean Number Of Synapses'
+    )
+
+
+class MaxDistance(RootModel[float]):
+    root: float = Field(
+        ...,
+        description='Maximum distance (in um) to take connectivity into account',
+        gt=0.0,
+        title='Max Distance',
+    )
+
+
+class ConnectivityMetricsRequest(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    circuit_id: str = Field(..., title='Circuit Id')
+    edge_population: str = Field(
+        ...,
+        description='Name of the edge population to extract connectivity metrics from',
+        title='Edge Population',
+    )
+    pre_selection: dict[str, str | list[str]] | None = Field(
+        default=None,
+        description='Property/value pairs for pre-synaptic neuron selection',
+        title='Pre Selection',
+    )
+    pre_node_set: str | None = Field(
+        default=None,
+        description='Existing node set to apply pre-synaptic neuron selection in',
+        title='Pre Node Set',
+    )
+    post_selection: dict[str, str | list[str]] | None = Field(
+        default=None,
+        description='Property/value pairs for post-synaptic neuron selection',
+        title='Post Selection',
+    )
+    post_node_set: str | None = Field(
+        default=None,
+        description='Existing node set to apply post-synaptic neuron selection in',
+        title='Post Node Set',
+    )
+    group_by: str | None = Field(
+        default=None,
+        description='Property name to group connectivity by',
+        title='Group By',
+    )
+    max_distance: MaxDistance | None = Field(
+        default=None,
+        description='Maximum distance (in um) to take connectivity into account',
+        title='Max Distance',
+    )
+
+
+class Duration(RootModel[float]):
+    root: float = Field(
+        200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        ge=0.0,
+        title='Duration',
+    )
+
+
+class DurationItem(RootModel[float]):
+    root: float = Field(..., ge=0.0)
+
+
+class DegreeTypes(
+    RootModel[Literal['indegree', 'outdegree', 'totaldegree', 'degreedifference']]
+):
+    root: Literal['indegree', 'outdegree', 'totaldegree', 'degreedifference'] = Field(
+        ..., title='DegreeTypes'
+    )
+
+
+class EdgePopulationType(RootModel[Literal['chemical', 'electrical']]):
+    root: Literal['chemical', 'electrical'] = Field(..., title='EdgePopulationType')
+
+
+class ElectrophysiologyMetricsOutput(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    feature_dict: dict[str, dict[str, Any]] = Field(
+        ...,
+        description="Mapping of feature name to its metric values. Each entry contains at least an 'avg', and optionally 'unit', 'num_traces', etc.",
+        title='Feature Dict',
+    )
+
+
+class SamplePercentage2(SamplePercentage):
+    pass
+
+
+class SamplePercentage3Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage3(RootModel[list[SamplePercentage3Item]]):
+    root: list[SamplePercentage3Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class ExcitatoryNeurons(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['ExcitatoryNeurons'] = Field(
+        default='ExcitatoryNeurons', title='Type'
+    )
+    sample_percentage: SamplePercentage2 | SamplePercentage3 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+
+
+class Scale(RootModel[float]):
+    root: float = Field(
+        1.0,
+        description='Scale parameter of the exponential distribution in milliseconds.',
+        gt=0.0,
+        title='Scale',
+    )
+
+
+class ScaleItem(RootModel[float]):
+    root: float = Field(..., gt=0.0)
+
+
+class ExponentialDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['ExponentialDistribution'] = Field(
+        default='ExponentialDistribution', title='Type'
+    )
+    scale: Scale | list[ScaleItem] = Field(
+        default=1.0,
+        description='Scale parameter of the exponential distribution in milliseconds.',
+        title='Scale',
+        validate_default=True,
+    )
+    shift: float | list[float] = Field(
+        default=0.0,
+        description='Constant value added to each sampled value.',
+        title='Shift',
+    )
+    random_seed: int | list[int] = Field(
+        default=1,
+        description='Seed for drawing random values from the exponential distribution.',
+        title='Random Seed',
+    )
+
+
+class FloatConstantDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['FloatConstantDistribution'] = Field(
+        default='FloatConstantDistribution', title='Type'
+    )
+    value: float | list[float] = Field(
+        default=1.0,
+        description='The constant value of the distribution.',
+        title='Value',
+    )
+
+
+class FloatRange(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['FloatRange'] = Field(default='FloatRange', title='Type')
+    start: float = Field(..., title='Start')
+    step: float = Field(..., gt=0.0, title='Step')
+    end: float = Field(..., title='End')
+
+
+class FloatUniformDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['FloatUniformDistribution'] = Field(
+        default='FloatUniformDistribution', title='Type'
+    )
+    low: float | list[float] = Field(
+        default=0.0,
+        description='The lower bound of the uniform distribution.',
+        title='Low',
+    )
+    high: float | list[float] = Field(
+        default=1.0,
+        description='The upper bound of the uniform distribution.',
+        title='High',
+    )
+    random_seed: int | list[int] = Field(
+        default=1,
+        description='Seed for drawing random values from the uniform distribution.',
+        title='Random seed',
+    )
+
+
+class Shape(RootModel[float]):
+    root: float = Field(
+        2.0,
+        description='Shape parameter of the gamma distribution.',
+        gt=0.0,
+        title='Shape',
+    )
+
+
+class ShapeItem(ScaleItem):
+    pass
+
+
+class Scale1(RootModel[float]):
+    root: float = Field(
+        1.0,
+        description='Scale parameter of the gamma distribution in milliseconds.',
+        gt=0.0,
+        title='Scale',
+    )
+
+
+class GammaDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['GammaDistribution'] = Field(
+        default='GammaDistribution', title='Type'
+    )
+    shape: Shape | list[ShapeItem] = Field(
+        default=2.0,
+        description='Shape parameter of the gamma distribution.',
+        title='Shape',
+        validate_default=True,
+    )
+    scale: Scale1 | list[ScaleItem] = Field(
+        default=1.0,
+        description='Scale parameter of the gamma distribution in milliseconds.',
+        title='Scale',
+        validate_default=True,
+    )
+    shift: float | list[float] = Field(
+        default=0.0,
+        description='Constant value added to each sampled value.',
+        title='Shift',
+    )
+    random_seed: int | list[int] = Field(
+        default=1,
+        description='Seed for drawing random values from the gamma distribution.',
+        title='Random Seed',
+    )
+
+
+class Duration2(Duration):
+    pass
+
+
+class SamplePercentage4(SamplePercentage):
+    pass
+
+
+class SamplePercentage5Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage5(RootModel[list[SamplePercentage5Item]]):
+    root: list[SamplePercentage5Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class Info(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['Info'] = Field(default='Info', title='Type')
+    campaign_name: str = Field(
+        ..., description='Name of the campaign.', min_length=1, title='Campaign Name'
+    )
+    campaign_description: str = Field(
+        ...,
+        description='Description of the campaign.',
+        min_length=1,
+        title='Campaign Description',
+    )
+
+
+class SamplePercentage6(SamplePercentage):
+    pass
+
+
+class SamplePercentage7Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage7(RootModel[list[SamplePercentage7Item]]):
+    root: list[SamplePercentage7Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class InhibitoryNeurons(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['InhibitoryNeurons'] = Field(
+        default='InhibitoryNeurons', title='Type'
+    )
+    sample_percentage: SamplePercentage6 | SamplePercentage7 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+
+
+class IntConstantDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['IntConstantDistribution'] = Field(
+        default='IntConstantDistribution', title='Type'
+    )
+    value: int | list[int] = Field(
+        default=1, description='The constant value of the distribution.', title='Value'
+    )
+
+
+class IntUniformDistribution(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['IntUniformDistribution'] = Field(
+        default='IntUniformDistribution', title='Type'
+    )
+    low: float | list[float] = Field(
+        default=0.0,
+        description='The lower bound of the uniform distribution.',
+        title='Low',
+    )
+    high: float | list[float] = Field(
+        default=1.0,
+        description='The upper bound of the uniform distribution.',
+        title='High',
+    )
+    random_seed: int | list[int] = Field(
+        default=1,
+        description='Seed for drawing random values from the uniform distribution.',
+        title='Random seed',
+    )
+
+
+class Duration3(RootModel[float]):
+    root: float = Field(
+        200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        ge=0.0,
+        le=12000.0,
+        title='Duration',
+    )
+
+
+class DurationItem3(RootModel[float]):
+    root: float = Field(..., ge=0.0, le=12000.0)
+
+
+class Dt(RootModel[float]):
+    root: float = Field(
+        0.1,
+        description='Interval between recording time steps in milliseconds (ms).',
+        ge=0.025,
+        title='Timestep',
+    )
+
+
+class DtItem(RootModel[float]):
+    root: float = Field(..., ge=0.025)
+
+
+class Duration4(Duration):
+    pass
+
+
+class DurationItem4(DurationItem):
+    pass
+
+
+class MorphologyMetricsOutput(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    aspect_ratio: float | None = Field(
+        default=None,
+        description='Calculates the min/max ratio of the principal direction extents                 along the plane.',
+        title='aspect_ratio',
+    )
+    circularity: float | None = Field(
+        default=None,
+        description='Calculates the circularity of the morphology points along the plane.',
+        title='circularity',
+    )
+    length_fraction_above_soma: float | None = Field(
+        default=None,
+        description='Returns the length fraction of the segments that have their midpoints                             higher than the soma.',
+        title='length_fraction_above_soma',
+    )
+    max_radial_distance: float | None = Field(
+        default=None,
+        description='The maximum radial distance from the soma in micrometers.',
+        title='max_radial_distance',
+    )
+    number_of_neurites: int | None = Field(
+        default=None,
+        description='Number of neurites in a morphology.',
+        title='number_of_neurites',
+    )
+    soma_radius: float | None = Field(
+        default=None,
+        description='The radius of the soma in micrometers.',
+        title='soma_radius [μm]',
+    )
+    soma_surface_area: float | None = Field(
+        default=None,
+        description='The surface area of the soma in square micrometers.',
+        title='soma_surface_area [μm^2]',
+    )
+    total_length: float | None = Field(
+        default=None,
+        description='The total length of the morphology neurites in micrometers.',
+        title='total_length [μm]',
+    )
+    total_height: float | None = Field(
+        default=None,
+        description='The total height (Y-range) of the morphology in micrometers.',
+        title='total_height [μm]',
+    )
+    total_width: float | None = Field(
+        default=None,
+        description='The total width (X-range) of the morphology in micrometers.',
+        title='total_width [μm]',
+    )
+    total_depth: float | None = Field(
+        default=None,
+        description='The total depth (Z-range) of the morphology in micrometers.',
+        title='total_depth [μm]',
+    )
+    total_area: float | None = Field(
+        default=None,
+        description='The total surface area of all sections in square micrometers.',
+        title='total_area [μm^2]',
+    )
+    total_volume: float | None = Field(
+        default=None,
+        description='The total volume of all sections in cubic micrometers.',
+        title='total_volume [μm^3]',
+    )
+    section_lengths: list[float] | None = Field(
+        default=None,
+        description='The distribution of lengths per section in micrometers.',
+        title='section_lengths [μm]',
+    )
+    segment_radii: list[float] | None = Field(
+        default=None,
+        description='The distribution of radii of the morphology in micrometers.',
+        title='segment_radii [μm]',
+    )
+    number_of_sections: float | None = Field(
+        default=None,
+        description='The number of sections in the morphology.',
+        title='number_of_sections',
+    )
+    local_bifurcation_angles: list[float] | None = Field(
+        default=None,
+        description='Angles between two sections computed at the bifurcation (local).',
+        title='local_bifurcation_angles [rad]',
+    )
+    remote_bifurcation_angles: list[float] | None = Field(
+        default=None,
+        description='Angles between two sections computed at the end of the sections (remote).',
+        title='remote_bifurcation_angles [rad]',
+    )
+    section_path_distances: list[float] | None = Field(
+        default=None,
+        description='Path distances from the soma to section endpoints in micrometers.',
+        title='section_path_distances [μm]',
+    )
+    section_radial_distances: list[float] | None = Field(
+        default=None,
+        description='Radial distance from the soma to section endpoints in micrometers.',
+        title='section_radial_distances [μm]',
+    )
+    section_branch_orders: list[float] | None = Field(
+        default=None,
+        description='The distribution of branch orders of sections, computed from soma.',
+        title='section_branch_orders',
+    )
+    section_strahler_orders: list[float] | None = Field(
+        default=None,
+        description='The distribution of strahler branch orders of sections, computed from                 terminals.',
+        title='section_strahler_orders',
+    )
+
+
+class Width(RootModel[float]):
+    root: float = Field(
+        50.0,
+        description='The length of time each pulse lasts. Given in milliseconds (ms).',
+        ge=1e-06,
+        title='Pulse Width',
+    )
+
+
+class WidthItem(RootModel[float]):
+    root: float = Field(..., ge=1e-06)
+
+
+class Frequency(RootModel[float]):
+    root: float = Field(
+        1.0,
+        description='The frequency of pulse trains. Given in Hertz (Hz).',
+        ge=1e-06,
+        title='Pulse Frequency',
+    )
+
+
+class FrequencyItem(WidthItem):
+    pass
+
+
+class Element(RootModel[int]):
+    root: int = Field(..., ge=0)
+
+
+class NamedTuple(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    name: str = Field(default='Default name', title='Name')
+    elements: list[Element] = Field(..., title='Elements')
+    type: Literal['NamedTuple'] = Field(default='NamedTuple', title='Type')
+
+
+class NeuronSetReference(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    block_dict_name: str = Field(
+        default='',
+        description='Name of the root level dictionary which contains the block you are referencing. E.g. `neuron_sets` when referencing a block within the neuron_sets dictionary, or `timestamps` when referencing a block within the timestamps dictionary.To reference a block at the root (i.e. a block that is not contained within a dictionary), block_dict_name should be an empty string. ',
+        title='Block Dict Name',
+    )
+    block_name: str = Field(..., description='Name of the block.', title='Block Name')
+    type: Literal['NeuronSetReference'] = Field(
+        default='NeuronSetReference', title='Type'
+    )
+
+
+class NodePopulationType(RootModel[Literal['biophysical', 'virtual']]):
+    root: Literal['biophysical', 'virtual'] = Field(..., title='NodePopulationType')
+
+
+class NonNegativeFloatRange(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['NonNegativeFloatRange'] = Field(
+        default='NonNegativeFloatRange', title='Type'
+    )
+    start: float = Field(..., ge=0.0, title='Start')
+    step: float = Field(..., gt=0.0, title='Step')
+    end: float = Field(..., ge=0.0, title='End')
+
+
+class Variance(RootModel[float]):
+    root: float = Field(
+        0.01,
+        description='The variance around the mean of current to inject using a                     normal distribution.',
+        ge=0.0,
+        title='Variance',
+    )
+
+
+class VarianceItem(DurationItem):
+    pass
+
+
+class TimeConstant(RootModel[float]):
+    root: float = Field(
+        2.7,
+        description='The time constant of the Ornstein-Uhlenbeck process.',
+        gt=0.0,
+        title='Tau',
+    )
+
+
+class TimeConstantItem(ScaleItem):
+    pass
+
+
+class MeanAmplitude(RootModel[float]):
+    root: float = Field(
+        0.001,
+        description='The mean value of conductance to inject. Given in microsiemens (μS).',
+        ge=0.0,
+        title='Mean Amplitude',
+    )
+
+
+class MeanAmplitudeItem(DurationItem):
+    pass
+
+
+class StandardDeviation(RootModel[float]):
+    root: float = Field(
+        0.001,
+        description='The standard deviation of conductance to inject. Given in microsiemens (μS).',
+        gt=0.0,
+        title='Standard Deviation',
+    )
+
+
+class StandardDeviationItem(ScaleItem):
+    pass
+
+
+class MeanAmplitude1(RootModel[float]):
+    root: float = Field(
+        0.1,
+        description='The mean value of current to inject. Given in nanoamps (nA).',
+        ge=0.0,
+        title='Mean Amplitude',
+    )
+
+
+class StandardDeviation1(RootModel[float]):
+    root: float = Field(
+        0.05,
+        description='The standard deviation of current to inject. Given in nanoamps (nA).',
+        gt=0.0,
+        title='Standard Deviation',
+    )
+
+
+class Duration9(Duration3):
+    pass
+
+
+class DurationItem9(DurationItem3):
+    pass
+
+
+class Frequency1(RootModel[float]):
+    root: float = Field(
+        1.0,
+        description='Mean frequency (Hz) of the Poisson input.',
+        ge=1e-06,
+        title='Frequency',
+    )
+
+
+class SamplePercentage8(SamplePercentage):
+    pass
+
+
+class SamplePercentage9Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage9(RootModel[list[SamplePercentage9Item]]):
+    root: list[SamplePercentage9Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class NodeSet(RootModel[str]):
+    root: str = Field(
+        ..., description='Name of the node set to use.', min_length=1, title='Node Set'
+    )
+
+
+class NodeSetItem(RootModel[str]):
+    root: str = Field(..., min_length=1)
+
+
+class PredefinedNeuronSet(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['PredefinedNeuronSet'] = Field(
+        default='PredefinedNeuronSet', title='Type'
+    )
+    sample_percentage: SamplePercentage8 | SamplePercentage9 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+    node_set: NodeSet | list[NodeSetItem] = Field(
+        ..., description='Name of the node set to use.', title='Node Set'
+    )
+
+
+class StartTime(RootModel[float]):
+    root: float = Field(
+        0.0,
+        description='Sart time of the timestamps in milliseconds (ms).',
+        ge=0.0,
+        title='Start Time',
+    )
+
+
+class StartTimeItem(DurationItem):
+    pass
+
+
+class Interval(RootModel[float]):
+    root: float = Field(
+        10.0,
+        description='Interval between timestamps in milliseconds (ms).',
+        ge=0.0,
+        title='Interval',
+    )
+
+
+class IntervalItem(DurationItem):
+    pass
+
+
+class NumberOfRepetitions(RootModel[int]):
+    root: int = Field(
+        10,
+        description='Number of timestamps to generate.',
+        ge=0,
+        title='Number Of Repetitions',
+    )
+
+
+class NumberOfRepetition(Element):
+    pass
+
+
+class RegularTimestamps(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RegularTimestamps'] = Field(
+        default='RegularTimestamps', title='Type'
+    )
+    start_time: StartTime | list[StartTimeItem] = Field(
+        default=0.0,
+        description='Sart time of the timestamps in milliseconds (ms).',
+        title='Start Time',
+        validate_default=True,
+    )
+    interval: Interval | list[IntervalItem] = Field(
+        default=10.0,
+        description='Interval between timestamps in milliseconds (ms).',
+        title='Interval',
+        validate_default=True,
+    )
+    number_of_repetitions: NumberOfRepetitions | list[NumberOfRepetition] = Field(
+        default=10,
+        description='Number of timestamps to generate.',
+        title='Number Of Repetitions',
+        validate_default=True,
+    )
+
+
+class Duration10(Duration):
+    pass
+
+
+class DurationItem10(DurationItem):
+    pass
+
+
+class PercentageOfThresholdCurrent(RootModel[float]):
+    root: float = Field(
+        10.0,
+        description="The percentage of a cell's threshold current to inject when the stimulus                     activates.",
+        ge=0.0,
+        title='Percentage of Threshold Current',
+    )
+
+
+class PercentageOfThresholdCurrentItem(DurationItem):
+    pass
+
+
+class PercentageOfThresholdCurrentStart(RootModel[float]):
+    root: float = Field(
+        10.0,
+        description="The percentage of a cell's threshold current to inject when the stimulus activates.",
+        ge=0.0,
+        title='Percentage of Threshold Current (Start)',
+    )
+
+
+class PercentageOfThresholdCurrentStartItem(DurationItem):
+    pass
+
+
+class PercentageOfThresholdCurrentEnd(RootModel[float]):
+    root: float = Field(
+        100.0,
+        description="If given, the percentage of a cell's threshold current is interpolated such that the percentage reaches this value when the stimulus concludes.",
+        ge=0.0,
+        title='Percentage of Threshold Current (End)',
+    )
+
+
+class PercentageOfThresholdCurrentEndItem(DurationItem):
+    pass
+
+
+class MeanPercentageOfThresholdCurrent(RootModel[float]):
+    root: float = Field(
+        0.01,
+        description="The mean value of current to inject as a percentage of a cell's                     threshold current.",
+        ge=0.0,
+        title='Percentage of Threshold Current (Mean)',
+    )
+
+
+class MeanPercentageOfThresholdCurrentItem(DurationItem):
+    pass
+
+
+class MeanPercentageOfCellsInputConductance(RootModel[float]):
+    root: float = Field(
+        100.0,
+        description="Signal mean as percentage of a cell's input conductance.",
+        ge=0.0,
+        title="Mean Percentage of Cells' Input Conductance",
+    )
+
+
+class MeanPercentageOfCellsInputConductanceItem(DurationItem):
+    pass
+
+
+class StandardDeviationPercentageOfCellsInputConductance(RootModel[float]):
+    root: float = Field(
+        5.0,
+        description="Signal standard deviation as percentage of a cell's input conductance.",
+        gt=0.0,
+        title='Standard Deviation',
+    )
+
+
+class StandardDeviationPercentageOfCellsInputConductanceItem(ScaleItem):
+    pass
+
+
+class MeanPercentageOfThresholdCurrent1(RootModel[float]):
+    root: float = Field(
+        100.0,
+        description="Signal mean as percentage of a cell's threshold current.",
+        ge=0.0,
+        title='Mean Percentage of Threshold Current',
+    )
+
+
+class StandardDeviationPercentageOfThreshold(RootModel[float]):
+    root: float = Field(
+        5.0,
+        description="Signal standard deviation as percentage of a cell's threshold current.",
+        gt=0.0,
+        title='Standard Deviation',
+    )
+
+
+class StandardDeviationPercentageOfThresholdItem(ScaleItem):
+    pass
+
+
+class UseScaling(RootModel[float]):
+    root: float = Field(
+        0.7050728631217412,
+        description='Scale the U_SE (ACh) parameter of the Tsodyks-Markram synaptic model.',
+        ge=0.0,
+        title='Scale U_SE (ACh)',
+    )
+
+
+class UseScalingItem(DurationItem):
+    pass
+
+
+class ScaleAcetylcholineUSESynapticManipulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['ScaleAcetylcholineUSESynapticManipulation'] = Field(
+        default='ScaleAcetylcholineUSESynapticManipulation', title='Type'
+    )
+    presynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Presynaptic Neuron Set',
+    )
+    postsynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Postsynaptic Neuron Set',
+    )
+    use_scaling: UseScaling | list[UseScalingItem] = Field(
+        default=0.7050728631217412,
+        description='Scale the U_SE (ACh) parameter of the Tsodyks-Markram synaptic model.',
+        title='Scale U_SE (ACh)',
+        validate_default=True,
+    )
+
+
+class SingleTimestamp(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SingleTimestamp'] = Field(default='SingleTimestamp', title='Type')
+    start_time: StartTime | list[StartTimeItem] = Field(
+        default=0.0,
+        description='Sart time of the timestamps in milliseconds (ms).',
+        title='Start Time',
+        validate_default=True,
+    )
+
+
+class Frequency2(RootModel[float]):
+    root: float = Field(
+        1.0,
+        description='The frequency of the waveform. Given in Hertz (Hz).',
+        ge=1e-06,
+        title='Frequency',
+    )
+
+
+class Dt1(RootModel[float]):
+    root: float = Field(
+        0.025,
+        description='Timestep of generated signal in milliseconds (ms).',
+        ge=0.025,
+        title='Timestep',
+    )
+
+
+class Duration16(RootModel[float]):
+    root: float = Field(
+        200.0,
+        description='Time duration of the stimulus in milliseconds.',
+        ge=0.0,
+        le=12000.0,
+        title='Duration',
+    )
+
+
+class DurationItem16(DurationItem3):
+    pass
+
+
+class MinimumRate(RootModel[float]):
+    root: float = Field(
+        1e-05,
+        description='Minimum rate of the stimulus in Hz.\n Must be less than the Maximum Rate.',
+        ge=1e-05,
+        gt=0.0,
+        le=50.0,
+        title='Minimum Rate',
+    )
+
+
+class MinimumRateItem(RootModel[float]):
+    root: float = Field(..., ge=1e-05, gt=0.0, le=50.0)
+
+
+class MaximumRate(RootModel[float]):
+    root: float = Field(
+        10.0,
+        description='Maximum rate of the stimulus in Hz. Must be greater than or equal to Minimum Rate.',
+        ge=1e-05,
+        gt=0.0,
+        le=50.0,
+        title='Maximum Rate',
+    )
+
+
+class MaximumRateItem(MinimumRateItem):
+    pass
+
+
+class ModulationFrequencyHz(RootModel[float]):
+    root: float = Field(
+        5.0,
+        description='Frequency (Hz) of the sinusoidal modulation of the rate.',
+        ge=1e-05,
+        gt=0.0,
+        le=100000.0,
+        title='Modulation Frequency',
+    )
+
+
+class ModulationFrequencyHzItem(RootModel[float]):
+    root: float = Field(..., ge=1e-05, gt=0.0, le=100000.0)
+
+
+class Dt2(Dt):
+    pass
+
+
+class SomaVoltageRecording(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SomaVoltageRecording'] = Field(
+        default='SomaVoltageRecording', title='Type'
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None, description='Neuron set to record from.', title='Neuron Set'
+    )
+    dt: Dt2 | list[DtItem] | NonNegativeFloatRange = Field(
+        default=0.1,
+        description='Interval between recording time steps in milliseconds (ms).',
+        title='Timestep',
+        validate_default=True,
+    )
+
+
+class SpatialCoordinate(RootModel[Literal['x', 'y', 'z']]):
+    root: Literal['x', 'y', 'z'] = Field(..., title='SpatialCoordinate')
+
+
+class Duration17(RootModel[float]):
+    root: float = Field(
+        200.0,
+        description='Time in milliseconds (ms) for how long the main stimulus is activated. The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        ge=0.0,
+        le=12000.0,
+        title='Duration',
+    )
+
+
+class RampUpDuration(RootModel[float]):
+    root: float = Field(
+        0.0,
+        description='Time over which the field linearly ramps up from zero to full amplitude, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        ge=0.0,
+        title='Ramp Up (Duration)',
+    )
+
+
+class RampUpDurationItem(DurationItem):
+    pass
+
+
+class RampDownDuration(RootModel[float]):
+    root: float = Field(
+        0.0,
+        description='Time over which the field linearly ramps down from full amplitude to zero, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        ge=0.0,
+        title='Ramp Down (Duration)',
+    )
+
+
+class RampDownDurationItem(DurationItem):
+    pass
+
+
+class Duration18(Duration):
+    pass
+
+
+class DurationItem18(DurationItem):
+    pass
+
+
+class MagnesiumValue(RootModel[float]):
+    root: float = Field(
+        2.4,
+        description='Extracellular magnesium concentration in millimoles (mM).',
+        ge=0.0,
+        title='Extracellular Magnesium Concentration',
+    )
+
+
+class MagnesiumValueItem(DurationItem):
+    pass
+
+
+class SynapticMgManipulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SynapticMgManipulation'] = Field(
+        default='SynapticMgManipulation', title='Type'
+    )
+    presynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Presynaptic Neuron Set',
+    )
+    postsynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Postsynaptic Neuron Set',
+    )
+    magnesium_value: MagnesiumValue | list[MagnesiumValueItem] = Field(
+        default=2.4,
+        description='Extracellular magnesium concentration in millimoles (mM).',
+        title='Extracellular Magnesium Concentration',
+        validate_default=True,
+    )
+
+
+class Duration19(Duration17):
+    pass
+
+
+class DurationItem19(DurationItem3):
+    pass
+
+
+class Frequency3(RootModel[float]):
+    root: float = Field(
+        0.0,
+        description='Frequency of the cosinusoid, in Hz. Must be non-negative. If not provided, assumed to be 0. In this case, a time-invariant field with amplitude [Ex, Ey, Ez] is applied, unless ramp_up_duration or ramp_down_duration is specified, in which case the field will increase/decrease linearly with time during the ramp periods, and will be constant during the remainder of the stimulation period. Note that the signal will be generated with the same time step as the simulation itself. Note that frequency should therefore be less than the Nyquist frequency of the simulation (i.e., 1/(2*dt))',
+        ge=0.0,
+        lt=20000.0,
+        title='Frequency',
+    )
+
+
+class Frequency4Item(RootModel[float]):
+    root: float = Field(..., ge=0.0, lt=20000.0)
+
+
+class Frequency4(RootModel[list[Frequency4Item]]):
+    root: list[Frequency4Item] = Field(
+        0.0,
+        description='Frequency of the cosinusoid, in Hz. Must be non-negative. If not provided, assumed to be 0. In this case, a time-invariant field with amplitude [Ex, Ey, Ez] is applied, unless ramp_up_duration or ramp_down_duration is specified, in which case the field will increase/decrease linearly with time during the ramp periods, and will be constant during the remainder of the stimulation period. Note that the signal will be generated with the same time step as the simulation itself. Note that frequency should therefore be less than the Nyquist frequency of the simulation (i.e., 1/(2*dt))',
+        min_length=1,
+        title='Frequency',
+        validate_default=True,
+    )
+
+
+class StartTime2(RootModel[float]):
+    root: float = Field(
+        0.0,
+        description='Recording start time in milliseconds (ms).',
+        ge=0.0,
+        title='Start Time',
+    )
+
+
+class EndTime(RootModel[float]):
+    root: float = Field(
+        100.0,
+        description='Recording end time in milliseconds (ms).',
+        ge=0.0,
+        title='End Time',
+    )
+
+
+class EndTimeItem(DurationItem):
+    pass
+
+
+class TimeWindowSomaVoltageRecording(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['TimeWindowSomaVoltageRecording'] = Field(
+        default='TimeWindowSomaVoltageRecording', title='Type'
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None, description='Neuron set to record from.', title='Neuron Set'
+    )
+    dt: Dt2 | list[DtItem] | NonNegativeFloatRange = Field(
+        default=0.1,
+        description='Interval between recording time steps in milliseconds (ms).',
+        title='Timestep',
+        validate_default=True,
+    )
+    start_time: StartTime2 | list[StartTimeItem] = Field(
+        default=0.0,
+        description='Recording start time in milliseconds (ms).',
+        title='Start Time',
+        validate_default=True,
+    )
+    end_time: EndTime | list[EndTimeItem] = Field(
+        default=100.0,
+        description='Recording end time in milliseconds (ms).',
+        title='End Time',
+        validate_default=True,
+    )
+
+
+class TimestampsReference(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    block_dict_name: str = Field(
+        default='',
+        description='Name of the root level dictionary which contains the block you are referencing. E.g. `neuron_sets` when referencing a block within the neuron_sets dictionary, or `timestamps` when referencing a block within the timestamps dictionary.To reference a block at the root (i.e. a block that is not contained within a dictionary), block_dict_name should be an empty string. ',
+        title='Block Dict Name',
+    )
+    block_name: str = Field(..., description='Name of the block.', title='Block Name')
+    type: Literal['TimestampsReference'] = Field(
+        default='TimestampsReference', title='Type'
+    )
+
+
+class SamplePercentage10(SamplePercentage):
+    pass
+
+
+class SamplePercentage11Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage11(RootModel[list[SamplePercentage11Item]]):
+    root: list[SamplePercentage11Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class NbS1POmInputs(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['nbS1POmInputs'] = Field(default='nbS1POmInputs', title='Type')
+    sample_percentage: SamplePercentage10 | SamplePercentage11 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+
+
+class SamplePercentage12(SamplePercentage):
+    pass
+
+
+class SamplePercentage13Item(SamplePercentage1Item):
+    pass
+
+
+class SamplePercentage13(RootModel[list[SamplePercentage13Item]]):
+    root: list[SamplePercentage13Item] = Field(
+        100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        min_length=1,
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+
+
+class NbS1VPMInputs(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['nbS1VPMInputs'] = Field(default='nbS1VPMInputs', title='Type')
+    sample_percentage: SamplePercentage12 | SamplePercentage13 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+
+
+class Circuit1(RootModel[Circuit | CircuitFromID]):
+    root: Circuit | CircuitFromID = Field(..., discriminator='type')
+
+
+class SimulationLength(RootModel[float]):
+    root: float = Field(
+        1000.0,
+        description='Simulation length in milliseconds (ms).',
+        ge=1.0,
+        le=12000.0,
+        title='Duration',
+    )
+
+
+class SimulationLength1Item(RootModel[float]):
+    root: float = Field(..., ge=1.0, le=12000.0)
+
+
+class SimulationLength1(RootModel[list[SimulationLength1Item]]):
+    root: list[SimulationLength1Item] = Field(
+        1000.0,
+        description='Simulation length in milliseconds (ms).',
+        min_length=1,
+        title='Duration',
+        validate_default=True,
+    )
+
+
+class ExtracellularCalciumConcentration(RootModel[float]):
+    root: float = Field(
+        1.1,
+        description='Extracellular calcium concentration around the synapse in millimoles (mM). Increasing this value increases the probability of synaptic vesicle release, which in turn increases the level of network activity. In vivo values are estimated to be ~0.9-1.2mM, whilst in vitro values are on the order of 2mM.',
+        ge=0.0,
+        title='Extracellular Calcium Concentration',
+    )
+
+
+class ExtracellularCalciumConcentrationItem(DurationItem):
+    pass
+
+
+class ObiOneScientificTasksGenerateSimulationsConfigCircuitCircuitSimulationScanConfigInitialize(
+    BaseModel
+):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['CircuitSimulationScanConfig.Initialize'] = Field(
+        default='CircuitSimulationScanConfig.Initialize', title='Type'
+    )
+    circuit: Circuit | CircuitFromID | list[Circuit1] = Field(
+        ..., description='Circuit to simulate.', title='Circuit'
+    )
+    simulation_length: SimulationLength | SimulationLength1 = Field(
+        default=1000.0,
+        description='Simulation length in milliseconds (ms).',
+        title='Duration',
+        validate_default=True,
+    )
+    extracellular_calcium_concentration: (
+        ExtracellularCalciumConcentration | list[ExtracellularCalciumConcentrationItem]
+    ) = Field(
+        default=1.1,
+        description='Extracellular calcium concentration around the synapse in millimoles (mM). Increasing this value increases the probability of synaptic vesicle release, which in turn increases the level of network activity. In vivo values are estimated to be ~0.9-1.2mM, whilst in vitro values are on the order of 2mM.',
+        title='Extracellular Calcium Concentration',
+        validate_default=True,
+    )
+    v_init: float | list[float] = Field(
+        default=-80.0,
+        description='Initial membrane potential in millivolts (mV).',
+        title='Initial Voltage',
+    )
+    random_seed: int | list[int] = Field(
+        default=1, description='Random seed for the simulation.', title='Random Seed'
+    )
+    node_set: NeuronSetReference | None = Field(
+        default=None, description='Neuron set to simulate.', title='Neuron Set'
+    )
+
+
+class CircuitMetricsEndpointDeclaredCircuitMetricsCircuitIdGetParametersQuery(
+    BaseModel
+):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    level_of_detail_nodes: CircuitStatsLevelOfDetail = Field(
+        default=0,
+        description='Level of detail for node populations analysis',
+        validate_default=True,
+    )
+    level_of_detail_edges: CircuitStatsLevelOfDetail = Field(
+        default=0,
+        description='Level of detail for edge populations analysis',
+        validate_default=True,
+    )
+
+
+class ElectrophysiologyrecordingMetricsEndpointDeclaredElectrophysiologyrecordingMetricsTraceIdGetParametersQuery(
+    BaseModel
+):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    requested_metrics: (
+        list[
+            Literal[
+                'spike_count',
+                'time_to_first_spike',
+                'time_to_last_spike',
+                'inv_time_to_first_spike',
+                'doublet_ISI',
+                'inv_first_ISI',
+                'ISI_log_slope',
+                'ISI_CV',
+                'irregularity_index',
+                'adaptation_index',
+                'mean_frequency',
+                'strict_burst_number',
+                'strict_burst_mean_freq',
+                'spikes_per_burst',
+                'AP_height',
+                'AP_amplitude',
+                'AP1_amp',
+                'APlast_amp',
+                'AP_duration_half_width',
+                'AHP_depth',
+                'AHP_time_from_peak',
+                'AP_peak_upstroke',
+                'AP_peak_downstroke',
+                'voltage_base',
+                'voltage_after_stim',
+                'ohmic_input_resistance_vb_ssse',
+                'steady_state_voltage_stimend',
+                'sag_amplitude',
+                'decay_time_constant_after_stim',
+                'depol_block_bool',
+            ]
+        ]
+        | None
+    ) = Field(default=None, title='Requested Metrics')
+    protocols: (
+        list[
+            Literal[
+                'spontaneous',
+                'idrest',
+                'idthreshold',
+                'apwaveform',
+                'iv',
+                'step',
+                'sponaps',
+                'firepattern',
+                'spontaneousnohold',
+                'starthold',
+                'startnohold',
+                'delta',
+                'sahp',
+                'idhyperpol',
+                'irdepol',
+                'irhyperpol',
+                'iddepol',
+                'apthreshold',
+                'hyperdepol',
+                'negcheops',
+                'poscheops',
+                'spikerec',
+                'sinespec',
+                'genericstep',
+            ]
+        ]
+        | None
+    ) = Field(default=None, title='Protocols')
+    min_value: float | None = Field(default=None, title='Min Value')
+    max_value: float | None = Field(default=None, title='Max Value')
+
+
+class NeuronMorphologyMetricsEndpointDeclaredNeuronMorphologyMetricsCellMorphologyIdGetParametersQuery(
+    BaseModel
+):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    requested_metrics: (
+        list[
+            Literal[
+                'aspect_ratio',
+                'circularity',
+                'length_fraction_above_soma',
+                'max_radial_distance',
+                'number_of_neurites',
+                'soma_radius',
+                'soma_surface_area',
+                'total_length',
+                'total_height',
+                'total_width',
+                'total_depth',
+                'total_area',
+                'total_volume',
+                'section_lengths',
+                'segment_radii',
+                'number_of_sections',
+                'local_bifurcation_angles',
+                'remote_bifurcation_angles',
+                'section_path_distances',
+                'section_radial_distances',
+                'section_branch_orders',
+                'section_strahler_orders',
+            ]
+        ]
+        | None
+    ) = Field(
+        default=None, description='List of requested metrics', title='Requested Metrics'
+    )
+
+
+class CircuitMetricsEdgePopulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    number_of_edges: int = Field(..., title='Number Of Edges')
+    name: str = Field(..., title='Name')
+    population_type: EdgePopulationType
+    source_name: str | None = Field(default=None, title='Source Name')
+    target_name: str | None = Field(default=None, title='Target Name')
+    property_names: list[str] = Field(..., title='Property Names')
+    property_stats: dict[str, dict[str, float]] | None = Field(
+        ..., title='Property Stats'
+    )
+    degree_stats: dict[DegreeTypes, dict[str, float]] | None = Field(
+        ..., title='Degree Stats'
+    )
+
+
+class CircuitMetricsNodePopulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    number_of_nodes: int = Field(..., title='Number Of Nodes')
+    name: str = Field(..., title='Name')
+    population_type: NodePopulationType
+    property_names: list[str] = Field(..., title='Property Names')
+    property_unique_values: dict[str, list[str]] = Field(
+        ..., title='Property Unique Values'
+    )
+    property_value_counts: dict[str, dict[str, int]] = Field(
+        ..., title='Property Value Counts'
+    )
+    dynamics_param_names: list[str] | None = Field(
+        default=None, title='Dynamics Param Names'
+    )
+    node_location_info: dict[SpatialCoordinate, dict[str, float]] | None = Field(
+        ..., title='Node Location Info'
+    )
+
+
+class CircuitMetricsOutput(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    number_of_biophys_node_populations: int = Field(
+        ..., title='Number Of Biophys Node Populations'
+    )
+    number_of_virtual_node_populations: int = Field(
+        ..., title='Number Of Virtual Node Populations'
+    )
+    names_of_biophys_node_populations: list[str] = Field(
+        ..., title='Names Of Biophys Node Populations'
+    )
+    names_of_virtual_node_populations: list[str] = Field(
+        ..., title='Names Of Virtual Node Populations'
+    )
+    names_of_nodesets: list[str] = Field(..., title='Names Of Nodesets')
+    biophysical_node_populations: list[CircuitMetricsNodePopulation | None] = Field(
+        ..., title='Biophysical Node Populations'
+    )
+    virtual_node_populations: list[CircuitMetricsNodePopulation | None] = Field(
+        ..., title='Virtual Node Populations'
+    )
+    number_of_chemical_edge_populations: int = Field(
+        ..., title='Number Of Chemical Edge Populations'
+    )
+    number_of_electrical_edge_populations: int = Field(
+        ..., title='Number Of Electrical Edge Populations'
+    )
+    names_of_chemical_edge_populations: list[str] = Field(
+        ..., title='Names Of Chemical Edge Populations'
+    )
+    names_of_electrical_edge_populations: list[str] = Field(
+        ..., title='Names Of Electrical Edge Populations'
+    )
+    chemical_edge_populations: list[CircuitMetricsEdgePopulation | None] = Field(
+        ..., title='Chemical Edge Populations'
+    )
+    electrical_edge_populations: list[CircuitMetricsEdgePopulation | None] = Field(
+        ..., title='Electrical Edge Populations'
+    )
+
+
+class ConnectSynapticManipulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['ConnectSynapticManipulation'] = Field(
+        default='ConnectSynapticManipulation', title='Type'
+    )
+    presynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Presynaptic Neuron Set',
+    )
+    postsynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Postsynaptic Neuron Set',
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the manipulation is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] | None = Field(
+        default=0.0,
+        description='An optional offset of the manipulation relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+
+
+class ConstantCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['ConstantCurrentClampSomaticStimulus'] = Field(
+        default='ConstantCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration | list[DurationItem] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    amplitude: float | list[float] | FloatRange = Field(
+        default=0.1,
+        description='The injected current. Given in nanoamps.',
+        title='Amplitude',
+        validate_default=True,
+    )
+
+
+class DisconnectSynapticManipulation(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['DisconnectSynapticManipulation'] = Field(
+        default='DisconnectSynapticManipulation', title='Type'
+    )
+    presynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Presynaptic Neuron Set',
+    )
+    postsynaptic_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='The manipulation is applied to all synapses between the presynaptic and postsynaptic neuron sets.',
+        title='Postsynaptic Neuron Set',
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the manipulation is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] | None = Field(
+        default=0.0,
+        description='An optional offset of the manipulation relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+
+
+class FullySynchronousSpikeStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['FullySynchronousSpikeStimulus'] = Field(
+        default='FullySynchronousSpikeStimulus', title='Type'
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    source_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Source neuron set to simulate',
+        title='Neuron Set (Source)',
+    )
+    targeted_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Target neuron set to simulate',
+        title='Neuron Set (Target)',
+    )
+
+
+class HyperpolarizingCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['HyperpolarizingCurrentClampSomaticStimulus'] = Field(
+        default='HyperpolarizingCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration2 | list[DurationItem] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+
+
+class NeuronIds(RootModel[list[NamedTuple]]):
+    root: list[NamedTuple] = Field(
+        ...,
+        description='List of neuron IDs to include in the neuron set.',
+        min_length=1,
+        title='ID Neuronset',
+    )
+
+
+class IDNeuronSet(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['IDNeuronSet'] = Field(default='IDNeuronSet', title='Type')
+    sample_percentage: SamplePercentage4 | SamplePercentage5 = Field(
+        default=100.0,
+        description='Percentage of neurons to sample between 0 and 100%',
+        title='Sample (Percentage)',
+        validate_default=True,
+    )
+    sample_seed: int | list[int] = Field(
+        default=1, description='Seed for random sampling.', title='Sample Seed'
+    )
+    neuron_ids: NamedTuple | NeuronIds = Field(
+        ...,
+        description='List of neuron IDs to include in the neuron set.',
+        title='ID Neuronset',
+    )
+
+
+class InterSpikeIntervalDistributionSpikeStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['InterSpikeIntervalDistributionSpikeStimulus'] = Field(
+        default='InterSpikeIntervalDistributionSpikeStimulus', title='Type'
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    source_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Source neuron set to simulate',
+        title='Neuron Set (Source)',
+    )
+    targeted_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Target neuron set to simulate',
+        title='Neuron Set (Target)',
+    )
+    duration: Duration3 | list[DurationItem3] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    distribution: AllDistributionsReference | None = Field(
+        default=None,
+        description='Distribution used to sample inter-spike intervals in milliseconds. Default: ExponentialDistribution(scale=50.0), approximately 20 Hz.',
+        title='Interval Distribution',
+    )
+    resample_each_repetition: bool = Field(
+        default=True,
+        description='When set to True, the spike train is regenerated for every timestamp repetition. When False, the same relative spike pattern is reused for all repetitions.',
+        title='Resample Each Repetition',
+    )
+
+
+class LinearCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['LinearCurrentClampSomaticStimulus'] = Field(
+        default='LinearCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration4 | list[DurationItem4] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    amplitude_start: float | list[float] = Field(
+        default=0.1,
+        description='The amount of current initially injected when the stimulus activates. Given in nanoamps.',
+        title='Start Amplitude',
+    )
+    amplitude_end: float | list[float] = Field(
+        default=0.2,
+        description="If given, current is interpolated such that current reaches this value when the stimulus concludes. Otherwise, current stays at 'Start Amplitude'. Given in nanoamps.",
+        title='End Amplitude',
+    )
+
+
+class MultiPulseCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['MultiPulseCurrentClampSomaticStimulus'] = Field(
+        default='MultiPulseCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration4 | list[DurationItem4] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    amplitude: float | list[float] = Field(
+        default=0.1,
+        description='The amount of current initially injected when each pulse activates. Given in nanoamps (nA).',
+        title='Amplitude',
+    )
+    width: Width | list[WidthItem] = Field(
+        default=50.0,
+        description='The length of time each pulse lasts. Given in milliseconds (ms).',
+        title='Pulse Width',
+        validate_default=True,
+    )
+    frequency: Frequency | list[FrequencyItem] = Field(
+        default=1.0,
+        description='The frequency of pulse trains. Given in Hertz (Hz).',
+        title='Pulse Frequency',
+        validate_default=True,
+    )
+
+
+class NormallyDistributedCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['NormallyDistributedCurrentClampSomaticStimulus'] = Field(
+        default='NormallyDistributedCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration4 | list[DurationItem4] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    mean_amplitude: float | list[float] = Field(
+        default=0.01,
+        description='The mean value of current to inject. Given in nanoamps (nA).',
+        title='Mean Amplitude',
+    )
+    variance: Variance | list[VarianceItem] = Field(
+        default=0.01,
+        description='The variance around the mean of current to inject using a                     normal distribution.',
+        title='Variance',
+        validate_default=True,
+    )
+
+
+class OrnsteinUhlenbeckConductanceSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['OrnsteinUhlenbeckConductanceSomaticStimulus'] = Field(
+        default='OrnsteinUhlenbeckConductanceSomaticStimulus', title='Type'
+    )
+    duration: Duration4 | list[DurationItem4] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    time_constant: TimeConstant | list[TimeConstantItem] = Field(
+        default=2.7,
+        description='The time constant of the Ornstein-Uhlenbeck process.',
+        title='Tau',
+        validate_default=True,
+    )
+    mean_amplitude: MeanAmplitude | list[MeanAmplitudeItem] = Field(
+        default=0.001,
+        description='The mean value of conductance to inject. Given in microsiemens (μS).',
+        title='Mean Amplitude',
+        validate_default=True,
+    )
+    standard_deviation: StandardDeviation | list[StandardDeviationItem] = Field(
+        default=0.001,
+        description='The standard deviation of conductance to inject. Given in microsiemens (μS).',
+        title='Standard Deviation',
+        validate_default=True,
+    )
+    reversal_potential: float | list[float] = Field(
+        default=0.0,
+        description='The reversal potential of the conductance injection.',
+        title='Reversal Potential',
+    )
+
+
+class OrnsteinUhlenbeckCurrentSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['OrnsteinUhlenbeckCurrentSomaticStimulus'] = Field(
+        default='OrnsteinUhlenbeckCurrentSomaticStimulus', title='Type'
+    )
+    duration: Duration4 | list[DurationItem4] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    time_constant: TimeConstant | list[TimeConstantItem] = Field(
+        default=2.7,
+        description='The time constant of the Ornstein-Uhlenbeck process.',
+        title='Tau',
+        validate_default=True,
+    )
+    mean_amplitude: MeanAmplitude1 | list[MeanAmplitudeItem] = Field(
+        default=0.1,
+        description='The mean value of current to inject. Given in nanoamps (nA).',
+        title='Mean Amplitude',
+        validate_default=True,
+    )
+    standard_deviation: StandardDeviation1 | list[StandardDeviationItem] = Field(
+        default=0.05,
+        description='The standard deviation of current to inject. Given in nanoamps (nA).',
+        title='Standard Deviation',
+        validate_default=True,
+    )
+
+
+class PoissonSpikeStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['PoissonSpikeStimulus'] = Field(
+        default='PoissonSpikeStimulus', title='Type'
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    source_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Source neuron set to simulate',
+        title='Neuron Set (Source)',
+    )
+    targeted_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Target neuron set to simulate',
+        title='Neuron Set (Target)',
+    )
+    duration: Duration9 | list[DurationItem9] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    frequency: Frequency1 | list[FrequencyItem] = Field(
+        default=1.0,
+        description='Mean frequency (Hz) of the Poisson input.',
+        title='Frequency',
+        validate_default=True,
+    )
+    random_seed: int | list[int] = Field(
+        default=0,
+        description='Seed for the random number generator to ensure reproducibility of the spike generation.',
+        title='Random Seed',
+    )
+
+
+class RelativeConstantCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RelativeConstantCurrentClampSomaticStimulus'] = Field(
+        default='RelativeConstantCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    percentage_of_threshold_current: (
+        PercentageOfThresholdCurrent | list[PercentageOfThresholdCurrentItem]
+    ) = Field(
+        default=10.0,
+        description="The percentage of a cell's threshold current to inject when the stimulus                     activates.",
+        title='Percentage of Threshold Current',
+        validate_default=True,
+    )
+
+
+class RelativeLinearCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RelativeLinearCurrentClampSomaticStimulus'] = Field(
+        default='RelativeLinearCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    percentage_of_threshold_current_start: (
+        PercentageOfThresholdCurrentStart | list[PercentageOfThresholdCurrentStartItem]
+    ) = Field(
+        default=10.0,
+        description="The percentage of a cell's threshold current to inject when the stimulus activates.",
+        title='Percentage of Threshold Current (Start)',
+        validate_default=True,
+    )
+    percentage_of_threshold_current_end: (
+        PercentageOfThresholdCurrentEnd | list[PercentageOfThresholdCurrentEndItem]
+    ) = Field(
+        default=100.0,
+        description="If given, the percentage of a cell's threshold current is interpolated such that the percentage reaches this value when the stimulus concludes.",
+        title='Percentage of Threshold Current (End)',
+        validate_default=True,
+    )
+
+
+class RelativeNormallyDistributedCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RelativeNormallyDistributedCurrentClampSomaticStimulus'] = Field(
+        default='RelativeNormallyDistributedCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    mean_percentage_of_threshold_current: (
+        MeanPercentageOfThresholdCurrent | list[MeanPercentageOfThresholdCurrentItem]
+    ) = Field(
+        default=0.01,
+        description="The mean value of current to inject as a percentage of a cell's                     threshold current.",
+        title='Percentage of Threshold Current (Mean)',
+        validate_default=True,
+    )
+    variance: Variance | list[VarianceItem] = Field(
+        default=0.01,
+        description='The variance around the mean of current to inject using a                     normal distribution.',
+        title='Variance',
+        validate_default=True,
+    )
+
+
+class RelativeOrnsteinUhlenbeckConductanceSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RelativeOrnsteinUhlenbeckConductanceSomaticStimulus'] = Field(
+        default='RelativeOrnsteinUhlenbeckConductanceSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    time_constant: TimeConstant | list[TimeConstantItem] = Field(
+        default=2.7,
+        description='The time constant of the Ornstein-Uhlenbeck process.',
+        title='Tau',
+        validate_default=True,
+    )
+    mean_percentage_of_cells_input_conductance: (
+        MeanPercentageOfCellsInputConductance
+        | list[MeanPercentageOfCellsInputConductanceItem]
+    ) = Field(
+        default=100.0,
+        description="Signal mean as percentage of a cell's input conductance.",
+        title="Mean Percentage of Cells' Input Conductance",
+        validate_default=True,
+    )
+    standard_deviation_percentage_of_cells_input_conductance: (
+        StandardDeviationPercentageOfCellsInputConductance
+        | list[StandardDeviationPercentageOfCellsInputConductanceItem]
+    ) = Field(
+        default=5.0,
+        description="Signal standard deviation as percentage of a cell's input conductance.",
+        title='Standard Deviation',
+        validate_default=True,
+    )
+    reversal_potential: float | list[float] = Field(
+        default=0.0,
+        description='The reversal potential of the conductance injection.',
+        title='Reversal Potential',
+    )
+
+
+class RelativeOrnsteinUhlenbeckCurrentSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['RelativeOrnsteinUhlenbeckCurrentSomaticStimulus'] = Field(
+        default='RelativeOrnsteinUhlenbeckCurrentSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    time_constant: TimeConstant | list[TimeConstantItem] = Field(
+        default=2.7,
+        description='The time constant of the Ornstein-Uhlenbeck process.',
+        title='Tau',
+        validate_default=True,
+    )
+    mean_percentage_of_threshold_current: (
+        MeanPercentageOfThresholdCurrent1 | list[MeanPercentageOfThresholdCurrentItem]
+    ) = Field(
+        default=100.0,
+        description="Signal mean as percentage of a cell's threshold current.",
+        title='Mean Percentage of Threshold Current',
+        validate_default=True,
+    )
+    standard_deviation_percentage_of_threshold: (
+        StandardDeviationPercentageOfThreshold
+        | list[StandardDeviationPercentageOfThresholdItem]
+    ) = Field(
+        default=5.0,
+        description="Signal standard deviation as percentage of a cell's threshold current.",
+        title='Standard Deviation',
+        validate_default=True,
+    )
+
+
+class SinusoidalCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SinusoidalCurrentClampSomaticStimulus'] = Field(
+        default='SinusoidalCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration10 | list[DurationItem10] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    maximum_amplitude: float | list[float] = Field(
+        default=0.1,
+        description='The maximum (and starting) amplitude of the sinusoid. Given in nanoamps (nA).',
+        title='Maximum Amplitude',
+    )
+    frequency: Frequency2 | list[FrequencyItem] = Field(
+        default=1.0,
+        description='The frequency of the waveform. Given in Hertz (Hz).',
+        title='Frequency',
+        validate_default=True,
+    )
+    dt: Dt1 | list[DtItem] = Field(
+        default=0.025,
+        description='Timestep of generated signal in milliseconds (ms).',
+        title='Timestep',
+        validate_default=True,
+    )
+
+
+class SinusoidalPoissonSpikeStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SinusoidalPoissonSpikeStimulus'] = Field(
+        default='SinusoidalPoissonSpikeStimulus', title='Type'
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    source_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Source neuron set to simulate',
+        title='Neuron Set (Source)',
+    )
+    targeted_neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Target neuron set to simulate',
+        title='Neuron Set (Target)',
+    )
+    duration: Duration16 | list[DurationItem16] = Field(
+        default=200.0,
+        description='Time duration of the stimulus in milliseconds.',
+        title='Duration',
+        validate_default=True,
+    )
+    minimum_rate: MinimumRate | list[MinimumRateItem] = Field(
+        default=1e-05,
+        description='Minimum rate of the stimulus in Hz.\n Must be less than the Maximum Rate.',
+        title='Minimum Rate',
+        validate_default=True,
+    )
+    maximum_rate: MaximumRate | list[MaximumRateItem] = Field(
+        default=10.0,
+        description='Maximum rate of the stimulus in Hz. Must be greater than or equal to Minimum Rate.',
+        title='Maximum Rate',
+        validate_default=True,
+    )
+    modulation_frequency_hz: ModulationFrequencyHz | list[ModulationFrequencyHzItem] = (
+        Field(
+            default=5.0,
+            description='Frequency (Hz) of the sinusoidal modulation of the rate.',
+            title='Modulation Frequency',
+            validate_default=True,
+        )
+    )
+    phase_degrees: float | list[float] = Field(
+        default=0.0,
+        description='Phase offset (degrees) of the sinusoid.',
+        title='Phase Offset',
+    )
+    random_seed: int | list[int] = Field(
+        default=0,
+        description='Seed for the random number generator to ensure reproducibility.',
+        title='Random Seed',
+    )
+
+
+class SpatiallyUniformElectricFieldStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SpatiallyUniformElectricFieldStimulus'] = Field(
+        default='SpatiallyUniformElectricFieldStimulus', title='Type'
+    )
+    duration: Duration17 | list[DurationItem16] = Field(
+        default=200.0,
+        description='Time in milliseconds (ms) for how long the main stimulus is activated. The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    ramp_up_duration: RampUpDuration | list[RampUpDurationItem] = Field(
+        default=0.0,
+        description='Time over which the field linearly ramps up from zero to full amplitude, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Ramp Up (Duration)',
+        validate_default=True,
+    )
+    ramp_down_duration: RampDownDuration | list[RampDownDurationItem] = Field(
+        default=0.0,
+        description='Time over which the field linearly ramps down from full amplitude to zero, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Ramp Down (Duration)',
+        validate_default=True,
+    )
+    E_x: float | list[float] = Field(
+        default=0.1,
+        description='Amplitude of the electric field in the x-direction, in V/m. May be negative',
+        title='X amplitude',
+    )
+    E_y: float | list[float] = Field(
+        default=0.1,
+        description='Amplitude of the electric field in the y-direction, in V/m. May be negative',
+        title='Y amplitude',
+    )
+    E_z: float | list[float] = Field(
+        default=0.1,
+        description='Amplitude of the electric field in the z-direction, in V/m. May be negative',
+        title='Z amplitude',
+    )
+
+
+class SubthresholdCurrentClampSomaticStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['SubthresholdCurrentClampSomaticStimulus'] = Field(
+        default='SubthresholdCurrentClampSomaticStimulus', title='Type'
+    )
+    duration: Duration18 | list[DurationItem18] = Field(
+        default=200.0,
+        description='Time duration in milliseconds for how long input is activated.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    percentage_below_threshold: float | list[float] = Field(
+        default=0.1,
+        description="A percentage adjusted from 100 of a cell's threshold current.                         E.g. 20 will apply 80\\% of the threshold current. Using a negative                             value will give more than 100. E.g. -20 will inject 120\\% of the                                 threshold current.",
+        title='Percentage Below Threshold',
+    )
+
+
+class TemporallyCosineSpatiallyUniformElectricFieldStimulus(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['TemporallyCosineSpatiallyUniformElectricFieldStimulus'] = Field(
+        default='TemporallyCosineSpatiallyUniformElectricFieldStimulus', title='Type'
+    )
+    duration: Duration19 | list[DurationItem19] = Field(
+        default=200.0,
+        description='Time in milliseconds (ms) for how long the main stimulus is activated. The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Duration',
+        validate_default=True,
+    )
+    timestamps: TimestampsReference | None = Field(
+        default=None,
+        description='Timestamps at which the stimulus is applied.',
+        title='Timestamps',
+    )
+    timestamp_offset: float | list[float] = Field(
+        default=0.0,
+        description='The offset of the stimulus relative to each timestamp in milliseconds (ms).',
+        title='Timestamp Offset',
+    )
+    neuron_set: NeuronSetReference | None = Field(
+        default=None,
+        description='Neuron set to which the stimulus is applied.',
+        title='Neuron Set',
+    )
+    ramp_up_duration: RampUpDuration | list[RampUpDurationItem] = Field(
+        default=0.0,
+        description='Time over which the field linearly ramps up from zero to full amplitude, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Ramp Up (Duration)',
+        validate_default=True,
+    )
+    ramp_down_duration: RampDownDuration | list[RampDownDurationItem] = Field(
+        default=0.0,
+        description='Time over which the field linearly ramps down from full amplitude to zero, in milliseconds (ms). The duration does not include the ramp up and ramp down times, so the total length of the stimulus will be the sum of the duration, ramp up and ramp down times.',
+        title='Ramp Down (Duration)',
+        validate_default=True,
+    )
+    E_x: float | list[float] = Field(
+        default=0.1,
+        description='Peak amplitude of the cosinusoid in the x-direction, in V/m. May be negative',
+        title='X peak amplitude',
+    )
+    E_y: float | list[float] = Field(
+        default=0.1,
+        description='Peak amplitude of the cosinusoid in the y-direction, in V/m. May be negative',
+        title='Y peak amplitude',
+    )
+    E_z: float | list[float] = Field(
+        default=0.1,
+        description='Peak amplitude of the cosinusoid in the z-direction, in V/m. May be negative',
+        title='Z peak amplitude',
+    )
+    frequency: Frequency3 | Frequency4 = Field(
+        default=0.0,
+        description='Frequency of the cosinusoid, in Hz. Must be non-negative. If not provided, assumed to be 0. In this case, a time-invariant field with amplitude [Ex, Ey, Ez] is applied, unless ramp_up_duration or ramp_down_duration is specified, in which case the field will increase/decrease linearly with time during the ramp periods, and will be constant during the remainder of the stimulation period. Note that the signal will be generated with the same time step as the simulation itself. Note that frequency should therefore be less than the Nyquist frequency of the simulation (i.e., 1/(2*dt))',
+        title='Frequency',
+        validate_default=True,
+    )
+    phase_degrees: float | list[float] = Field(
+        default=0.0, description='Phase of the cosinusoid, in degrees.', title='Phase'
+    )
+
+
+class CircuitSimulationScanConfig(BaseModel):
+    model_config = ConfigDict(
+        extra='ignore',
+    )
+    type: Literal['CircuitSimulationScanConfig'] = Field(
+        default='CircuitSimulationScanConfig', title='Type'
+    )
+    info: Info = Field(..., description='Information about the campaign.')
+    timestamps: dict[str, SingleTimestamp | RegularTimestamps] | None = Field(
+        default=None, description='Timestamps for the simulation.', title='Timestamps'
+    )
+    recordings: (
+        dict[str, SomaVoltageRecording | TimeWindowSomaVoltageRecording] | None
+    ) = Field(
+        default=None, description='Recordings for the simulation.', title='Recordings'
+    )
+    neuron_sets: (
+        dict[
+            str,
+            IDNeuronSet
+            | AllNeurons
+            | ExcitatoryNeurons
+            | InhibitoryNeurons
+            | PredefinedNeuronSet
+            | NbS1VPMInputs
+            | NbS1POmInputs,
+        ]
+        | None
+    ) = Field(
+        default=None, description='Neuron sets for the simulation.', title='Neuron Sets'
+    )
+    synaptic_manipulations: (
+        dict[
+            str,
+            DisconnectSynapticManipulation
+            | ConnectSynapticManipulation
+            | SynapticMgManipulation
+            | ScaleAcetylcholineUSESynapticManipulation,
+        ]
+        | None
+    ) = Field(
+        default=None,
+        description='Synaptic manipulations for the simulation.',
+        title='Synaptic Manipulations',
+    )
+    initialize: ObiOneScientificTasksGenerateSimulationsConfigCircuitCircuitSimulationScanConfigInitialize = Field(
+        ...,
+        description='Parameters for initializing the simulation.',
+        title='Initialization',
+    )
+    stimuli: (
+        dict[
+            str,
+            RelativeNormallyDistributedCurrentClampSomaticStimulus
+            | RelativeConstantCurrentClampSomaticStimulus
+            | RelativeLinearCurrentClampSomaticStimulus
+            | SubthresholdCurrentClampSomaticStimulus
+            | RelativeOrnsteinUhlenbeckCurrentSomaticStimulus
+            | RelativeOrnsteinUhlenbeckConductanceSomaticStimulus
+            | ConstantCurrentClampSomaticStimulus
+            | HyperpolarizingCurrentClampSomaticStimulus
+            | LinearCurrentClampSomaticStimulus
+            | MultiPulseCurrentClampSomaticStimulus
+            | NormallyDistributedCurrentClampSomaticStimulus
+            | SinusoidalCurrentClampSomaticStimulus
+            | OrnsteinUhlenbeckCurrentSomaticStimulus
+            | OrnsteinUhlenbeckConductanceSomaticStimulus
+            | PoissonSpikeStimulus
+            | FullySynchronousSpikeStimulus
+            | SinusoidalPoissonSpikeStimulus
+            | InterSpikeIntervalDistributionSpikeStimulus
+            | SpatiallyUniformElectricFieldStimulus
+            | TemporallyCosineSpatiallyUniformElectricFieldStimulus,
+        ]
+        | None
+    ) = Field(default=None, description='Stimuli for the simulation.', title='Stimuli')
+    distributions: (
+        dict[
+            str,
+            FloatConstantDistribution
+            | FloatUniformDistribution
+            | ExponentialDistribution
+            | GammaDistribution
+            | IntConstantDistribution
+            | IntUniformDistribution,
+        ]
+        | None
+    ) = Field(
+        default=None,
+        description='Distributions used by stimuli (e.g. inter-spike interval distributions).',
+        title='Distributions',
+    )
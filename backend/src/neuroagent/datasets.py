@@ -0,0 +1,218 @@
+"""Per-thread datasets shared between tools and the python sandbox."""
+
+import json
+import logging
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+from uuid import UUID
+
+import duckdb
+from pandas import DataFrame
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_DATASET_DIR = "/datasets"
+
+
+class Dataset(BaseModel):
+    """Dataset registered for a thread and stored as a parquet file."""
+
+    name: str
+    path: Path
+    n_rows: int
+    size: int
+
+    @property
+    def sandbox_path(self) -> str:
+        """Path of the dataset inside of the python sandbox."""
+        return f"{SANDBOX_DATASET_DIR}/{self.name}.parquet"
+
+
+class DatasetStore:
+    """In-process cache of the datasets produced by tools, grouped per thread.
+
+    Tabular tool outputs are written to parquet files on the local disk when the
+    python sandbox is first used in the thread, and are then mounted into it, so
+    that the LLM can analyze them without re-emitting the data in the code. The
+    datasets are built from the tool outputs of the thread history, so the cache
+    being local to the worker only costs a rebuild on another worker. It is
+    bounded both in number of threads and in datasets per thread. Least recently
+    used entries are evicted first.
+
+    Parameters
+    ----------
+    base_dir : str
+        Directory under which the parquet files are written.
+    max_threads : int
+        Maximum number of threads for which datasets are kept.
+    max_datasets_per_thread : int
+        Maximum number of datasets kept for a single thread.
+    max_bytes_per_thread : int
+        Maximum cumulated size of the datasets of a single thread.
+    """
+
+    def __init__(
+        self,
+        base_dir: str = "/tmp",  # nosec: B108
+        max_threads: int = 200,
+        max_datasets_per_thread: int = 10,
+        max_bytes_per_thread: int = 100 * 1024 * 1024,
+    ) -> None:
+        """Init."""
+        self.base_dir = Path(base_dir).resolve() / "sandbox_datasets"
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_threads = max_threads
+        self.max_datasets_per_thread = max_datasets_per_thread
+        self.max_bytes_per_thread = max_bytes_per_thread
+
+        # thread_id -> (name -> dataset), both ordered from least to most recent.
+        self._datasets: OrderedDict[UUID, OrderedDict[str, Dataset]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def sanitize_name(name: str) -> str:
+        """Turn an arbitrary string into a valid file name."""
+        return re.sub(r"[^A-Za-z0-9_-]", "_", name)
+
+    def register(
+        self,
+        thread_id: UUID,
+        name: str,
+        data: DataFrame | list[dict[str, Any]],
+    ) -> Dataset | None:
+        """Write the data as parquet and register it for the thread.
+
+        Parameters
+        ----------
+        thread_id : UUID
+            Thread the dataset belongs to.
+        name : str
+            Name of the dataset, used as file name in the sandbox.
+        data : DataFrame | list[dict[str, Any]]
+            Data frame or list of JSON records to store.
+
+        Returns
+        -------
+        Dataset | None
+            The registered dataset, or None if there was nothing to store.
+        """
+        if len(data) == 0:
+            return None
+
+        name = self.sanitize_name(name)
+        thread_dir = self.base_dir / str(thread_id)
+        thread_dir.mkdir(parents=True, exist_ok=True)
+        path = thread_dir / f"{name}.parquet"
+
+        # Relations are written without putting the paths in SQL strings
+        conn = duckdb.connect()
+        try:
+            if isinstance(data, DataFrame):
+                conn.from_df(data).write_parquet(str(path))
+            else:
+                # Let duckdb infer the (possibly nested) schema of the records.
+                with tempfile.NamedTemporaryFile(
+                    "w", suffix=".json", dir=thread_dir
+                ) as records_file:
+                    json.dump(data, records_file)
+                    records_file.flush()
+                    conn.read_json(records_file.name).write_parquet(str(path))
+        finally:
+            conn.close()
+
+        dataset = Dataset(
+            name=name, path=path, n_rows=len(data), size=path.stat().st_size
+        )
+        with self._lock:
+            thread_datasets = self._datasets.setdefault(thread_id, OrderedDict())
+            thread_datasets[name] = dataset
+            thread_datasets.move_to_end(name)
+            self._datasets.move_to_end(thread_id)
+            self._evict_datasets(thread_id)
+            self._evict_threads()
+
+        logger.debug(
+            f"Registered dataset {name} ({dataset.n_rows} rows) for thread {thread_id}."
+        )
+        return dataset
+
+    def get(self, thread_id: UUID) -> list[Dataset]:
+        """Return the datasets of a thread and mark the thread as recently used."""
+        with self._lock:
+            thread_datasets = self._datasets.get(thread_id)
+            if thread_datasets is None:
+                return []
+            self._datasets.move_to_end(thread_id)
+            return [
+                dataset for dataset in thread_datasets.values() if dataset.path.exists()
+            ]
+
+    def materialize(
+        self,
+        thread_id: UUID,
+        sources: list[
+            tuple[str, Callable[[], DataFrame | list[dict[str, Any]] | None]]
+        ],
+    ) -> list[Dataset]:
+        """Write the datasets of a thread that are not on the disk yet.
+
+        Parameters
+        ----------
+        thread_id : UUID
+            Thread the datasets belong to.
+        sources : list[tuple[str, Callable[[], DataFrame | list[dict[str, Any]] | None]]]
+            Name of each dataset, from the oldest to the most recent, and a
+            function getting its data. Only the most recent datasets are kept.
+
+        Returns
+        -------
+        list[Dataset]
+            The datasets of the thread.
+        """
+        cached = {dataset.name for dataset in self.get(thread_id)}
+        # The most recent datasets are kept by the eviction, skip the others
+        for name, get_data in sources[-self.max_datasets_per_thread :]:
+            if self.sanitize_name(name) in cached:
+                continue
+            try:
+                data = get_data()
+                if data is not None:
+                    self.register(thread_id, name, data)
+            except Exception:
+                logger.exception(f"Could not build the dataset {name}.")
+        return self.get(thread_id)
+
+    def evict(self, thread_id: UUID) -> None:
+        """Drop all of the datasets of a thread."""
+        with self._lock:
+            self._datasets.pop(thread_id, None)
+        shutil.rmtree(self.base_dir / str(thread_id), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Drop every dataset."""
+        with self._lock:
+            self._datasets.clear()
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _evict_datasets(self, thread_id: UUID) -> None:
+        """Evict the least recently used datasets of a thread above the limits."""
+        thread_datasets = self._datasets[thread_id]
+        while len(thread_datasets) > 1 and (
+            len(thread_datasets) > self.max_datasets_per_thread
+            or sum(dataset.size for dataset in thread_datasets.values())
+            > self.max_bytes_per_thread
+        ):
+            _, evicted = thread_datasets.popitem(last=False)
+            evicted.path.unlink(missing_ok=True)
+
+    def _evict_threads(self) -> None:
+        """Evict the least recently used threads above the limit."""
+        while len(self._datasets) > self.max_threads:
+            thread_id, _ = self._datasets.popitem(last=False)
+            shutil.rmtree(self.base_dir / str(thread_id), ignore_errors=True)
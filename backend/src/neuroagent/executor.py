@@ -6,6 +6,7 @@ import logging
 import os
 import subprocess  # nosec: B404
 import tempfile
+import time
 from pathlib import Path
 from textwrap import dedent
 from types import TracebackType
@@ -13,10 +14,39 @@ from typing import Any, Literal
 
 from pydantic import BaseModel
 
+from neuroagent.datasets import Dataset
+
+logger = logging.getLogger(__name__)
+
 LoggingLevel = Literal[
     "debug", "info", "notice", "warning", "error", "critical", "alert", "emergency"
 ]
 
+# Modules needed by the runner itself, imported and timed before the user code.
+PRELOAD_MODULES = [
+    "sys",
+    "io",
+    "gc",
+    "json",
+    "warnings",
+    "plotly.io",
+    "plotly.graph_objects",
+]
+
+
+class ExecutionTimings(BaseModel):
+    """Duration in milliseconds of each phase of a python execution."""
+
+    spawn: float | None = None
+    pyodide_load: float | None = None
+    package_install: float | None = None
+    preload: float | None = None
+    imports: dict[str, float | None] = {}
+    user_code: float | None = None
+    figure_serialisation: float | None = None
+    output_parse: float | None = None
+    total: float | None = None
+
 
 class SuccessOutput(BaseModel):
     """Output of the python script."""
@@ -135,7 +165,10 @@ class WasmExecutor:
             with open(runner_path, "w") as f:
                 f.write(
                     self.JS_CODE.format(
-                        packages=self.additional_imports, code=json.dumps("")
+                        packages=self.additional_imports,
+                        preload=json.dumps(PRELOAD_MODULES),
+                        datasets=json.dumps({}),
+                        code=json.dumps(""),
                     )
                 )  # Empty code
 
@@ -154,7 +187,7 @@ class WasmExecutor:
 
             # Run the cmd in a subprocess
             # Note: We don't set cwd here to allow reading from local node_modules
-            subprocess.run(  # nosec: B603
+            result = subprocess.run(  # nosec: B603
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -162,8 +195,43 @@ class WasmExecutor:
                 timeout=self.timeout,
                 env=env,
             )
+            self._log_import_profile(result.stdout)
             return self
 
+    def _log_import_profile(self, stdout: str | None) -> None:
+        """Log the import time of the preloaded modules from the warmup run."""
+        lines = [line for line in (stdout or "").splitlines() if line.strip()]
+        if not lines:
+            return
+        try:
+            timings = ExecutionTimings(**json.loads(lines[-1]).get("timings", {}))
+        except (json.JSONDecodeError, AttributeError, ValueError):
+            return
+
+        report = ", ".join(
+            f"{module}: {'failed' if duration is None else f'{duration:.0f}ms'}"
+            for module, duration in sorted(
+                timings.imports.items(),
+                key=lambda item: -1 if item[1] is None else item[1],
+                reverse=True,
+            )
+        )
+        logger.info(
+            f"Sandbox warmup: pyodide load {timings.pyodide_load or 0:.0f}ms, "
+            f"package install {timings.package_install or 0:.0f}ms, "
+            f"preload {timings.preload or 0:.0f}ms ({report})",
+            extra={"sandbox_timings": timings.model_dump(exclude_none=True)},
+        )
+
+    @staticmethod
+    def _log_timings(timings: ExecutionTimings, start: float) -> None:
+        """Log the duration of each phase of a python execution."""
+        timings.total = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Python execution timings (ms): {timings.model_dump_json(exclude_none=True)}",
+            extra={"sandbox_timings": timings.model_dump(exclude_none=True)},
+        )
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -173,18 +241,23 @@ class WasmExecutor:
         """Exit context manager."""
         return False
 
-    async def run_code(self, code: str) -> SuccessOutput | FailureOutput:
+    async def run_code(
+        self, code: str, datasets: list[Dataset] | None = None
+    ) -> SuccessOutput | FailureOutput:
         """
         Execute Python code in the Pyodide environment and return the result.
 
         Parameters
         ----------
             code (`str`): Python code to execute.
+            datasets (`list[Dataset]`, optional): Parquet datasets to mount under `/datasets` in the sandbox.
 
         Returns
         -------
             `SuccessOutput | FailureOutput`: Code output containing the result and logs or potential errors.
         """
+        start = time.perf_counter()
+        datasets = datasets or []
         with tempfile.TemporaryDirectory(
             prefix="pyodide_deno_", dir=self.tmp_base_dir
         ) as runner_dir:
@@ -193,15 +266,21 @@ class WasmExecutor:
             with open(runner_path, "w") as f:
                 f.write(
                     self.JS_CODE.format(
-                        packages=self.additional_imports, code=json.dumps(code)
+                        packages=self.additional_imports,
+                        preload=json.dumps(PRELOAD_MODULES),
+                        datasets=json.dumps(
+                            {dataset.name: str(dataset.path) for dataset in datasets}
+                        ),
+                        code=json.dumps(code),
                     )
                 )
-            # Add read permission to tempdir
+            # Add read permission to tempdir and to the mounted datasets
             permission = []
             for perm in self.deno_permissions:
                 if "--allow-read" in perm:
                     allowed_read_dir = perm.split("=")[-1].split(",")
                     allowed_read_dir.append(runner_dir)
+                    allowed_read_dir.extend(str(dataset.path) for dataset in datasets)
                     permission.append(f"--allow-read={','.join(allowed_read_dir)}")
                 else:
                     permission.append(perm)
@@ -217,12 +296,14 @@ class WasmExecutor:
 
             # Run the cmd in a subprocess
             # Note: We don't set cwd here to allow reading from local node_modules
+            spawn_start = time.perf_counter()
             process = await asyncio.create_subprocess_exec(  # nosec: B603
                 *cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 env=env,
             )
+            timings = ExecutionTimings(spawn=(time.perf_counter() - spawn_start) * 1000)
 
             # Use communicate() to wait for process and read all output
             try:
@@ -235,9 +316,11 @@ class WasmExecutor:
 
             # Check for execution errors
             if stderr:
+                self._log_timings(timings, start)
                 return FailureOutput(error_type="install-error", error=stderr.decode())
 
             # Parse stdout into lines
+            parse_start = time.perf_counter()
             events = []
             if stdout:
                 lines = stdout.decode().split("\n")
@@ -260,6 +343,10 @@ class WasmExecutor:
                     f"The code returned an invalid output: {python_outcome}"
                 )
 
+            timings = timings.model_copy(update=result_json.get("timings") or {})
+            timings.output_parse = (time.perf_counter() - parse_start) * 1000
+            self._log_timings(timings, start)
+
             if result_json["error"]:
                 return FailureOutput(
                     error_type="python-error", error=ErrorDetail(**result_json["error"])
@@ -274,13 +361,21 @@ class WasmExecutor:
 // pyodide_runner.js - Runs Python code in Pyodide within Deno
 import {{ loadPyodide }} from "npm:pyodide";
 
-// Initialize Pyodide instance
-const pyodidePromise = loadPyodide();
 const packages = {packages} // first variable
+const preload = {preload} // modules imported before running the code
+const datasets = {datasets} // dataset name -> path on the host
+
+// Duration of each phase, in milliseconds
+const timings = {{ imports: {{}} }};
+let phaseStart = performance.now();
+
+// Initialize Pyodide instance
+const pyodide = await loadPyodide();
+timings.pyodide_load = performance.now() - phaseStart;
 
 // Load any requested packages
+phaseStart = performance.now();
 if (packages && packages.length > 0) {{
-    const pyodide = await pyodidePromise;
     await pyodide.loadPackage("micropip");
     const micropip = pyodide.pyimport("micropip");
     try {{
@@ -289,10 +384,30 @@ if (packages && packages.length > 0) {{
         console.error(`Failed to load package ${{packages}}: ${{e.message}}`);
     }}
 }}
+timings.package_install = performance.now() - phaseStart;
+
+// Import the modules once, before the user code, to time them individually
+phaseStart = performance.now();
+for (const module of preload) {{
+  const importStart = performance.now();
+  try {{
+    pyodide.runPython(`import ${{module}}`);
+    timings.imports[module] = performance.now() - importStart;
+  }} catch (e) {{
+    timings.imports[module] = null;
+  }}
+}}
+timings.preload = performance.now() - phaseStart;
 
 // Function to execute Python code and return the result
 async function execute(code) {{
-  const pyodide = await pyodidePromise;
+  // Mount the datasets produced by other tools
+  if (Object.keys(datasets).length > 0) {{
+    pyodide.FS.mkdirTree("/datasets");
+    for (const [name, path] of Object.entries(datasets)) {{
+      pyodide.FS.writeFile(`/datasets/${{name}}.parquet`, await Deno.readFile(path));
+    }}
+  }}
 
   // Create a capture for stdout
   pyodide.runPython(`
@@ -313,13 +428,17 @@ async function execute(code) {{
 
   try {{
     // Execute the code
+    phaseStart = performance.now();
     return_value = await pyodide.runPythonAsync(code);
+    timings.user_code = performance.now() - phaseStart;
 
     // For now this code is ran everytime.
     // Feel free to protest if you think it
     // should conditionally run.
     // Grab figures if present.
+    phaseStart = performance.now();
     pyodide.runPython(`
+    # The modules are already imported, these are only lookups
     import gc
     import json
 
@@ -333,6 +452,7 @@ async function execute(code) {{
         serialized = {{"_plots": [fig.to_json() for fig in figures]}}
         print(json.dumps(serialized, separators=(",", ":")))
     `)
+    timings.figure_serialisation = performance.now() - phaseStart;
 
     // Try to mitigate issues related to js proxies being destroyed immediately
     if (return_value && typeof return_value.toJs === "function") {{
@@ -383,7 +503,8 @@ async function execute(code) {{
   return {{
     return_value,
     output,
-    error
+    error,
+    timings
   }};
 }}
 
@@ -1,20 +1,263 @@
 """MCP client logic."""
 
+import asyncio
+import json
 import logging
 import re
+import time
+from collections import OrderedDict
 from types import TracebackType
 from typing import Any, ClassVar, Optional, Type
 
-from mcp import ClientSession, ClientSessionGroup, StdioServerParameters
+from mcp import ClientSession, StdioServerParameters, stdio_client
 from mcp.types import CallToolResult, Tool
 from pydantic import BaseModel, ConfigDict
 
-from neuroagent.app.config import SettingsMCP
+from neuroagent.app.config import MCPServerConfig, SettingsMCP
 from neuroagent.tools.base_tool import BaseMetadata, BaseTool
 
 logger = logging.getLogger(__name__)
 
-SERVER_TOOL_SEPARATOR = "|||"
+# Seconds to wait for the answer of a server to a ping
+PING_TIMEOUT = 10
+
+
+class MCPConnection:
+    """Session with an MCP server, respawned if the server dies.
+
+    The stdio transport runs in a task group that must be exited by the task
+    that entered it, so the session is opened and closed by a dedicated task.
+    """
+
+    def __init__(self, name: str, config: MCPServerConfig):
+        self.name = name
+        self.config = config
+        self.session: ClientSession | None = None
+        self.tools: list[Tool] = []
+        self.in_flight = 0  # calls waiting for an answer
+        self._task: asyncio.Task[None] | None = None
+        self._stop = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def parameters(self) -> StdioServerParameters:
+        """Get the parameters to spawn the server."""
+        if self.config.env:
+            env = {k: v.get_secret_value() for k, v in self.config.env.items()}
+        else:
+            env = None
+
+        return StdioServerParameters(
+            command=self.config.command,
+            args=self.config.args or [],
+            env={
+                **(env or {}),
+                "TMPDIR": "/tmp",  # nosec B108
+                "TMP": "/tmp",  # nosec B108
+                "TEMP": "/tmp",  # nosec B108
+                "npm_config_cache": "/tmp/.npm",  # nosec B108
+                "npm_config_logs_dir": "/tmp/.npm/_logs",  # nosec B108
+                "HOME": "/tmp",  # nosec B108
+            },
+        )
+
+    async def _run(
+        self, ready: asyncio.Future[ClientSession], stop: asyncio.Event
+    ) -> None:
+        """Open the session and keep it open until stopped."""
+        try:
+            async with (
+                stdio_client(self.parameters) as (read, write),
+                ClientSession(read, write) as session,
+            ):
+                await session.initialize()
+                self.tools = (await session.list_tools()).tools
+                if not ready.done():
+                    ready.set_result(session)
+                await stop.wait()
+        except Exception as err:
+            if not ready.done():
+                ready.set_exception(err)
+            else:
+                logger.warning(f"MCP server {self.name} stopped: {err!r}")
+
+    async def connect(self) -> ClientSession:
+        """Spawn the server and open a session, within the connection timeout."""
+        start = time.perf_counter()
+        ready: asyncio.Future[ClientSession] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run(ready, self._stop))
+        try:
+            self.session = await asyncio.wait_for(ready, self.config.connect_timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+        logger.info(
+            f"Connected to MCP server {self.name} in"
+            f" {time.perf_counter() - start:.2f}s, {len(self.tools)} tools"
+        )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the session and stop the server."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if self.session is None:
+            # Still connecting
+            task.cancel()
+        self.session = None
+        self._stop.set()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def get_session(self) -> ClientSession:
+        """Get the session, respawning the server if it died."""
+        async with self._lock:
+            if self.session is None or self._task is None or self._task.done():
+                logger.info(f"Reconnecting to MCP server {self.name}")
+                await self.close()
+                return await self.connect()
+            return self.session
+
+    async def ping(self) -> bool:
+        """Check that the server is alive, otherwise respawn it on the next call."""
+        session = self.session
+        if session is None:
+            return False
+        try:
+            await asyncio.wait_for(session.send_ping(), PING_TIMEOUT)
+        except Exception as err:
+            logger.warning(f"MCP server {self.name} is not responding: {err!r}")
+            if self.session is session:
+                self.session = None
+            return False
+        return True
+
+    async def is_online(self) -> bool:
+        """Check that the server is alive, respawning it if needed."""
+        await self.get_session()
+        return await self.ping()
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None
+    ) -> CallToolResult:
+        """Call a tool of the server."""
+        self.in_flight += 1
+        try:
+            session = await self.get_session()
+            return await session.call_tool(name, arguments=arguments)
+        except Exception:
+            # If the server died, it is respawned on the next call
+            await self.ping()
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+class MCPServer:
+    """Pool of connections to an MCP server.
+
+    At most `max_concurrent_calls` calls run at once, the others wait for their
+    turn. Each call goes to the connection with the fewest calls in flight, so
+    that a slow call does not hold back the others when the pool has several
+    processes. The results of the idempotent tools are cached by arguments.
+    """
+
+    def __init__(self, name: str, config: MCPServerConfig):
+        self.name = name
+        self.config = config
+        self.connections = [
+            MCPConnection(f"{name}[{i}]" if config.pool_size > 1 else name, config)
+            for i in range(config.pool_size)
+        ]
+        self.tools: list[Tool] = []
+        self._slots = asyncio.Semaphore(config.max_concurrent_calls)
+        # Arguments -> expiry and result, least recently used first
+        self._cache: OrderedDict[str, tuple[float, CallToolResult]] = OrderedDict()
+
+    async def connect(self) -> None:
+        """Connect the pool.
+
+        Fails if no connection could be opened. Otherwise, the connections that
+        failed are opened again on their first call.
+        """
+        results = await asyncio.gather(
+            *(connection.connect() for connection in self.connections),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+        for connection, result in zip(self.connections, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Could not connect to MCP server {connection.name}, retrying on"
+                    f" its first call: {result!r}"
+                )
+            elif not self.tools:
+                self.tools = connection.tools
+
+    async def close(self) -> None:
+        """Close the connections."""
+        await asyncio.gather(*(connection.close() for connection in self.connections))
+
+    async def is_online(self) -> bool:
+        """Check that a connection of the pool is alive."""
+        results = await asyncio.gather(
+            *(connection.is_online() for connection in self.connections),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None, cache: bool = False
+    ) -> CallToolResult:
+        """Call a tool of the server, waiting at most `call_timeout` seconds.
+
+        If `cache` is True, the result is cached for `cache_ttl` seconds.
+        """
+        key = json.dumps([name, arguments], sort_keys=True, default=str)
+        if cache and key in self._cache:
+            expiry, result = self._cache[key]
+            if expiry > time.monotonic():
+                self._cache.move_to_end(key)
+                return result
+            del self._cache[key]
+
+        try:
+            result = await asyncio.wait_for(
+                self._call_tool(name, arguments), self.config.call_timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"The tool {name} of the MCP server {self.name} did not answer"
+                f" within {self.config.call_timeout}s."
+            ) from None
+
+        # `isError` is the name of the field in the protocol, whatever the SDK
+        if cache and not result.model_dump(by_alias=True).get("isError"):
+            self._cache[key] = (time.monotonic() + self.config.cache_ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.config.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    async def _call_tool(
+        self, name: str, arguments: dict[str, Any] | None
+    ) -> CallToolResult:
+        """Call a tool on the least busy connection, once a slot is free."""
+        async with self._slots:
+            connection = min(
+                self.connections,
+                key=lambda connection: (
+                    connection.in_flight,
+                    connection.session is None,
+                ),
+            )
+            return await connection.call_tool(name, arguments=arguments)
 
 
 class MCPClient:
@@ -22,15 +265,9 @@ class MCPClient:
 
     def __init__(self, config: SettingsMCP):
         self.config = config
-        self.group_session: ClientSessionGroup = ClientSessionGroup(
-            component_name_hook=lambda name, server_info: (
-                f"{(server_info.name)}{SERVER_TOOL_SEPARATOR}{name}"
-            )
-        )
-
         self.tools: dict[str, list[Tool]] = {}  # server -> tool list
         self.tool_name_mapping: dict[str, str] = {}  # custom names -> original names
-        self.sessions: dict[str, ClientSession] = {}  # server -> session
+        self.servers: dict[str, MCPServer] = {}  # server -> connections
 
     async def __aenter__(self) -> "MCPClient | None":
         """Enter the async context manager."""
@@ -38,78 +275,62 @@ class MCPClient:
             logger.info("Skipping MCP client initialization")
             return None
 
-        await self.group_session.__aenter__()
-
-        # Connect to each server
-        for name, server_config in self.config.servers.items():
-            logger.info(f"Connecting to server: {name}")
-            if server_config.env:
-                env = {k: v.get_secret_value() for k, v in server_config.env.items()}
-            else:
-                env = None
-
-            # Connect to server using the group session
-            await self.group_session.connect_to_server(
-                StdioServerParameters(
-                    command=server_config.command,
-                    args=server_config.args or [],
-                    env={
-                        **(env or {}),
-                        "TMPDIR": "/tmp",  # nosec B108
-                        "TMP": "/tmp",  # nosec B108
-                        "TEMP": "/tmp",  # nosec B108
-                        "npm_config_cache": "/tmp/.npm",  # nosec B108
-                        "npm_config_logs_dir": "/tmp/.npm/_logs",  # nosec B108
-                        "HOME": "/tmp",  # nosec B108
-                    },
+        # Connect to the servers concurrently. A server that fails or does not
+        # start in time is skipped, without blocking the others.
+        servers = [
+            MCPServer(name, server_config)
+            for name, server_config in self.config.servers.items()
+        ]
+        results = await asyncio.gather(
+            *(server.connect() for server in servers), return_exceptions=True
+        )
+        for server, result in zip(servers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(
+                    f"MCP server {server.name} did not start within"
+                    f" {server.config.connect_timeout}s, skipping it."
                 )
-            )
+            elif isinstance(result, BaseException):
+                logger.error(
+                    f"Could not connect to MCP server {server.name}, skipping"
+                    f" it: {result!r}"
+                )
+            else:
+                self.servers[server.name] = server
+                self.tools[server.name] = server.tools
+
         # Override tool name and description
         # Iterate on each server defined in the settings
-        for server in self.config.servers.values():
+        for name, server_config in self.config.servers.items():
             # If the server has tool overriding defined
-            if server.tool_metadata:
-                # Get the list of tools that must be overriden
-                tools_to_override = server.tool_metadata.keys()
-
-                # For each tool that has an override defined
-                for tool_name in tools_to_override:
-                    # Find the corresponding Tool class in the group_session
-                    try:
-                        tool = next(
-                            tool
-                            for tool in self.group_session._tools.values()
-                            if tool.name == tool_name
-                        )
-                    except StopIteration:
-                        logger.warning(
-                            f"Tool {tool_name} not found in server. "
-                            f"Skipping override. Available tools: "
-                            f"{[t.name for t in self.group_session._tools.values()]}"
-                        )
-                        continue
-
-                    # Store the original name for when we call the tool
-                    self.tool_name_mapping[
-                        server.tool_metadata[tool_name].name or tool.name
-                    ] = tool.name
-
-                    # Perform the override
-                    # This could in theory not be needed and the new name
-                    # could be passed directly in the `create_dynamic_tool` method
-                    # in the dependencies, but since we need the mapping between
-                    # new and old tool it is better to keep one source of truth
-                    # in the tool definition itself
-                    tool.name = server.tool_metadata[tool_name].name or tool.name
-
-        # Populate the tools and sessions dictionaries
-        for session, components in self.group_session._sessions.items():
-            tool_names = components.tools
-            server_name = next(iter(tool_names)).split(SERVER_TOOL_SEPARATOR)[0]
-            self.tools[server_name] = [
-                self.group_session._tools[tool_name] for tool_name in tool_names
-            ]
-            self.sessions[server_name] = session
+            if name not in self.tools or not server_config.tool_metadata:
+                continue
+
+            # For each tool that has an override defined
+            for tool_name, tool_metadata in server_config.tool_metadata.items():
+                # Find the corresponding Tool of the server
+                try:
+                    tool = next(
+                        tool for tool in self.tools[name] if tool.name == tool_name
+                    )
+                except StopIteration:
+                    logger.warning(
+                        f"Tool {tool_name} not found in server. "
+                        f"Skipping override. Available tools: "
+                        f"{[t.name for t in self.tools[name]]}"
+                    )
+                    continue
+
+                # Store the original name for when we call the tool
+                self.tool_name_mapping[tool_metadata.name or tool.name] = tool.name
+
+                # Perform the override
+                # This could in theory not be needed and the new name
+                # could be passed directly in the `create_dynamic_tool` method
+                # in the dependencies, but since we need the mapping between
+                # new and old tool it is better to keep one source of truth
+                # in the tool definition itself
+                tool.name = tool_metadata.name or tool.name
 
         return self
 
@@ -120,12 +341,7 @@ class MCPClient:
         exc_tb: Optional[TracebackType],
     ) -> None:
         """Exit the async context manager."""
-        if self.config.servers:
-            try:
-                await self.group_session.__aexit__(exc_type, exc_val, exc_tb)
-            except Exception:  # nosec
-                # Issue with ClientSessionGroup cleanup when multiple servers are present
-                pass
+        await asyncio.gather(*(server.close() for server in self.servers.values()))
 
 
 def create_dynamic_tool(
@@ -133,10 +349,11 @@ def create_dynamic_tool(
     tool_name_mapping: dict[str, str],
     tool_description: str,
     input_schema_serialized: dict[str, Any],
-    session: ClientSession,
+    server: MCPServer,
     utterance_list: list[str] | None = None,
     tool_name_frontend: str | None = None,
     tool_description_frontend: str | None = None,
+    idempotent: bool = False,
 ) -> Type[BaseTool]:
     """Create a dynamic BaseTool subclass for an MCP tool.
 
@@ -150,12 +367,14 @@ def create_dynamic_tool(
         Description of the tool
     input_schema_serialized : dict
         JSON schema for the tool's input
-    session : ClientSession
-        MCP client session for invoking the tool
+    server : MCPServer
+        MCP server of the tool
     utterances: list[str] | None
         List of utterances
     tool_name_frontend: str | None
         Frontend name of the tool
+    idempotent: bool
+        Whether the results of the tool can be cached
 
     Returns
     -------
@@ -193,9 +412,10 @@ def create_dynamic_tool(
 
         async def arun(self) -> CallToolResult:
             """Run the tool."""
-            result = await session.call_tool(
+            result = await server.call_tool(
                 tool_name_mapping.get(tool_name) or tool_name,
                 arguments=self.input_schema.model_dump(),
+                cache=idempotent,
             )
 
             return result
@@ -203,9 +423,6 @@ def create_dynamic_tool(
         @classmethod
         async def is_online(cls) -> bool:
             """Check if the tool is online."""
-            # The below will raise an exception if the session is not connected
-            _ = await session.send_ping()
-
-            return True
+            return await server.is_online()
 
     return MCPDynamicTool
@@ -0,0 +1,157 @@
+"""Archive the threads untouched for a while to the object storage."""
+
+import argparse
+import asyncio
+import datetime
+import logging
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.config import Settings
+from neuroagent.app.database.archive import ArchiveStats, archive_thread
+from neuroagent.app.database.sql_schemas import Threads, utc_now
+from neuroagent.app.dependencies import get_connection_string, get_s3_client
+
+logger = logging.getLogger(__name__)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Move the messages of the threads that were not updated for a while"
+            " to the object storage. Archived threads are moved back to the"
+            " database when they are opened."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--env",
+        type=Path,
+        default=Path(__file__).parent.parent.parent.parent / ".env",
+        help="Path to the env file for app config.",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        help=(
+            "Archive the threads not updated for this number of days. Defaults"
+            " to the storage archive_after_days setting."
+        ),
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of threads to archive.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report what would be archived.",
+    )
+    return parser
+
+
+async def archive(
+    settings: Settings,
+    days: int | None = None,
+    limit: int | None = None,
+    dry_run: bool = False,
+) -> list[ArchiveStats]:
+    """Archive the threads not updated for `days` days, oldest first.
+
+    Returns
+    -------
+    list[ArchiveStats]
+        Size of the archive of each thread.
+    """
+    connection_string = get_connection_string(settings)
+    if connection_string is None:
+        raise ValueError("The SQL db_prefix needs to be set to archive the threads.")
+
+    if days is None:
+        days = settings.storage.archive_after_days
+    cutoff = utc_now() - datetime.timedelta(days=days)
+    s3_client = get_s3_client(settings)
+
+    engine = create_async_engine(connection_string)
+    archived = []
+    try:
+        async with AsyncSession(engine) as session:
+            thread_ids = (
+                (
+                    await session.execute(
+                        select(Threads.thread_id)
+                        .where(
+                            Threads.update_date < cutoff,
+                            Threads.archive_key.is_(None),
+                        )
+                        .order_by(Threads.update_date)
+                        .limit(limit)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            await session.rollback()
+
+            # One transaction per thread, so that a failure leaves it untouched
+            for thread_id in thread_ids:
+                try:
+                    stats = await archive_thread(
+                        session=session,
+                        s3_client=s3_client,
+                        bucket_name=settings.storage.bucket_name,
+                        thread_id=thread_id,
+                        cutoff=cutoff,
+                        dry_run=dry_run,
+                    )
+                except Exception:
+                    logger.exception(f"Could not archive thread {thread_id}.")
+                    await session.rollback()
+                    continue
+                if stats is not None and stats.n_messages:
+                    archived.append(stats)
+    finally:
+        await engine.dispose()
+
+    return archived
+
+
+def main() -> None:
+    """Run main logic."""
+    parser = get_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv(args.env)
+
+    start = time.perf_counter()
+    archived = asyncio.run(
+        archive(
+            settings=Settings(),
+            days=args.days,
+            limit=args.limit,
+            dry_run=args.dry_run,
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    n_messages = sum(stats.n_messages for stats in archived)
+    raw_size = sum(stats.raw_size for stats in archived)
+    compressed_size = sum(stats.compressed_size for stats in archived)
+    action = "Would archive" if args.dry_run else "Archived"
+    logger.info(
+        f"{action} {len(archived)} threads and {n_messages} messages in"
+        f" {elapsed:.1f}s: {raw_size} bytes compressed to {compressed_size} bytes"
+        f" (ratio {raw_size / compressed_size if compressed_size else 0:.1f})."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Index the storage objects created before the storage artifact index."""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from uuid import UUID
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.config import Settings
+from neuroagent.app.database.sql_schemas import StorageArtifacts, Threads
+from neuroagent.app.dependencies import get_connection_string, get_s3_client
+from neuroagent.utils import delete_from_storage, list_thread_objects
+
+logger = logging.getLogger(__name__)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Index the existing storage objects of the threads, so that they are"
+            " deleted with their thread. Reads the metadata of every object."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--env",
+        type=Path,
+        default=Path(__file__).parent.parent.parent.parent / ".env",
+        help="Path to the env file for app config.",
+    )
+    parser.add_argument(
+        "--prefix",
+        type=str,
+        default="",
+        help="Only index the objects under this prefix, e.g. '<user_id>/'.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Number of index entries committed at once.",
+    )
+    parser.add_argument(
+        "--delete-orphans",
+        action="store_true",
+        help="Delete the objects of the threads that do not exist anymore.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report what would be done.",
+    )
+    return parser
+
+
+async def backfill(
+    settings: Settings,
+    prefix: str = "",
+    batch_size: int = 500,
+    delete_orphans: bool = False,
+    dry_run: bool = False,
+) -> tuple[int, int]:
+    """Index the storage objects of the existing threads.
+
+    Returns
+    -------
+    tuple[int, int]
+        Number of indexed objects and number of orphan objects.
+    """
+    connection_string = get_connection_string(settings)
+    if connection_string is None:
+        raise ValueError("The SQL db_prefix needs to be set to backfill the index.")
+
+    s3_client = get_s3_client(settings)
+    bucket_name = settings.storage.bucket_name
+    objects = await asyncio.to_thread(
+        lambda: list(list_thread_objects(s3_client, bucket_name, prefix))
+    )
+
+    engine = create_async_engine(connection_string)
+    indexed = 0
+    orphans = []
+    try:
+        async with AsyncSession(engine) as session:
+            thread_ids = set(
+                (await session.execute(select(Threads.thread_id))).scalars()
+            )
+            already_indexed = set(
+                (await session.execute(select(StorageArtifacts.key))).scalars()
+            )
+
+            for thread_id, key in objects:
+                if key in already_indexed:
+                    continue
+                if UUID(thread_id) not in thread_ids:
+                    orphans.append(key)
+                    continue
+
+                indexed += 1
+                if not dry_run:
+                    session.add(StorageArtifacts(thread_id=UUID(thread_id), key=key))
+                    if indexed % batch_size == 0:
+                        await session.commit()
+            await session.commit()
+    finally:
+        await engine.dispose()
+
+    if delete_orphans and orphans and not dry_run:
+        await asyncio.to_thread(delete_from_storage, s3_client, bucket_name, orphans)
+
+    return indexed, len(orphans)
+
+
+def main() -> None:
+    """Run main logic."""
+    parser = get_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv(args.env)
+
+    indexed, orphans = asyncio.run(
+        backfill(
+            settings=Settings(),
+            prefix=args.prefix,
+            batch_size=args.batch_size,
+            delete_orphans=args.delete_orphans,
+            dry_run=args.dry_run,
+        )
+    )
+    action = "Would index" if args.dry_run else "Indexed"
+    logger.info(
+        f"{action} {indexed} objects. Found {orphans} objects of deleted threads"
+        f"{' (deleted)' if args.delete_orphans and not args.dry_run else ''}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Build the manifest of the internal tools."""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from neuroagent.tools.registry import MANIFEST_PATH, build_manifest
+
+logger = logging.getLogger(__name__)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write the name, descriptions, utterances and HIL flag of the"
+            " internal tools to the manifest read at startup. To run after"
+            " adding a tool or changing its metadata."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=MANIFEST_PATH,
+        help="Path of the manifest.",
+    )
+    return parser
+
+
+def main() -> None:
+    """Run main logic."""
+    parser = get_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    manifest = build_manifest()
+    args.output.write_text(json.dumps(manifest, indent=2) + "\n")
+    logger.info(f"Wrote {len(manifest)} tools to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Delete the content addressed storage objects that no thread references."""
+
+import argparse
+import asyncio
+import datetime
+import logging
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.config import Settings
+from neuroagent.app.database.sql_schemas import StorageArtifacts, utc_now
+from neuroagent.app.dependencies import get_connection_string, get_s3_client
+from neuroagent.utils import delete_from_storage, list_content_addressed_objects
+
+logger = logging.getLogger(__name__)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Delete the content addressed objects of the storage that are not"
+            " referenced by any thread. They are shared by threads, so they are"
+            " not deleted with the threads."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--env",
+        type=Path,
+        default=Path(__file__).parent.parent.parent.parent / ".env",
+        help="Path to the env file for app config.",
+    )
+    parser.add_argument(
+        "--prefix",
+        type=str,
+        default="",
+        help="Only sweep the objects under this prefix, e.g. '<user_id>/'.",
+    )
+    parser.add_argument(
+        "--grace-hours",
+        type=float,
+        default=24,
+        help=(
+            "Keep the objects written or reused during this number of hours, as"
+            " the threads using them may not be indexed yet."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of objects checked against the index at once.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report what would be deleted.",
+    )
+    return parser
+
+
+async def sweep(
+    settings: Settings,
+    prefix: str = "",
+    grace_hours: float = 24,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> int:
+    """Delete the unreferenced content addressed objects.
+
+    Returns
+    -------
+    int
+        Number of unreferenced objects.
+    """
+    connection_string = get_connection_string(settings)
+    if connection_string is None:
+        raise ValueError("The SQL db_prefix needs to be set to sweep the storage.")
+
+    s3_client = get_s3_client(settings)
+    bucket_name = settings.storage.bucket_name
+    before = utc_now() - datetime.timedelta(hours=grace_hours)
+    keys = await asyncio.to_thread(
+        lambda: list(
+            list_content_addressed_objects(s3_client, bucket_name, before, prefix)
+        )
+    )
+
+    engine = create_async_engine(connection_string)
+    unreferenced: list[str] = []
+    try:
+        async with AsyncSession(engine) as session:
+            for i in range(0, len(keys), batch_size):
+                batch = keys[i : i + batch_size]
+                referenced = set(
+                    (
+                        await session.execute(
+                            select(StorageArtifacts.key)
+                            .where(StorageArtifacts.key.in_(batch))
+                            .distinct()
+                        )
+                    ).scalars()
+                )
+                unreferenced.extend(key for key in batch if key not in referenced)
+    finally:
+        await engine.dispose()
+
+    if unreferenced and not dry_run:
+        await asyncio.to_thread(
+            delete_from_storage, s3_client, bucket_name, unreferenced
+        )
+
+    return len(unreferenced)
+
+
+def main() -> None:
+    """Run main logic."""
+    parser = get_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv(args.env)
+
+    unreferenced = asyncio.run(
+        sweep(
+            settings=Settings(),
+            prefix=args.prefix,
+            grace_hours=args.grace_hours,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    )
+    action = "Would delete" if args.dry_run else "Deleted"
+    logger.info(f"{action} {unreferenced} unreferenced content addressed objects.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Trim the autogenerated types to the models used by neuroagent."""
+
+import argparse
+import ast
+import json
+import logging
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).parent.parent
+GENERATED_DIR = PACKAGE_DIR / "autogenerated_types"
+TRIMMED_DIR = GENERATED_DIR / "trimmed"
+# Generated modules with too many models to import them all
+MODULES = ("entitycore", "obione")
+
+HEADER = """\
+# Trimmed by `neuroagent-trim-autogenerated-types` from {module}.py, do not edit.
+# Only the models imported by neuroagent and their dependencies are kept.
+"""
+
+# Imports a module, reports its number of models, import time and peak memory
+# (ru_maxrss is in kB on Linux)
+REPORT = """
+import inspect, json, resource, sys, time
+from pydantic import BaseModel
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["_"])
+print(json.dumps({
+    "models": sum(
+        issubclass(cls, BaseModel) and cls.__module__ == module.__name__
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+    ),
+    "import_ms": 1000 * (time.perf_counter() - start),
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+}))
+"""
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write the models of the autogenerated types imported by neuroagent,"
+            " and the models they depend on, to the trimmed modules. To run after"
+            " regenerating the types or importing new models."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help=(
+            "Only report the number of models, the import time and the memory of"
+            " the full and trimmed modules."
+        ),
+    )
+    return parser
+
+
+def get_used_models(module: str) -> set[str]:
+    """Get the names imported from a generated module by the neuroagent code."""
+    modules = {
+        f"neuroagent.autogenerated_types.{module}",
+        f"neuroagent.autogenerated_types.trimmed.{module}",
+    }
+    used: set[str] = set()
+    for path in PACKAGE_DIR.rglob("*.py"):
+        if GENERATED_DIR in path.parents:
+            continue
+        for node in ast.walk(ast.parse(path.read_text())):
+            if isinstance(node, ast.ImportFrom) and node.module in modules:
+                used.update(alias.name for alias in node.names)
+    return used
+
+
+def trim_module(module: str, source: str, used: set[str]) -> str:
+    """Keep the classes of a generated module that `used` depends on.
+
+    The imports, the order of the classes and the statements on the kept
+    classes (e.g. `model_rebuild`) are preserved.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    dependencies = {
+        name: {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+        & classes.keys()
+        for name, node in classes.items()
+    }
+
+    kept: set[str] = set()
+    to_visit = [name for name in used if name in classes]
+    while to_visit:
+        name = to_visit.pop()
+        if name not in kept:
+            kept.add(name)
+            to_visit.extend(dependencies[name])
+
+    # Comments and imports, before the first class
+    first = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+    header = "\n".join(lines[: first.lineno - 1]).rstrip("\n")
+    blocks = [
+        "\n".join(lines[node.lineno - 1 : node.end_lineno])
+        for node in tree.body
+        if (isinstance(node, ast.ClassDef) and node.name in kept)
+        or (
+            isinstance(node, ast.Expr)
+            and {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+            <= kept
+        )
+    ]
+    return HEADER.format(module=module) + "\n\n\n".join([header, *blocks]) + "\n"
+
+
+def trim(module: str) -> str:
+    """Get the trimmed source of a generated module."""
+    source = (GENERATED_DIR / f"{module}.py").read_text()
+    return trim_module(module, source, get_used_models(module))
+
+
+def report(module: str) -> dict[str, float]:
+    """Import a module in a new interpreter and report its models and cost."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", REPORT, module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    """Run main logic."""
+    parser = get_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if not args.report:
+        for module in MODULES:
+            (TRIMMED_DIR / f"{module}.py").write_text(trim(module))
+
+    for module in MODULES:
+        full = report(f"neuroagent.autogenerated_types.{module}")
+        trimmed = report(f"neuroagent.autogenerated_types.trimmed.{module}")
+        logger.info(
+            f"{module}: {full['models']} -> {trimmed['models']} models,"
+            f" {full['import_ms']:.0f} -> {trimmed['import_ms']:.0f} ms,"
+            f" {full['rss_kb'] / 1024:.1f} -> {trimmed['rss_kb'] / 1024:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,13 @@
-"""Shared state types."""
+"""Shared state types.
+
+The shared state validated against the obione models is in
+`neuroagent.shared_state_validation`, as the obione models are slow to import.
+"""
 
 from typing import Any
 
 from pydantic import BaseModel
 
-from neuroagent.autogenerated_types.obione import CircuitSimulationScanConfig
-
-
-class SharedStateStrict(BaseModel):
-    """Eventually for saving to DBs."""
-
-    smc_simulation_config: CircuitSimulationScanConfig
-
-
-class SharedStatePartial(BaseModel):
-    """For validation and schema dumping."""
-
-    smc_simulation_config: CircuitSimulationScanConfig | None = None
-
 
 class SharedStateLoosened(BaseModel):
     """For request body and tool outputs."""
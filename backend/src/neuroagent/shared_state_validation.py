@@ -0,0 +1,17 @@
+"""Shared state types validated against the obione models."""
+
+from pydantic import BaseModel
+
+from neuroagent.autogenerated_types.trimmed.obione import CircuitSimulationScanConfig
+
+
+class SharedStateStrict(BaseModel):
+    """Eventually for saving to DBs."""
+
+    smc_simulation_config: CircuitSimulationScanConfig
+
+
+class SharedStatePartial(BaseModel):
+    """For validation and schema dumping."""
+
+    smc_simulation_config: CircuitSimulationScanConfig | None = None
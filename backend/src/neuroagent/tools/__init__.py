@@ -1,161 +1,13 @@
-"""Tools package."""
+"""Tools package.
 
-from neuroagent.tools.circuit_population_analysis_tool import (
-    CircuitPopulationAnalysisTool,
-)
-from neuroagent.tools.editstate import EditStateTool
-from neuroagent.tools.entitycore_asset_downloadone import AssetDownloadOneTool
-from neuroagent.tools.entitycore_asset_getall import AssetGetAllTool
-from neuroagent.tools.entitycore_asset_getone import AssetGetOneTool
-from neuroagent.tools.entitycore_brainatlas_getall import BrainAtlasGetAllTool
-from neuroagent.tools.entitycore_brainatlas_getone import BrainAtlasGetOneTool
-from neuroagent.tools.entitycore_brainregion_getall import BrainRegionGetAllTool
-from neuroagent.tools.entitycore_brainregion_getone import BrainRegionGetOneTool
-from neuroagent.tools.entitycore_brainregionhierarchy_getall import (
-    BrainRegionHierarchyGetAllTool,
-)
-from neuroagent.tools.entitycore_brainregionhierarchy_getone import (
-    BrainRegionHierarchyGetOneTool,
-)
-from neuroagent.tools.entitycore_cellmorphology_getall import (
-    CellMorphologyGetAllTool,
-)
-from neuroagent.tools.entitycore_cellmorphology_getone import (
-    CellMorphologyGetOneTool,
-)
-from neuroagent.tools.entitycore_circuit_getall import CircuitGetAllTool
-from neuroagent.tools.entitycore_circuit_getone import CircuitGetOneTool
-from neuroagent.tools.entitycore_contribution_getall import ContributionGetAllTool
-from neuroagent.tools.entitycore_contribution_getone import ContributionGetOneTool
-from neuroagent.tools.entitycore_electricalcellrecording_getall import (
-    ElectricalCellRecordingGetAllTool,
-)
-from neuroagent.tools.entitycore_electricalcellrecording_getone import (
-    ElectricalCellRecordingGetOneTool,
-)
-from neuroagent.tools.entitycore_emodel_getall import EModelGetAllTool
-from neuroagent.tools.entitycore_emodel_getone import EModelGetOneTool
-from neuroagent.tools.entitycore_etype_getall import EtypeGetAllTool
-from neuroagent.tools.entitycore_etype_getone import EtypeGetOneTool
-from neuroagent.tools.entitycore_experimentalboutondensity_getall import (
-    ExperimentalBoutonDensityGetAllTool,
-)
-from neuroagent.tools.entitycore_experimentalboutondensity_getone import (
-    ExperimentalBoutonDensityGetOneTool,
-)
-from neuroagent.tools.entitycore_experimentalneurondensity_getall import (
-    ExperimentalNeuronDensityGetAllTool,
-)
-from neuroagent.tools.entitycore_experimentalneurondensity_getone import (
-    ExperimentalNeuronDensityGetOneTool,
-)
-from neuroagent.tools.entitycore_experimentalsynapsesperconnection_getall import (
-    ExperimentalSynapsesPerConnectionGetAllTool,
-)
-from neuroagent.tools.entitycore_experimentalsynapsesperconnection_getone import (
-    ExperimentalSynapsesPerConnectionGetOneTool,
-)
-from neuroagent.tools.entitycore_ionchannel_getall import IonChannelGetAllTool
-from neuroagent.tools.entitycore_ionchannel_getone import IonChannelGetOneTool
-from neuroagent.tools.entitycore_ionchannelmodel_getall import (
-    IonChannelModelGetAllTool,
-)
-from neuroagent.tools.entitycore_ionchannelmodel_getone import (
-    IonChannelModelGetOneTool,
-)
-from neuroagent.tools.entitycore_ionchannelrecording_getall import (
-    IonChannelRecordingGetAllTool,
-)
-from neuroagent.tools.entitycore_ionchannelrecording_getone import (
-    IonChannelRecordingGetOneTool,
-)
-from neuroagent.tools.entitycore_measurementannotation_getall import (
-    MeasurementAnnotationGetAllTool,
-)
-from neuroagent.tools.entitycore_measurementannotation_getone import (
-    MeasurementAnnotationGetOneTool,
-)
-from neuroagent.tools.entitycore_memodel_getall import MEModelGetAllTool
-from neuroagent.tools.entitycore_memodel_getone import MEModelGetOneTool
-from neuroagent.tools.entitycore_mtype_getall import MtypeGetAllTool
-from neuroagent.tools.entitycore_mtype_getone import MtypeGetOneTool
-from neuroagent.tools.entitycore_organization_getall import OrganizationGetAllTool
-from neuroagent.tools.entitycore_organization_getone import OrganizationGetOneTool
-from neuroagent.tools.entitycore_person_getall import PersonGetAllTool
-from neuroagent.tools.entitycore_person_getone import PersonGetOneTool
-from neuroagent.tools.entitycore_simulation_getall import SimulationGetAllTool
-from neuroagent.tools.entitycore_simulation_getone import SimulationGetOneTool
-from neuroagent.tools.entitycore_simulationcampaign_getall import (
-    SimulationCampaignGetAllTool,
-)
-from neuroagent.tools.entitycore_simulationcampaign_getone import (
-    SimulationCampaignGetOneTool,
-)
-from neuroagent.tools.entitycore_simulationexecution_getall import (
-    SimulationExecutionGetAllTool,
-)
-from neuroagent.tools.entitycore_simulationexecution_getone import (
-    SimulationExecutionGetOneTool,
-)
-from neuroagent.tools.entitycore_simulationgeneration_getall import (
-    SimulationGenerationGetAllTool,
-)
-from neuroagent.tools.entitycore_simulationgeneration_getone import (
-    SimulationGenerationGetOneTool,
-)
-from neuroagent.tools.entitycore_simulationresult_getall import (
-    SimulationResultGetAllTool,
-)
-from neuroagent.tools.entitycore_simulationresult_getone import (
-    SimulationResultGetOneTool,
-)
-from neuroagent.tools.entitycore_singleneuronsimulation_getall import (
-    SingleNeuronSimulationGetAllTool,
-)
-from neuroagent.tools.entitycore_singleneuronsimulation_getone import (
-    SingleNeuronSimulationGetOneTool,
-)
-from neuroagent.tools.entitycore_singleneuronsynaptome_getall import (
-    SingleNeuronSynaptomeGetAllTool,
-)
-from neuroagent.tools.entitycore_singleneuronsynaptome_getone import (
-    SingleNeuronSynaptomeGetOneTool,
-)
-from neuroagent.tools.entitycore_singleneuronsynaptomesimulation_getall import (
-    SingleNeuronSynaptomeSimulationGetAllTool,
-)
-from neuroagent.tools.entitycore_singleneuronsynaptomesimulation_getone import (
-    SingleNeuronSynaptomeSimulationGetOneTool,
-)
-from neuroagent.tools.entitycore_species_getall import SpeciesGetAllTool
-from neuroagent.tools.entitycore_species_getone import SpeciesGetOneTool
-from neuroagent.tools.entitycore_strain_getall import StrainGetAllTool
-from neuroagent.tools.entitycore_strain_getone import StrainGetOneTool
-from neuroagent.tools.entitycore_subject_getall import SubjectGetAllTool
-from neuroagent.tools.entitycore_subject_getone import SubjectGetOneTool
-from neuroagent.tools.feedback_submit import FeedbackSubmitTool
-from neuroagent.tools.getstate import GetStateTool
-from neuroagent.tools.literature_search import LiteratureSearchTool
-from neuroagent.tools.obi_expert import OBIExpertTool
-from neuroagent.tools.obione_circuitconnectivitymetrics_getone import (
-    CircuitConnectivityMetricsGetOneTool,
-)
-from neuroagent.tools.obione_circuitmetrics_getone import CircuitMetricGetOneTool
-from neuroagent.tools.obione_circuitnodesets_getone import CircuitNodesetsGetOneTool
-from neuroagent.tools.obione_circuitpopulations_getone import (
-    CircuitPopulationGetOneTool,
-)
-from neuroagent.tools.obione_ephysmetrics_getone import EphysMetricsGetOneTool
-from neuroagent.tools.obione_morphometrics_getone import MorphometricsGetOneTool
-from neuroagent.tools.read_paper import ReadPaperTool
-from neuroagent.tools.run_python_tool import RunPythonTool
-from neuroagent.tools.thumbnailgen_electricalcellrecording_getone import (
-    PlotElectricalCellRecordingGetOneTool,
-)
-from neuroagent.tools.thumbnailgen_morphology_getone import PlotMorphologyGetOneTool
-from neuroagent.tools.validatestate import ValidateStateTool
-from neuroagent.tools.weather import WeatherTool
-from neuroagent.tools.web_search import WebSearchTool
+The tool classes are imported on first access, as their modules are slow to
+import. See `neuroagent.tools.registry`.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neuroagent.tools.base_tool import BaseTool
 
 __all__ = [
     "AssetDownloadOneTool",
@@ -243,3 +95,18 @@ __all__ = [
     "WeatherTool",
     "WebSearchTool",
 ]
+
+
+def __getattr__(name: str) -> "type[BaseTool]":
+    """Import the tool classes on first access."""
+    from neuroagent.tools.registry import get_tool_manifest
+
+    manifest = get_tool_manifest()
+    if name in manifest:
+        return manifest[name].load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the tool classes."""
+    return sorted({*globals(), *__all__})
@@ -1,14 +1,18 @@
 """Base tool."""
 
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import UUID
 
 from httpx import AsyncClient
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.json_schema import SkipJsonSchema
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,6 +198,27 @@ class BaseTool(BaseModel, ABC):
     async def arun(self) -> BaseModel:
         """Run the tool."""
 
+    @classmethod
+    def to_dataset(cls, output: str) -> "DataFrame | list[dict[str, Any]] | None":
+        """Extract a tabular dataset from the JSON output of the tool.
+
+        The dataset is mounted in the python sandbox so that the data can be analyzed
+        without being re-emitted by the LLM. By default, list responses (e.g. the
+        entitycore get all endpoints) are exposed as one record per element.
+        This method can be overridden by tools producing other kinds of tables.
+        """
+        try:
+            data = json.loads(output).get("data")
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        if (
+            isinstance(data, list)
+            and data
+            and all(isinstance(elem, dict) for elem in data)
+        ):
+            return data
+        return None
+
     @classmethod
     async def is_online(cls) -> bool:
         """Check if the tool is online.
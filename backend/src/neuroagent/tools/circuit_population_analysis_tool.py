@@ -1,8 +1,10 @@
 """Tool to analyze circuit population Frames using natural language queries."""
 
+import json
 import logging
 import tarfile
 import tempfile
+from io import StringIO
 from pathlib import Path
 from typing import ClassVar
 from uuid import UUID
@@ -11,7 +13,7 @@ import bluepysnap
 import duckdb
 from httpx import AsyncClient
 from openai import AsyncOpenAI
-from pandas import DataFrame
+from pandas import DataFrame, read_json
 from pydantic import BaseModel, Field
 
 from neuroagent.tools.base_tool import BaseTool, EntitycoreMetadata
@@ -351,6 +353,14 @@ Generate the SQL query to analyze the neuron population:"""
             if "conn" in locals():
                 conn.close()
 
+    @classmethod
+    def to_dataset(cls, output: str) -> DataFrame | None:
+        """Expose the table resulting from the query to the python sandbox."""
+        try:
+            return read_json(StringIO(json.loads(output)["result_data"]))
+        except (ValueError, KeyError, TypeError):
+            return None
+
     @classmethod
     async def is_online(cls) -> bool:
         """Check if the tool is online."""
@@ -1,5 +1,6 @@
 """Tool to edit the shared state using JSONPatch operations."""
 
+from functools import cache
 from typing import Any, ClassVar
 from urllib.parse import urlparse
 from uuid import UUID
@@ -7,7 +8,8 @@ from uuid import UUID
 import jsonpatch
 from pydantic import BaseModel, Field
 
-from neuroagent.shared_state import SharedStateLoosened, SharedStatePartial
+from neuroagent.shared_state import SharedStateLoosened
+from neuroagent.shared_state_validation import SharedStatePartial
 from neuroagent.tools.base_tool import BaseMetadata, BaseTool
 from neuroagent.utils import extract_frontend_context
 
@@ -58,6 +60,12 @@ class EditStateOutput(BaseModel):
     url_links: dict[str, str] | None = None
 
 
+@cache
+def shared_state_schema() -> dict[str, Any]:
+    """Get the JSON schema of the shared state."""
+    return SharedStatePartial.model_json_schema()
+
+
 class EditStateTool(BaseTool):
     """Class defining the EditState tool."""
 
@@ -68,12 +76,11 @@ class EditStateTool(BaseTool):
         "Modify the state",
         "Change the simulation parameters",
     ]
-    description: ClassVar[str] = f"""Modify the shared state using JSONPatch operations.
-
-# Shared State Schema
-{SharedStatePartial.model_json_schema()}
+    # The schema of the shared state is appended when the tool is given to the LLM,
+    # it depends on the pydantic version and is left out of the tool manifest.
+    description: ClassVar[str] = """Modify the shared state using JSONPatch operations.
 
-**CRITICAL:** All modifications must conform to the schema above as much as possible.
+**CRITICAL:** All modifications must conform to the shared state schema, given at the end of this description, as much as possible.
 
 **IMPORTANT:** Always work relative to the current state. If you don't know the current state, call `getstate` first. Never assume the state structure.
 
@@ -115,6 +122,17 @@ After making changes, use your judgment: if you think the state should now be va
     metadata: EditStateMetadata
     input_schema: EditStateInput
 
+    @classmethod
+    def pydantic_to_openai_schema(cls) -> dict[str, Any]:
+        """Convert pydantic schema to OpenAI json, with the shared state schema."""
+        schema = super().pydantic_to_openai_schema()
+        description = (
+            f"{cls.description}\n# Shared State Schema\n{shared_state_schema()}\n"
+        )
+        schema["description"] = description
+        schema["function"]["description"] = description
+        return schema
+
     async def arun(self) -> EditStateOutput:
         """Apply JSONPatch operations to the shared state."""
         if not self.metadata.shared_state:
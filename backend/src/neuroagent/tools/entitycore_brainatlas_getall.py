@@ -5,7 +5,7 @@ from typing import ClassVar
 from httpx import AsyncClient
 from pydantic import Field
 
-from neuroagent.autogenerated_types.entitycore import (
+from neuroagent.autogenerated_types.trimmed.entitycore import (
     ListResponseBrainAtlasRead,
     ReadManyBrainAtlasGetParametersQuery,
 )
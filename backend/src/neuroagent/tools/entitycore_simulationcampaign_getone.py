@@ -6,7 +6,7 @@ from uuid import UUID
 from httpx import AsyncClient
 from pydantic import BaseModel, Field
 
-from neuroagent.autogenerated_types.entitycore import (
+from neuroagent.autogenerated_types.trimmed.entitycore import (
     SimulationCampaignRead,
 )
 from neuroagent.tools.base_tool import BaseTool, EntitycoreMetadata
@@ -6,7 +6,7 @@ from uuid import UUID
 from httpx import AsyncClient
 from pydantic import BaseModel, Field
 
-from neuroagent.autogenerated_types.obione import CircuitPopulationsResponse
+from neuroagent.autogenerated_types.trimmed.obione import CircuitPopulationsResponse
 from neuroagent.tools.base_tool import BaseMetadata, BaseTool
 
 
@@ -7,7 +7,7 @@ from uuid import UUID
 from httpx import AsyncClient
 from pydantic import Field
 
-from neuroagent.autogenerated_types.obione import (
+from neuroagent.autogenerated_types.trimmed.obione import (
     MorphologyMetricsOutput,
     NeuronMorphologyMetricsEndpointDeclaredNeuronMorphologyMetricsCellMorphologyIdGetParametersQuery,
 )
@@ -0,0 +1,94 @@
+"""Registry of the internal tools, imported when they are first used."""
+
+import importlib
+import inspect
+import json
+import pkgutil
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from neuroagent.tools.base_tool import BaseTool
+
+MANIFEST_PATH = Path(__file__).parent / "manifest.json"
+
+
+@dataclass(frozen=True, eq=False)
+class LazyTool:
+    """Internal tool whose module is imported when the tool is first used.
+
+    The tool modules pull in the autogenerated entitycore and obione models,
+    which are slow to import. The name, descriptions, utterances and HIL flag
+    are read from the manifest instead, so that listing and selecting the
+    tools imports nothing. Use `load_tool` to get the tool class, e.g. to get
+    its input schema or to run it.
+    """
+
+    module: str
+    class_name: str
+    name: str
+    name_frontend: str
+    description: str
+    description_frontend: str
+    utterances: list[str]
+    hil: bool
+
+    def load(self) -> type[BaseTool]:
+        """Import the tool class."""
+        return import_tool(self.module, self.class_name)
+
+
+# Internal tools from the manifest, or tool classes such as the MCP tools
+ToolEntry = type[BaseTool] | LazyTool
+
+
+@cache
+def import_tool(module: str, class_name: str) -> type[BaseTool]:
+    """Import a tool class from its module."""
+    return getattr(importlib.import_module(module), class_name)
+
+
+def load_tool(tool: ToolEntry) -> type[BaseTool]:
+    """Get the class of a tool, importing it if needed."""
+    if isinstance(tool, LazyTool):
+        return tool.load()
+    return tool
+
+
+@cache
+def get_tool_manifest() -> dict[str, LazyTool]:
+    """Get the internal tools of the manifest, by class name."""
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    return {
+        class_name: LazyTool(class_name=class_name, **entry)
+        for class_name, entry in manifest.items()
+    }
+
+
+def build_manifest() -> dict[str, dict[str, Any]]:
+    """Import the tools exported by `neuroagent.tools` to build the manifest.
+
+    Slow, as every tool module is imported.
+    """
+    import neuroagent.tools
+
+    manifest = {}
+    for module_info in pkgutil.iter_modules(neuroagent.tools.__path__):
+        module = importlib.import_module(f"neuroagent.tools.{module_info.name}")
+        for class_name, tool in inspect.getmembers(module, inspect.isclass):
+            if (
+                tool.__module__ == module.__name__
+                and class_name in neuroagent.tools.__all__
+                and issubclass(tool, BaseTool)
+            ):
+                manifest[class_name] = {
+                    "module": module.__name__,
+                    "name": tool.name,
+                    "name_frontend": tool.name_frontend,
+                    "description": tool.description,
+                    "description_frontend": tool.description_frontend,
+                    "utterances": tool.utterances,
+                    "hil": tool.hil,
+                }
+    return dict(sorted(manifest.items()))
@@ -1,15 +1,17 @@
 """Tool for running any kind of python code."""
 
+import asyncio
 import json
 import logging
-from typing import Any, ClassVar
+from typing import Any, Callable, ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from neuroagent.datasets import DatasetStore
 from neuroagent.executor import FailureOutput, SuccessOutput, WasmExecutor
 from neuroagent.tools.base_tool import BaseMetadata, BaseTool
-from neuroagent.utils import save_to_storage
+from neuroagent.utils import save_many_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,12 @@ class RunPythonMetadata(BaseMetadata):
     bucket_name: str
     thread_id: UUID
     storage_frontend_url: str
+    dataset_store: DatasetStore | None = None
+    dataset_sources: list[tuple[str, Callable[[], Any]]] = []
+    storage_compress_json: bool = False
+    storage_upload_concurrency: int = 8
+    storage_content_addressed: bool = False
+    storage_keys: list[str] = []
 
 
 class RunPythonOutput(BaseModel):
@@ -71,7 +79,9 @@ class RunPythonTool(BaseTool):
     The images can be downloaded directly in chat as plotly offers a download button next to the displayed image.
     OUTPUT: image_link contains URLs to stored plot images. Embed image_link URLs using Markdown image syntax.
     You are not able to export anything. Don't pretend like you can.
-    The user can read the code from this tool's input. DO NOT re-write the code you just executed in chat."""
+    The user can read the code from this tool's input. DO NOT re-write the code you just executed in chat.
+    DATASETS: the outputs of previous tool calls returning lists of entities or tables are available as parquet files at `/datasets/<tool_call_id>.parquet`.
+    Load them with `pd.read_parquet` instead of copying their content in the code, and list them with `os.listdir('/datasets')`."""
     description_frontend: ClassVar[
         str
     ] = """Tool to execute Python code and return stdout, stderr, and return value.
@@ -95,12 +105,23 @@ AVAILABLE LIBRARIES:
 
     async def arun(self) -> RunPythonOutput:
         """Run arbitrary python code."""
+        # Mount the datasets produced by previous tool calls of the thread
+        datasets = (
+            await asyncio.to_thread(
+                self.metadata.dataset_store.materialize,
+                self.metadata.thread_id,
+                self.metadata.dataset_sources,
+            )
+            if self.metadata.dataset_store is not None
+            else []
+        )
+
         # Run the entire code
         result = await self.metadata.python_sandbox.run_code(
-            self.input_schema.python_script
+            self.input_schema.python_script, datasets=datasets
         )
 
-        identifiers = []
+        identifiers: list[str] = []
         # Check if we have images, upload them to the store if so
         # Get the plot stdout for parsing
         fig_list = []
@@ -122,20 +143,23 @@ AVAILABLE LIBRARIES:
 
             # If we have figures, save them to the storage
             if fig_list:
-                # Save individual jsons to storage
-                for plot_json in fig_list:
-                    identifiers.append(
-                        save_to_storage(
-                            s3_client=self.metadata.s3_client,
-                            bucket_name=self.metadata.bucket_name,
-                            user_id=self.metadata.user_id,
-                            content_type="application/json",
-                            body=plot_json,
-                            category="json",
-                            thread_id=self.metadata.thread_id,
-                        )
-                    )
-
+                # Save individual jsons to storage, concurrently
+                identifiers = await save_many_to_storage(
+                    s3_client=self.metadata.s3_client,
+                    bucket_name=self.metadata.bucket_name,
+                    user_id=self.metadata.user_id,
+                    content_type="application/json",
+                    category="json",
+                    bodies=fig_list,
+                    thread_id=self.metadata.thread_id,
+                    compress=self.metadata.storage_compress_json,
+                    max_concurrency=self.metadata.storage_upload_concurrency,
+                    content_addressed=self.metadata.storage_content_addressed,
+                )
+
+        self.metadata.storage_keys = [
+            f"{self.metadata.user_id}/{id}" for id in identifiers
+        ]
         urls = [f"{self.metadata.storage_frontend_url}/{id}" for id in identifiers]
         return RunPythonOutput(result=result, image_link=urls)
 
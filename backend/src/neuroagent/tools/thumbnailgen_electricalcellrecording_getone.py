@@ -1,5 +1,6 @@
 """Get One Electrical Cell Recording Thumbnail tool."""
 
+import asyncio
 from typing import Any, ClassVar
 from uuid import UUID
 
@@ -11,7 +12,7 @@ from neuroagent.autogenerated_types.thumbnail_generation import (
     GetEphysPreviewApiThumbnailGenerationCoreElectricalCellRecordingPreviewGetParametersQuery,
 )
 from neuroagent.tools.base_tool import BaseMetadata, BaseTool
-from neuroagent.utils import save_to_storage
+from neuroagent.utils import asave_to_storage, content_address, reuse_from_storage
 
 
 class PlotElectricalCellRecordingGetOneInput(
@@ -35,6 +36,8 @@ class PlotElectricalCellRecordingGetOneMetadata(BaseMetadata):
     vlab_id: UUID | None
     project_id: UUID | None
     storage_frontend_url: str
+    storage_content_addressed: bool = False
+    storage_keys: list[str] = []
 
 
 class PlotElectricalCellRecordingGetOneOutput(BaseModel):
@@ -114,6 +117,22 @@ class PlotElectricalCellRecordingGetOneTool(BaseTool):
         query_params = self.input_schema.model_dump(exclude_defaults=True, mode="json")
         query_params["asset_id"] = nwb_asset["id"]
 
+        # Reuse the thumbnail if it was already rendered with the same parameters
+        identifier = None
+        if self.metadata.storage_content_addressed:
+            identifier = content_address(self.name, query_params)
+            if await asyncio.to_thread(
+                reuse_from_storage,
+                s3_client=self.metadata.s3_client,
+                bucket_name=self.metadata.bucket_name,
+                user_id=self.metadata.user_id,
+                identifier=identifier,
+            ):
+                self.metadata.storage_keys = [f"{self.metadata.user_id}/{identifier}"]
+                return PlotElectricalCellRecordingGetOneOutput(
+                    image_link=f"{self.metadata.storage_frontend_url}/{identifier}"
+                )
+
         response = await self.metadata.httpx_client.get(
             url=self.metadata.thumbnail_generation_url.rstrip("/")
             + "/core/electrical-cell-recording/preview",
@@ -126,7 +145,7 @@ class PlotElectricalCellRecordingGetOneTool(BaseTool):
             )
 
         # Save to storage
-        identifier = save_to_storage(
+        identifier = await asave_to_storage(
             s3_client=self.metadata.s3_client,
             bucket_name=self.metadata.bucket_name,
             user_id=self.metadata.user_id,
@@ -134,7 +153,9 @@ class PlotElectricalCellRecordingGetOneTool(BaseTool):
             category="image",
             body=response.content,
             thread_id=self.metadata.thread_id,
+            identifier=identifier,
         )
+        self.metadata.storage_keys = [f"{self.metadata.user_id}/{identifier}"]
 
         url = f"{self.metadata.storage_frontend_url}/{identifier}"
         return PlotElectricalCellRecordingGetOneOutput(image_link=url)
@@ -1,13 +1,18 @@
 """Utilies for neuroagent."""
 
+import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import re
 import uuid
-from typing import Any, Literal, get_args
+from datetime import datetime
+from typing import Any, Iterator, Literal, get_args
 from urllib.parse import parse_qs, urlparse
 from uuid import UUID
 
+from botocore.exceptions import ClientError
 from fastapi import HTTPException
 from openai.types.completion_usage import CompletionUsage
 
@@ -16,7 +21,6 @@ from neuroagent.app.database.sql_schemas import (
     Messages,
 )
 from neuroagent.app.schemas import FrontendContextOutput
-from neuroagent.autogenerated_types.entitycore import EntityRoute
 
 logger = logging.getLogger(__name__)
 
@@ -46,12 +50,35 @@ def merge_chunk(final_response: dict[str, Any], delta: dict[str, Any]) -> None:
 
 async def messages_to_openai_content(
     db_messages: list[Messages] | None = None,
+    max_tool_content_length: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Exctract content from Messages as dictionary to pass them to OpenAI."""
+    """Exctract content from Messages as dictionary to pass them to OpenAI.
+
+    If `max_tool_content_length` is set, the outputs of the tools called before
+    the last user message are truncated to that many characters.
+    """
     messages = []
     if db_messages:
         for msg in db_messages:
-            messages.append(json.loads(msg.content))
+            # Shallow copy, the history is modified in place
+            messages.append({**msg.content})
+
+    if max_tool_content_length is not None:
+        last_user_index = max(
+            (i for i, message in enumerate(messages) if message["role"] == "user"),
+            default=0,
+        )
+        for message in messages[:last_user_index]:
+            content = message.get("content")
+            if (
+                message["role"] == "tool"
+                and isinstance(content, str)
+                and len(content) > max_tool_content_length
+            ):
+                message["content"] = (
+                    content[:max_tool_content_length]
+                    + f"... [truncated {len(content) - max_tool_content_length} characters]"
+                )
 
     return messages
 
@@ -148,6 +175,77 @@ def complete_partial_json(partial: str) -> str:
             return partial  # fallback to the fixed string even if not perfect
 
 
+def content_address(*parts: Any) -> str:
+    """Compute a deterministic storage identifier from the given parts.
+
+    Parts can be raw bytes (e.g. the body of the object) or any JSON
+    serializable value (e.g. entity ID, asset ID and rendering parameters).
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, default=str).encode()
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def is_content_addressed(key: str) -> bool:
+    """Check whether a storage key is the one of a content addressed object."""
+    return re.fullmatch(r"[0-9a-f]{64}", key.rsplit("/", 1)[-1]) is not None
+
+
+def reuse_from_storage(
+    s3_client: Any,
+    bucket_name: str,
+    user_id: uuid.UUID,
+    identifier: str,
+) -> bool:
+    """Check whether a content addressed object exists and mark it as used.
+
+    The object is copied onto itself to refresh its modification date, so that
+    it is not deleted by the sweep of the unreferenced objects before the
+    thread reusing it is indexed.
+
+    Parameters
+    ----------
+    s3_client : Any
+        Boto3 S3 client instance
+    bucket_name : str
+        Name of the S3 bucket
+    user_id : str
+        User identifier
+    identifier : str
+        Storage identifier of the object
+
+    Returns
+    -------
+    bool
+        Whether the object exists.
+    """
+    key = f"{user_id}/{identifier}"
+    try:
+        head = s3_client.head_object(Bucket=bucket_name, Key=key)
+        extra_args = {
+            name: head[name]
+            for name in ("ContentType", "ContentEncoding")
+            if name in head
+        }
+        s3_client.copy_object(
+            Bucket=bucket_name,
+            Key=key,
+            CopySource={"Bucket": bucket_name, "Key": key},
+            Metadata=head.get("Metadata", {}),
+            MetadataDirective="REPLACE",
+            **extra_args,
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return False
+        raise
+    return True
+
+
 def save_to_storage(
     s3_client: Any,
     bucket_name: str,
@@ -156,6 +254,8 @@ def save_to_storage(
     category: Literal["image", "json"],
     body: bytes | str,
     thread_id: uuid.UUID | None = None,
+    compress: bool = False,
+    identifier: str | None = None,
 ) -> str:
     """Save content to S3 storage and return the storage ID.
 
@@ -175,14 +275,25 @@ def save_to_storage(
         Content to store - can be bytes or string (for JSON)
     thread_id : str | None
         Optional thread identifier for grouping related objects
+    compress : bool
+        Whether to gzip the body. The object is then served with a gzip
+        content encoding, which browsers decode transparently.
+    identifier : str | None
+        Content address of the object, see `content_address`. If provided, the
+        upload is skipped when the object already exists. Otherwise a random
+        identifier is generated.
 
     Returns
     -------
     str
         Generated storage identifier
     """
-    # Generate unique identifier
-    identifier = str(uuid.uuid4())
+    content_addressed = identifier is not None
+    if identifier is None:
+        # Generate unique identifier
+        identifier = str(uuid.uuid4())
+    elif reuse_from_storage(s3_client, bucket_name, user_id, identifier):
+        return identifier
 
     # Construct the full path including user_id
     key_parts = [str(user_id), identifier]
@@ -190,9 +301,15 @@ def save_to_storage(
 
     metadata: dict[str, str] = {"category": category}
 
-    if thread_id is not None:
+    # Content addressed objects can be shared by threads
+    if thread_id is not None and not content_addressed:
         metadata["thread_id"] = str(thread_id)
 
+    extra_args: dict[str, str] = {}
+    if compress:
+        body = gzip.compress(body.encode() if isinstance(body, str) else body)
+        extra_args["ContentEncoding"] = "gzip"
+
     # Save to S3 with metadata
     s3_client.put_object(
         Bucket=bucket_name,
@@ -200,18 +317,99 @@ def save_to_storage(
         Body=body,
         ContentType=content_type,
         Metadata=metadata,
+        **extra_args,
     )
 
     return identifier
 
 
-def delete_from_storage(
+async def asave_to_storage(
+    s3_client: Any,
+    bucket_name: str,
+    user_id: uuid.UUID,
+    content_type: str,
+    category: Literal["image", "json"],
+    body: bytes | str,
+    thread_id: uuid.UUID | None = None,
+    compress: bool = False,
+    identifier: str | None = None,
+) -> str:
+    """Save content to S3 storage without blocking the event loop.
+
+    The boto3 client is thread safe, the upload runs in a worker thread and
+    reuses the connection pool of the client. See `save_to_storage` for the
+    parameters.
+    """
+    return await asyncio.to_thread(
+        save_to_storage,
+        s3_client=s3_client,
+        bucket_name=bucket_name,
+        user_id=user_id,
+        content_type=content_type,
+        category=category,
+        body=body,
+        thread_id=thread_id,
+        compress=compress,
+        identifier=identifier,
+    )
+
+
+async def save_many_to_storage(
     s3_client: Any,
     bucket_name: str,
     user_id: uuid.UUID,
-    thread_id: uuid.UUID,
+    content_type: str,
+    category: Literal["image", "json"],
+    bodies: list[bytes | str],
+    thread_id: uuid.UUID | None = None,
+    compress: bool = False,
+    max_concurrency: int = 8,
+    content_addressed: bool = False,
+) -> list[str]:
+    """Save several objects to S3 storage concurrently.
+
+    Parameters
+    ----------
+    bodies : list[bytes | str]
+        Contents to store, all sharing the same content type and category.
+    max_concurrency : int
+        Maximum number of uploads running at the same time. Should not exceed
+        the size of the connection pool of the client.
+    content_addressed : bool
+        Whether to key the objects by a hash of their body, to deduplicate them.
+
+    See `save_to_storage` for the other parameters.
+
+    Returns
+    -------
+    list[str]
+        Storage identifiers, in the same order as the bodies.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload(body: bytes | str) -> str:
+        async with semaphore:
+            return await asave_to_storage(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                user_id=user_id,
+                content_type=content_type,
+                category=category,
+                body=body,
+                thread_id=thread_id,
+                compress=compress,
+                identifier=content_address(body) if content_addressed else None,
+            )
+
+    return list(await asyncio.gather(*(upload(body) for body in bodies)))
+
+
+def delete_from_storage(
+    s3_client: Any,
+    bucket_name: str,
+    keys: list[str],
 ) -> None:
-    """Delete all objects from S3 storage that match the given user_id and thread_id.
+    """Delete the given objects from S3 storage.
 
     Parameters
     ----------
@@ -219,39 +417,74 @@ def delete_from_storage(
         Boto3 S3 client instance
     bucket_name : str
         Name of the S3 bucket
-    user_id : str
-        User identifier
-    thread_id : str
-        Thread identifier for filtering objects to delete
+    keys : list[str]
+        Keys of the objects to delete, as recorded in the storage artifact index
     """
-    # List all objects under the user's prefix
-    paginator = s3_client.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=bucket_name, Prefix=f"{user_id}/")
+    # Delete in batches of 1000 (S3 limit)
+    for i in range(0, len(keys), 1000):
+        batch = [{"Key": key} for key in keys[i : i + 1000]]
+        s3_client.delete_objects(
+            Bucket=bucket_name, Delete={"Objects": batch, "Quiet": True}
+        )
 
-    # Collect objects to delete
-    objects_to_delete = []
 
-    for page in pages:
-        if "Contents" not in page:
-            continue
+def list_thread_objects(
+    s3_client: Any, bucket_name: str, prefix: str = ""
+) -> Iterator[tuple[str, str]]:
+    """List the objects of the storage that belong to a thread.
+
+    This reads the metadata of every object, it is only meant to backfill the
+    storage artifact index.
 
-        for obj in page["Contents"]:
-            # Get object metadata
+    Parameters
+    ----------
+    s3_client : Any
+        Boto3 S3 client instance
+    bucket_name : str
+        Name of the S3 bucket
+    prefix : str
+        Only list the objects under this prefix, e.g. the one of a user
+
+    Yields
+    ------
+    tuple[str, str]
+        Thread ID and key of the objects having a thread_id metadata.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get("Contents", []):
             head = s3_client.head_object(Bucket=bucket_name, Key=obj["Key"])
-            metadata = head.get("Metadata", {})
-
-            # Check if object has matching thread_id
-            if metadata.get("thread_id") == thread_id:
-                objects_to_delete.append({"Key": obj["Key"]})
-
-        # Delete in batches of 1000 (S3 limit)
-        if objects_to_delete:
-            for i in range(0, len(objects_to_delete), 1000):
-                batch = objects_to_delete[i : i + 1000]
-                s3_client.delete_objects(
-                    Bucket=bucket_name, Delete={"Objects": batch, "Quiet": True}
-                )
-            objects_to_delete = []
+            thread_id = head.get("Metadata", {}).get("thread_id")
+            if thread_id is not None:
+                yield thread_id, obj["Key"]
+
+
+def list_content_addressed_objects(
+    s3_client: Any, bucket_name: str, before: datetime, prefix: str = ""
+) -> Iterator[str]:
+    """List the content addressed objects of the storage not used since a date.
+
+    Parameters
+    ----------
+    s3_client : Any
+        Boto3 S3 client instance
+    bucket_name : str
+        Name of the S3 bucket
+    before : datetime
+        Only list the objects last modified or reused before this date
+    prefix : str
+        Only list the objects under this prefix, e.g. the one of a user
+
+    Yields
+    ------
+    str
+        Key of the content addressed objects.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            if is_content_addressed(obj["Key"]) and obj["LastModified"] < before:
+                yield obj["Key"]
 
 
 def get_token_count(usage: CompletionUsage | None) -> dict[str, int | None]:
@@ -307,7 +540,9 @@ def extract_frontend_context(url: str) -> FrontendContextOutput:
     # [4:] skips 'app/virtual-lab/{vlab_id}/{proj_id}'
     current_page = path.split("/")[4:]
 
-    # Get valid entity types
+    # Get valid entity types, the entitycore models are slow to import
+    from neuroagent.autogenerated_types.trimmed.entitycore import EntityRoute
+
     ec_types = get_args(EntityRoute.model_fields["root"].annotation)
     # Frontend extends EC types
     extended_types = (
@@ -0,0 +1,207 @@
+"""Test the archival of the cold threads."""
+
+import datetime
+import gzip
+import json
+import uuid
+
+import boto3
+import pytest
+from moto import mock_aws
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.database.archive import (
+    archive_thread,
+    from_json_row,
+    rehydrate_thread,
+    to_json_row,
+)
+from neuroagent.app.database.sql_schemas import (
+    Base,
+    Entity,
+    Messages,
+    StorageArtifacts,
+    Task,
+    Threads,
+    TokenConsumption,
+    TokenType,
+    TokenUsageDaily,
+    ToolCalls,
+    utc_now,
+)
+
+
+@pytest.fixture
+def s3_bucket():
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+        yield s3_client
+
+
+def test_json_row_roundtrip():
+    message = Messages(
+        message_id=uuid.uuid4(),
+        thread_id=uuid.uuid4(),
+        entity=Entity.AI_MESSAGE,
+        content={"role": "assistant", "content": "Hello"},
+        is_complete=True,
+        creation_date=utc_now(),
+    )
+
+    row = to_json_row(message)
+    # Computed by the database
+    assert "role" not in row
+    assert "text_content" not in row
+    assert row["entity"] == "AI_MESSAGE"
+    assert row["message_id"] == str(message.message_id)
+
+    values = from_json_row(Messages.__table__, json.loads(json.dumps(row)))
+    assert values["message_id"] == message.message_id
+    assert values["thread_id"] == message.thread_id
+    assert values["entity"] == Entity.AI_MESSAGE
+    assert values["content"] == message.content
+    assert values["creation_date"] == message.creation_date
+
+
+@pytest.mark.asyncio
+async def test_archive_and_rehydrate(db_connection, test_user_info, s3_bucket):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    old = utc_now() - datetime.timedelta(days=100)
+    thread = Threads(
+        thread_id=uuid.uuid4(),
+        user_id=user_id,
+        vlab_id=vlab,
+        project_id=proj,
+        creation_date=old,
+        update_date=old,
+    )
+    messages = [
+        Messages(
+            thread=thread,
+            entity=Entity.USER,
+            content={"role": "user", "content": "What's the weather?"},
+            is_complete=True,
+        ),
+        Messages(
+            thread=thread,
+            entity=Entity.AI_TOOL,
+            content={"role": "assistant", "content": ""},
+            is_complete=True,
+            tool_calls=[
+                ToolCalls(tool_call_id="call_1", name="weather", arguments="{}")
+            ],
+            token_consumption=[
+                TokenConsumption(
+                    type=TokenType.COMPLETION,
+                    task=Task.CHAT_COMPLETION,
+                    count=10,
+                    model="gpt-4o-mini",
+                )
+            ],
+        ),
+    ]
+    messages[1].storage_artifacts = [
+        StorageArtifacts(thread_id=thread.thread_id, key="plot.png")
+    ]
+    thread_id = thread.thread_id
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([thread, *messages])
+            await session.commit()
+            message_ids = {message.message_id for message in messages}
+            usage = await session.scalar(select(func.sum(TokenUsageDaily.count)))
+            search_vector = await session.scalar(
+                select(Threads.search_vector).where(Threads.thread_id == thread_id)
+            )
+
+        async with AsyncSession(engine) as session:
+            # Recently updated threads are kept
+            assert (
+                await archive_thread(
+                    session, s3_bucket, "test-bucket", thread_id, cutoff=old
+                )
+                is None
+            )
+            stats = await archive_thread(
+                session, s3_bucket, "test-bucket", thread_id, cutoff=utc_now()
+            )
+        assert stats is not None
+        assert stats.n_messages == 2
+        assert stats.compressed_size < stats.raw_size
+
+        key = f"{user_id}/archives/{thread_id}.jsonl.gz"
+        body = s3_bucket.get_object(Bucket="test-bucket", Key=key)["Body"].read()
+        records = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+        assert [record["message"]["entity"] for record in records] == [
+            "USER",
+            "AI_TOOL",
+        ]
+        assert records[1]["tool_calls"][0]["tool_call_id"] == "call_1"
+
+        async with AsyncSession(engine) as session:
+            thread = await session.get(Threads, thread_id)
+            assert thread.archive_key == key
+            assert thread.update_date == old.replace(tzinfo=datetime.timezone.utc)
+            # Still found by the search
+            assert (
+                await session.scalar(
+                    select(Threads.search_vector).where(Threads.thread_id == thread_id)
+                )
+                == search_vector
+            )
+            assert not (
+                await session.execute(
+                    select(Messages).where(Messages.thread_id == thread_id)
+                )
+            ).all()
+
+            await rehydrate_thread(session, s3_bucket, "test-bucket", thread)
+            assert thread.archive_key is None
+            # Seen as recently written, not archived again right away
+            assert thread.update_date > old.replace(tzinfo=datetime.timezone.utc)
+            assert (
+                await archive_thread(
+                    session,
+                    s3_bucket,
+                    "test-bucket",
+                    thread_id,
+                    cutoff=utc_now() - datetime.timedelta(days=1),
+                )
+                is None
+            )
+            restored = (
+                (
+                    await session.execute(
+                        select(Messages).where(Messages.thread_id == thread_id)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert {message.message_id for message in restored} == message_ids
+            assert (
+                await session.scalar(select(func.count()).select_from(ToolCalls)) == 1
+            )
+            artifacts = (await session.execute(select(StorageArtifacts))).scalars()
+            assert [artifact.key for artifact in artifacts] == ["plot.png"]
+            # Not counted twice
+            assert (
+                await session.scalar(select(func.sum(TokenUsageDaily.count))) == usage
+            )
+            assert (
+                await session.scalar(
+                    select(Threads.search_vector).where(Threads.thread_id == thread_id)
+                )
+                == search_vector
+            )
+        assert "Contents" not in s3_bucket.list_objects_v2(
+            Bucket="test-bucket", Prefix=f"{user_id}/archives/"
+        )
+    finally:
+        await engine.dispose()
@@ -0,0 +1,37 @@
+"""Test the connection pool of the database."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from neuroagent.app.database.pool import MeteredPool
+
+
+@pytest.mark.asyncio
+async def test_metered_pool():
+    pool = MeteredPool(Mock, pool_size=1, max_overflow=1, timeout=0.01)
+    assert pool.metrics()["checkouts"] == 0
+    assert pool.metrics()["mean_checkout_ms"] == 0.0
+
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    metrics = pool.metrics()
+    assert metrics["checked_out"] == 2
+    assert metrics["overflow"] == 1
+    assert metrics["utilisation"] == 1.0
+    assert metrics["checkouts"] == 2
+    assert metrics["max_checkout_ms"] >= metrics["mean_checkout_ms"] > 0
+
+    # Pool exhausted
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert pool.metrics()["timeouts"] == 1
+
+    first.close()
+    second.close()
+    metrics = pool.metrics()
+    assert metrics["checked_out"] == 0
+    assert metrics["utilisation"] == 0.0
+    assert metrics["checkouts"] == 3
@@ -0,0 +1,251 @@
+"""Test the indexes of the database against the queries of the app."""
+
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import String, desc, insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.app_utils import keyset
+from neuroagent.app.database.sql_schemas import (
+    Base,
+    Entity,
+    Messages,
+    Threads,
+    TokenConsumption,
+    ToolCalls,
+)
+
+
+async def explain(session, query):
+    """Get the plan of a query."""
+    compiled = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(text(f"EXPLAIN {compiled}"))
+    return "\n".join(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_pagination_queries_use_indexes(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    threads = [
+        Threads(
+            user_id=user_id,
+            vlab_id=vlab,
+            project_id=proj,
+            creation_date=start + timedelta(minutes=i),
+            update_date=start + timedelta(minutes=i),
+        )
+        for i in range(20)
+    ]
+    # The committed rows are read back without lazy loads
+    session = AsyncSession(engine, expire_on_commit=False)
+    try:
+        session.add_all(threads)
+        session.add_all(
+            [
+                Messages(
+                    entity=Entity.USER,
+                    content={"content": "query", "role": "user"},
+                    thread=thread,
+                    is_complete=True,
+                    creation_date=start + timedelta(seconds=i),
+                )
+                for thread in threads
+                for i in range(50)
+            ]
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        # The stand-in tables are small, make the planner pick the indexes anyway
+        await session.execute(text("SET enable_seqscan = off"))
+
+        thread = threads[0]
+        key, cursor = keyset(
+            Messages.creation_date, Messages.message_id, start, uuid.uuid4()
+        )
+        plan = await explain(
+            session,
+            select(Messages.message_id, Messages.creation_date, Messages.entity)
+            .where(Messages.thread_id == thread.thread_id, key < cursor)
+            .order_by(desc(Messages.creation_date), desc(Messages.message_id))
+            .limit(11),
+        )
+        assert "ix_messages_thread_id_creation_date_message_id" in plan
+        assert "Sort" not in plan
+
+        for sort_column, index in [
+            (Threads.update_date, "ix_threads_user_project_update_date"),
+            (Threads.creation_date, "ix_threads_user_project_creation_date"),
+        ]:
+            key, cursor = keyset(sort_column, Threads.thread_id, start, uuid.uuid4())
+            plan = await explain(
+                session,
+                select(Threads)
+                .where(
+                    Threads.user_id == user_id,
+                    Threads.vlab_id == vlab,
+                    Threads.project_id == proj,
+                    key < cursor,
+                )
+                .order_by(desc(sort_column), desc(Threads.thread_id))
+                .limit(11),
+            )
+            assert index in plan
+            assert "Sort" not in plan
+
+        # Loading of the tool calls and token consumption of the messages
+        for table in [ToolCalls, TokenConsumption]:
+            plan = await explain(
+                session, select(table).where(table.message_id == uuid.uuid4())
+            )
+            assert f"ix_{table.__tablename__}_message_id" in plan
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_projected_message_columns(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    thread = Threads(user_id=user_id, vlab_id=vlab, project_id=proj)
+    # Large tool outputs, as returned by the entitycore tools
+    tool_output = {"results": [{"name": f"entity {i}"} for i in range(500)]}
+    session = AsyncSession(engine, expire_on_commit=False)
+    try:
+        session.add(thread)
+        session.add_all(
+            [
+                Messages(
+                    entity=Entity.AI_MESSAGE,
+                    content={
+                        "role": "assistant",
+                        "content": f"answer {i}",
+                        "reasoning": "thinking",
+                        "tool_calls": [{"arguments": tool_output}],
+                    },
+                    thread=thread,
+                    is_complete=True,
+                )
+                for i in range(200)
+            ]
+        )
+        await session.commit()
+
+        message = (await session.execute(select(Messages).limit(1))).scalar_one()
+        assert message.role == "assistant"
+        assert message.text_content.startswith("answer")
+        assert message.reasoning == "thinking"
+        assert message.tool_call_id is None
+
+        query = select(Messages).where(Messages.thread_id == thread.thread_id)
+        projected_query = select(Messages.text_content, Messages.reasoning).where(
+            Messages.thread_id == thread.thread_id
+        )
+
+        # Listing of the messages, from the whole content or the projected columns
+        durations = {}
+        for name, list_messages in [
+            (
+                "content",
+                lambda: session.execute(
+                    query.execution_options(populate_existing=True)
+                ),
+            ),
+            ("projected", lambda: session.execute(projected_query)),
+        ]:
+            start = time.perf_counter()
+            for _ in range(10):
+                result = await list_messages()
+                rows = result.all()
+            durations[name] = time.perf_counter() - start
+
+        assert sorted(row.text_content for row in rows) == sorted(
+            message.content["content"]
+            for message in (await session.execute(query)).scalars()
+        )
+        assert durations["projected"] < durations["content"]
+
+        # The tool results are not duplicated in the text content
+        tool_message = Messages(
+            entity=Entity.TOOL,
+            content={
+                "role": "tool",
+                "tool_call_id": "tool_call_id",
+                "content": json.dumps(tool_output),
+            },
+            thread=thread,
+            is_complete=True,
+        )
+        session.add(tool_message)
+        await session.commit()
+        await session.refresh(tool_message)
+        assert tool_message.tool_call_id == "tool_call_id"
+        assert tool_message.text_content is None
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_thread_search_vector(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    user_id, vlab, proj = test_user_info
+    thread = Threads(user_id=user_id, vlab_id=vlab, project_id=proj)
+    session = AsyncSession(engine, expire_on_commit=False)
+    try:
+        session.add(thread)
+        await session.commit()
+
+        # The messages of a statement are appended in order, the tool results
+        # are not searched
+        for contents in [["pyramidal neurons", "cortex"], ["hippocampus"]]:
+            await session.execute(
+                insert(Messages),
+                [
+                    {
+                        "thread_id": thread.thread_id,
+                        "entity": entity,
+                        "content": {"role": "user", "content": content},
+                        "is_complete": True,
+                    }
+                    for content in contents
+                    for entity in (Entity.USER, Entity.TOOL)
+                ],
+            )
+            await session.commit()
+
+        search_vector = await session.scalar(
+            select(Threads.search_vector.cast(String)).where(
+                Threads.thread_id == thread.thread_id
+            )
+        )
+        assert search_vector == "'cortex':3 'hippocampus':4 'neuron':2 'pyramid':1"
+
+        # Large documents drop their positions
+        stripped = await session.scalar(
+            text(
+                "SELECT append_search_vector(to_tsvector('simple', :document),"
+                " to_tsvector('simple', 'neuron')) = strip(to_tsvector('simple',"
+                " :document || ' neuron'))"
+            ),
+            {"document": " ".join(f"word{i}" for i in range(60000))},
+        )
+        assert stripped
+    finally:
+        await session.close()
+        await engine.dispose()
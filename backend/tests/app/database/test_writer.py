@@ -0,0 +1,274 @@
+"""Test the write-behind persistence of the messages."""
+
+import asyncio
+import gc
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.database.sql_schemas import (
+    Base,
+    Entity,
+    Messages,
+    Task,
+    Threads,
+    TokenConsumption,
+    TokenType,
+    ToolCalls,
+)
+from neuroagent.app.database.writer import MessageWriter
+
+
+def make_turn(thread_id):
+    """Create the messages of a turn with a tool call."""
+    return [
+        Messages(
+            thread_id=thread_id,
+            entity=Entity.USER,
+            content={"role": "user", "content": "What's the weather?"},
+            is_complete=True,
+        ),
+        Messages(
+            thread_id=thread_id,
+            entity=Entity.AI_TOOL,
+            content={"role": "assistant", "content": ""},
+            is_complete=True,
+            tool_calls=[
+                ToolCalls(tool_call_id=uuid.uuid4().hex, name="weather", arguments="{}")
+            ],
+            token_consumption=[
+                TokenConsumption(
+                    type=TokenType.COMPLETION,
+                    task=Task.CHAT_COMPLETION,
+                    count=10,
+                    model="gpt-4o-mini",
+                )
+            ],
+        ),
+    ]
+
+
+def test_submit():
+    writer = MessageWriter(engine=Mock())
+    persisted = Messages(
+        message_id=uuid.uuid4(),
+        thread_id=uuid.uuid4(),
+        entity=Entity.AI_MESSAGE,
+        content="{}",
+        is_complete=True,
+    )
+    turn = make_turn(persisted.thread_id)
+
+    writer.submit([persisted, *turn])
+    # Submitting again does not duplicate the messages
+    writer.submit([persisted, *turn])
+
+    batch = writer._batches[persisted.thread_id]
+    message_rows = batch.rows[Messages.__table__]
+    assert [row["message_id"] for row in message_rows] == [
+        message.message_id for message in turn
+    ]
+    assert all(row["message_id"] is not None for row in message_rows)
+    assert all(row["creation_date"] is not None for row in message_rows)
+    # Incomplete until the end of the turn
+    assert not any(row["is_complete"] for row in message_rows)
+    assert turn[0].is_complete
+
+    (tool_call_row,) = batch.rows[ToolCalls.__table__]
+    assert tool_call_row["message_id"] == turn[1].message_id
+    (token_row,) = batch.rows[TokenConsumption.__table__]
+    assert token_row["message_id"] == turn[1].message_id
+    assert token_row["id"] is not None
+
+    # The turns that never finish are not kept once flushed and dropped
+    assert len(writer._in_flight) == 2
+    writer._batches.clear()
+    del batch, turn
+    gc.collect()
+    assert len(writer._in_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_message_writer(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    threads = [
+        Threads(user_id=user_id, vlab_id=vlab, project_id=proj) for _ in range(2)
+    ]
+    async with AsyncSession(engine) as session:
+        session.add_all(threads)
+        await session.commit()
+        for thread in threads:
+            await session.refresh(thread)
+        thread_ids = [thread.thread_id for thread in threads]
+        update_dates = [thread.update_date for thread in threads]
+
+    try:
+        async with MessageWriter(engine, flush_interval=0.01) as writer:
+            turns = [make_turn(thread_id) for thread_id in thread_ids]
+            for turn in turns:
+                writer.submit(turn)
+            await asyncio.sleep(0.1)
+
+            # Written while the turn is in progress, as interrupted messages
+            async with AsyncSession(engine) as session:
+                messages = (
+                    (
+                        await session.execute(
+                            select(Messages).where(Messages.thread_id.in_(thread_ids))
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+                assert len(messages) == 4
+                assert not any(message.is_complete for message in messages)
+
+            turns[0].append(
+                Messages(
+                    thread_id=thread_ids[0],
+                    entity=Entity.TOOL,
+                    content={"role": "tool", "content": "Sunny"},
+                    is_complete=True,
+                )
+            )
+            await writer.finish_turn(turns[0])
+
+        async with AsyncSession(engine) as session:
+            messages = (
+                (
+                    await session.execute(
+                        select(Messages)
+                        .where(Messages.thread_id == thread_ids[0])
+                        .order_by(Messages.creation_date)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert [message.entity for message in messages] == [
+                Entity.USER,
+                Entity.AI_TOOL,
+                Entity.TOOL,
+            ]
+            assert all(message.is_complete for message in messages)
+            assert len(await messages[1].awaitable_attrs.tool_calls) == 1
+            assert len(await messages[1].awaitable_attrs.token_consumption) == 1
+
+            # The turn of the other thread was never finished
+            messages = (
+                (
+                    await session.execute(
+                        select(Messages).where(Messages.thread_id == thread_ids[1])
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert not any(message.is_complete for message in messages)
+
+            thread = await session.get(Threads, thread_ids[0])
+            assert thread.update_date > update_dates[0]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_message_writer_isolates_failing_threads(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        thread = Threads(user_id=user_id, vlab_id=vlab, project_id=proj)
+        session.add(thread)
+        await session.commit()
+
+    try:
+        async with MessageWriter(engine, flush_interval=0.01) as writer:
+            turn = make_turn(thread.thread_id)
+            # Thread deleted during its stream
+            deleted_turn = make_turn(uuid.uuid4())
+            writer.submit(turn)
+            writer.submit(deleted_turn)
+
+            results = await asyncio.gather(
+                writer.finish_turn(turn),
+                writer.finish_turn(deleted_turn),
+                return_exceptions=True,
+            )
+            assert results[0] is None
+            assert isinstance(results[1], RuntimeError)
+            assert len(writer._in_flight) == 0
+
+        # The messages of the other thread are written
+        async with AsyncSession(engine) as session:
+            messages = (
+                (
+                    await session.execute(
+                        select(Messages).where(Messages.thread_id == thread.thread_id)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert len(messages) == 2
+            assert all(message.is_complete for message in messages)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_message_writer_drops_following_messages(db_connection, test_user_info):
+    engine = create_async_engine(db_connection)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, vlab, proj = test_user_info
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        thread = Threads(user_id=user_id, vlab_id=vlab, project_id=proj)
+        session.add(thread)
+        await session.commit()
+
+    try:
+        async with MessageWriter(engine, flush_interval=0.01) as writer:
+            turn = make_turn(thread.thread_id)
+            write = writer._write
+            writer._write = Mock(side_effect=RuntimeError("Connection lost."))
+            writer.submit(turn[:1])
+            await asyncio.sleep(0.1)
+            writer._write = write
+
+            # The message following the failed one is not written
+            writer.submit(turn[1:])
+            assert not writer._batches
+            with pytest.raises(RuntimeError):
+                await writer.finish_turn(turn)
+            assert not writer._failed
+
+            # The next turn of the thread is written
+            next_turn = make_turn(thread.thread_id)
+            await writer.finish_turn(next_turn)
+
+        async with AsyncSession(engine) as session:
+            messages = (
+                (
+                    await session.execute(
+                        select(Messages).where(Messages.thread_id == thread.thread_id)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert {message.message_id for message in messages} == {
+                message.message_id for message in next_turn
+            }
+    finally:
+        await engine.dispose()
@@ -0,0 +1,119 @@
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuroagent.app.config import Settings
+from neuroagent.app.database.sql_schemas import (
+    Entity,
+    Messages,
+    Task,
+    TokenConsumption,
+    TokenType,
+)
+from neuroagent.app.dependencies import get_read_session, get_settings
+from neuroagent.app.main import app
+from tests.conftest import mock_keycloak_user_identification
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.asyncio
+async def test_get_token_usage(httpx_mock, app_client, db_connection, test_user_info):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    _, vlab, proj = test_user_info
+
+    with app_client as app_client:
+        thread_id = app_client.post(
+            "/threads", json={"virtual_lab_id": str(vlab), "project_id": str(proj)}
+        ).json()["thread_id"]
+
+    # The usage is summed per day by a trigger on the token consumption
+    engine = create_async_engine(db_connection)
+    async with AsyncSession(engine) as session:
+        for day, count in [(1, 100), (1, 50), (2, 10)]:
+            session.add(
+                Messages(
+                    entity=Entity.AI_MESSAGE,
+                    content={"role": "assistant", "content": "Hi"},
+                    thread_id=thread_id,
+                    is_complete=True,
+                    creation_date=datetime(2025, 1, day, 12, tzinfo=timezone.utc),
+                    token_consumption=[
+                        TokenConsumption(
+                            type=TokenType.COMPLETION,
+                            task=Task.CHAT_COMPLETION,
+                            count=count,
+                            model="openai/gpt-5-mini",
+                        )
+                    ],
+                )
+            )
+            await session.commit()
+    await engine.dispose()
+
+    with app_client as app_client:
+        usage = app_client.get(
+            "/analytics/token_usage",
+            params={"start_date": "2025-01-01", "end_date": "2025-01-31"},
+        ).json()
+        project_usage = app_client.get(
+            "/analytics/token_usage",
+            params={
+                "start_date": "2025-01-02",
+                "end_date": "2025-01-31",
+                "vlab_id": vlab,
+                "project_id": proj,
+            },
+        ).json()
+
+    assert usage == {
+        "start_date": "2025-01-01",
+        "end_date": "2025-01-31",
+        "results": [
+            {
+                "day": f"2025-01-0{day}",
+                "model": "openai/gpt-5-mini",
+                "task": "chat-completion",
+                "type": "completion",
+                "count": count,
+            }
+            for day, count in [(1, 150), (2, 10)]
+        ],
+    }
+    assert [result["count"] for result in project_usage["results"]] == [10]
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.asyncio
+async def test_get_token_usage_dates(app_client, httpx_mock, test_user_info):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(keycloak={"issuer": "https://great_issuer.com"})
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    session = Mock()
+    session.execute = AsyncMock(return_value=Mock(all=Mock(return_value=[])))
+    app.dependency_overrides[get_read_session] = lambda: session
+
+    with app_client as app_client:
+        # Last 30 days by default
+        usage = app_client.get("/analytics/token_usage").json()
+        assert (
+            date.fromisoformat(usage["end_date"])
+            - date.fromisoformat(usage["start_date"])
+        ).days == 29
+
+        response = app_client.get(
+            "/analytics/token_usage",
+            params={"start_date": "2025-02-01", "end_date": "2025-01-01"},
+        )
+        assert response.status_code == 422
+
+        response = app_client.get(
+            "/analytics/token_usage",
+            params={"start_date": "2020-01-01", "end_date": "2025-01-01"},
+        )
+        assert response.status_code == 422
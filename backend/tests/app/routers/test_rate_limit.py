@@ -1,12 +1,10 @@
-from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, Mock
-
 import pytest
 
 from neuroagent.app.config import Settings
 from neuroagent.app.dependencies import get_redis_client, get_settings
 from neuroagent.app.main import app
 from tests.conftest import mock_keycloak_user_identification
+from tests.mock_redis import FakeRedis
 
 
 @pytest.mark.asyncio
@@ -53,28 +51,15 @@ async def test_get_rate_limit_outside_project(app_client, httpx_mock, test_user_
     )
     app.dependency_overrides[get_settings] = lambda: test_settings
 
-    # Create a proper mock for the pipeline
-    pipeline = AsyncMock()
-    pipeline.get = AsyncMock()
-    pipeline.pttl = AsyncMock()
-    pipeline.execute = AsyncMock(return_value=[5, 3600000, 3, 1800000, 2, 900000])
-
-    @asynccontextmanager
-    async def fake_pipeline():
-        yield pipeline
-
-    redis_mock = Mock()
-    # Mock Redis responses for keys
-    redis_mock.keys = AsyncMock(
-        return_value=[
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/chat_streamed/{thread_id}",
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/question_suggestions",
-            "rate_limit:20293-2467-9665-4678-203948573627:/threads/{thread_id}/generate_title",
-        ]
-    )
-    redis_mock.pipeline.return_value = fake_pipeline()
-
-    app.dependency_overrides[get_redis_client] = lambda: redis_mock
+    user_id = test_user_info[0]
+    other_user_id = "20293-2467-9665-4678-203948573627"
+    redis = FakeRedis()
+    redis._set(f"rate_limit:{user_id}:/qa/chat_streamed/{{thread_id}}", 5, ex=3600)
+    redis._set(f"rate_limit:{user_id}:/qa/question_suggestions", 3, ex=1800)
+    redis._set(f"rate_limit:{user_id}:/threads/{{thread_id}}/generate_title", 2, ex=900)
+    # Keys of other users are not read
+    redis._set(f"rate_limit:{other_user_id}:/qa/chat_streamed/{{thread_id}}", 12, ex=60)
+    app.dependency_overrides[get_redis_client] = lambda: redis
 
     with app_client as app_client:
         response = app_client.get("/rate_limit")
@@ -82,11 +67,8 @@ async def test_get_rate_limit_outside_project(app_client, httpx_mock, test_user_
     assert response.status_code == 200
     results = response.json()
 
-    # Verify pipeline was used correctly
-    assert redis_mock.pipeline.called
-    assert pipeline.get.call_count == 3
-    assert pipeline.pttl.call_count == 3
-    assert pipeline.execute.called
+    # The counts and ttls are read in a single round-trip, without scanning keys
+    assert redis.round_trips == 1
 
     # Verify response structure and calculations
     assert results["chat_streamed"]["limit"] == 20
@@ -119,26 +101,8 @@ async def test_get_rate_limit_inside_project(app_client, httpx_mock, test_user_i
     )
     app.dependency_overrides[get_settings] = lambda: test_settings
 
-    pipeline = AsyncMock()
-    pipeline.get = AsyncMock()
-    pipeline.pttl = AsyncMock()
-    pipeline.execute = AsyncMock(return_value=[None, -2, None, -2, None, -2])
-
-    @asynccontextmanager
-    async def fake_pipeline():
-        yield pipeline
-
-    redis_mock = Mock()
-    # Mock Redis responses - no current usage
-    redis_mock.keys = AsyncMock(
-        return_value=[
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/chat_streamed/{thread_id}",
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/question_suggestions",
-            "rate_limit:20293-2467-9665-4678-203948573627:/threads/{thread_id}/generate_title",
-        ]
-    )
-    redis_mock.pipeline.return_value = fake_pipeline()
-    app.dependency_overrides[get_redis_client] = lambda: redis_mock
+    # No current usage
+    app.dependency_overrides[get_redis_client] = lambda: FakeRedis()
 
     with app_client as app_client:
         response = app_client.get(
@@ -182,26 +146,12 @@ async def test_get_rate_limit_with_ttl_values(app_client, httpx_mock, test_user_
     )
     app.dependency_overrides[get_settings] = lambda: test_settings
 
-    pipeline = AsyncMock()
-    pipeline.get = AsyncMock()
-    pipeline.pttl = AsyncMock()
-    pipeline.execute = AsyncMock(return_value=[1, 5432, 2, 2789, 3, 360000])
-
-    @asynccontextmanager
-    async def fake_pipeline():
-        yield pipeline
-
-    redis_mock = Mock()
-    # Mock Redis responses with different TTL scenarios
-    redis_mock.keys = AsyncMock(
-        return_value=[
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/chat_streamed/{thread_id}",
-            "rate_limit:20293-2467-9665-4678-203948573627:/qa/question_suggestions",
-            "rate_limit:20293-2467-9665-4678-203948573627:/threads/{thread_id}/generate_title",
-        ]
-    )
-    redis_mock.pipeline.return_value = fake_pipeline()
-    app.dependency_overrides[get_redis_client] = lambda: redis_mock
+    user_id = test_user_info[0]
+    redis = FakeRedis()
+    redis._set(f"rate_limit:{user_id}:/qa/chat_streamed/{{thread_id}}", 1, ex=5.432)
+    redis._set(f"rate_limit:{user_id}:/qa/question_suggestions", 2, ex=2.789)
+    redis._set(f"rate_limit:{user_id}:/threads/{{thread_id}}/generate_title", 3, ex=360)
+    app.dependency_overrides[get_redis_client] = lambda: redis
 
     with app_client as app_client:
         response = app_client.get("/rate_limit")
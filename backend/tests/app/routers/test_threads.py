@@ -4,8 +4,17 @@ from unittest.mock import Mock
 
 import pytest
 from dateutil import parser
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from neuroagent.app.config import Settings
+from neuroagent.app.database.sql_schemas import (
+    Entity,
+    Messages,
+    StorageArtifacts,
+    Threads,
+    ToolCalls,
+)
 from neuroagent.app.dependencies import (
     get_openai_client,
     get_s3_client,
@@ -13,6 +22,7 @@ from neuroagent.app.dependencies import (
 )
 from neuroagent.app.main import app
 from neuroagent.app.schemas import ThreadGeneratedTitle
+from neuroagent.utils import content_address
 from tests.conftest import mock_keycloak_user_identification
 from tests.mock_client import MockOpenAIClient, create_mock_response
 
@@ -161,6 +171,7 @@ def test_get_threads_paginated(httpx_mock, app_client, db_connection, test_user_
         threads = app_client.get("/threads").json()
         assert set(threads.keys()) == {
             "next_cursor",
+            "next_cursor_id",
             "has_more",
             "page_size",
             "results",
@@ -323,7 +334,8 @@ def test_update_thread_title(httpx_mock, app_client, db_connection, test_user_in
 
 
 @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
-def test_delete_thread(
+@pytest.mark.asyncio
+async def test_delete_thread(
     httpx_mock,
     app_client,
     db_connection,
@@ -365,6 +377,18 @@ def test_delete_thread(
         assert len(threads["results"]) == 1
         assert threads["results"][0]["thread_id"] == thread_id
 
+    # Content addressed objects are left to the sweep of the storage
+    user_id = test_user_info[0]
+    keys = [f"{user_id}/{uuid.uuid4()}", f"{user_id}/{content_address(b'png')}"]
+    engine = create_async_engine(db_connection)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            StorageArtifacts(thread_id=uuid.UUID(thread_id), key=key) for key in keys
+        )
+        await session.commit()
+    await engine.dispose()
+
+    with app_client as app_client:
         delete_response = app_client.delete(f"/threads/{thread_id}").json()
         assert delete_response["Acknowledged"] == "true"
 
@@ -372,6 +396,112 @@ def test_delete_thread(
         assert not threads["results"]
 
         assert fake_delete_from_storage.call_count == 1
+        assert fake_delete_from_storage.call_args.kwargs["keys"] == keys[:1]
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.asyncio
+async def test_search(httpx_mock, app_client, db_connection, test_user_info):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+
+    with app_client as app_client:
+        thread_ids = [app_client.post("/threads").json()["thread_id"] for _ in range(3)]
+
+    # The search documents of the threads are updated by a trigger
+    contents = [
+        ["Show me a neuron.", "Here is a neuron with its morphology."],
+        ["Which neurons are in the cortex?", "Pyramidal neurons, many neurons."],
+        ["What is the weather in Geneva?", "It is sunny."],
+    ]
+    engine = create_async_engine(db_connection)
+    async with AsyncSession(engine) as session:
+        for thread_id, (query, answer) in zip(thread_ids, contents):
+            session.add_all(
+                [
+                    Messages(
+                        entity=Entity.USER,
+                        content={"role": "user", "content": query},
+                        thread_id=thread_id,
+                        is_complete=True,
+                    ),
+                    Messages(
+                        entity=Entity.AI_MESSAGE,
+                        content={"role": "assistant", "content": answer},
+                        thread_id=thread_id,
+                        is_complete=True,
+                    ),
+                ]
+            )
+        await session.commit()
+    await engine.dispose()
+
+    with app_client as app_client:
+        # Ordered by relevance, the last word is a prefix
+        search = app_client.get("/threads/search", params={"query": "neur"}).json()
+        assert [result["thread_id"] for result in search["result_list"]] == [
+            thread_ids[1],
+            thread_ids[0],
+        ]
+        assert not search["has_more"]
+        assert "<b>neurons</b>" in search["result_list"][0]["headline"]
+
+        # Paginated by rank
+        page_1 = app_client.get(
+            "/threads/search", params={"query": "neuron", "limit": 1}
+        ).json()
+        assert page_1["has_more"]
+        page_2 = app_client.get(
+            "/threads/search",
+            params={
+                "query": "neuron",
+                "limit": 1,
+                "cursor": page_1["next_cursor"],
+                "cursor_id": page_1["next_cursor_id"],
+            },
+        ).json()
+        assert not page_2["has_more"]
+        assert [
+            result["thread_id"]
+            for result in page_1["result_list"] + page_2["result_list"]
+        ] == [thread_ids[1], thread_ids[0]]
+
+        # Similar words when no thread matches
+        search = app_client.get("/threads/search", params={"query": "morpholgy"}).json()
+        assert [result["thread_id"] for result in search["result_list"]] == [
+            thread_ids[0]
+        ]
+        assert search["result_list"][0]["content"] == contents[0][1]
+        assert search["result_list"][0]["headline"] is None
+
+    # Archived threads keep their search document, without messages
+    engine = create_async_engine(db_connection)
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            delete(Messages).where(Messages.thread_id == thread_ids[2])
+        )
+        await session.execute(
+            update(Threads)
+            .where(Threads.thread_id == thread_ids[2])
+            .values(archive_key="archive.jsonl.gz")
+        )
+        await session.commit()
+    await engine.dispose()
+
+    with app_client as app_client:
+        search = app_client.get("/threads/search", params={"query": "sunny"}).json()
+        assert search["result_list"] == [
+            {
+                "thread_id": thread_ids[2],
+                "message_id": None,
+                "title": "New chat",
+                "content": "",
+                "headline": None,
+            }
+        ]
 
 
 @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
@@ -545,7 +675,13 @@ async def test_get_thread_messages_paginated(
             params={"page_size": 3, "cursor": messages["next_cursor"]},
         ).json()
 
-    assert set(messages.keys()) == {"next_cursor", "has_more", "page_size", "results"}
+    assert set(messages.keys()) == {
+        "next_cursor",
+        "next_cursor_id",
+        "has_more",
+        "page_size",
+        "results",
+    }
 
     assert messages["page_size"] == 3
     assert messages["next_cursor"] == messages["results"][-1]["creation_date"]
@@ -585,6 +721,64 @@ async def test_get_thread_messages_paginated(
     assert len(page_2["results"]) == 1
 
 
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.asyncio
+async def test_get_thread_messages_paginated_same_date(
+    httpx_mock,
+    app_client,
+    db_connection,
+    populate_db,
+    test_user_info,
+):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+
+    db_items, _ = populate_db
+    thread = db_items["thread"]
+
+    # Messages written in the same transaction can share their creation date
+    engine = create_async_engine(db_connection)
+    date = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            [
+                Messages(
+                    entity=Entity.AI_MESSAGE,
+                    content={"content": str(i), "role": "assistant"},
+                    thread_id=thread.thread_id,
+                    is_complete=True,
+                    creation_date=date,
+                )
+                for i in range(5)
+            ]
+        )
+        await session.commit()
+    await engine.dispose()
+
+    message_ids = []
+    params = {"page_size": 2}
+    with app_client as app_client:
+        while True:
+            messages = app_client.get(
+                f"/threads/{thread.thread_id}/messages", params=params
+            ).json()
+            message_ids.extend(message["message_id"] for message in messages["results"])
+            if not messages["has_more"]:
+                break
+            params = {
+                "page_size": 2,
+                "cursor": messages["next_cursor"],
+                "cursor_id": messages["next_cursor_id"],
+            }
+
+    # No message is skipped or repeated across the pages
+    assert len(message_ids) == 9
+    assert len(set(message_ids)) == 9
+
+
 @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
 @pytest.mark.asyncio
 async def test_get_thread_messages_empty_paginated(
@@ -607,7 +801,13 @@ async def test_get_thread_messages_empty_paginated(
             f"/threads/{thread}/messages", params={"page_size": 3}
         ).json()
 
-    assert set(messages.keys()) == {"next_cursor", "has_more", "page_size", "results"}
+    assert set(messages.keys()) == {
+        "next_cursor",
+        "next_cursor_id",
+        "has_more",
+        "page_size",
+        "results",
+    }
 
     assert messages["page_size"] == 3
     assert messages["next_cursor"] is None
@@ -649,7 +849,13 @@ async def test_get_thread_messages_vercel_format(
         ).json()
 
     # Assert the first page with all its attributes.
-    assert set(messages.keys()) == {"next_cursor", "has_more", "page_size", "results"}
+    assert set(messages.keys()) == {
+        "next_cursor",
+        "next_cursor_id",
+        "has_more",
+        "page_size",
+        "results",
+    }
     assert messages["page_size"] == 1
     assert messages["has_more"]
     assert len(messages["results"]) == 1
@@ -710,6 +916,105 @@ async def test_get_thread_messages_vercel_format(
     assert msg["role"] == "user"
 
 
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+@pytest.mark.parametrize("page_size", [2, 3])
+@pytest.mark.asyncio
+async def test_get_thread_messages_vercel_format_many_tool_calls(
+    httpx_mock, app_client, db_connection, test_user_info, page_size
+):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+
+    with app_client as app_client:
+        thread_id = app_client.post("/threads").json()["thread_id"]
+
+    # Agent turns calling dozens of tools
+    n_turns, n_tool_calls = 5, 30
+    engine = create_async_engine(db_connection)
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    messages = []
+    for turn in range(n_turns):
+        messages.append(
+            Messages(
+                entity=Entity.USER,
+                content={"role": "user", "content": f"query {turn}"},
+            )
+        )
+        messages.append(
+            Messages(
+                entity=Entity.AI_TOOL,
+                content={"role": "assistant", "content": ""},
+                tool_calls=[
+                    ToolCalls(
+                        tool_call_id=f"{turn}_{i}", name="get_weather", arguments="{}"
+                    )
+                    for i in range(n_tool_calls)
+                ],
+            )
+        )
+        messages.extend(
+            Messages(
+                entity=Entity.TOOL,
+                content={
+                    "role": "tool",
+                    "tool_call_id": f"{turn}_{i}",
+                    "content": f"result {turn}_{i}",
+                },
+            )
+            for i in range(n_tool_calls)
+        )
+        messages.append(
+            Messages(
+                entity=Entity.AI_MESSAGE,
+                content={"role": "assistant", "content": f"answer {turn}"},
+            )
+        )
+    for i, message in enumerate(messages):
+        message.thread_id = thread_id
+        message.is_complete = True
+        message.creation_date = start + timedelta(seconds=i)
+    async with AsyncSession(engine) as session:
+        session.add_all(messages)
+        await session.commit()
+    await engine.dispose()
+
+    results = []
+    params = {"page_size": page_size, "vercel_format": True}
+    with app_client as app_client:
+        while True:
+            page = app_client.get(
+                f"/threads/{thread_id}/messages", params=params
+            ).json()
+            results.extend(page["results"])
+            if not page["has_more"]:
+                break
+            params = {
+                "page_size": page_size,
+                "vercel_format": True,
+                "cursor": page["next_cursor"],
+                "cursor_id": page["next_cursor_id"],
+            }
+
+    # Every turn is returned once, with the results of all its tools
+    assert [message["content"] for message in results] == [
+        content
+        for turn in reversed(range(n_turns))
+        for content in [f"answer {turn}", f"query {turn}"]
+    ]
+    for turn, message in zip(reversed(range(n_turns)), results[::2]):
+        tool_results = {
+            part["toolInvocation"]["toolCallId"]: part["toolInvocation"]["result"]
+            for part in message["parts"]
+            if part["type"] == "tool-invocation"
+        }
+        assert tool_results == {
+            f"{turn}_{i}": f"result {turn}_{i}" for i in range(n_tool_calls)
+        }
+
+
 @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
 def test_get_threads_creation_date_filters(
     httpx_mock,
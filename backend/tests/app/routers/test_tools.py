@@ -195,3 +195,58 @@ async def test_get_tool_metadata(
             }
         ]
     }
+
+
+@pytest.mark.asyncio
+async def test_get_tools_status(
+    httpx_mock,
+    app_client,
+    db_connection,
+    get_weather_tool,
+    test_user_info,
+):
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    # Also called outside of requests by the health checks, with its dependencies
+    app.dependency_overrides[get_tool_list] = lambda mcp_tool_list=None, settings=None: [
+        get_weather_tool
+    ]
+
+    with app_client as app_client:
+        response = app_client.get("/tools/status")
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": get_weather_tool.name, "is_online": True}]
+
+
+@pytest.mark.asyncio
+async def test_get_available_tools_not_modified(
+    httpx_mock,
+    app_client,
+    db_connection,
+    get_weather_tool,
+    test_user_info,
+):
+    # One identification per request
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    mock_keycloak_user_identification(httpx_mock, test_user_info)
+    test_settings = Settings(
+        db={"prefix": db_connection}, keycloak={"issuer": "https://great_issuer.com"}
+    )
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    app.dependency_overrides[get_tool_list] = lambda: [get_weather_tool]
+
+    with app_client as app_client:
+        response = app_client.get("/tools")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert response.json() == [
+            {"name": get_weather_tool.name, "name_frontend": "Get Weather"}
+        ]
+
+        response = app_client.get("/tools", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
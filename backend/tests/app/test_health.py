@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from neuroagent.app.config import Settings
+from neuroagent.app.dependencies import (
+    get_healthcheck_variables,
+    get_mcp_tool_list,
+    get_settings,
+    get_tool_list,
+)
+from neuroagent.app.health import ToolHealthProber
+
+
+def make_tool(name, check):
+    """Make a tool whose `is_online` runs `check`."""
+
+    class Tool:
+        @classmethod
+        async def is_online(cls, *, httpx_client: AsyncClient, entitycore_url: str):
+            return await check(entitycore_url)
+
+    Tool.name = name
+    return Tool
+
+
+def make_local_tool(name, check):
+    """Make a tool whose `is_online` needs no upstream."""
+
+    class Tool:
+        @classmethod
+        async def is_online(cls):
+            return await check()
+
+    Tool.name = name
+    return Tool
+
+
+def make_app(settings, tools):
+    fastapi_app = FastAPI()
+    fastapi_app.dependency_overrides[get_settings] = lambda: settings
+    fastapi_app.dependency_overrides[get_mcp_tool_list] = lambda *_: []
+    fastapi_app.dependency_overrides[get_tool_list] = lambda **_: tools
+    return fastapi_app
+
+
+@pytest.mark.asyncio
+async def test_tool_health_prober_check():
+    settings = Settings(tools={"health_check_timeout": 0.1})
+    checks = []
+
+    async def online(url=None):
+        checks.append(url)
+        return True
+
+    async def slow():
+        await asyncio.sleep(10)
+        return True
+
+    async def failing():
+        raise RuntimeError("Down")
+
+    tools = [
+        make_tool("entitycore_1", online),
+        make_tool("entitycore_2", online),
+        make_local_tool("slow", slow),
+        make_local_tool("failing", failing),
+    ]
+    prober = ToolHealthProber(make_app(settings, tools), settings)
+
+    async with AsyncClient() as client:
+        await prober.check(get_healthcheck_variables(settings, client))
+
+    # The tools with the same upstream are checked once
+    assert checks == [settings.tools.entitycore.url.rstrip("/") + "/"]
+    assert prober.status == {
+        "entitycore_1": True,
+        "entitycore_2": True,
+        "slow": False,
+        "failing": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_tool_health_prober_run():
+    settings = Settings(tools={"health_check_interval": 0.01})
+    checks = 0
+
+    async def online():
+        nonlocal checks
+        checks += 1
+        return True
+
+    prober = ToolHealthProber(
+        make_app(settings, [make_local_tool("a", online)]), settings
+    )
+
+    # Nothing is checked before the status is needed
+    await asyncio.sleep(0.05)
+    assert checks == 0
+
+    assert await prober.get_status() == {"a": True}
+    await asyncio.sleep(0.05)
+    assert checks > 1
+
+    await prober.stop()
+    stopped_checks = checks
+    await asyncio.sleep(0.05)
+    assert checks == stopped_checks
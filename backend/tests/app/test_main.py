@@ -1,9 +1,15 @@
 import logging
+from unittest.mock import Mock
 
 from fastapi.testclient import TestClient
 
-from neuroagent.app.dependencies import get_settings, get_tool_list
+from neuroagent.app.dependencies import (
+    get_mcp_tool_list,
+    get_settings,
+    get_tool_list,
+)
 from neuroagent.app.main import app
+from neuroagent.mcp import create_dynamic_tool
 
 
 def test_settings_endpoint(app_client, dont_look_at_env_file, settings):
@@ -24,6 +30,14 @@ def test_readyz(app_client):
     assert body["status"] == "ok"
 
 
+def test_metrics(app_client):
+    with app_client as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "db_pool" in response.json()
+
+
 def test_custom_openapi(app_client, get_weather_tool):
     app.dependency_overrides[get_tool_list] = lambda **kwargs: [get_weather_tool]
     with app_client as client:
@@ -39,6 +53,48 @@ def test_custom_openapi(app_client, get_weather_tool):
     )
 
 
+def test_openapi_cached(app_client, get_weather_tool):
+    mcp_tool = create_dynamic_tool(
+        tool_name="mcp-tool",
+        tool_name_mapping={},
+        tool_description="MCP tool.",
+        input_schema_serialized={},
+        server=Mock(),
+    )
+    app.dependency_overrides[get_mcp_tool_list] = lambda *args: [mcp_tool]
+    app.dependency_overrides[get_tool_list] = lambda mcp_tool_list, **kwargs: [
+        get_weather_tool,
+        *mcp_tool_list,
+    ]
+    with app_client as client:
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        etag = response.headers["etag"]
+        schemas = response.json()["components"]["schemas"]
+        # The outputs of the MCP tools are included
+        assert "FakeToolOutput" in schemas
+        assert "CallToolResult" in schemas
+
+        document = app.state.openapi_document
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == etag
+        assert response.json()["components"]["schemas"] == schemas
+        # Served without being built again
+        assert app.state.openapi_document is document
+
+        response = client.get("/openapi.json", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Built again when the tools change
+        app.dependency_overrides[get_tool_list] = lambda **kwargs: [get_weather_tool]
+        response = client.get("/openapi.json")
+        assert response.headers["etag"] != etag
+        assert "CallToolResult" not in response.json()["components"]["schemas"]
+
+
 def test_lifespan(caplog, monkeypatch, db_connection):
     get_settings.cache_clear()
     caplog.set_level(logging.INFO)
@@ -0,0 +1,87 @@
+import json
+from dataclasses import replace
+
+import pytest
+from fastapi import FastAPI
+
+from neuroagent.app.config import Settings
+from neuroagent.app.dependencies import get_tool_list, get_whitelisted_tools
+from neuroagent.app.tool_catalogue import build_tool_catalogue, get_tool_catalogue
+from neuroagent.tools.registry import get_tool_manifest
+
+
+def test_build_tool_catalogue(get_weather_tool):
+    # Internal tools are listed from the manifest, without importing them
+    lazy_tool = replace(
+        get_tool_manifest()["WeatherTool"],
+        module="neuroagent.tools.missing",
+        name="missing",
+    )
+    catalogue = build_tool_catalogue([lazy_tool, get_weather_tool])
+
+    assert json.loads(catalogue.content) == [
+        {"name": "missing", "name_frontend": lazy_tool.name_frontend},
+        {"name": "get_weather", "name_frontend": "Get Weather"},
+    ]
+    assert catalogue.etag.startswith('"') and catalogue.etag.endswith('"')
+    # The details are built on request
+    assert catalogue.details == {}
+
+    details = catalogue.get_details("get_weather")
+    assert details is not None
+    assert details.description == "Great description"
+    assert details.hil
+    assert json.loads(details.input_schema) == {
+        "parameters": [
+            {
+                "name": "location",
+                "required": True,
+                "default": None,
+                "description": "The location to get the weather for",
+            }
+        ]
+    }
+    assert catalogue.get_details("get_weather") is details
+    assert catalogue.get_details("unknown") is None
+    assert catalogue.details.keys() == {"get_weather"}
+    with pytest.raises(ModuleNotFoundError):
+        catalogue.get_details("missing")
+
+
+def test_get_tool_catalogue(get_weather_tool, agent_handoff_tool):
+    fastapi_app = FastAPI()
+
+    catalogue = get_tool_catalogue(fastapi_app, [get_weather_tool])
+    assert get_tool_catalogue(fastapi_app, [get_weather_tool]) is catalogue
+
+    # Built again when the tools change
+    other_catalogue = get_tool_catalogue(
+        fastapi_app, [get_weather_tool, agent_handoff_tool]
+    )
+    assert other_catalogue is not catalogue
+    assert [tool["name"] for tool in json.loads(other_catalogue.content)] == [
+        get_weather_tool.name,
+        agent_handoff_tool.name,
+    ]
+
+
+def test_get_tool_list_filtered_once(get_weather_tool):
+    get_whitelisted_tools.cache_clear()
+    settings = Settings(
+        tools={"whitelisted_tool_regex": "get_weather|entitycore-species-.*"}
+    )
+
+    tool_list = get_tool_list(mcp_tool_list=[get_weather_tool], settings=settings)
+    assert get_weather_tool in tool_list
+    # The example weather tool of the manifest is left out
+    assert len(tool_list) == 3
+    assert {tool.name for tool in tool_list} == {
+        "get_weather",
+        "entitycore-species-getall",
+        "entitycore-species-getone",
+    }
+
+    assert get_tool_list(mcp_tool_list=[get_weather_tool], settings=settings) == (
+        tool_list
+    )
+    assert get_whitelisted_tools.cache_info().hits == 1
@@ -250,6 +250,11 @@ async def setup_sql_db(request):
         await conn.run_sync(metadata.reflect)
         tables = metadata.tables
         await session.execute(tables["tool_calls"].delete())
+        await session.execute(tables["tool_selection"].delete())
+        await session.execute(tables["complexity_estimation"].delete())
+        await session.execute(tables["storage_artifacts"].delete())
+        await session.execute(tables["token_consumption"].delete())
+        await session.execute(tables["token_usage_daily"].delete())
         await session.execute(tables["messages"].delete())
         await session.execute(tables["threads"].delete())
 
@@ -275,33 +280,29 @@ async def populate_db(db_connection, test_user_info):
     messages = [
         Messages(
             entity=Entity.USER,
-            content=json.dumps({"content": "This is my query.", "role": "user"}),
+            content={"content": "This is my query.", "role": "user"},
             thread=thread,
             is_complete=True,
         ),
         Messages(
             entity=Entity.AI_TOOL,
-            content=json.dumps(
-                {
-                    "content": "",
-                    "role": "assistant",
-                    "tool_calls": {"name": "great-tool"},
-                }
-            ),
+            content={
+                "content": "",
+                "role": "assistant",
+                "tool_calls": {"name": "great-tool"},
+            },
             thread=thread,
             is_complete=True,
         ),
         Messages(
             entity=Entity.TOOL,
-            content=json.dumps({"content": "It's sunny today.", "role": "tool"}),
+            content={"content": "It's sunny today.", "role": "tool"},
             thread=thread,
             is_complete=True,
         ),
         Messages(
             entity=Entity.AI_MESSAGE,
-            content=json.dumps(
-                {"content": "sample response content.", "role": "assistant"}
-            ),
+            content={"content": "sample response content.", "role": "assistant"},
             thread=thread,
             is_complete=True,
         ),
@@ -0,0 +1,71 @@
+"""Minimal MCP server over stdio, to test the MCP client.
+
+Usage: python mcp_server.py <name> [<startup delay in seconds>]
+"""
+
+import json
+import os
+import sys
+import time
+
+TOOLS = [
+    {
+        "name": "echo",
+        "description": "Echo the text.",
+        "inputSchema": {"type": "object", "properties": {"text": {"type": "string"}}},
+    },
+    {
+        "name": "sleep",
+        "description": "Wait, the calls are answered one after the other.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"seconds": {"type": "number"}},
+        },
+    },
+    {
+        "name": "count",
+        "description": "Count the calls.",
+        "inputSchema": {"type": "object", "properties": {"text": {"type": "string"}}},
+    },
+    {
+        "name": "crash",
+        "description": "Exit the server.",
+        "inputSchema": {"type": "object", "properties": {}},
+    },
+]
+
+time.sleep(float(sys.argv[2]) if len(sys.argv) > 2 else 0)
+calls = 0
+
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        # Notification
+        continue
+
+    method = message["method"]
+    if method == "initialize":
+        result = {
+            "protocolVersion": message["params"]["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": sys.argv[1], "version": "0.1.0"},
+        }
+    elif method == "tools/list":
+        result = {"tools": TOOLS}
+    elif method == "tools/call":
+        name, arguments = message["params"]["name"], message["params"]["arguments"]
+        calls += 1
+        if name == "crash":
+            os._exit(1)
+        elif name == "sleep":
+            time.sleep(arguments["seconds"])
+            text = "done"
+        elif name == "count":
+            text = str(calls)
+        else:
+            text = arguments["text"]
+        result = {"content": [{"type": "text", "text": text}]}
+    else:
+        result = {}
+    print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}))
+    sys.stdout.flush()
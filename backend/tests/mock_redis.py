@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+
+class FakeRedis:
+    """In-memory Redis with the commands used by the rate limiter.
+
+    Every call and every pipeline execution is a round-trip that yields to the
+    event loop, so that concurrent requests interleave as with a real server.
+    The commands of a pipeline run together, as with MULTI/EXEC.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.round_trips = 0
+
+    def _expire_keys(self):
+        now = time.monotonic()
+        for key, deadline in list(self.expires.items()):
+            if deadline <= now:
+                self.data.pop(key, None)
+                self.expires.pop(key)
+
+    def _run(self, command, *args, **kwargs):
+        self._expire_keys()
+        return getattr(self, f"_{command}")(*args, **kwargs)
+
+    async def _round_trip(self, commands):
+        self.round_trips += 1
+        await asyncio.sleep(0)
+        return [
+            self._run(command, *args, **kwargs) for command, args, kwargs in commands
+        ]
+
+    def __getattr__(self, command):
+        if not hasattr(type(self), f"_{command}"):
+            raise AttributeError(command)
+
+        async def call(*args, **kwargs):
+            return (await self._round_trip([(command, args, kwargs)]))[0]
+
+        return call
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def _get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    def _mget(self, keys):
+        return [self._get(key) for key in keys]
+
+    def _set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expires.pop(key, None)
+        if ex is not None:
+            self.expires[key] = time.monotonic() + ex
+        if px is not None:
+            self.expires[key] = time.monotonic() + px / 1000
+        return True
+
+    def _exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    def _incr(self, key):
+        return self._incrby(key, 1)
+
+    def _incrby(self, key, amount):
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    def _pttl(self, key):
+        if key not in self.data:
+            return -2
+        if key not in self.expires:
+            return -1
+        return round(1000 * (self.expires[key] - time.monotonic()))
+
+    def _delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            deleted += self.data.pop(key, None) is not None
+            self.expires.pop(key, None)
+        return deleted
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.commands = []
+
+    def __getattr__(self, command):
+        if not hasattr(FakeRedis, f"_{command}"):
+            raise AttributeError(command)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        commands, self.commands = self.commands, []
+        return await self.redis._round_trip(commands)
@@ -1,6 +1,7 @@
 import json
-from typing import AsyncIterator
-from unittest.mock import patch
+from typing import AsyncIterator, ClassVar
+from unittest.mock import Mock, patch
+from uuid import uuid4
 
 import pytest
 from openai.types.chat.chat_completion_chunk import (
@@ -10,11 +11,12 @@ from openai.types.chat.chat_completion_chunk import (
     ChoiceDeltaToolCall,
     ChoiceDeltaToolCallFunction,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from neuroagent.agent_routine import AgentsRoutine
 from neuroagent.app.database.sql_schemas import Entity, Messages, ToolCalls
 from neuroagent.new_types import Agent, Response, Result
+from neuroagent.tools.base_tool import BaseTool
 from tests.mock_client import create_mock_response
 
 
@@ -427,6 +429,92 @@ class TestAgentsRoutine:
             None,
         )
 
+    def test_dataset_sources(self):
+        thread_id = uuid4()
+        tool = Mock()
+        tool.name = "list-tool"
+        tool.to_dataset = BaseTool.to_dataset
+
+        def tool_message(tool_call_id, tool_name, content):
+            return Messages(
+                thread_id=thread_id,
+                entity=Entity.TOOL,
+                content={
+                    "role": "tool",
+                    "tool_call_id": tool_call_id,
+                    "tool_name": tool_name,
+                    "content": content,
+                },
+            )
+
+        messages = [
+            Messages(
+                thread_id=thread_id,
+                entity=Entity.USER,
+                content={"role": "user", "content": "List the items."},
+            ),
+            tool_message(
+                "tool_call_id", "list-tool", json.dumps({"data": [{"name": "a"}]})
+            ),
+            # Outputs that are not lists have no dataset
+            tool_message("other_tool_call_id", "list-tool", '{"name": "c"}'),
+            tool_message("error_tool_call_id", "list-tool", "Error: Tool failed."),
+            # Unknown tools are skipped
+            tool_message("unknown_tool_call_id", "unknown-tool", "{}"),
+        ]
+
+        sources = AgentsRoutine.dataset_sources(messages, [tool])
+
+        assert [name for name, _ in sources] == [
+            "tool_call_id",
+            "other_tool_call_id",
+            "error_tool_call_id",
+        ]
+        assert [get_data() for _, get_data in sources] == [[{"name": "a"}], None, None]
+
+    @pytest.mark.asyncio
+    async def test_handle_tool_call_storage_keys(self, mock_openai_client):
+        class PlotInput(BaseModel):
+            pass
+
+        class PlotMetadata(BaseModel):
+            model_config = ConfigDict(extra="ignore")
+            storage_keys: list[str] = []
+
+        class PlotOutput(BaseModel):
+            image_link: str
+
+        class PlotTool(BaseTool):
+            name: ClassVar[str] = "plot"
+            description: ClassVar[str] = "Plot."
+            metadata: PlotMetadata
+            input_schema: PlotInput
+
+            async def arun(self) -> PlotOutput:
+                self.metadata.storage_keys = ["user/plot"]
+                return PlotOutput(image_link="plot")
+
+            @classmethod
+            async def is_online(cls):
+                return True
+
+        routine = AgentsRoutine(client=mock_openai_client)
+        context_variables = {"storage_dict": {}}
+
+        for tool_call_id in ("call_1", "call_2"):
+            await routine.handle_tool_call(
+                tool_call=ToolCalls(
+                    tool_call_id=tool_call_id, name="plot", arguments="{}"
+                ),
+                tools=[PlotTool],
+                context_variables=context_variables,
+            )
+
+        # The keys are recorded per tool call and do not leak to the next calls
+        assert context_variables == {
+            "storage_dict": {"call_1": ["user/plot"], "call_2": ["user/plot"]}
+        }
+
     @pytest.mark.asyncio
     async def test_handle_tool_call_handoff(
         self, mock_openai_client, get_weather_tool, agent_handoff_tool
@@ -484,15 +572,13 @@ class TestAgentsRoutine:
             Messages(
                 thread_id="fake_id",
                 entity=Entity.USER,
-                content=json.dumps(
-                    {
+                content={
+                    "role": "user",
+                    "content": {
                         "role": "user",
-                        "content": {
-                            "role": "user",
-                            "content": "What's the weather like in San Francisco?",
-                        },
-                    }
-                ),
+                        "content": "What's the weather like in San Francisco?",
+                    },
+                },
             )
         ]
         context_variables = {"to_agent": agent_2, "planet": "Mars"}
@@ -0,0 +1,72 @@
+"""Test the trimmed autogenerated types."""
+
+import subprocess
+import sys
+
+import pytest
+
+from neuroagent.scripts.trim_autogenerated_types import (
+    MODULES,
+    TRIMMED_DIR,
+    trim_module,
+)
+
+SOURCE = """\
+# generated by datamodel-codegen
+
+from __future__ import annotations
+
+from pydantic import BaseModel, RootModel
+
+
+class Unused(BaseModel):
+    a: int
+
+
+class Child(RootModel[int]):
+    root: int
+
+
+class Parent(BaseModel):
+    children: list[Child]
+    tree: Tree | None = None
+
+
+class Tree(BaseModel):
+    parent: Parent
+
+
+Unused.model_rebuild()
+Tree.model_rebuild()
+"""
+
+
+def test_trim_module():
+    trimmed = trim_module("test", SOURCE, {"Parent"})
+
+    assert "class Unused" not in trimmed
+    assert "Unused.model_rebuild()" not in trimmed
+    for kept in ("class Child", "class Parent", "class Tree", "Tree.model_rebuild()"):
+        assert kept in trimmed
+    assert "from pydantic import BaseModel, RootModel" in trimmed
+    compile(trimmed, "test.py", "exec")
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_trimmed_up_to_date(module):
+    # In a new interpreter, as parsing the large generated modules can raise a
+    # spurious "AST constructor recursion depth mismatch" after other tests
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from neuroagent.scripts.trim_autogenerated_types import trim;"
+            " sys.stdout.write(trim(sys.argv[1]))",
+            module,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Run `neuroagent-trim-autogenerated-types` if this fails
+    assert (TRIMMED_DIR / f"{module}.py").read_text() == result.stdout
@@ -0,0 +1,142 @@
+"""Tests for the dataset store."""
+
+from uuid import uuid4
+
+import duckdb
+import pandas as pd
+
+from neuroagent.datasets import DatasetStore
+
+
+def test_register_dataframe(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path))
+    thread_id = uuid4()
+
+    dataset = store.register(
+        thread_id, "my-table.v1", pd.DataFrame({"mtype": ["L5_TPC", "L4_SS"]})
+    )
+
+    assert dataset is not None
+    assert dataset.name == "my-table_v1"
+    assert dataset.n_rows == 2
+    assert dataset.sandbox_path == "/datasets/my-table_v1.parquet"
+    assert duckdb.sql(f"SELECT mtype FROM '{dataset.path}'").fetchall() == [
+        ("L5_TPC",),
+        ("L4_SS",),
+    ]
+    assert store.get(thread_id) == [dataset]
+    assert store.get(uuid4()) == []
+
+
+def test_register_records(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path))
+    thread_id = uuid4()
+    records = [
+        {"id": "a", "brain_region": {"name": "Isocortex"}, "assets": [{"id": 1}]},
+        {"id": "b", "brain_region": None, "assets": []},
+    ]
+
+    dataset = store.register(thread_id, "tool_call_id", records)
+
+    assert dataset is not None
+    assert duckdb.sql(
+        f"SELECT id, brain_region.name FROM '{dataset.path}'"
+    ).fetchall() == [
+        ("a", "Isocortex"),
+        ("b", None),
+    ]
+    # Only the parquet file remains on disk
+    assert [path.name for path in dataset.path.parent.iterdir()] == [
+        "tool_call_id.parquet"
+    ]
+
+    # Nothing to register
+    assert store.register(thread_id, "empty", []) is None
+
+
+def test_eviction_per_thread(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path), max_datasets_per_thread=2)
+    thread_id = uuid4()
+
+    first = store.register(thread_id, "first", [{"a": 1}])
+    store.register(thread_id, "second", [{"a": 2}])
+    store.register(thread_id, "third", [{"a": 3}])
+
+    assert [dataset.name for dataset in store.get(thread_id)] == ["second", "third"]
+    assert not first.path.exists()
+
+
+def test_eviction_per_size(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path), max_bytes_per_thread=1)
+    thread_id = uuid4()
+
+    store.register(thread_id, "first", [{"a": 1}])
+    store.register(thread_id, "second", [{"a": 2}])
+
+    # The most recent dataset is always kept
+    assert [dataset.name for dataset in store.get(thread_id)] == ["second"]
+
+
+def test_eviction_threads(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path), max_threads=2)
+    thread_ids = [uuid4() for _ in range(3)]
+
+    store.register(thread_ids[0], "data", [{"a": 1}])
+    store.register(thread_ids[1], "data", [{"a": 1}])
+    # Accessing the first thread makes it the most recently used
+    store.get(thread_ids[0])
+    store.register(thread_ids[2], "data", [{"a": 1}])
+
+    assert store.get(thread_ids[1]) == []
+    assert len(store.get(thread_ids[0])) == 1
+    assert len(store.get(thread_ids[2])) == 1
+    assert not (store.base_dir / str(thread_ids[1])).exists()
+
+
+def test_materialize(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path), max_datasets_per_thread=2)
+    thread_id = uuid4()
+    calls = []
+
+    def source(name, data):
+        def get_data():
+            calls.append(name)
+            return data
+
+        return name, get_data
+
+    def failing():
+        raise ValueError("Not a table.")
+
+    sources = [
+        source("first", [{"a": 1}]),
+        ("failing", failing),
+        source("empty", None),
+        source("last", [{"a": 2}]),
+    ]
+    datasets = store.materialize(thread_id, sources[:3])
+    assert datasets == []
+
+    # Only the most recent datasets are built, and the cached ones are reused
+    datasets = store.materialize(thread_id, sources)
+    assert [dataset.name for dataset in datasets] == ["last"]
+    datasets = store.materialize(thread_id, sources)
+    assert [dataset.name for dataset in datasets] == ["last"]
+    assert calls == ["empty", "empty", "last", "empty"]
+
+
+def test_evict_and_clear(tmp_path):
+    store = DatasetStore(base_dir=str(tmp_path))
+    thread_id = uuid4()
+    other_thread_id = uuid4()
+    store.register(thread_id, "data", [{"a": 1}])
+    store.register(other_thread_id, "data", [{"a": 1}])
+
+    store.evict(thread_id)
+    assert store.get(thread_id) == []
+    assert not (store.base_dir / str(thread_id)).exists()
+    assert len(store.get(other_thread_id)) == 1
+
+    store.clear()
+    assert store.get(other_thread_id) == []
+    assert not store.base_dir.exists()
@@ -2,11 +2,14 @@
 
 import json
 import logging
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
 
+from neuroagent.datasets import Dataset
 from neuroagent.executor import (
+    PRELOAD_MODULES,
     ErrorDetail,
     FailureOutput,
     SuccessOutput,
@@ -55,6 +58,41 @@ class TestWasmExecutor:
         assert executor.timeout == 120
         assert executor.deno_permissions == ["--allow-net", "--allow-read"]
 
+    @patch("subprocess.run")
+    @patch("tempfile.TemporaryDirectory")
+    @patch("builtins.open", new_callable=mock_open)
+    def test_context_manager_import_profile(
+        self, mock_file, mock_tempdir, mock_run, caplog
+    ):
+        """Test the import time of the preloaded modules is logged at warmup."""
+        mock_tempdir_instance = Mock()
+        mock_tempdir_instance.__enter__ = Mock(return_value="/tmp/test_dir")
+        mock_tempdir_instance.__exit__ = Mock(return_value=None)
+        mock_tempdir.return_value = mock_tempdir_instance
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=json.dumps(
+                {
+                    "output": [],
+                    "error": None,
+                    "timings": {
+                        "pyodide_load": 1500.0,
+                        "preload": 900.0,
+                        "imports": {"numpy": 600.0, "plotly.io": 300.0, "foo": None},
+                    },
+                }
+            ),
+            stderr="",
+        )
+
+        with caplog.at_level(logging.INFO, logger="neuroagent.executor"):
+            with WasmExecutor(additional_imports=["numpy"]):
+                pass
+
+        record = next(r for r in caplog.records if "Sandbox warmup" in r.message)
+        assert "numpy: 600ms, plotly.io: 300ms, foo: failed" in record.message
+        assert record.sandbox_timings["imports"]["numpy"] == 600.0
+
     @patch("subprocess.run")
     @patch("tempfile.TemporaryDirectory")
     @patch("builtins.open", new_callable=mock_open)
@@ -157,6 +195,96 @@ class TestWasmExecutor:
         # Verify TemporaryDirectory cleanup was called
         mock_tempdir_instance.__exit__.assert_called()
 
+    @patch("asyncio.create_subprocess_exec")
+    @patch("tempfile.TemporaryDirectory")
+    @patch("builtins.open", new_callable=mock_open)
+    @pytest.mark.asyncio
+    async def test_run_code_logs_timings(
+        self, mock_file, mock_tempdir, mock_create_subproc_exec, caplog
+    ):
+        """Test the duration of each phase of the execution is logged."""
+        mock_tempdir_instance = Mock()
+        mock_tempdir_instance.__enter__ = Mock(return_value="/tmp/test_dir")
+        mock_tempdir_instance.__exit__ = Mock(return_value=None)
+        mock_tempdir.return_value = mock_tempdir_instance
+
+        mock_stdout_data = json.dumps(
+            {
+                "output": [],
+                "return_value": None,
+                "error": None,
+                "timings": {
+                    "pyodide_load": 1200.0,
+                    "package_install": 300.0,
+                    "preload": 800.0,
+                    "imports": {"numpy": 500.0},
+                    "user_code": 12.0,
+                    "figure_serialisation": 3.0,
+                },
+            }
+        ).encode()
+        mock_process = AsyncMock()
+        mock_process.communicate = AsyncMock(return_value=(mock_stdout_data, b""))
+        mock_create_subproc_exec.return_value = mock_process
+
+        executor = WasmExecutor(additional_imports=[])
+        with caplog.at_level(logging.INFO, logger="neuroagent.executor"):
+            result = await executor.run_code("x = 1")
+
+        assert isinstance(result, SuccessOutput)
+        record = next(r for r in caplog.records if hasattr(r, "sandbox_timings"))
+        timings = record.sandbox_timings
+        assert timings["pyodide_load"] == 1200.0
+        assert timings["user_code"] == 12.0
+        assert timings["imports"] == {"numpy": 500.0}
+        assert {"spawn", "output_parse", "total"} <= timings.keys()
+        assert timings["total"] >= timings["spawn"]
+
+    @patch("subprocess.run")
+    @patch("asyncio.create_subprocess_exec")
+    @patch("tempfile.TemporaryDirectory")
+    @patch("builtins.open", new_callable=mock_open)
+    @pytest.mark.asyncio
+    async def test_run_code_with_datasets(
+        self, mock_file, mock_tempdir, mock_create_subproc_exec, mock_run
+    ):
+        """Test that datasets are mounted in the sandbox."""
+        mock_tempdir_instance = Mock()
+        mock_tempdir_instance.__enter__ = Mock(return_value="/tmp/test_dir")
+        mock_tempdir_instance.__exit__ = Mock(return_value=None)
+        mock_tempdir.return_value = mock_tempdir_instance
+
+        mock_process = AsyncMock()
+        mock_process.communicate = AsyncMock(
+            return_value=(
+                json.dumps(
+                    {"output": [], "return_value": None, "error": None}
+                ).encode(),
+                b"",
+            )
+        )
+        mock_create_subproc_exec.return_value = mock_process
+
+        dataset = Dataset(
+            name="abc", path=Path("/tmp/sandbox_datasets/abc.parquet"), n_rows=1, size=1
+        )
+        executor = WasmExecutor(additional_imports=[])
+        result = await executor.run_code("print('test')", datasets=[dataset])
+
+        assert isinstance(result, SuccessOutput)
+        written_code = "".join(
+            call.args[0] for call in mock_file.return_value.write.call_args_list
+        )
+        assert 'const datasets = {"abc": "/tmp/sandbox_datasets/abc.parquet"}' in (
+            written_code
+        )
+        read_permission = next(
+            arg
+            for arg in mock_create_subproc_exec.call_args[0]
+            if str(arg).startswith("--allow-read=")
+        )
+        assert "/tmp/sandbox_datasets/abc.parquet" in read_permission.split(",")
+
     @patch("subprocess.run")
     @patch("asyncio.create_subprocess_exec")
     @patch("tempfile.TemporaryDirectory")
@@ -436,7 +564,10 @@ class TestWasmExecutor:
         executor = WasmExecutor(additional_imports=["numpy", "pandas"])
 
         formatted = executor.JS_CODE.format(
-            packages=["numpy", "pandas"], code=json.dumps("print('test')")
+            packages=["numpy", "pandas"],
+            preload=json.dumps(PRELOAD_MODULES),
+            datasets=json.dumps({}),
+            code=json.dumps("print('test')"),
         )
 
         assert "numpy" in formatted
@@ -0,0 +1,165 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from neuroagent.app.config import SettingsMCP
+from neuroagent.mcp import MCPClient, MCPServer, create_dynamic_tool
+
+SERVER = str(Path(__file__).parent / "data" / "mcp_server.py")
+
+
+def server_config(name, delay=0, **kwargs):
+    return {"command": sys.executable, "args": [SERVER, name, str(delay)], **kwargs}
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_connects_concurrently():
+    config = SettingsMCP(
+        servers={
+            "first": server_config(
+                "first", delay=1, tool_metadata={"echo": {"name": "echo-first"}}
+            ),
+            "second": server_config("second", delay=1),
+            "third": server_config("third", delay=1),
+        }
+    )
+
+    start = time.perf_counter()
+    async with MCPClient(config) as client:
+        # The servers start at the same time
+        assert time.perf_counter() - start < 2.5
+        assert client.servers.keys() == {"first", "second", "third"}
+        assert [tool.name for tool in client.tools["first"]] == [
+            "echo-first",
+            "sleep",
+            "count",
+            "crash",
+        ]
+        assert [tool.name for tool in client.tools["second"]] == [
+            "echo",
+            "sleep",
+            "count",
+            "crash",
+        ]
+        assert client.tool_name_mapping == {"echo-first": "echo"}
+
+        result = await client.servers["first"].call_tool(
+            "echo", arguments={"text": "hello"}
+        )
+        assert result.content[0].text == "hello"
+
+    assert all(
+        connection.session is None
+        for server in client.servers.values()
+        for connection in server.connections
+    )
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_skips_slow_server():
+    config = SettingsMCP(
+        servers={
+            "fast": server_config("fast"),
+            "slow": server_config("slow", delay=30, connect_timeout=0.5),
+        }
+    )
+
+    start = time.perf_counter()
+    async with MCPClient(config) as client:
+        assert time.perf_counter() - start < 5
+        assert client.servers.keys() == {"fast"}
+        assert client.tools.keys() == {"fast"}
+
+
+def make_server(**kwargs):
+    config = SettingsMCP(servers={"server": server_config("server", **kwargs)})
+    return MCPServer("server", config.servers["server"])
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_respawns_dead_connection():
+    server = make_server()
+    await server.connect()
+    tool = create_dynamic_tool(
+        tool_name="echo",
+        tool_name_mapping={},
+        tool_description="Echo the text.",
+        input_schema_serialized={},
+        server=server,
+    )
+    connection = server.connections[0]
+    try:
+        assert await tool.is_online()
+        first_session = connection.session
+
+        with pytest.raises(Exception, match="Connection closed"):
+            await server.call_tool("crash", arguments={})
+        # The dead session is detected
+        assert connection.session is None
+
+        # and the server is respawned on the next call
+        result = await tool(input_schema={"text": "hello"}, metadata={}).arun()
+        assert result.content[0].text == "hello"
+        assert connection.session is not first_session
+        assert await tool.is_online()
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pool_size,max_concurrent_calls,min_duration,max_duration",
+    [(1, 10, 1.5, 3), (2, 10, 0.5, 1.5), (2, 1, 1.5, 3)],
+)
+async def test_mcp_server_pool(
+    pool_size, max_concurrent_calls, min_duration, max_duration
+):
+    server = make_server(pool_size=pool_size, max_concurrent_calls=max_concurrent_calls)
+    await server.connect()
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(server.call_tool("sleep", arguments={"seconds": 0.8}) for _ in range(2))
+        )
+        # The processes answer one call at a time
+        assert min_duration < time.perf_counter() - start < max_duration
+        assert all(connection.in_flight == 0 for connection in server.connections)
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_call_timeout():
+    server = make_server(call_timeout=0.3)
+    await server.connect()
+    try:
+        with pytest.raises(TimeoutError, match="did not answer within 0.3s"):
+            await server.call_tool("sleep", arguments={"seconds": 1})
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_cache():
+    server = make_server(cache_size=1)
+    await server.connect()
+    try:
+
+        async def count(text, cache=True):
+            result = await server.call_tool(
+                "count", arguments={"text": text}, cache=cache
+            )
+            return result.content[0].text
+
+        assert await count("a") == "1"
+        assert await count("a") == "1"
+        assert await count("a", cache=False) == "2"
+        # Other arguments, evicting the first ones
+        assert await count("b") == "3"
+        assert await count("b") == "3"
+        assert await count("a") == "4"
+    finally:
+        await server.close()
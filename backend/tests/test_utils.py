@@ -1,15 +1,31 @@
 """Test utility functions."""
 
+import asyncio
+import gzip
 import json
-from unittest.mock import Mock, call
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import uuid4
 
+import boto3
 import pytest
+from moto import mock_aws
 
 from neuroagent.utils import (
+    asave_to_storage,
     complete_partial_json,
+    content_address,
     delete_from_storage,
+    is_content_addressed,
+    list_content_addressed_objects,
+    list_thread_objects,
     merge_chunk,
     merge_fields,
+    messages_to_openai_content,
+    reuse_from_storage,
+    save_many_to_storage,
     save_to_storage,
 )
 
@@ -214,149 +230,251 @@ def test_save_to_storage_with_string_body():
     assert call_args["Metadata"] == {"category": category, "thread_id": thread_id}
 
 
-def test_delete_from_storage():
-    # Setup mock s3 client
-    mock_s3 = Mock()
+@pytest.fixture
+def s3_bucket():
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+        yield s3_client
 
-    # Mock paginator and its paginate method
-    mock_paginator = Mock()
-    mock_s3.get_paginator.return_value = mock_paginator
 
-    # Test parameters
-    bucket_name = "test-bucket"
-    user_id = "test-user"
-    thread_id = "test-thread"
+def test_save_to_storage_compressed(s3_bucket):
+    user_id = uuid4()
+    body = json.dumps({"data": [{"x": list(range(100))}]})
 
-    # Test case 1: Multiple pages with matching objects
-    mock_paginator.paginate.return_value = [
-        {
-            "Contents": [
-                {"Key": f"{user_id}/obj1"},
-                {"Key": f"{user_id}/obj2"},
-            ]
-        },
-        {
-            "Contents": [
-                {"Key": f"{user_id}/obj3"},
-            ]
-        },
-    ]
+    identifier = save_to_storage(
+        s3_client=s3_bucket,
+        bucket_name="test-bucket",
+        user_id=user_id,
+        content_type="application/json",
+        category="json",
+        body=body,
+        compress=True,
+    )
 
-    # Mock head_object responses for each object
-    mock_s3.head_object.side_effect = [
-        {"Metadata": {"thread_id": thread_id}},  # obj1
-        {"Metadata": {"thread_id": "other"}},  # obj2
-        {"Metadata": {"thread_id": thread_id}},  # obj3
-    ]
+    stored = s3_bucket.get_object(Bucket="test-bucket", Key=f"{user_id}/{identifier}")
+    assert stored["ContentEncoding"] == "gzip"
+    assert stored["ContentType"] == "application/json"
+    assert gzip.decompress(stored["Body"].read()).decode() == body
 
-    # Call function
-    delete_from_storage(
-        s3_client=mock_s3,
-        bucket_name=bucket_name,
+
+@pytest.mark.asyncio
+async def test_asave_to_storage(s3_bucket):
+    user_id = uuid4()
+    thread_id = uuid4()
+
+    identifier = await asave_to_storage(
+        s3_client=s3_bucket,
+        bucket_name="test-bucket",
         user_id=user_id,
+        content_type="image/png",
+        category="image",
+        body=b"png",
         thread_id=thread_id,
     )
 
-    # Verify paginator was called correctly
-    mock_s3.get_paginator.assert_called_once_with("list_objects_v2")
-    mock_paginator.paginate.assert_called_once_with(
-        Bucket=bucket_name, Prefix=f"{user_id}/"
+    stored = s3_bucket.get_object(Bucket="test-bucket", Key=f"{user_id}/{identifier}")
+    assert stored["Body"].read() == b"png"
+    assert stored["Metadata"]["category"] == "image"
+
+
+@pytest.mark.asyncio
+async def test_save_many_to_storage(s3_bucket):
+    user_id = uuid4()
+    bodies = [json.dumps({"plot": i}) for i in range(10)]
+
+    identifiers = await save_many_to_storage(
+        s3_client=s3_bucket,
+        bucket_name="test-bucket",
+        user_id=user_id,
+        content_type="application/json",
+        category="json",
+        bodies=bodies,
+        max_concurrency=3,
     )
 
-    # Verify head_object was called for each object
-    assert mock_s3.head_object.call_count == 3
-    mock_s3.head_object.assert_has_calls(
-        [
-            call(Bucket=bucket_name, Key=f"{user_id}/obj1"),
-            call(Bucket=bucket_name, Key=f"{user_id}/obj2"),
-            call(Bucket=bucket_name, Key=f"{user_id}/obj3"),
-        ]
+    assert len(set(identifiers)) == 10
+    # Identifiers are returned in the order of the bodies
+    for identifier, body in zip(identifiers, bodies):
+        stored = s3_bucket.get_object(
+            Bucket="test-bucket", Key=f"{user_id}/{identifier}"
+        )
+        assert stored["Body"].read().decode() == body
+
+
+@pytest.mark.asyncio
+async def test_save_many_to_storage_bounded_concurrency():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def put_object(**kwargs):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    mock_s3 = Mock()
+    mock_s3.put_object.side_effect = put_object
+
+    await asyncio.wait_for(
+        save_many_to_storage(
+            s3_client=mock_s3,
+            bucket_name="test-bucket",
+            user_id=uuid4(),
+            content_type="application/json",
+            category="json",
+            bodies=["{}"] * 8,
+            max_concurrency=2,
+        ),
+        timeout=5,
     )
 
-    # Verify delete_objects was called for each page with correct objects
-    assert mock_s3.delete_objects.call_count == 2
-    mock_s3.delete_objects.assert_has_calls(
-        [
-            call(
-                Bucket=bucket_name,
-                Delete={
-                    "Objects": [{"Key": f"{user_id}/obj1"}],
-                    "Quiet": True,
-                },
-            ),
-            call(
-                Bucket=bucket_name,
-                Delete={
-                    "Objects": [{"Key": f"{user_id}/obj3"}],
-                    "Quiet": True,
-                },
-            ),
-        ]
+    assert mock_s3.put_object.call_count == 8
+    assert max_running == 2
+
+
+def test_content_address():
+    params = {"entity_id": "abc", "asset_id": "def", "dpi": 300}
+
+    # Deterministic and independent of the key order
+    assert content_address("tool", params) == content_address(
+        "tool", dict(reversed(params.items()))
+    )
+    assert content_address("tool", params) != content_address(
+        "tool", {**params, "dpi": 72}
+    )
+    assert content_address(b"body") != content_address(b"other body")
+    assert len(content_address(b"body")) == 64
+
+
+def test_save_to_storage_content_addressed(s3_bucket):
+    user_id = uuid4()
+    identifier = content_address(b"png")
+
+    for thread_id in (uuid4(), uuid4()):
+        assert (
+            save_to_storage(
+                s3_client=s3_bucket,
+                bucket_name="test-bucket",
+                user_id=user_id,
+                content_type="image/png",
+                category="image",
+                body=b"png",
+                thread_id=thread_id,
+                identifier=identifier,
+            )
+            == identifier
+        )
+
+    # A single blob shared by both threads
+    objects = s3_bucket.list_objects_v2(Bucket="test-bucket")["Contents"]
+    assert [obj["Key"] for obj in objects] == [f"{user_id}/{identifier}"]
+    assert reuse_from_storage(s3_bucket, "test-bucket", user_id, identifier)
+    assert not reuse_from_storage(s3_bucket, "test-bucket", user_id, "other")
+
+
+def test_reuse_from_storage_refreshes_date(s3_bucket):
+    user_id = uuid4()
+    identifier = content_address(b"json")
+    save_to_storage(
+        s3_client=s3_bucket,
+        bucket_name="test-bucket",
+        user_id=user_id,
+        content_type="application/json",
+        category="json",
+        body="{}",
+        compress=True,
+        identifier=identifier,
     )
+    key = f"{user_id}/{identifier}"
+    written = s3_bucket.head_object(Bucket="test-bucket", Key=key)
 
+    time.sleep(1)
+    assert reuse_from_storage(s3_bucket, "test-bucket", user_id, identifier)
 
-def test_delete_from_storage_no_contents():
-    # Setup mock s3 client
-    mock_s3 = Mock()
+    reused = s3_bucket.head_object(Bucket="test-bucket", Key=key)
+    assert reused["LastModified"] > written["LastModified"]
+    assert reused["ContentType"] == "application/json"
+    assert reused["ContentEncoding"] == "gzip"
+    assert reused["Metadata"] == {"category": "json"}
 
-    # Mock paginator and its paginate method
-    mock_paginator = Mock()
-    mock_s3.get_paginator.return_value = mock_paginator
 
-    # Test parameters
-    bucket_name = "test-bucket"
-    user_id = "test-user"
-    thread_id = "test-thread"
+def test_list_content_addressed_objects(s3_bucket):
+    user_id = uuid4()
+    identifier = content_address(b"png")
+    for key in (f"{user_id}/{identifier}", f"{user_id}/{uuid4()}"):
+        s3_bucket.put_object(Bucket="test-bucket", Key=key, Body=b"png")
 
-    # Test case: Page with no contents
-    mock_paginator.paginate.return_value = [{}]
+    assert is_content_addressed(f"{user_id}/{identifier}")
+    assert not is_content_addressed(f"{user_id}/{uuid4()}")
 
-    # Call function
-    delete_from_storage(
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert list(list_content_addressed_objects(s3_bucket, "test-bucket", future)) == [
+        f"{user_id}/{identifier}"
+    ]
+    # Recently written objects are kept
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert list(list_content_addressed_objects(s3_bucket, "test-bucket", past)) == []
+
+
+def test_save_to_storage_content_addressed_skips_upload():
+    mock_s3 = Mock()
+    mock_s3.head_object.return_value = {}
+
+    identifier = save_to_storage(
         s3_client=mock_s3,
-        bucket_name=bucket_name,
-        user_id=user_id,
-        thread_id=thread_id,
+        bucket_name="test-bucket",
+        user_id="test-user",
+        content_type="image/png",
+        category="image",
+        body=b"png",
+        thread_id=uuid4(),
+        identifier="abc",
     )
 
-    # Verify paginator was called correctly
-    mock_s3.get_paginator.assert_called_once_with("list_objects_v2")
-    mock_paginator.paginate.assert_called_once_with(
-        Bucket=bucket_name, Prefix=f"{user_id}/"
+    assert identifier == "abc"
+    mock_s3.head_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test-user/abc"
     )
+    mock_s3.copy_object.assert_called_once()
+    mock_s3.put_object.assert_not_called()
 
-    # Verify no other methods were called
-    mock_s3.head_object.assert_not_called()
-    mock_s3.delete_objects.assert_not_called()
 
+def test_delete_from_storage(s3_bucket):
+    for key in ("user/obj1", "user/obj2", "user/obj3"):
+        s3_bucket.put_object(Bucket="test-bucket", Key=key, Body=b"")
 
-def test_delete_from_storage_large_batch():
-    # Setup mock s3 client
+    delete_from_storage(
+        s3_client=s3_bucket,
+        bucket_name="test-bucket",
+        keys=["user/obj1", "user/obj3"],
+    )
+
+    objects = s3_bucket.list_objects_v2(Bucket="test-bucket")["Contents"]
+    assert [obj["Key"] for obj in objects] == ["user/obj2"]
+
+
+def test_delete_from_storage_no_keys():
     mock_s3 = Mock()
 
-    # Mock paginator and its paginate method
-    mock_paginator = Mock()
-    mock_s3.get_paginator.return_value = mock_paginator
+    delete_from_storage(s3_client=mock_s3, bucket_name="test-bucket", keys=[])
+
+    mock_s3.delete_objects.assert_not_called()
 
-    # Test parameters
-    bucket_name = "test-bucket"
-    user_id = "test-user"
-    thread_id = "test-thread"
 
-    # Create 1500 test objects (more than the 1000 batch limit)
-    test_objects = [{"Key": f"{user_id}/obj{i}"} for i in range(1500)]
-    mock_paginator.paginate.return_value = [{"Contents": test_objects}]
+def test_delete_from_storage_large_batch():
+    # Setup mock s3 client
+    mock_s3 = Mock()
 
-    # Mock head_object to always return matching thread_id
-    mock_s3.head_object.return_value = {"Metadata": {"thread_id": thread_id}}
+    # Create 1500 test keys (more than the 1000 batch limit)
+    keys = [f"test-user/obj{i}" for i in range(1500)]
 
     # Call function
-    delete_from_storage(
-        s3_client=mock_s3,
-        bucket_name=bucket_name,
-        user_id=user_id,
-        thread_id=thread_id,
-    )
+    delete_from_storage(s3_client=mock_s3, bucket_name="test-bucket", keys=keys)
 
     # Verify delete_objects was called twice (1000 objects, then 500)
     assert mock_s3.delete_objects.call_count == 2
@@ -364,12 +482,62 @@ def test_delete_from_storage_large_batch():
     # First batch should have 1000 objects
     first_batch = mock_s3.delete_objects.call_args_list[0][1]
     assert len(first_batch["Delete"]["Objects"]) == 1000
+    assert first_batch["Delete"]["Objects"][0] == {"Key": "test-user/obj0"}
 
     # Second batch should have 500 objects
     second_batch = mock_s3.delete_objects.call_args_list[1][1]
     assert len(second_batch["Delete"]["Objects"]) == 500
 
 
+def test_list_thread_objects():
+    # Setup mock s3 client
+    mock_s3 = Mock()
+
+    # Mock paginator and its paginate method
+    mock_paginator = Mock()
+    mock_s3.get_paginator.return_value = mock_paginator
+
+    # Test parameters
+    bucket_name = "test-bucket"
+    user_id = "test-user"
+
+    mock_paginator.paginate.return_value = [
+        {
+            "Contents": [
+                {"Key": f"{user_id}/obj1"},
+                {"Key": f"{user_id}/obj2"},
+            ]
+        },
+        {},
+        {
+            "Contents": [
+                {"Key": f"{user_id}/obj3"},
+            ]
+        },
+    ]
+
+    # Mock head_object responses for each object
+    mock_s3.head_object.side_effect = [
+        {"Metadata": {"thread_id": "thread-1"}},  # obj1
+        {"Metadata": {"category": "image"}},  # obj2, content addressed
+        {"Metadata": {"thread_id": "thread-2"}},  # obj3
+    ]
+
+    objects = list(
+        list_thread_objects(
+            s3_client=mock_s3, bucket_name=bucket_name, prefix=f"{user_id}/"
+        )
+    )
+
+    mock_paginator.paginate.assert_called_once_with(
+        Bucket=bucket_name, Prefix=f"{user_id}/"
+    )
+    assert objects == [
+        ("thread-1", f"{user_id}/obj1"),
+        ("thread-2", f"{user_id}/obj3"),
+    ]
+
+
 def test_valid_uuid():
     """Test that valid UUID strings return True."""
     from neuroagent.utils import is_uuid
@@ -601,3 +769,25 @@ async def test_url_with_simulation():
     assert result.query_params["group"] == ["simulations"]
     assert result.query_params["view"] == ["flat"]
     assert result.query_params["circuit__scale"] == ["pair"]
+
+
+@pytest.mark.asyncio
+async def test_messages_to_openai_content_truncates_old_tool_outputs():
+    contents = [
+        {"role": "user", "content": "first query"},
+        {"role": "tool", "content": "a" * 50, "tool_call_id": "1"},
+        {"role": "assistant", "content": "first answer"},
+        {"role": "user", "content": "second query"},
+        {"role": "tool", "content": "b" * 50, "tool_call_id": "2"},
+    ]
+    db_messages = [Mock(content=content) for content in contents]
+
+    messages = await messages_to_openai_content(db_messages)
+    assert messages == contents
+
+    messages = await messages_to_openai_content(db_messages, max_tool_content_length=10)
+    assert messages[1]["content"] == "a" * 10 + "... [truncated 40 characters]"
+    # The outputs of the current turn are kept whole
+    assert messages[4]["content"] == "b" * 50
+    assert messages[0] == contents[0]
+    assert messages[2] == contents[2]
@@ -0,0 +1,77 @@
+"""Test the registry of the internal tools."""
+
+import json
+import subprocess
+import sys
+
+import neuroagent.tools
+from neuroagent.tools.registry import (
+    MANIFEST_PATH,
+    LazyTool,
+    build_manifest,
+    get_tool_manifest,
+    load_tool,
+)
+from neuroagent.tools.weather import WeatherTool
+
+
+def test_manifest_up_to_date():
+    # Run `neuroagent-build-tool-manifest` if this fails
+    assert json.loads(MANIFEST_PATH.read_text()) == build_manifest()
+    assert set(get_tool_manifest()) == set(neuroagent.tools.__all__)
+
+
+def test_lazy_tool():
+    tool = get_tool_manifest()["WeatherTool"]
+
+    assert isinstance(tool, LazyTool)
+    assert tool.name == WeatherTool.name
+    assert tool.utterances == WeatherTool.utterances
+    assert tool.hil
+    assert load_tool(tool) is WeatherTool
+    assert load_tool(WeatherTool) is WeatherTool
+    assert neuroagent.tools.WeatherTool is WeatherTool
+
+
+def test_import_time():
+    """Import the app with `-X importtime` and check the tools are not imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import neuroagent.app.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: self [us] | cumulative | module"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, total, module = line.split("|")
+            if total.strip().isdigit():
+                cumulative[module.strip()] = int(total)
+
+    # Generous, as `-X importtime` slows the imports down
+    main_seconds = cumulative["neuroagent.app.main"] / 1e6
+    assert 0 < main_seconds < 20, f"neuroagent.app.main imported in {main_seconds:.2f}s"
+    loaded = [
+        module
+        for module in cumulative
+        if module.startswith("neuroagent.autogenerated_types")
+        or (
+            module.startswith("neuroagent.tools.")
+            and module
+            not in {"neuroagent.tools.base_tool", "neuroagent.tools.registry"}
+        )
+    ]
+    assert loaded == [], (
+        f"neuroagent.app.main imported in {main_seconds:.2f}s, with {loaded}"
+    )
+
+
+def test_manifest_description_independent_of_pydantic():
+    # The shared state schema is only added for the LLM
+    tool = get_tool_manifest()["EditStateTool"]
+    assert "$defs" not in tool.description
+
+    schema = load_tool(tool).pydantic_to_openai_schema()
+    assert schema["function"]["description"].startswith(tool.description)
+    assert "# Shared State Schema" in schema["function"]["description"]
@@ -57,7 +57,7 @@ type SearchPopoverProps = {
 
 export type SearchMessagesResult = {
   thread_id: string;
-  message_id: string;
+  message_id: string | null;
   title: string;
   content: string;
 };
@@ -175,8 +175,8 @@ export function SearchPopover({ debounceMs = 400 }: SearchPopoverProps) {
               <CommandGroup>
                 {results.map((res) => (
                   <CommandItem
-                    key={res.message_id}
-                    value={res.message_id}
+                    key={res.message_id ?? res.thread_id}
+                    value={res.message_id ?? res.thread_id}
                     className="flex flex-col items-start rounded-md p-3 transition hover:bg-gray-50 dark:hover:bg-gray-800"
                     asChild
                     onSelect={() => {
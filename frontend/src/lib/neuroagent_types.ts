@@ -661,11 +661,8 @@ export interface components {
        * Format: uuid
        */
       thread_id: string;
-      /**
-       * Message Id
-       * Format: uuid
-       */
-      message_id: string;
+      /** Message Id */
+      message_id: string | null;
       /** Title */
       title: string;
       /** Content */